@@ -12,10 +12,13 @@ from .core import (Model, Attribute,  # noqa: F401
                    RelatedManager, OneToManyRelatedManager, ManyToOneRelatedManager, ManyToManyRelatedManager,
                    RelatedAttribute, OneToOneAttribute, OneToManyAttribute, ManyToOneAttribute, ManyToManyAttribute,
                    CellDialect, ToManyAttribute,
-                   InvalidObjectSet, InvalidModel, InvalidObject, InvalidAttribute, Validator,
-                   ObjTablesWarning, SchemaWarning,
-                   ModelSource, TableFormat,
+                   InvalidObjectSet, InvalidModel, InvalidObject, InvalidAttribute, Validator, ValidationError,
+                   ObjTablesWarning, SchemaWarning, ValidationWarning,
+                   ModelSource, TableFormat, ObjectStore, ChangeJournal, AttributeChange, RelatedManagerChange, Snapshot,
+                   SubgraphView,
+                   depends_on,
                    get_models, get_model, xlsx_col_name,
                    ModelMerge,
                    TOC_TABLE_TYPE, TOC_SHEET_NAME,
                    SCHEMA_TABLE_TYPE, SCHEMA_SHEET_NAME)
+from .query import Q  # noqa: F401
@@ -11,6 +11,7 @@ from . import io
 from . import utils
 import cement
 import copy
+import json
 import obj_tables
 import os
 import os.path
@@ -106,18 +107,34 @@ class DiffController(cement.Controller):
             (['wb_file_1'], dict(type=str,
                                  help='Path to the first workbook (.csv, .json, .tsv, .xlsx, .yml)')),
             (['wb_file_2'], dict(type=str,
-                                 help='Path to the second workbook (.csv, .json, .tsv, .xlsx, .yml)')), ]
+                                 help='Path to the second workbook (.csv, .json, .tsv, .xlsx, .yml)')),
+            (['--related'], dict(action='store_true', default=False,
+                                 help='If set, also compare the objects of the models related to the model')),
+            (['--json'], dict(action='store_true', default=False,
+                              help='If set, print the objects which were added, removed, and changed as JSON')), ]
 
     @cement.ex(hide=True)
     def _default(self):
         args = self.app.pargs
         schema_name, schema, models = get_schema_models(args.schema_file)
         try:
-            diffs = utils.diff_workbooks(args.wb_file_1, args.wb_file_2,
-                                         models, args.model,
-                                         schema_name=schema_name, **DEFAULT_READER_ARGS)
+            if args.json:
+                diff = utils.get_workbook_diff(args.wb_file_1, args.wb_file_2,
+                                               models, args.model,
+                                               schema_name=schema_name, related=args.related,
+                                               **DEFAULT_READER_ARGS)
+            else:
+                diffs = utils.diff_workbooks(args.wb_file_1, args.wb_file_2,
+                                             models, args.model,
+                                             schema_name=schema_name, related=args.related,
+                                             **DEFAULT_READER_ARGS)
         except ValueError as err:
             raise SystemExit(str(err))
+        if args.json:
+            print(json.dumps(diff, indent=2))
+            if diff:
+                sys.exit(1)
+            return
         if diffs:
             raise SystemExit('\n\n'.join(diffs))
         print('Workbooks are equivalent')
@@ -247,6 +264,8 @@ class ValidateController(cement.Controller):
                                    help='Path to the schema (.py) or a declarative description of the schema (.csv, .tsv, .xlsx)')),
             (['wb_file'], dict(type=str,
                                help='Path to the workbooks (.csv, .json, .tsv, .xlsx, .yml)')),
+            (['--max-errors'], dict(type=int, default=None,
+                                    help='Stop validating after this number of errors')),
         ]
 
     @cement.ex(hide=True)
@@ -258,6 +277,7 @@ class ValidateController(cement.Controller):
                             schema_name=schema_name,
                             models=models,
                             group_objects_by_model=False,
+                            max_errors=args.max_errors,
                             **DEFAULT_READER_ARGS)
         except ValueError as err:
             raise SystemExit(str(err))
@@ -20,10 +20,10 @@ which can then be referenced to deserialize the related attribute.
 
 from datetime import date, time, datetime
 from enum import Enum
-from itertools import chain
+from itertools import chain, islice
 from math import isnan
 from natsort import natsort_keygen, natsorted, ns
-from operator import attrgetter
+from operator import attrgetter, itemgetter
 from stringcase import sentencecase
 from os.path import basename, splitext
 from weakref import WeakSet, WeakKeyDictionary
@@ -34,23 +34,36 @@ from wc_utils.util.string import indent_forest
 from wc_utils.util.types import get_subclasses, get_superclasses
 from wc_utils.workbook.core import get_column_letter
 import abc
+import bisect
 import collections
 import collections.abc
+import contextlib
 import copy
 import csv
 import dateutil.parser
 import enum
+import hashlib
 import inflect
+import inspect
 import io
 import json
+import keyword
+import multiprocessing
+import multiprocessing.pool
 import numbers
+import numpy
+import os
 import pathlib
+import pickle
 import pronto
 import queue
 import re
 import sys
+import threading
+import types
 import validate_email
 import warnings
+import weakref
 import wc_utils.workbook.io
 # todo: simplify primary attributes, deserialization
 # todo: improve memory efficiency
@@ -105,6 +118,7 @@ class ModelMeta(type):
             Meta.unique_together = copy.deepcopy(bases[0].Meta.unique_together)
             Meta.indexed_attrs_tuples = copy.deepcopy(
                 bases[0].Meta.indexed_attrs_tuples)
+            Meta.ordered_indexes = bases[0].Meta.ordered_indexes
             Meta.description = bases[0].Meta.description
             Meta.table_format = bases[0].Meta.table_format
             Meta.frozen_columns = bases[0].Meta.frozen_columns
@@ -112,6 +126,13 @@ class ModelMeta(type):
             Meta.children = copy.deepcopy(bases[0].Meta.children)
             Meta.merge = bases[0].Meta.merge
 
+        # compact and columnar storage are inherited by all subclasses of compact and columnar models
+        Meta = namespace['Meta']
+        Meta.compact = Meta.compact or any(issubclass(base, Model) and base.Meta.compact for base in bases)
+        Meta.columnar = Meta.columnar or any(issubclass(base, Model) and base.Meta.columnar for base in bases)
+        if Meta.compact and Meta.columnar:
+            raise ValueError('Model {} cannot be both compact and columnar'.format(name))
+
         # validate attribute inheritance
         metacls.validate_meta(name, bases, namespace)
 
@@ -125,6 +146,17 @@ class ModelMeta(type):
         # validate attribute inheritance
         metacls.validate_attribute_inheritance(name, bases, namespace)
 
+        # declare slots for compact models
+        if Meta.compact:
+            namespace['__slots__'] = metacls.get_compact_slot_names(bases)
+            namespace.setdefault('__getstate__', CompactSlot.get_state)
+            namespace.setdefault('__setstate__', CompactSlot.set_state)
+
+        # include the values stored in the columns of columnar models in their states
+        if Meta.columnar:
+            namespace.setdefault('__getstate__', ColumnStore.get_state)
+            namespace.setdefault('__setstate__', ColumnStore.set_state)
+
         # call super class method
         cls = super(ModelMeta, metacls).__new__(metacls, name, bases, namespace)
 
@@ -139,8 +171,12 @@ class ModelMeta(type):
         cls.Meta.local_attributes = collections.OrderedDict()
         for attr in cls.Meta.attributes.values():
             cls.Meta.local_attributes[attr.name] = LocalAttribute(attr, cls)
-        for model in get_subclasses(Model):
-            metacls.init_related_attributes(cls, model)
+        metacls.init_compact_slots(cls)
+        metacls.init_column_store(cls)
+        cls.Meta.initializer = None
+        cls.Meta.traversal_plan = None
+        cls.Meta.code_generator = None
+        metacls.init_related_attributes(cls)
         metacls.init_attribute_order(cls)
 
         metacls.init_ordering(cls)
@@ -207,6 +243,40 @@ class ModelMeta(type):
 
         metacls.validate_attr_tuples(name, bases, namespace, 'unique_together')
         metacls.validate_attr_tuples(name, bases, namespace, 'indexed_attrs_tuples')
+        metacls.validate_ordered_indexes(name, bases, namespace)
+
+    @classmethod
+    def validate_ordered_indexes(metacls, name, bases, namespace):
+        """ Validate the names of the attributes with ordered indexes
+
+        Raises:
+            :obj:`ValueError`: if :obj:`Meta.ordered_indexes` is not a tuple of the names of distinct
+                non-related attributes
+        """
+        ordered_indexes = namespace['Meta'].ordered_indexes
+
+        attribute_names = []
+        for attr_name, attr in namespace.items():
+            if isinstance(attr, Attribute) and not isinstance(attr, RelatedAttribute):
+                attribute_names.append(attr_name)
+        for base in bases:
+            if issubclass(base, Model) and base.Meta.attributes:
+                for attr_name, attr in base.Meta.attributes.items():
+                    if not isinstance(attr, RelatedAttribute):
+                        attribute_names.append(attr_name)
+
+        if not isinstance(ordered_indexes, tuple):
+            raise ValueError("ordered_indexes for '{}' must be a tuple, not '{}'".format(
+                name, ordered_indexes))
+
+        for attr_name in ordered_indexes:
+            if not isinstance(attr_name, str) or attr_name not in attribute_names:
+                raise ValueError("ordered_indexes for '{}' must be a tuple of the names of non-related attributes, "
+                                 "not '{}'".format(name, ordered_indexes))
+
+        if len(set(ordered_indexes)) < len(ordered_indexes):
+            raise ValueError("ordered_indexes for '{}' cannot repeat attribute names: '{}'".format(
+                name, ordered_indexes))
 
     @classmethod
     def validate_attr_tuples(metacls, name, bases, namespace, meta_attribute_name):
@@ -231,25 +301,15 @@ class ModelMeta(type):
             if issubclass(base, Model) and base.Meta.attributes:
                 attribute_names += base.Meta.attributes.keys()
 
-        for model in get_subclasses(Model):
-            for attr in model.Meta.attributes.values():
-                if isinstance(attr, RelatedAttribute):
-                    if isinstance(attr.related_class, str):
-                        related_class_name = attr.related_class
-                        if '.' not in related_class_name:
-                            related_class_name = model.__module__ + '.' + related_class_name
-                    else:
-                        related_class_name = attr.related_class.__module__ + \
-                            '.' + attr.related_class.__name__
-
-                    if attr.name in model.__dict__ and attr.related_name:
-                        if '__module__' in namespace and related_class_name == namespace['__module__'] + '.' + name:
-                            attribute_names.append(attr.related_name)
-                        else:
-                            for base in bases:
-                                if related_class_name == base.__module__ + '.' + base.__name__:
-                                    attribute_names.append(attr.related_name)
-                                    break
+        # related attributes declared by other models
+        related_class_names = []
+        if '__module__' in namespace:
+            related_class_names.append(namespace['__module__'] + '.' + name)
+        for base in bases:
+            related_class_names.append(base.__module__ + '.' + base.__name__)
+        for related_class_name in det_dedupe(related_class_names):
+            for _, attr in metacls.get_referencing_attributes(related_class_name):
+                attribute_names.append(attr.related_name)
 
         if not isinstance(meta_attribute, tuple):
             raise ValueError("{} for '{}' must be a tuple, not '{}'".format(
@@ -266,6 +326,15 @@ class ModelMeta(type):
                         meta_attribute_name, name, meta_attribute))
 
                 if attr_name not in attribute_names:
+                    if meta_attribute_name == 'indexed_attrs_tuples':
+                        value = namespace.get(attr_name, None)
+                        for base in bases:
+                            if value is not None:
+                                break
+                            value = inspect.getattr_static(base, attr_name, None)
+                        if metacls.get_computed_attribute_function(value) is not None:
+                            continue
+
                     raise ValueError("{} for '{}' must be a tuple of tuples of attribute names, not '{}'".format(
                         meta_attribute_name, name, meta_attribute))
 
@@ -286,9 +355,43 @@ class ModelMeta(type):
             raise ValueError("{} cannot contain identical attribute sets: {}".format(
                 meta_attribute_name, str(equivalent_tuples)))
 
+    @staticmethod
+    def get_computed_attribute_function(value):
+        """ Get the function which computes the value of a computed attribute (a zero-argument method or
+        a property)
+
+        Args:
+            value (:obj:`object`): value of a name in the namespace of a :obj:`Model` class
+
+        Returns:
+            :obj:`types.FunctionType`: function which computes the value, or :obj:`None` if :obj:`value` is
+                not a zero-argument method or a property
+        """
+        if isinstance(value, property):
+            return value.fget
+        if not isinstance(value, types.FunctionType):
+            return None
+        params = list(inspect.signature(value).parameters.values())[1:]
+        for param in params:
+            if param.default is inspect.Parameter.empty and \
+                    param.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                                   inspect.Parameter.KEYWORD_ONLY):
+                return None
+        return value
+
     # enable suspension of checking of same related attribute name so that obj_tables schemas can be migrated
     CHECK_SAME_RELATED_ATTRIBUTE_NAME = True
 
+    # registries which enable related attributes to be initialized without scanning all models
+    # (see :obj:`init_related_attributes`); models are referenced weakly so that they can be garbage collected
+
+    # fully-qualified name -> weak references to the models with the name
+    _models_by_name = {}
+    # fully-qualified name of a model -> weak references to the models which declare related attributes to it
+    _referencing_models = {}
+    # fully-qualified name -> weak references to the models with unresolved references to a related class
+    _unresolved_models = {}
+
     @classmethod
     def validate_related_attributes(metacls, name, bases, namespace):
         """ Check the related attributes
@@ -312,7 +415,7 @@ class ModelMeta(type):
                         related_class_name = namespace.get(
                             '__module__', '') + '.' + related_class_name
 
-                    related_class = get_model(related_class_name)
+                    related_class = metacls.get_model_by_name(related_class_name)
                 else:
                     related_class = attr.related_class
 
@@ -405,33 +508,219 @@ class ModelMeta(type):
                 if isinstance(attr, RelatedAttribute) and attr.name in cls.__dict__:
                     attr.primary_class = cls
 
-    def init_related_attributes(cls, model_cls):
-        """ Initialize related attributes """
-        for attr in model_cls.Meta.attributes.values():
+    def init_related_attributes(cls):
+        """ Initialize the related attributes of a new model, and of the models which are related to it
+
+        Rather than scanning all of the models each time a model is created, the related attributes are
+        resolved incrementally with the registries of models by name (:obj:`_models_by_name`), of the models
+        which declare related attributes to each model (:obj:`_referencing_models`), and of the models with
+        unresolved references to related classes by name (:obj:`_unresolved_models`). Therefore, the cost of
+        initializing each model is proportional to the number of its related attributes, and the cost of
+        creating a schema is linear in its size.
+        """
+        cls_name = cls.__module__ + '.' + cls.__name__
+        cls_ref = weakref.ref(cls)
+        model_refs = ModelMeta._models_by_name.setdefault(cls_name, [])
+        model_refs[:] = [model_ref for model_ref in model_refs if model_ref() is not None]
+        model_refs.append(cls_ref)
+
+        # inherit the related attributes of the superclasses
+        for super_cls in cls.__mro__[1:]:
+            if isinstance(super_cls, ModelMeta) and super_cls is not Model:
+                super_cls_name = super_cls.__module__ + '.' + super_cls.__name__
+                for _, attr in ModelMeta.get_referencing_attributes(super_cls_name):
+                    if attr.related_class is super_cls:
+                        ModelMeta.add_related_attribute(cls, attr)
+
+        # resolve references to the new model by name
+        for model_ref in ModelMeta._unresolved_models.pop(cls_name, []):
+            model = model_ref()
+            if model is not None:
+                for attr in model.Meta.attributes.values():
+                    if isinstance(attr, RelatedAttribute) and \
+                            ModelMeta.get_related_class_name(model, attr) == cls_name:
+                        if isinstance(attr.related_class, str):
+                            attr.related_class = cls
+                        if attr.related_class is cls:
+                            model.Meta.local_attributes[attr.name].related_class = cls
+                            if attr.name in model.__dict__ and attr.related_name and model is not cls:
+                                ModelMeta.add_related_attribute(cls, attr)
+
+        unresolved_class_names = set()
+        related_class_names = set()
+        for attr in cls.Meta.attributes.values():
             if isinstance(attr, RelatedAttribute):
+                related_class_name = ModelMeta.get_related_class_name(cls, attr)
 
                 # deserialize related class references by class name
                 if isinstance(attr.related_class, str):
-                    related_class_name = attr.related_class
-                    if '.' not in related_class_name:
-                        related_class_name = model_cls.__module__ + '.' + related_class_name
-
-                    related_class = get_model(related_class_name)
+                    related_class = ModelMeta.get_model_by_name(related_class_name)
                     if related_class:
                         attr.related_class = related_class
-                        model_cls.Meta.local_attributes[attr.name].related_class = related_class
+                        cls.Meta.local_attributes[attr.name].related_class = related_class
+                    elif related_class_name not in unresolved_class_names:
+                        unresolved_class_names.add(related_class_name)
+                        ModelMeta._unresolved_models.setdefault(related_class_name, []).append(cls_ref)
 
                 # setup related attributes on related classes
-                if attr.name in model_cls.__dict__ and attr.related_name and \
-                        isinstance(attr.related_class, type) and issubclass(attr.related_class, Model):
-                    related_classes = chain(
-                        [attr.related_class], get_subclasses(attr.related_class))
-                    for related_class in related_classes:
-                        # add attribute to dictionary of related attributes
-                        related_class.Meta.related_attributes[
-                            attr.related_name] = attr
-                        related_class.Meta.local_attributes[attr.related_name] = LocalAttribute(
-                            attr, related_class, is_primary=False)
+                if attr.name in cls.__dict__ and attr.related_name:
+                    if related_class_name not in related_class_names:
+                        related_class_names.add(related_class_name)
+                        ModelMeta._referencing_models.setdefault(related_class_name, []).append(cls_ref)
+                    if isinstance(attr.related_class, type) and issubclass(attr.related_class, Model):
+                        related_classes = chain(
+                            [attr.related_class], get_subclasses(attr.related_class))
+                        for related_class in related_classes:
+                            ModelMeta.add_related_attribute(related_class, attr)
+
+    @staticmethod
+    def add_related_attribute(related_class, attr):
+        """ Add a related attribute to a model
+
+        Args:
+            related_class (:obj:`type`): model
+            attr (:obj:`RelatedAttribute`): attribute whose related class is :obj:`related_class`
+                or a superclass of :obj:`related_class`
+        """
+        # add attribute to dictionary of related attributes
+        related_class.Meta.related_attributes[
+            attr.related_name] = attr
+        related_class.Meta.local_attributes[attr.related_name] = LocalAttribute(
+            attr, related_class, is_primary=False)
+        if related_class.Meta.compact:
+            ModelMeta.add_compact_slot(related_class, attr.related_name, attr, related=True)
+        related_class.Meta.initializer = None
+        related_class.Meta.traversal_plan = None
+        related_class.Meta.code_generator = None
+
+    @staticmethod
+    def get_related_class_name(model, attr):
+        """ Get the fully-qualified name of the related class of a related attribute
+
+        Args:
+            model (:obj:`type`): model which has the attribute
+            attr (:obj:`RelatedAttribute`): attribute
+
+        Returns:
+            :obj:`str`: fully-qualified name of the related class
+        """
+        if isinstance(attr.related_class, str):
+            related_class_name = attr.related_class
+            if '.' not in related_class_name:
+                related_class_name = model.__module__ + '.' + related_class_name
+            return related_class_name
+        return attr.related_class.__module__ + '.' + attr.related_class.__name__
+
+    @staticmethod
+    def get_model_by_name(name):
+        """ Get the first live model with a fully-qualified name
+
+        Args:
+            name (:obj:`str`): fully-qualified name
+
+        Returns:
+            :obj:`type`: model, or :obj:`None` if there is no live model with the name
+        """
+        for model_ref in ModelMeta._models_by_name.get(name, []):
+            model = model_ref()
+            # models can be renamed (e.g., by :obj:`obj_tables.migrate.SchemaModule`) so that they cannot be found
+            if model is not None and model.__module__ + '.' + model.__name__ == name:
+                return model
+        return None
+
+    @staticmethod
+    def get_referencing_attributes(related_class_name):
+        """ Get the related attributes which other models declare to a model
+
+        Args:
+            related_class_name (:obj:`str`): fully-qualified name of the model
+
+        Returns:
+            :obj:`list` of :obj:`tuple` of :obj:`type` and :obj:`RelatedAttribute`: models and the related
+                attributes which they declare to the model, in the order in which the models were created
+        """
+        model_refs = ModelMeta._referencing_models.get(related_class_name, None)
+        if not model_refs:
+            return []
+
+        live_model_refs = []
+        models_attrs = []
+        for model_ref in model_refs:
+            model = model_ref()
+            if model is None:
+                continue
+            live_model_refs.append(model_ref)
+            for attr_name, attr in model.Meta.attributes.items():
+                if isinstance(attr, RelatedAttribute) and attr_name in model.__dict__ and attr.related_name and \
+                        ModelMeta.get_related_class_name(model, attr) == related_class_name:
+                    models_attrs.append((model, attr))
+        model_refs[:] = live_model_refs
+        return models_attrs
+
+    @staticmethod
+    def get_compact_slot_names(bases):
+        """ Get the names of the slots which must be declared by a compact model
+
+        Args:
+            bases (:obj:`tuple`): tuple of superclasses
+
+        Returns:
+            :obj:`tuple` of :obj:`str`: names of slots
+        """
+        # models can only be expressions if :obj:`obj_tables.math.expression` has been imported
+        expression_module = sys.modules.get('obj_tables.math.expression', None)
+        expression = expression_module is not None and any(issubclass(base, expression_module.Expression)
+                                                           for base in bases)
+
+        slot_names = []
+        for slot_name in CompactSlot.INSTANCE_SLOT_NAMES:
+            if slot_name == '_parsed_expression' and not expression:
+                continue
+            if not any(slot_name in getattr(super_cls, '__slots__', ())
+                       for base in bases for super_cls in base.__mro__):
+                slot_names.append(slot_name)
+
+        # instances don't have dictionaries, but can be weakly referenced (e.g., by :obj:`Manager`\ s)
+        if not any(base.__weakrefoffset__ for base in bases):
+            slot_names.append('__weakref__')
+
+        return tuple(slot_names)
+
+    def init_compact_slots(cls):
+        """ Initialize the descriptors which store the values of the attributes of compact models """
+        if cls.Meta.compact:
+            cls.Meta.compact_slots = collections.OrderedDict()
+            for attr_name, attr in cls.Meta.attributes.items():
+                ModelMeta.add_compact_slot(cls, attr_name, attr, related=False)
+
+    def init_column_store(cls):
+        """ Initialize the store of the values of the numeric and Boolean attributes of columnar models """
+        if cls.Meta.columnar:
+            cls.Meta.column_store = store = ColumnStore(cls)
+            for attr_name, attr in cls.Meta.attributes.items():
+                dtype = attr.get_column_dtype()
+                if dtype is not None:
+                    store.add_column(attr_name, dtype)
+                    setattr(cls, attr_name, ColumnSlot(attr, attr_name, store))
+
+    @staticmethod
+    def add_compact_slot(cls, attr_name, attr, related=False):
+        """ Add a descriptor for the value of an attribute to a compact model
+
+        Args:
+            cls (:obj:`type`): compact model
+            attr_name (:obj:`str`): attribute name
+            attr (:obj:`Attribute`): attribute
+            related (:obj:`bool`, optional): if :obj:`True`, the attribute is a related attribute of :obj:`cls`
+        """
+        slot = cls.Meta.compact_slots.get(attr_name, None)
+        if slot is None:
+            slot = CompactSlot(attr, attr_name, len(cls.Meta.compact_slots), related=related)
+            cls.Meta.compact_slots[attr_name] = slot
+        else:
+            slot.attr = attr
+            slot.related = related
+        setattr(cls, attr_name, slot)
 
     def init_primary_attribute(cls):
         """ Initialize the primary attribute of a model """
@@ -514,6 +803,355 @@ class ModelMeta(type):
         setattr(cls, 'objects', Manager(cls))
 
 
+class OrderedIndex(object):
+    """ Sorted index of the values of an attribute of the instances of a :obj:`Model`
+
+    The entries of the index are kept in a list of sorted chunks of at most 2 * :obj:`CHUNK_SIZE` entries,
+    together with the last entry of each chunk. Each entry is a tuple of the value of an instance, the
+    sequence number of its insertion, and a weak reference to the instance. The sequence number breaks ties
+    between equal values, so that each entry can be located with a single binary search.
+
+    Inserting or removing an instance costs O(log n) comparisons, plus moving at most 2 * :obj:`CHUNK_SIZE`
+    entries within a chunk and, when a chunk is split or merged, O(n / :obj:`CHUNK_SIZE`) references to chunks,
+    where n is the number of indexed instances. Range and prefix queries cost O(log n + k), where k is the
+    number of matches. Instances whose values are :obj:`None` or NaN are not indexed. Instances are referenced
+    weakly, so that instances which are otherwise unused can be garbage collected.
+
+    Attributes:
+        attr_name (:obj:`str`): name of the indexed attribute
+        _chunks (:obj:`list` of :obj:`list` of :obj:`tuple`): sorted chunks of entries
+        _maxes (:obj:`list` of :obj:`tuple`): last entry of each chunk
+        _n_entries (:obj:`int`): number of entries, including the entries of garbage collected instances
+        _n_added (:obj:`int`): number of entries which have been inserted, used as the sequence number of
+            the next entry
+        _obj_keys (:obj:`WeakKeyDictionary`): dictionary which maps each indexed instance to the value and
+            sequence number of its entry
+    """
+
+    # number of entries per chunk after chunks are split or the index is re-sorted
+    CHUNK_SIZE = 512
+
+    # minimum ratio of the number of indexed instances to the number of new instances for which new instances
+    # are inserted one by one, rather than by re-sorting the index
+    BULK_INSERT_RATIO = 16
+
+    def __init__(self, attr_name):
+        """
+        Args:
+            attr_name (:obj:`str`): name of the indexed attribute
+        """
+        self.attr_name = attr_name
+        self._chunks = []
+        self._maxes = []
+        self._n_entries = 0
+        self._n_added = 0
+        self._obj_keys = WeakKeyDictionary()
+
+    def __len__(self):
+        """ Get the number of indexed instances
+
+        Returns:
+            :obj:`int`: number of indexed instances
+        """
+        return len(self._obj_keys)
+
+    def _get_key(self, obj):
+        """ Get the value of the indexed attribute of an instance
+
+        Args:
+            obj (:obj:`Model`): instance
+
+        Returns:
+            :obj:`object`: value of the attribute, or :obj:`None` if the instance should not be indexed
+        """
+        key = getattr(obj, self.attr_name)
+        if key != key:
+            # NaN cannot be ordered
+            return None
+        return key
+
+    def _load(self, entries):
+        """ Replace the entries of the index with sorted entries
+
+        Args:
+            entries (:obj:`list` of :obj:`tuple`): sorted entries
+        """
+        size = self.CHUNK_SIZE
+        self._chunks = [entries[i_entry:i_entry + size] for i_entry in range(0, len(entries), size)]
+        self._maxes = [chunk[-1] for chunk in self._chunks]
+        self._n_entries = len(entries)
+
+    def _get_entries(self):
+        """ Get the entries of the index
+
+        Returns:
+            :obj:`list` of :obj:`tuple`: sorted entries
+        """
+        return list(chain.from_iterable(self._chunks))
+
+    def add(self, obj):
+        """ Insert an instance into the index
+
+        Args:
+            obj (:obj:`Model`): instance
+        """
+        key = self._get_key(obj)
+        if key is None:
+            return
+        entry = (key, self._n_added, weakref.ref(obj))
+        self._n_added += 1
+        self._n_entries += 1
+        self._obj_keys[obj] = entry[0:2]
+
+        chunks = self._chunks
+        maxes = self._maxes
+        if not chunks:
+            chunks.append([entry])
+            maxes.append(entry)
+            return
+
+        # the sequence number of the entry is larger than those of all other entries, so the entry follows all
+        # entries with equal values
+        i_chunk = bisect.bisect_right(maxes, entry)
+        if i_chunk == len(maxes):
+            i_chunk -= 1
+            chunk = chunks[i_chunk]
+            chunk.append(entry)
+            maxes[i_chunk] = entry
+        else:
+            chunk = chunks[i_chunk]
+            chunk.insert(bisect.bisect_right(chunk, entry), entry)
+
+        if len(chunk) > 2 * self.CHUNK_SIZE:
+            chunks.insert(i_chunk + 1, chunk[self.CHUNK_SIZE:])
+            del chunk[self.CHUNK_SIZE:]
+            maxes.insert(i_chunk, chunk[-1])
+
+    def add_all(self, objs):
+        """ Insert instances into the index, re-sorting the index if there are many instances
+
+        Args:
+            objs (:obj:`list` of :obj:`Model`): instances
+        """
+        if len(objs) * self.BULK_INSERT_RATIO < self._n_entries:
+            for obj in objs:
+                self.add(obj)
+            return
+
+        entries = self._get_entries()
+        for obj in objs:
+            key = self._get_key(obj)
+            if key is not None:
+                entries.append((key, self._n_added, weakref.ref(obj)))
+                self._obj_keys[obj] = (key, self._n_added)
+                self._n_added += 1
+        # sequence numbers are unique, so the references are never compared
+        entries.sort(key=itemgetter(0, 1))
+        self._load(entries)
+
+    def discard(self, obj):
+        """ Remove an instance from the index, if it is indexed
+
+        Args:
+            obj (:obj:`Model`): instance
+        """
+        key = self._obj_keys.pop(obj, None)
+        if key is None:
+            return
+
+        # the value and sequence number identify the entry, and sort before it
+        chunks = self._chunks
+        maxes = self._maxes
+        i_chunk = bisect.bisect_left(maxes, key)
+        chunk = chunks[i_chunk]
+        del chunk[bisect.bisect_left(chunk, key)]
+        self._n_entries -= 1
+
+        if not chunk:
+            del chunks[i_chunk]
+            del maxes[i_chunk]
+        elif len(chunk) < self.CHUNK_SIZE // 2 and len(chunks) > 1:
+            # merge the chunk into one of its neighbors, and split the merged chunk if it is too large
+            if i_chunk == len(chunks) - 1:
+                i_chunk -= 1
+            chunk = chunks[i_chunk]
+            chunk.extend(chunks.pop(i_chunk + 1))
+            del maxes[i_chunk + 1]
+            maxes[i_chunk] = chunk[-1]
+            if len(chunk) > 2 * self.CHUNK_SIZE:
+                half = len(chunk) // 2
+                chunks.insert(i_chunk + 1, chunk[half:])
+                del chunk[half:]
+                maxes.insert(i_chunk, chunk[-1])
+        else:
+            maxes[i_chunk] = chunk[-1]
+
+        self._compact_if_sparse()
+
+    def update(self, obj):
+        """ Update the position of an instance whose value of the attribute may have changed
+
+        Args:
+            obj (:obj:`Model`): instance
+        """
+        entry_key = self._obj_keys.get(obj, None)
+        if (entry_key[0] if entry_key else None) != self._get_key(obj):
+            self.discard(obj)
+            self.add(obj)
+
+    def _compact_if_sparse(self):
+        """ Remove the entries of garbage collected instances if they are at least half of the index
+
+        Returns:
+            :obj:`int`: number of entries removed
+        """
+        n_dead = self._n_entries - len(self._obj_keys)
+        if n_dead and 2 * n_dead >= self._n_entries:
+            self._load([entry for entry in self._get_entries() if entry[2]() is not None])
+            return n_dead
+        return 0
+
+    def _locate(self, probe, right=False):
+        """ Get the position of the first entry which is greater than (or equal to) a probe
+
+        Args:
+            probe (:obj:`tuple`): probe
+            right (:obj:`bool`, optional): if :obj:`True`, get the position of the first entry which is
+                greater than the probe; otherwise, get the position of the first entry which is greater than or
+                equal to the probe
+
+        Returns:
+            :obj:`tuple` of :obj:`int`: index of the chunk and position within the chunk
+        """
+        bisect_fn = bisect.bisect_right if right else bisect.bisect_left
+        i_chunk = bisect_fn(self._maxes, probe)
+        if i_chunk == len(self._maxes):
+            return (i_chunk, 0)
+        return (i_chunk, bisect_fn(self._chunks[i_chunk], probe))
+
+    def _iter_entries(self, start):
+        """ Iterate over the entries of the index, starting from a position
+
+        Args:
+            start (:obj:`tuple` of :obj:`int`): index of the chunk and position within the chunk
+
+        Returns:
+            :obj:`iterator` of :obj:`tuple`: entries
+        """
+        i_chunk, i_pos = start
+        for chunk in islice(self._chunks, i_chunk, None):
+            yield from islice(chunk, i_pos, None)
+            i_pos = 0
+
+    def _get_objs(self, start, end):
+        """ Get the live instances at a range of positions of the index
+
+        Args:
+            start (:obj:`tuple` of :obj:`int`): index of the chunk and position within the chunk of the first
+                entry
+            end (:obj:`tuple` of :obj:`int`): index of the chunk and position within the chunk of the entry
+                after the last entry
+
+        Returns:
+            :obj:`list` of :obj:`Model`: instances
+        """
+        objs = []
+        i_chunk, i_pos = start
+        i_end_chunk, i_end_pos = end
+        while (i_chunk, i_pos) < (i_end_chunk, i_end_pos):
+            chunk = self._chunks[i_chunk]
+            i_stop = i_end_pos if i_chunk == i_end_chunk else len(chunk)
+            for _, _, ref in chunk[i_pos:i_stop]:
+                obj = ref()
+                if obj is not None:
+                    objs.append(obj)
+            i_chunk += 1
+            i_pos = 0
+        return objs
+
+    def range(self, lower=None, upper=None, include_lower=True, include_upper=True):
+        """ Get the instances whose values are within a range
+
+        Args:
+            lower (:obj:`object`, optional): lower bound; if :obj:`None`, the range is unbounded below
+            upper (:obj:`object`, optional): upper bound; if :obj:`None`, the range is unbounded above
+            include_lower (:obj:`bool`, optional): if :obj:`True`, include instances whose values are equal
+                to :obj:`lower`
+            include_upper (:obj:`bool`, optional): if :obj:`True`, include instances whose values are equal
+                to :obj:`upper`
+
+        Returns:
+            :obj:`list` of :obj:`Model`: instances, sorted by their values
+        """
+        # a 1-tuple of a value sorts before, and a pair of a value and an infinite sequence number sorts after, all
+        # of the entries with the value
+        if lower is None:
+            start = (0, 0)
+        elif include_lower:
+            start = self._locate((lower,))
+        else:
+            start = self._locate((lower, float('inf')), right=True)
+
+        if upper is None:
+            end = (len(self._chunks), 0)
+        elif include_upper:
+            end = self._locate((upper, float('inf')), right=True)
+        else:
+            end = self._locate((upper,))
+
+        return self._get_objs(start, end)
+
+    def prefix(self, prefix):
+        """ Get the instances whose values start with a prefix
+
+        Args:
+            prefix (:obj:`str`): prefix
+
+        Returns:
+            :obj:`list` of :obj:`Model`: instances, sorted by their values
+        """
+        objs = []
+        for key, _, ref in self._iter_entries(self._locate((prefix,))):
+            if not key.startswith(prefix):
+                break
+            obj = ref()
+            if obj is not None:
+                objs.append(obj)
+        return objs
+
+
+def depends_on(*attr_names):
+    """ Decorator which declares the attributes on which a computed attribute (a zero-argument method or a
+    property) depends
+
+    The :obj:`Manager` and :obj:`ObjectStore` indices of computed attributes in :obj:`Meta.indexed_attrs_tuples`
+    are updated when any of these attributes is set. Computed attributes without declared dependencies are
+    updated when any attribute of the instance is set. For properties, apply the decorator below
+    :obj:`property`, e.g.::
+
+        @property
+        @depends_on('name')
+        def normalized_name(self):
+            return self.name.lower()
+
+    Computed attributes which depend on attributes of related objects must declare these dependencies as paths
+    of the name of a related attribute and the name of an attribute of the related objects, separated by `__`
+    (e.g., `'species__id'`). Such computed attributes are updated when the related attribute is set, and when the
+    attribute of any of the related objects is set.
+
+    Args:
+        *attr_names (:obj:`str`): names of the attributes of the instance, or paths to the attributes of related
+            objects, on which the computed attribute depends
+
+    Returns:
+        :obj:`types.FunctionType`: decorator
+    """
+    def decorator(func):
+        func._obj_tables_depends_on = attr_names
+        return func
+    return decorator
+
+
 class Manager(object):
     """ Enable O(1) dictionary-based searching of a Model's instances
 
@@ -530,8 +1168,35 @@ class Manager(object):
     * O(1) get operations for :obj:`Model` instances indexed by a indexed attribute tuple
     * O(1) :obj:`Model` instance insert and update operations
 
+    In addition, the values of the attributes in the :obj:`ordered_indexes` attribute of a :obj:`Model`'s
+    :obj:`Meta` class are kept in sorted indexes (:obj:`OrderedIndex`), which :obj:`filter` uses for range and
+    prefix queries with O(log n + k) cost, where k is the number of matches. Inserting, updating, or deleting
+    an instance costs O(log n) comparisons per ordered index, plus moving a bounded number of entries (see
+    :obj:`OrderedIndex`).
+
+    Indexed attribute tuples can also contain computed attributes: zero-argument methods or properties of the
+    :obj:`Model`. Their values are computed when instances are inserted, cached in the indices, and recomputed
+    when an attribute which they depend on, including an attribute of a related object, is set (see
+    :obj:`depends_on`).
+
+    Once an instance has been inserted into the indices, :obj:`Model.__setattr__` notifies the :obj:`Manager`
+    whenever an indexed attribute of the instance is set, and the :obj:`Manager` updates the entries of the
+    indices which contain the attribute. Within :obj:`batch`, these updates are deferred and each changed
+    instance is re-indexed once at the end of the batch.
+
     Attributes:
         cls (:obj:`class`): the :obj:`Model` class which is being managed
+        _attr_tuples_by_name (:obj:`dict`): dictionary which maps the name of each indexed attribute, and of each
+            attribute on which an indexed computed attribute depends, to the indexed attribute tuples which
+            must be updated when it is set
+        _any_attr_tuples (:obj:`list` of :obj:`tuple`): indexed attribute tuples which contain computed attributes
+            without declared dependencies, which must be updated when any attribute is set
+        _batch_depth (:obj:`int`): number of active :obj:`batch` contexts
+        _batched_instances (:obj:`dict`): instances whose indexed attributes have been changed during the current
+            batch
+        _indexed (:obj:`bool`): whether the :obj:`Model` has any indexed attribute tuples or ordered indexes
+        _ordered_indexes (:obj:`dict` mapping :obj:`str` to :obj:`OrderedIndex`): dictionary which maps the name
+            of each attribute in :obj:`Meta.ordered_indexes` to its sorted index
         _new_instances (:obj:`WeakSet`): set of all new instances of :obj:`cls` that have not been indexed,
             stored as weakrefs, so :obj:`Model`'s that are otherwise unused can be garbage collected
         _index_dicts (:obj:`dict` mapping :obj:`tuple` to :obj:`WeakSet`): indices that enable
@@ -543,70 +1208,238 @@ class Manager(object):
         num_ops_since_gc (:obj:`int`): number of operations since the last gc of weaksets
     """
     # todo: learn how to describe dict -> dict -> X in Sphinx
-    # todo: index computed attributes which don't take arguments
-    # implement by modifying _get_attr_tuple_vals & using inspect.getcallargs()
-    # todo: make Managers local, rather than global, by associating them with a Model collection, and
-    # searching them through the collection; associate with a collection via a weakref so that when
-    # the collection goes out of scope the Managers are gc'ed
+    # collection-local indices are provided by :obj:`ObjectStore`
 
     # number of Manager operations between calls to _gc_weaksets
     # todo: make this value configurable
     GC_PERIOD = 1000
 
+    # dictionary which maps the names of attributes to weak references to the :obj:`Model`\ s whose computed
+    # attributes depend on these attributes of related objects, and to the names of the related attributes
+    _related_dependencies = {}
+
     def __init__(self, cls):
         """
         Args:
             cls (:obj:`class`): the :obj:`Model` class which is being managed
         """
         self.cls = cls
-        if self.cls.Meta.indexed_attrs_tuples:
+        self._attr_tuples_by_name, self._any_attr_tuples = self.get_attr_tuple_dependencies(
+            cls, cls.Meta.indexed_attrs_tuples)
+        self._register_related_dependencies(cls, self._attr_tuples_by_name)
+        self._batch_depth = 0
+        self._batched_instances = {}
+        self._ordered_indexes = {}
+        self._indexed = bool(self.cls.Meta.indexed_attrs_tuples or self.cls.Meta.ordered_indexes)
+        if self._indexed:
             self._new_instances = WeakSet()
             self._create_indices()
             self.num_ops_since_gc = 0
+            for attr_name in self.cls.Meta.ordered_indexes:
+                self._ordered_indexes[attr_name] = OrderedIndex(attr_name)
+                self._attr_tuples_by_name.setdefault(attr_name, [])
 
-    def _check_model(self, model_obj, method):
-        """ Verify :obj:`model_obj`'s :obj:`Model`
+    @staticmethod
+    def get_attr_tuple_dependencies(cls, attr_tuples):
+        """ Get the indexed attribute tuples which must be updated when each attribute of a :obj:`Model` is set
 
         Args:
-            model_obj (:obj:`Model`): a :obj:`Model` instance
-            method (:obj:`str`): the name of the method requesting the check
+            cls (:obj:`type`): :obj:`Model`
+            attr_tuples (:obj:`list` of :obj:`tuple`): indexed attribute tuples
+
+        Returns:
+            :obj:`tuple`:
+
+                * :obj:`dict`: dictionary which maps the names of attributes to the tuples which depend on them
+                * :obj:`list` of :obj:`tuple`: tuples which contain computed attributes without declared
+                  dependencies, and which therefore depend on every attribute
+        """
+        attr_tuples_by_name = {}
+        any_attr_tuples = []
+        for attr_tuple in attr_tuples:
+            for attr_name in attr_tuple:
+                func = ModelMeta.get_computed_attribute_function(inspect.getattr_static(cls, attr_name, None))
+                if func is None:
+                    dependencies = (attr_name, )
+                else:
+                    dependencies = getattr(func, '_obj_tables_depends_on', None)
+                    if dependencies is None:
+                        if attr_tuple not in any_attr_tuples:
+                            any_attr_tuples.append(attr_tuple)
+                        continue
+                for dependency in dependencies:
+                    names = [dependency]
+                    if '__' in dependency:
+                        names.append(Manager._get_related_dependency(cls, attr_name, dependency)[0])
+                    for name in names:
+                        dependent_attr_tuples = attr_tuples_by_name.setdefault(name, [])
+                        if attr_tuple not in dependent_attr_tuples:
+                            dependent_attr_tuples.append(attr_tuple)
+        return attr_tuples_by_name, any_attr_tuples
+
+    @staticmethod
+    def _get_related_dependency(cls, attr_name, path):
+        """ Get the related attribute and the attribute of the related objects of a dependency of a computed
+        attribute on related objects
+
+        Args:
+            cls (:obj:`type`): :obj:`Model`
+            attr_name (:obj:`str`): name of the computed attribute
+            path (:obj:`str`): dependency, e.g. `'species__id'`
+
+        Returns:
+            :obj:`tuple` of :obj:`str`: name of the related attribute and name of the attribute of the related
+                objects
 
         Raises:
-            :obj:`ValueError`: if :obj:`model_obj`'s type is not handled by this :obj:`Manager`
-            :obj:`ValueError`: if :obj:`model_obj`'s type does not have any indexed attribute tuples
+            :obj:`ValueError`: if the dependency is not the name of a related attribute and the name of an
+                attribute, separated by `__`
         """
-        if not type(model_obj) is self.cls:
-            raise ValueError("{}(): The '{}' Manager does not process '{}' objects".format(
-                method, self.cls.__name__, type(model_obj).__name__))
-        if not self.cls.Meta.indexed_attrs_tuples:
-            raise ValueError("{}(): The '{}' Manager does not have any indexed attribute tuples".format(
-                method, self.cls.__name__))
+        names = path.split('__')
+        if len(names) != 2 or not all(names) or (names[0] in cls.Meta.attributes and
+                                                  not isinstance(cls.Meta.attributes[names[0]], RelatedAttribute)):
+            raise ValueError("Dependency '{}' of '{}' of '{}' must be the name of a related attribute and the name "
+                             "of an attribute of the related objects, separated by '__'".format(
+                                 path, attr_name, cls.__name__))
+        return tuple(names)
 
-    def _create_indices(self):
-        """ Create dicts needed to manage indices on attribute tuples
+    @staticmethod
+    def _register_related_dependencies(cls, attr_tuples_by_name):
+        """ Register the dependencies of the computed attributes of a :obj:`Model` on the attributes of related
+        objects, so that the indices of the computed attributes are updated when the attributes of the related
+        objects are set
 
-        The references to :obj:`Model` instances are stored as weakrefs in a :obj:`WeakKeyDictionary`,
-        so that :obj:`Model`'s which are otherwise unused get garbage collected.
+        Args:
+            cls (:obj:`type`): :obj:`Model`
+            attr_tuples_by_name (:obj:`dict`): dictionary which maps the names of attributes, and paths to the
+                attributes of related objects, to the tuples which depend on them
         """
-        self._index_dicts = {}
-        # for each indexed_attrs, create a dict
-        for indexed_attrs in self.cls.Meta.indexed_attrs_tuples:
-            self._index_dicts[indexed_attrs] = {}
+        cls_ref = weakref.ref(cls)
+        for path in attr_tuples_by_name:
+            if '__' in path:
+                related_attr_name, attr_name = path.split('__')
+                dependencies = Manager._related_dependencies.setdefault(attr_name, [])
+                # drop the dependencies of models which have been garbage collected
+                dependencies[:] = [dependency for dependency in dependencies if dependency[0]() is not None]
+                dependencies.append((cls_ref, related_attr_name))
 
-        # A reverse index from Model instances to index keys enables updates of instances that
-        # are already indexed. Update is performed by deleting and inserting.
-        self._reverse_index = WeakKeyDictionary()
+    @staticmethod
+    def _update_related_dependents(related_obj, attr_name):
+        """ Update the entries of the indices of the computed attributes which depend on an attribute of a related
+        object, which has been set
 
-    def _dump_index_dicts(self, file=None):
-        """ Dump the index dictionaries for debugging
+        Called by :obj:`Model.__setattr__`.
 
         Args:
-            file (:obj:`object`, optitonal): an object with a :obj:`write(string)` method
+            related_obj (:obj:`Model`): related object
+            attr_name (:obj:`str`): name of the attribute of the related object which has been set
         """
-        # gc before printing to produce consistent data
-        self._gc_weaksets()
-        print("Dicts for '{}':".format(self.cls.__name__), file=file)
-        for attr_tuple, d in self._index_dicts.items():
+        for cls_ref, related_attr_name in Manager._related_dependencies[attr_name]:
+            cls = cls_ref()
+            if cls is None:
+                continue
+            path = related_attr_name + '__' + attr_name
+            stores = ObjectStore.get_registered_stores(cls)
+            for obj in Manager._get_related_dependents(cls, related_attr_name, related_obj):
+                cls.objects._update_attr(obj, path)
+                for store in stores:
+                    store._update_attr(obj, path)
+
+    @staticmethod
+    def _get_related_dependents(cls, related_attr_name, related_obj):
+        """ Get the instances of a :obj:`Model` which are related to an object through a related attribute
+
+        Args:
+            cls (:obj:`type`): :obj:`Model`
+            related_attr_name (:obj:`str`): name of the related attribute of :obj:`cls`
+            related_obj (:obj:`Model`): related object
+
+        Returns:
+            :obj:`list` of :obj:`Model`: instances of :obj:`cls` whose related attribute contains
+                :obj:`related_obj`
+        """
+        attr = cls.Meta.attributes.get(related_attr_name, None)
+        if attr is not None:
+            if not isinstance(attr.related_class, type) or not isinstance(related_obj, attr.related_class) \
+                    or not attr.related_name:
+                return []
+            reverse_attr_name = attr.related_name
+        else:
+            attr = cls.Meta.related_attributes.get(related_attr_name, None)
+            if attr is None or not isinstance(related_obj, attr.primary_class):
+                return []
+            reverse_attr_name = attr.name
+
+        value = getattr(related_obj, reverse_attr_name)
+        if value is None:
+            return []
+        if isinstance(value, Model):
+            value = [value]
+        return [obj for obj in value if obj.__class__ is cls]
+
+    @staticmethod
+    def _get_dependent_attr_tuples(cls, attr_tuples_by_name, any_attr_tuples, attr_name):
+        """ Get the indexed attribute tuples which must be updated when an attribute is set
+
+        Args:
+            cls (:obj:`type`): :obj:`Model`
+            attr_tuples_by_name (:obj:`dict`): dictionary which maps the names of attributes to the tuples
+                which depend on them
+            any_attr_tuples (:obj:`list` of :obj:`tuple`): tuples which depend on every attribute
+            attr_name (:obj:`str`): name of the attribute which has been set
+
+        Returns:
+            :obj:`list` of :obj:`tuple`: indexed attribute tuples
+        """
+        attr_tuples = attr_tuples_by_name.get(attr_name, [])
+        if any_attr_tuples and (attr_name in cls.Meta.attributes or attr_name in cls.Meta.related_attributes):
+            attr_tuples = attr_tuples + [attr_tuple for attr_tuple in any_attr_tuples
+                                         if attr_tuple not in attr_tuples]
+        return attr_tuples
+
+    def _check_model(self, model_obj, method):
+        """ Verify :obj:`model_obj`'s :obj:`Model`
+
+        Args:
+            model_obj (:obj:`Model`): a :obj:`Model` instance
+            method (:obj:`str`): the name of the method requesting the check
+
+        Raises:
+            :obj:`ValueError`: if :obj:`model_obj`'s type is not handled by this :obj:`Manager`
+            :obj:`ValueError`: if :obj:`model_obj`'s type does not have any indexed attribute tuples
+        """
+        if not type(model_obj) is self.cls:
+            raise ValueError("{}(): The '{}' Manager does not process '{}' objects".format(
+                method, self.cls.__name__, type(model_obj).__name__))
+        if not self._indexed:
+            raise ValueError("{}(): The '{}' Manager does not have any indexed attribute tuples".format(
+                method, self.cls.__name__))
+
+    def _create_indices(self):
+        """ Create dicts needed to manage indices on attribute tuples
+
+        The references to :obj:`Model` instances are stored as weakrefs in a :obj:`WeakKeyDictionary`,
+        so that :obj:`Model`'s which are otherwise unused get garbage collected.
+        """
+        self._index_dicts = {}
+        # for each indexed_attrs, create a dict
+        for indexed_attrs in self.cls.Meta.indexed_attrs_tuples:
+            self._index_dicts[indexed_attrs] = {}
+
+        # A reverse index from Model instances to index keys enables updates of instances that
+        # are already indexed. Update is performed by deleting and inserting.
+        self._reverse_index = WeakKeyDictionary()
+
+    def _dump_index_dicts(self, file=None):
+        """ Dump the index dictionaries for debugging
+
+        Args:
+            file (:obj:`object`, optitonal): an object with a :obj:`write(string)` method
+        """
+        # gc before printing to produce consistent data
+        self._gc_weaksets()
+        print("Dicts for '{}':".format(self.cls.__name__), file=file)
+        for attr_tuple, d in self._index_dicts.items():
             print('\tindexed attr tuple:', attr_tuple, file=file)
             for k, v in d.items():
                 print('\t\tk,v', k, {id(obj_tables)
@@ -627,9 +1460,16 @@ class Manager(object):
             attr_tuple (:obj:`tuple`): a tuple of attribute names in :obj:`model_obj`
 
         Returns:
-            :obj:`tuple`: :obj:`model_obj`'s values for the attributes in :obj:`attr_tuple`
+            :obj:`tuple`: :obj:`model_obj`'s values for the attributes in :obj:`attr_tuple`; the values of
+                computed attributes which are methods are the return values of the methods
         """
-        return tuple(map(lambda name: getattr(model_obj, name), attr_tuple))
+        vals = []
+        for name in attr_tuple:
+            val = getattr(model_obj, name)
+            if isinstance(val, types.MethodType) and val.__self__ is model_obj:
+                val = val()
+            vals.append(val)
+        return tuple(vals)
 
     @staticmethod
     def _get_hashable_values(values):
@@ -716,11 +1556,25 @@ class Manager(object):
         Args:
             model_obj (:obj:`Model`): a new :obj:`Model` instance
         """
-        if self.cls.Meta.indexed_attrs_tuples:
+        if self._indexed:
             self._check_model(model_obj, '_register_obj')
             self._run_gc_weaksets()
             self._new_instances.add(model_obj)
 
+    def _register_objs(self, model_objs):
+        """ Register multiple new :obj:`Model` instances
+
+        Called by :obj:`ModelInitializer.create()`. Do nothing if the :obj:`Model` has no indexed attribute tuples.
+
+        Args:
+            model_objs (:obj:`list` of :obj:`Model`): new :obj:`Model` instances
+        """
+        if self._indexed:
+            for model_obj in model_objs:
+                self._check_model(model_obj, '_register_objs')
+            self._run_gc_weaksets()
+            self._new_instances.update(model_objs)
+
     def _update(self, model_obj):
         """ Update the indices for :obj:`model_obj`, whose indexed attribute have been updated
 
@@ -756,6 +1610,8 @@ class Manager(object):
                 # gc'ed by _gc_weaksets.
                 if 0 == len(self._index_dicts[indexed_attr_tuple][vals]):
                     del self._index_dicts[indexed_attr_tuple][vals]
+        for ordered_index in self._ordered_indexes.values():
+            ordered_index.discard(model_obj)
         del self._reverse_index[model_obj]
 
     def _insert_new(self, model_obj):
@@ -774,30 +1630,110 @@ class Manager(object):
         self._insert(model_obj)
         self._new_instances.remove(model_obj)
 
-    def _insert(self, model_obj):
+    def _insert(self, model_obj, insert_ordered=True):
         """ Insert :obj:`model_obj` into the indices that are used to search on indexed attribute tuples
 
-        Costs O(I) where I is the number of indexed attribute tuples for the :obj:`Model`.
+        Costs O(I) where I is the number of indexed attribute tuples for the :obj:`Model`, plus O(log n)
+        comparisons per ordered index (see :obj:`OrderedIndex`).
 
         Args:
             model_obj (:obj:`Model`): a :obj:`Model` instance
+            insert_ordered (:obj:`bool`, optional): if :obj:`False`, do not insert :obj:`model_obj` into the
+                ordered indexes (used by :obj:`insert_all_new` to insert new instances in bulk)
         """
         self._check_model(model_obj, '_insert')
         self._run_gc_weaksets()
         cls = self.cls
 
+        d = {}
         for indexed_attr_tuple in cls.Meta.indexed_attrs_tuples:
             vals = Manager._hashable_attr_tup_vals(
                 model_obj, indexed_attr_tuple)
             if vals not in self._index_dicts[indexed_attr_tuple]:
                 self._index_dicts[indexed_attr_tuple][vals] = WeakSet()
             self._index_dicts[indexed_attr_tuple][vals].add(model_obj)
-
-        d = {}
-        for indexed_attr_tuple in cls.Meta.indexed_attrs_tuples:
-            d[indexed_attr_tuple] = Manager._hashable_attr_tup_vals(
-                model_obj, indexed_attr_tuple)
+            d[indexed_attr_tuple] = vals
         self._reverse_index[model_obj] = d
+        if insert_ordered:
+            for ordered_index in self._ordered_indexes.values():
+                ordered_index.add(model_obj)
+
+    def _update_attr(self, model_obj, attr_name):
+        """ Update the entries of the indices for an indexed attribute of :obj:`model_obj`, which has been set
+
+        Called by :obj:`Model.__setattr__`. Do nothing if :obj:`model_obj` has not been inserted into the indices.
+        Costs O(I) where I is the number of indexed attribute tuples which contain the attribute.
+
+        Args:
+            model_obj (:obj:`Model`): a :obj:`Model` instance
+            attr_name (:obj:`str`): name of the attribute which has been set
+        """
+        keys = self._reverse_index.get(model_obj, None)
+        if keys is None:
+            return
+
+        indexed_attr_tuples = self._get_dependent_attr_tuples(self.cls, self._attr_tuples_by_name,
+                                                              self._any_attr_tuples, attr_name)
+        if not indexed_attr_tuples and attr_name not in self._ordered_indexes:
+            return
+
+        if self._batch_depth:
+            self._batched_instances[model_obj] = None
+            return
+
+        for indexed_attr_tuple in indexed_attr_tuples:
+            self._update_attr_tuple(model_obj, keys, indexed_attr_tuple)
+        ordered_index = self._ordered_indexes.get(attr_name, None)
+        if ordered_index is not None:
+            ordered_index.update(model_obj)
+
+    def _update_attr_tuple(self, model_obj, keys, indexed_attr_tuple):
+        """ Update the entry of the index of an attribute tuple for :obj:`model_obj`
+
+        Args:
+            model_obj (:obj:`Model`): a :obj:`Model` instance
+            keys (:obj:`dict`): reverse index entry for :obj:`model_obj`
+            indexed_attr_tuple (:obj:`tuple`): indexed attribute tuple
+        """
+        old_vals = keys[indexed_attr_tuple]
+        vals = Manager._hashable_attr_tup_vals(model_obj, indexed_attr_tuple)
+        if vals == old_vals:
+            return
+
+        index_dict = self._index_dicts[indexed_attr_tuple]
+        old_instances = index_dict.get(old_vals, None)
+        if old_instances is not None:
+            old_instances.discard(model_obj)
+            if 0 == len(old_instances):
+                del index_dict[old_vals]
+
+        if vals not in index_dict:
+            index_dict[vals] = WeakSet()
+        index_dict[vals].add(model_obj)
+        keys[indexed_attr_tuple] = vals
+
+    @contextlib.contextmanager
+    def batch(self):
+        """ Context in which changes to indexed attributes are batched
+
+        The changed instances are re-indexed once when the outermost batch exits, rather than each time one
+        of their indexed attributes is set.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth = max(self._batch_depth - 1, 0)
+            if not self._batch_depth:
+                batched_instances = self._batched_instances
+                self._batched_instances = {}
+                for model_obj in batched_instances:
+                    keys = self._reverse_index.get(model_obj, None)
+                    if keys is not None:
+                        for indexed_attr_tuple in self.cls.Meta.indexed_attrs_tuples:
+                            self._update_attr_tuple(model_obj, keys, indexed_attr_tuple)
+                        for ordered_index in self._ordered_indexes.values():
+                            ordered_index.update(model_obj)
 
     def _run_gc_weaksets(self):
         """ Periodically garbage collect empty WeakSets
@@ -825,6 +1761,8 @@ class Manager(object):
                 if not weakset:
                     del self._index_dicts[indexed_attr_tuple][attr_val]
                     num += 1
+        for ordered_index in self._ordered_indexes.values():
+            ordered_index._compact_if_sparse()
         return num
 
     # Public Manager() methods follow
@@ -845,7 +1783,7 @@ class Manager(object):
             :obj:`list` of :obj:`Model`: a list of all instances of the managed :obj:`Model`
                 or :obj:`None` if the :obj:`Model` is not indexed
         """
-        if self.cls.Meta.indexed_attrs_tuples:
+        if self._indexed:
             self._run_gc_weaksets()
             # return list of strong refs, so keys in WeakKeyDictionary cannot be changed by gc
             # while iterating over them
@@ -853,19 +1791,37 @@ class Manager(object):
         else:
             return None
 
+    def bulk_create(self, rows, attr_names=None, comments=None):
+        """ Efficiently create many instances of this :obj:`Manager`'s :obj:`Model`
+
+        See :obj:`Model.bulk_create`.
+
+        Args:
+            rows (:obj:`list` of :obj:`dict`, :obj:`list` of :obj:`tuple`, or :obj:`dict` of :obj:`str`, :obj:`list`):
+                values of the attributes of the instances
+            attr_names (:obj:`list` of :obj:`str`, optional): names of the attributes of the values in each tuple
+                of :obj:`rows`
+            comments (:obj:`list` of :obj:`list` of :obj:`str`, optional): comments about each instance
+
+        Returns:
+            :obj:`list` of :obj:`Model`: new instances
+        """
+        return self.cls.bulk_create(rows, attr_names=attr_names, comments=comments)
+
     def upsert(self, model_obj):
         """ Update the indices for :obj:`model_obj` that are used to search on indexed attribute tuples
 
         :obj:`Upsert` means update or insert. Update the indices if :obj:`model_obj` is already stored, otherwise
-        insert :obj:`model_obj`. Users of :obj:`Manager` are responsible for calling this method if :obj:`model_obj`
-        changes.
+        insert :obj:`model_obj`. Changes to the indexed attributes of stored instances are applied automatically,
+        except for in-place changes to the :obj:`RelatedManager`\ s of indexed \*-to-many attributes, which require
+        this method to be called.
 
         Costs O(I) where I is the number of indexed attribute tuples for the :obj:`Model`.
 
         Args:
             model_obj (:obj:`Model`): a :obj:`Model` instance
         """
-        if self.cls.Meta.indexed_attrs_tuples:
+        if self._indexed:
             if model_obj in self._new_instances:
                 self._insert_new(model_obj)
             else:
@@ -874,22 +1830,25 @@ class Manager(object):
     def upsert_all(self):
         """ Upsert the indices for all of this :obj:`Manager`'s :obj:`Model`'s
         """
-        if self.cls.Meta.indexed_attrs_tuples:
+        if self._indexed:
             for model_obj in self.all():
                 self.upsert(model_obj)
 
     def insert_all_new(self):
         """ Insert all new instances of this :obj:`Manager`'s :obj:`Model`'s into the search indices
         """
-        if self.cls.Meta.indexed_attrs_tuples:
-            for model_obj in self._new_instances:
-                self._insert(model_obj)
+        if self._indexed:
+            new_instances = list(self._new_instances)
+            for model_obj in new_instances:
+                self._insert(model_obj, insert_ordered=False)
+            for ordered_index in self._ordered_indexes.values():
+                ordered_index.add_all(new_instances)
             self._new_instances.clear()
 
     def clear_new_instances(self):
         """ Clear the set of new instances that have not been inserted
         """
-        if self.cls.Meta.indexed_attrs_tuples:
+        if self._indexed:
             self._new_instances.clear()
 
     def get(self, **kwargs):
@@ -960,19 +1919,2502 @@ class Manager(object):
                                                                            kwargs))
         return rv[0]
 
+    # lookups supported by :obj:`filter`
+    ORDERED_LOOKUPS = ('exact', 'gt', 'gte', 'lt', 'lte', 'between', 'prefix')
+
+    def filter(self, **kwargs):
+        """ Get the :obj:`Model` instances whose attributes in :obj:`Meta.ordered_indexes` satisfy range
+        and/or prefix conditions
+
+        Each key of :obj:`kwargs` is the name of an attribute with an ordered index, optionally followed by
+        `__` and one of the following lookups:
+
+        * `exact` (default): value is equal to the argument
+        * `gt`, `gte`, `lt`, `lte`: value is greater than, greater than or equal to, less than, or less than or
+          equal to the argument
+        * `between`: value is between the two values of the argument, inclusive
+        * `prefix`: (string) value starts with the argument
+
+        For example, :obj:`Parameter.objects.filter(value__between=(1., 2.), id__prefix='k_')`. Each condition
+        costs O(log n + k), where n is the number of indexed instances and k is the number of instances which
+        satisfy the condition. Only instances which have been inserted into the indices (e.g., with
+        :obj:`insert_all_new`) are found; instances whose values are :obj:`None` are never found.
+
+        Args:
+            **kwargs: keyword args mapping from attribute names and lookups to values
+
+        Returns:
+            :obj:`list` of :obj:`Model`: instances which satisfy all of the conditions, sorted by the value of
+                the attribute of the first condition; otherwise :obj:`None`, indicating no match
+
+        Raises:
+            :obj:`ValueError`: if no arguments are provided, an attribute does not have an ordered index, or the
+                argument of a :obj:`between` lookup is not a pair of values
+        """
+        cls = self.cls
+
+        if 0 == len(kwargs.keys()):
+            raise ValueError("No arguments provided in filter() on '{}'".format(cls.__name__))
+
+        result = None
+        for key, value in kwargs.items():
+            attr_name, _, lookup = key.rpartition('__')
+            if not attr_name or lookup not in self.ORDERED_LOOKUPS:
+                attr_name = key
+                lookup = 'exact'
+
+            ordered_index = self._ordered_indexes.get(attr_name, None)
+            if ordered_index is None:
+                raise ValueError("'{}' does not have an ordered index in '{}'".format(attr_name, cls.__name__))
+            if value is None:
+                raise ValueError("The argument of '{}' cannot be None".format(key))
+
+            if lookup == 'exact':
+                objs = ordered_index.range(value, value)
+            elif lookup == 'gt':
+                objs = ordered_index.range(lower=value, include_lower=False)
+            elif lookup == 'gte':
+                objs = ordered_index.range(lower=value)
+            elif lookup == 'lt':
+                objs = ordered_index.range(upper=value, include_upper=False)
+            elif lookup == 'lte':
+                objs = ordered_index.range(upper=value)
+            elif lookup == 'between':
+                if not isinstance(value, (tuple, list)) or len(value) != 2:
+                    raise ValueError("The argument of '{}' must be a pair of values".format(key))
+                objs = ordered_index.range(value[0], value[1])
+            else:
+                objs = ordered_index.prefix(value)
+
+            if result is None:
+                result = objs
+            else:
+                matches = set(objs)
+                result = [obj for obj in result if obj in matches]
+
+            if not result:
+                return None
+
+        return result
+
+
+class ObjectStore(object):
+    """ Collection-scoped store of :obj:`Model` instances which enables O(1) dictionary-based searching of them
+
+    In contrast to the :obj:`Manager` of each :obj:`Model`, which indexes all live instances of the model in the
+    process, an :obj:`ObjectStore` only indexes the objects which are added to it (e.g., the objects decoded by a
+    reader, see the :obj:`object_store` argument of :obj:`obj_tables.io.Reader.run`). Therefore, multiple
+    collections of objects can be loaded and searched independently. Objects are held by strong references,
+    so the store does not need to garbage collect weak references, and all of the objects and indices of a
+    store are released together by :obj:`release` (or at the end of a :obj:`with` block).
+
+    For each model, the store indexes the primary attribute (if the model has one) and each tuple
+    of attributes in :obj:`Model.Meta.indexed_attrs_tuples`. Stores register themselves for the models of
+    the objects which they contain. Whenever an attribute of an instance of a model is set,
+    :obj:`Model.__setattr__` notifies the live stores which are registered for the model, and the stores which
+    contain the instance update the entries of their indices which contain the attribute. Instances of models
+    which are not in any store do not pay for this. Within :obj:`batch`, these updates are deferred and each
+    changed object is re-indexed once at the end of the batch.
+
+    The store also records which of its objects have been added or changed, and which of their attributes
+    have been set or whose related objects have been added or removed (by the methods of
+    :obj:`RelatedManager`). :obj:`Validator.validate_incremental` uses this record to only revalidate the
+    objects which have changed since the store was last validated.
+
+    Attributes:
+        _objects (:obj:`dict`): dictionary which maps each model to a dictionary whose keys are the
+            instances of the model in the store, in the order in which they were added
+        _index_dicts (:obj:`dict`): dictionary which maps each model to a dictionary which maps each indexed
+            tuple of attribute names to a dictionary which maps the values of the attributes to
+            dictionaries whose keys are the matching instances
+        _reverse_index (:obj:`dict`): dictionary which maps each object to a dictionary which maps each indexed
+            tuple of attribute names of its model to its values of the attributes
+        _attr_tuples_by_name (:obj:`dict`): dictionary which maps each model to a dictionary which maps the name
+            of each attribute to the indexed tuples of attribute names which depend on it
+            (see :obj:`Manager.get_attr_tuple_dependencies`)
+        _any_attr_tuples (:obj:`dict`): dictionary which maps each model to the indexed tuples of attribute names
+            which depend on every attribute
+        _batch_depth (:obj:`int`): number of active :obj:`batch` contexts
+        _batched_objects (:obj:`dict`): objects whose indexed attributes have been changed during the current batch
+        _dirty (:obj:`dict`): dictionary which maps each object which has been added or changed to the set of the
+            names of its changed attributes, or to :obj:`None` if the object has been added
+        _removed (:obj:`dict`): objects which have been removed from the store since the record of changes was
+            last cleared
+        _unique_index (:obj:`dict`): dictionary which maps each model and each tuple of attribute names whose
+            values must be unique to a dictionary which maps the values of the attributes to dictionaries whose
+            keys are the matching objects, or :obj:`None` if the index hasn't been built
+            (see :obj:`Validator.validate_incremental`)
+        _unique_keys (:obj:`dict`): reverse index which maps each object to a dictionary which maps the keys of
+            :obj:`_unique_index` to the values of the attributes of the object
+        _ref (:obj:`weakref.ref`): weak reference to the store, which is registered for the models of its objects
+    """
+
+    # dictionary which maps each model to weak references to the stores which contain its instances, which are
+    # notified of changes to the attributes of the instances; the tuples are replaced, rather than modified, so
+    # they can be read without holding :obj:`_registry_lock`
+    _stores_by_model = {}
+    _registry_lock = threading.RLock()
+
+    def __init__(self, objs=None):
+        """
+        Args:
+            objs (:obj:`list` of :obj:`Model`, optional): objects to add to the store
+        """
+        self._objects = {}
+        self._index_dicts = {}
+        self._reverse_index = {}
+        self._attr_tuples_by_name = {}
+        self._any_attr_tuples = {}
+        self._batch_depth = 0
+        self._batched_objects = {}
+        self._dirty = {}
+        self._removed = {}
+        self._unique_index = None
+        self._unique_keys = {}
+        self._ref = weakref.ref(self, ObjectStore._unregister)
+        if objs:
+            self.add_all(objs)
+
+    def __enter__(self):
+        """ Enter context """
+        return self
+
+    def __exit__(self, type, value, traceback):
+        """ Exit context and release the objects of the store """
+        self.release()
+
+    def __contains__(self, obj):
+        """ Determine whether an object is in the store
+
+        Args:
+            obj (:obj:`Model`): object
+
+        Returns:
+            :obj:`bool`: :obj:`True` if :obj:`obj` is in the store
+        """
+        return obj in self._reverse_index
+
+    def __len__(self):
+        """ Get the number of objects in the store
+
+        Returns:
+            :obj:`int`: number of objects in the store
+        """
+        return len(self._reverse_index)
+
+    @staticmethod
+    def get_indexed_attrs_tuples(cls):
+        """ Get the tuples of attributes of a model which are indexed by object stores
+
+        Args:
+            cls (:obj:`type`): model
+
+        Returns:
+            :obj:`list` of :obj:`tuple` of :obj:`str`: tuples of names of indexed attributes, each sorted by name
+        """
+        attrs_tuples = []
+        if cls.Meta.primary_attribute:
+            attrs_tuples.append((cls.Meta.primary_attribute.name, ))
+        for attrs_tuple in cls.Meta.indexed_attrs_tuples:
+            if attrs_tuple not in attrs_tuples:
+                attrs_tuples.append(attrs_tuple)
+        return attrs_tuples
+
+    def add(self, obj):
+        """ Add an object to the store
+
+        Costs O(I) where I is the number of indexed attribute tuples of the model of the object.
+
+        Args:
+            obj (:obj:`Model`): object
+
+        Returns:
+            :obj:`bool`: :obj:`True` if the object was added, or :obj:`False` if the object was already in the store
+        """
+        if obj in self._reverse_index:
+            return False
+
+        cls = obj.__class__
+        model_objects = self._objects.get(cls, None)
+        if model_objects is None:
+            model_objects = self._objects[cls] = {}
+            attrs_tuples = self.get_indexed_attrs_tuples(cls)
+            self._index_dicts[cls] = {attrs_tuple: {} for attrs_tuple in attrs_tuples}
+            self._attr_tuples_by_name[cls], self._any_attr_tuples[cls] = Manager.get_attr_tuple_dependencies(
+                cls, attrs_tuples)
+            self._register(cls)
+        model_objects[obj] = None
+        self._insert(obj)
+        self._dirty[obj] = None
+        return True
+
+    def add_all(self, objs, get_related=False):
+        """ Add objects to the store
+
+        Args:
+            objs (:obj:`list` of :obj:`Model` or :obj:`dict` that maps :obj:`type` to :obj:`list` of :obj:`Model`):
+                objects
+            get_related (:obj:`bool`, optional): if :obj:`True`, also add all of the objects which are related
+                to the objects
+
+        Returns:
+            :obj:`int`: number of objects added to the store
+        """
+        if isinstance(objs, dict):
+            objs = list(chain.from_iterable(objs.values()))
+        if get_related:
+            objs = Model.get_all_related(objs)
+
+        num_added = 0
+        for obj in objs:
+            if self.add(obj):
+                num_added += 1
+        return num_added
+
+    def remove(self, obj):
+        """ Remove an object from the store
+
+        Args:
+            obj (:obj:`Model`): object
+
+        Raises:
+            :obj:`ValueError`: if the object is not in the store
+        """
+        if obj not in self._reverse_index:
+            raise ValueError("{} object is not in the store".format(obj.__class__.__name__))
+        self._delete(obj)
+        del self._objects[obj.__class__][obj]
+        self._dirty.pop(obj, None)
+        self._removed[obj] = None
+
+    def _register(self, cls):
+        """ Register the store to be notified of changes to the attributes of the instances of a model
+
+        Args:
+            cls (:obj:`type`): model
+        """
+        with ObjectStore._registry_lock:
+            refs = ObjectStore._stores_by_model.get(cls, ())
+            ObjectStore._stores_by_model[cls] = tuple(ref for ref in refs if ref() is not None) + (self._ref, )
+
+    @staticmethod
+    def _unregister(store_ref, models=None):
+        """ Unregister a store from the notifications of changes to the attributes of the instances of models
+
+        Also called when a store is garbage collected.
+
+        Args:
+            store_ref (:obj:`weakref.ref`): weak reference to the store
+            models (:obj:`list` of :obj:`type`, optional): models; if :obj:`None`, unregister the store from
+                all models
+        """
+        with ObjectStore._registry_lock:
+            stores_by_model = ObjectStore._stores_by_model
+            for cls in list(stores_by_model.keys() if models is None else models):
+                refs = tuple(ref for ref in stores_by_model.get(cls, ()) if ref is not store_ref and ref() is not None)
+                if refs:
+                    stores_by_model[cls] = refs
+                else:
+                    stores_by_model.pop(cls, None)
+
+    @staticmethod
+    def get_registered_stores(cls):
+        """ Get the live stores which contain, or have contained, instances of a model
+
+        Args:
+            cls (:obj:`type`): model
+
+        Returns:
+            :obj:`list` of :obj:`ObjectStore`: stores
+        """
+        stores = []
+        for ref in ObjectStore._stores_by_model.get(cls, ()):
+            store = ref()
+            if store is not None:
+                stores.append(store)
+        return stores
+
+    def upsert(self, obj):
+        """ Update the indices for an object whose indexed attributes may have changed, or add the object to the
+        store if it is not in the store
+
+        Args:
+            obj (:obj:`Model`): object
+        """
+        if obj in self._reverse_index:
+            self._delete(obj)
+            self._insert(obj)
+        else:
+            self.add(obj)
+
+    def upsert_all(self):
+        """ Update the indices for all of the objects in the store """
+        for obj in list(self._reverse_index.keys()):
+            self._delete(obj)
+            self._insert(obj)
+
+    def _insert(self, obj):
+        """ Insert an object into the indices of the store
+
+        Args:
+            obj (:obj:`Model`): object
+        """
+        keys = {}
+        for attrs_tuple, index in self._index_dicts[obj.__class__].items():
+            vals = Manager._hashable_attr_tup_vals(obj, attrs_tuple)
+            keys[attrs_tuple] = vals
+            matches = index.get(vals, None)
+            if matches is None:
+                matches = index[vals] = {}
+            matches[obj] = None
+        self._reverse_index[obj] = keys
+
+    def _delete(self, obj):
+        """ Delete an object from the indices of the store
+
+        Args:
+            obj (:obj:`Model`): object
+        """
+        index_dicts = self._index_dicts[obj.__class__]
+        for attrs_tuple, vals in self._reverse_index.pop(obj).items():
+            matches = index_dicts[attrs_tuple][vals]
+            del matches[obj]
+            if not matches:
+                del index_dicts[attrs_tuple][vals]
+
+    def _update_attr(self, obj, attr_name):
+        """ Record that an attribute of an object has been set, and update the entries of the indices which
+        contain the attribute
+
+        Called by :obj:`Model.__setattr__` for the stores which are registered for the model of the object, and by
+        :obj:`Manager._update_related_dependents` with paths to the attributes of related objects. Do nothing if the
+        object is not in the store.
+
+        Args:
+            obj (:obj:`Model`): object
+            attr_name (:obj:`str`): name of the attribute which has been set
+        """
+        keys = self._reverse_index.get(obj, None)
+        if keys is None:
+            return
+
+        cls = obj.__class__
+        attrs_tuples = Manager._get_dependent_attr_tuples(cls, self._attr_tuples_by_name[cls],
+                                                          self._any_attr_tuples[cls], attr_name)
+        if attr_name in cls.Meta.attributes or attr_name in cls.Meta.related_attributes:
+            self._mark_dirty(obj, attr_name)
+        if not attrs_tuples:
+            return
+
+        if self._batch_depth:
+            self._batched_objects[obj] = None
+            return
+
+        for attrs_tuple in attrs_tuples:
+            self._update_attrs_tuple(obj, keys, attrs_tuple)
+
+    def _update_attrs_tuple(self, obj, keys, attrs_tuple):
+        """ Update the entry of the index of a tuple of attributes for an object
+
+        Args:
+            obj (:obj:`Model`): object
+            keys (:obj:`dict`): reverse index entry for the object
+            attrs_tuple (:obj:`tuple`): indexed tuple of attribute names
+        """
+        old_vals = keys[attrs_tuple]
+        vals = Manager._hashable_attr_tup_vals(obj, attrs_tuple)
+        if vals == old_vals:
+            return
+
+        index = self._index_dicts[obj.__class__][attrs_tuple]
+        matches = index[old_vals]
+        del matches[obj]
+        if not matches:
+            del index[old_vals]
+
+        matches = index.get(vals, None)
+        if matches is None:
+            matches = index[vals] = {}
+        matches[obj] = None
+        keys[attrs_tuple] = vals
+
+    def _mark_dirty(self, obj, attr_name):
+        """ Record that an attribute of an object has changed
+
+        Called by :obj:`_update_attr`. Do nothing if the object
+        is not in the store.
+
+        Args:
+            obj (:obj:`Model`): object
+            attr_name (:obj:`str`): name of the attribute which has changed
+        """
+        dirty = self._dirty
+        if obj in dirty:
+            attr_names = dirty[obj]
+            if attr_names is not None:
+                attr_names.add(attr_name)
+        elif obj in self._reverse_index:
+            dirty[obj] = set([attr_name])
+
+    def get_dirty(self):
+        """ Get the objects which have been added to the store or changed since the record of changes was last
+        cleared
+
+        Returns:
+            :obj:`dict`: dictionary which maps each object which has been added or changed to the set of the names
+                of its changed attributes, or to :obj:`None` if the object has been added
+        """
+        return {obj: None if attr_names is None else set(attr_names) for obj, attr_names in self._dirty.items()}
+
+    def pop_dirty(self):
+        """ Get and clear the record of the objects which have been added, changed, or removed
+
+        Returns:
+            :obj:`tuple`:
+
+                * :obj:`dict`: dictionary which maps each object which has been added or changed to the set of the
+                  names of its changed attributes, or to :obj:`None` if the object has been added
+                * :obj:`list` of :obj:`Model`: objects which have been removed
+        """
+        dirty = self._dirty
+        removed = list(self._removed.keys())
+        self._dirty = {}
+        self._removed = {}
+        return (dirty, removed)
+
+    def clear_dirty(self):
+        """ Clear the record of the objects which have been added, changed, or removed (e.g., after all of the
+        objects in the store have been validated)
+        """
+        self._dirty = {}
+        self._removed = {}
+
+    @contextlib.contextmanager
+    def batch(self):
+        """ Context in which changes to indexed attributes are batched
+
+        The changed objects are re-indexed once when the outermost batch exits, rather than each time one
+        of their indexed attributes is set.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth = max(self._batch_depth - 1, 0)
+            if not self._batch_depth:
+                batched_objects = self._batched_objects
+                self._batched_objects = {}
+                for obj in batched_objects:
+                    keys = self._reverse_index.get(obj, None)
+                    if keys is not None:
+                        for attrs_tuple in list(keys.keys()):
+                            self._update_attrs_tuple(obj, keys, attrs_tuple)
+
+    def release(self):
+        """ Release all of the objects and indices of the store """
+        ObjectStore._unregister(self._ref, self._objects.keys())
+        self._objects = {}
+        self._index_dicts = {}
+        self._reverse_index = {}
+        self._attr_tuples_by_name = {}
+        self._any_attr_tuples = {}
+        self._batched_objects = {}
+        self._dirty = {}
+        self._removed = {}
+        self._unique_index = None
+        self._unique_keys = {}
+
+    def all(self, cls=None):
+        """ Get the objects in the store
+
+        Args:
+            cls (:obj:`type`, optional): model; if provided, only get the instances of this model
+
+        Returns:
+            :obj:`list` of :obj:`Model`: objects, in the order in which they were added to the store
+        """
+        if cls is None:
+            return list(self._reverse_index.keys())
+        return list(self._objects.get(cls, {}).keys())
+
+    def get(self, cls, **kwargs):
+        """ Get the instances of a model in the store that match attribute name/value pair(s)
+
+        The keys in :obj:`kwargs` must be the primary attribute or a tuple of attributes in the
+        :obj:`Meta.indexed_attrs_tuples` of the model.
+
+        Args:
+            cls (:obj:`type`): model
+            **kwargs: keyword args mapping from attribute name(s) to value(s)
+
+        Returns:
+            :obj:`list` of :obj:`Model`: a list of the instances whose indexed attributes have the
+                values in :obj:`kwargs`, in the order in which they were added to the store;
+                otherwise :obj:`None`, indicating no match
+
+        Raises:
+            :obj:`ValueError`: if no arguments are provided, or the attribute name(s) in :obj:`kwargs.keys()`
+                are not indexed
+        """
+        if 0 == len(kwargs.keys()):
+            raise ValueError("No arguments provided in get() on '{}'".format(cls.__name__))
+
+        attrs_tuple, vals = zip(*sorted(kwargs.items()))
+        if attrs_tuple not in self.get_indexed_attrs_tuples(cls):
+            raise ValueError("{} not an indexed attribute tuple in '{}'".format(attrs_tuple, cls.__name__))
+
+        index = self._index_dicts.get(cls, {}).get(attrs_tuple, {})
+        matches = index.get(Manager._get_hashable_values(vals), None)
+        if not matches:
+            return None
+        return list(matches.keys())
+
+    def get_one(self, cls, **kwargs):
+        """ Get the instance of a model in the store that matches attribute name/value pair(s)
+
+        Args:
+            cls (:obj:`type`): model
+            **kwargs: keyword args mapping from attribute name(s) to value(s)
+
+        Returns:
+            :obj:`Model`: the instance whose indexed attributes have the values in :obj:`kwargs`,
+                or :obj:`None` if no instance matches
+
+        Raises:
+            :obj:`ValueError`: if :obj:`get` raises an exception, or if multiple instances match
+        """
+        matches = self.get(cls, **kwargs)
+        if matches is None:
+            return None
+        if 1 < len(matches):
+            raise ValueError("get_one(): {} {} instances with '{}'".format(len(matches), cls.__name__, kwargs))
+        return matches[0]
+
+
+class AttributeChange(object):
+    """ Record of the assignment of a value to an attribute of an object (see :obj:`ChangeJournal`)
+
+    Attributes:
+        obj (:obj:`Model`): object
+        attr_name (:obj:`str`): name of the attribute
+        old_value (:obj:`object`): value of the attribute before the assignment
+        new_value (:obj:`object`): value of the attribute after the assignment
+    """
+    __slots__ = ('obj', 'attr_name', 'old_value', 'new_value')
+
+    def __init__(self, obj, attr_name, old_value, new_value):
+        """
+        Args:
+            obj (:obj:`Model`): object
+            attr_name (:obj:`str`): name of the attribute
+            old_value (:obj:`object`): value of the attribute before the assignment
+            new_value (:obj:`object`): value of the attribute after the assignment
+        """
+        self.obj = obj
+        self.attr_name = attr_name
+        self.old_value = old_value
+        self.new_value = new_value
+
+    def __repr__(self):
+        """ Get a string representation of the change
+
+        Returns:
+            :obj:`str`: string representation
+        """
+        return '<AttributeChange {}.{}: {!r} -> {!r}>'.format(
+            self.obj.__class__.__name__, self.attr_name, self.old_value, self.new_value)
+
+    def invert(self):
+        """ Get the change which reverts this change
+
+        Returns:
+            :obj:`AttributeChange`: inverse change
+        """
+        return AttributeChange(self.obj, self.attr_name, self.new_value, self.old_value)
+
+    def apply(self):
+        """ Assign the new value to the attribute, without propagating the assignment to related objects
+        (the changes to the related objects are recorded separately)
+        """
+        self.obj.__setattr__(self.attr_name, self.new_value, propagate=False)
+
+
+class RelatedManagerChange(object):
+    """ Record of the replacement of a contiguous range of the values of a :obj:`RelatedManager`
+    (see :obj:`ChangeJournal`)
+
+    Additions, insertions, and removals of single values are recorded as the replacement of an empty
+    range or of a single value. Operations which rearrange an entire list (e.g., :obj:`RelatedManager.sort`)
+    are recorded as the replacement of all of its values.
+
+    Attributes:
+        manager (:obj:`RelatedManager`): related manager
+        start (:obj:`int`): index of the first replaced value
+        old_values (:obj:`tuple`): values before the change
+        new_values (:obj:`tuple`): values after the change
+    """
+    __slots__ = ('manager', 'start', 'old_values', 'new_values')
+
+    def __init__(self, manager, start, old_values, new_values):
+        """
+        Args:
+            manager (:obj:`RelatedManager`): related manager
+            start (:obj:`int`): index of the first replaced value
+            old_values (:obj:`tuple`): values before the change
+            new_values (:obj:`tuple`): values after the change
+        """
+        self.manager = manager
+        self.start = start
+        self.old_values = old_values
+        self.new_values = new_values
+
+    @property
+    def obj(self):
+        """ Get the object whose related attribute was changed
+
+        Returns:
+            :obj:`Model`: object
+        """
+        return self.manager.object
+
+    @property
+    def attr_name(self):
+        """ Get the name of the related attribute which was changed
+
+        Returns:
+            :obj:`str`: name of the attribute
+        """
+        manager = self.manager
+        return manager.attribute.related_name if manager.related else manager.attribute.name
+
+    def __repr__(self):
+        """ Get a string representation of the change
+
+        Returns:
+            :obj:`str`: string representation
+        """
+        return '<RelatedManagerChange {}.{}[{}]: {} -> {} value(s)>'.format(
+            self.obj.__class__.__name__, self.attr_name, self.start, len(self.old_values), len(self.new_values))
+
+    def invert(self):
+        """ Get the change which reverts this change
+
+        Returns:
+            :obj:`RelatedManagerChange`: inverse change
+        """
+        return RelatedManagerChange(self.manager, self.start, self.new_values, self.old_values)
+
+    def apply(self):
+        """ Replace the old values with the new values, without propagating the replacement to the related
+        objects (the changes to the related objects are recorded separately)
+        """
+        manager = self.manager
+        GraphState.link(manager.object, self.new_values)
+        list.__setitem__(manager, slice(self.start, self.start + len(self.old_values)), self.new_values)
+        manager._invalidate_index_positions()
+        manager._remove_members(self.old_values)
+        manager._add_members(self.new_values)
+        if ChangeJournal._journals:
+            ChangeJournal._record_all(self)
+
+
+class ChangeJournal(object):
+    """ Opt-in journal of the changes to the attributes of objects
+
+    While a journal is recording (see :obj:`start` and :obj:`stop`, or use the journal as a context manager),
+    :obj:`Model.__setattr__` and the methods of :obj:`RelatedManager` which change the values of related
+    managers record each change as an :obj:`AttributeChange` or a :obj:`RelatedManagerChange`. The
+    propagation of a change to the inverse attributes of the related objects is recorded as separate
+    changes. Only changes to attributes which have already been initialized are recorded (i.e., the
+    initialization of new objects is not recorded, but their addition to the related attributes of
+    existing objects is). Other instance variables (e.g., caches) and in-place changes to mutable values of
+    literal attributes (e.g., lists) are not recorded.
+
+    The recorded changes can be consumed in two ways:
+
+    * Downstream steps (e.g., validation or export) can obtain a :obj:`checkpoint` and later iterate over
+      the changes since the checkpoint (:obj:`iter_changes`) or get the objects which have changed
+      (:obj:`get_changed_objects`), and only reprocess these objects.
+    * Changes are grouped into steps, which can be undone and redone (:obj:`undo` and :obj:`redo`). Each
+      :obj:`transaction` is one step, and the changes outside of transactions are grouped into steps by
+      checkpoints. If a transaction raises an exception, its changes are rolled back.
+
+    Undoing, redoing, and rolling back changes append the reverting changes to the record of changes, so
+    that the changes since a checkpoint always describe how the objects have changed. The journal holds
+    strong references to the changed objects and their values until it is cleared.
+
+    A journal can be limited to the changes to the objects of the graph of an object, including the objects
+    which are related to the graph while the journal is recording (see :obj:`GraphState`).
+
+    Attributes:
+        _graph_state (:obj:`GraphState`): state of the graph whose changes are recorded, or :obj:`None`
+            to record the changes to all objects
+        _changes (:obj:`list`): changes, in the order in which they were made
+        _step (:obj:`list`): changes of the current step
+        _undo_steps (:obj:`list` of :obj:`list`): completed steps which can be undone
+        _redo_steps (:obj:`list` of :obj:`list`): undone steps which can be redone
+        _transaction_depth (:obj:`int`): number of active transactions
+        _paused (:obj:`bool`): if :obj:`True`, the journal is applying changes and doesn't record them
+    """
+
+    # recording journals, which are notified of changes to the attributes of objects
+    _journals = WeakSet()
+
+    # value of attributes which have not been initialized
+    MISSING = object()
+
+    def __init__(self, graph=None):
+        """
+        Args:
+            graph (:obj:`Model`, optional): object whose graph the journal should be limited to
+        """
+        self._graph_state = GraphState.get(graph) if graph is not None else None
+        self._changes = []
+        self._step = []
+        self._undo_steps = []
+        self._redo_steps = []
+        self._transaction_depth = 0
+        self._paused = False
+
+    def __enter__(self):
+        """ Enter context and start recording changes """
+        self.start()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        """ Exit context and stop recording changes """
+        self.stop()
+
+    def __len__(self):
+        """ Get the number of recorded changes
+
+        Returns:
+            :obj:`int`: number of recorded changes
+        """
+        return len(self._changes)
+
+    def start(self):
+        """ Start recording changes """
+        ChangeJournal._journals.add(self)
+
+    def stop(self):
+        """ Stop recording changes """
+        ChangeJournal._journals.discard(self)
+
+    def is_recording(self):
+        """ Determine whether the journal is recording changes
+
+        Returns:
+            :obj:`bool`: :obj:`True` if the journal is recording changes
+        """
+        return self in ChangeJournal._journals
+
+    def clear(self):
+        """ Clear the record of changes and the steps which can be undone and redone """
+        self._changes = []
+        self._step = []
+        self._undo_steps = []
+        self._redo_steps = []
+
+    @staticmethod
+    def get_value(obj, attr_name):
+        """ Get the value of an attribute of an object without initializing it
+
+        Args:
+            obj (:obj:`Model`): object
+            attr_name (:obj:`str`): name of the attribute
+
+        Returns:
+            :obj:`object`: value of the attribute, or :obj:`ChangeJournal.MISSING` if the attribute
+                has not been initialized
+        """
+        meta = obj.__class__.Meta
+        if meta.compact:
+            slot = meta.compact_slots.get(attr_name, None)
+            if slot is not None:
+                value = slot.peek(obj)
+                if value is CompactSlot.UNINITIALIZED:
+                    return ChangeJournal.MISSING
+                return value
+        elif meta.columnar and attr_name in meta.column_store.arrays:
+            if ColumnStore.ROW not in obj.__dict__:
+                return ChangeJournal.MISSING
+            return meta.column_store.get(obj, attr_name)
+        return getattr(obj, '__dict__', {}).get(attr_name, ChangeJournal.MISSING)
+
+    @staticmethod
+    def _record_all(change):
+        """ Record a change in all of the recording journals
+
+        Called by :obj:`Model.__setattr__` and the methods of :obj:`RelatedManager`.
+
+        Args:
+            change (:obj:`AttributeChange` or :obj:`RelatedManagerChange`): change
+        """
+        for journal in ChangeJournal._journals:
+            if journal._paused:
+                continue
+            if journal._graph_state is not None:
+                obj_state = change.obj._graph_state
+                if obj_state is None or obj_state.get_root() is not journal._graph_state.get_root():
+                    continue
+            journal._changes.append(change)
+            journal._step.append(change)
+            if journal._redo_steps:
+                journal._redo_steps = []
+
+    def checkpoint(self):
+        """ Get a checkpoint of the changes and, outside of transactions, end the current step
+
+        Returns:
+            :obj:`int`: checkpoint, which can be passed to :obj:`iter_changes` and :obj:`get_changed_objects`
+        """
+        if not self._transaction_depth:
+            self._end_step()
+        return len(self._changes)
+
+    def _end_step(self):
+        """ End the current step """
+        if self._step:
+            self._undo_steps.append(self._step)
+            self._step = []
+
+    def iter_changes(self, checkpoint=0):
+        """ Iterate over the changes since a checkpoint
+
+        Args:
+            checkpoint (:obj:`int`, optional): checkpoint (see :obj:`checkpoint`); by default,
+                iterate over all of the recorded changes
+
+        Returns:
+            :obj:`iterator` of :obj:`AttributeChange` or :obj:`RelatedManagerChange`: changes, in the
+                order in which they were made
+        """
+        return islice(self._changes, checkpoint, None)
+
+    def get_changed_objects(self, checkpoint=0):
+        """ Get the objects which have changed since a checkpoint
+
+        Args:
+            checkpoint (:obj:`int`, optional): checkpoint (see :obj:`checkpoint`); by default,
+                get the objects changed by all of the recorded changes
+
+        Returns:
+            :obj:`dict`: dictionary which maps each changed object to the set of the names of its changed
+                attributes, in the order in which the objects were first changed
+        """
+        objs = {}
+        for change in self.iter_changes(checkpoint):
+            obj = change.obj
+            attr_names = objs.get(obj, None)
+            if attr_names is None:
+                attr_names = objs[obj] = set()
+            attr_names.add(change.attr_name)
+        return objs
+
+    def _apply(self, changes):
+        """ Apply changes without recording them in the current step
+
+        Args:
+            changes (:obj:`list` of :obj:`AttributeChange` or :obj:`RelatedManagerChange`): changes
+        """
+        self._paused = True
+        try:
+            for change in changes:
+                change.apply()
+                self._changes.append(change)
+        finally:
+            self._paused = False
+
+    def revert(self, checkpoint=0):
+        """ Revert the changes since a checkpoint
+
+        The reverting changes are appended to the record of changes. The reverted changes cannot be redone.
+
+        Args:
+            checkpoint (:obj:`int`, optional): checkpoint (see :obj:`checkpoint`); by default,
+                revert all of the recorded changes
+
+        Raises:
+            :obj:`ValueError`: if a transaction is active
+        """
+        if self._transaction_depth:
+            raise ValueError('Changes cannot be reverted within a transaction')
+        self._end_step()
+        changes = self._changes[checkpoint:]
+        self._apply([change.invert() for change in reversed(changes)])
+        self._undo_steps = []
+        self._redo_steps = []
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """ Context in which changes are grouped into a single step, and rolled back if an exception is raised
+
+        Transactions can be nested. If an exception is raised within a nested transaction, only the changes
+        of the nested transaction are rolled back. The journal records changes for the duration of the
+        transaction, even if it hasn't been started.
+        """
+        started = not self.is_recording()
+        if started:
+            self.start()
+        if not self._transaction_depth:
+            self._end_step()
+        self._transaction_depth += 1
+        start = len(self._step)
+        try:
+            yield self
+        except BaseException:
+            changes = self._step[start:]
+            del self._step[start:]
+            self._apply([change.invert() for change in reversed(changes)])
+            raise
+        finally:
+            self._transaction_depth -= 1
+            if not self._transaction_depth:
+                self._end_step()
+            if started:
+                self.stop()
+
+    def can_undo(self):
+        """ Determine whether there is a step which can be undone
+
+        Returns:
+            :obj:`bool`: :obj:`True` if there is a step which can be undone
+        """
+        return bool(self._step or self._undo_steps)
+
+    def can_redo(self):
+        """ Determine whether there is a step which can be redone
+
+        Returns:
+            :obj:`bool`: :obj:`True` if there is a step which can be redone
+        """
+        return bool(self._redo_steps)
+
+    def undo(self):
+        """ Undo the last step
+
+        Returns:
+            :obj:`bool`: :obj:`True` if a step was undone, or :obj:`False` if there is no step to undo
+
+        Raises:
+            :obj:`ValueError`: if a transaction is active
+        """
+        if self._transaction_depth:
+            raise ValueError('Changes cannot be undone within a transaction')
+        self._end_step()
+        if not self._undo_steps:
+            return False
+        step = self._undo_steps.pop()
+        self._apply([change.invert() for change in reversed(step)])
+        self._redo_steps.append(step)
+        return True
+
+    def redo(self):
+        """ Redo the last undone step
+
+        Returns:
+            :obj:`bool`: :obj:`True` if a step was redone, or :obj:`False` if there is no step to redo
+
+        Raises:
+            :obj:`ValueError`: if a transaction is active
+        """
+        if self._transaction_depth:
+            raise ValueError('Changes cannot be redone within a transaction')
+        if not self._redo_steps:
+            return False
+        self._end_step()
+        step = self._redo_steps.pop()
+        self._apply(step)
+        self._undo_steps.append(step)
+        return True
+
+
+class Snapshot(object):
+    """ Snapshot of the state of a graph of objects, which records the original values of the attributes of the
+    objects as they are changed (see :obj:`Model.snapshot`)
+
+    Creating a snapshot doesn't copy any objects. Instead, the snapshot shares all of the objects and the values
+    of their attributes with the live graph, and records the original values of the attributes of the objects
+    of the graph as they are changed, using a :obj:`ChangeJournal` which is limited to the graph. Therefore,
+    the cost of a snapshot is proportional to the number of changes to the graph after the snapshot, rather
+    than to the size of the graph, and changes to other graphs are neither recorded nor restored. (If the graph
+    has not been traversed before, e.g., by :obj:`Model.normalize`, creating the snapshot traverses it once to
+    identify its objects; see :obj:`GraphState`.) The original values of the attributes can be read with
+    :obj:`get_value`, the live graph can be restored to the state of the snapshot with :obj:`restore`, and an
+    independent copy of the graph in the state of the snapshot can be created with :obj:`copy`. Unlike
+    :obj:`get_value` and :obj:`restore`, :obj:`copy` costs O(graph), as :obj:`Model.copy` does. Because the
+    live objects are restored, rather than recreated, restoring a snapshot preserves the instance variables of
+    the objects which are not attributes, such as the parsed expressions of
+    :obj:`obj_tables.math.expression.Expression`\ s.
+
+    Snapshots record changes until they are released (see :obj:`release`, or use the snapshot as a context
+    manager). While a snapshot is recording, changes to the values of columnar attributes
+    (see :obj:`Model.set_column`) are made one object at a time.
+
+    Attributes:
+        root (:obj:`Model`): object whose graph is captured by the snapshot
+        journal (:obj:`ChangeJournal`): journal of the changes to the graph since the snapshot
+        _changes_by_attr (:obj:`dict`): dictionary which maps pairs of objects and names of attributes to the
+            changes to the attributes, in the order in which they were made
+        _num_indexed (:obj:`int`): number of changes in :obj:`_changes_by_attr`
+    """
+
+    def __init__(self, root):
+        """
+        Args:
+            root (:obj:`Model`): object whose graph should be captured by the snapshot
+        """
+        self.root = root
+        self.journal = ChangeJournal(graph=root)
+        self.journal.start()
+        self._changes_by_attr = {}
+        self._num_indexed = 0
+
+    def __enter__(self):
+        """ Enter context """
+        return self
+
+    def __exit__(self, type, value, traceback):
+        """ Exit context and release the snapshot """
+        self.release()
+
+    def release(self):
+        """ Stop recording changes and release the original values of the changed attributes """
+        self.journal.stop()
+        self.journal.clear()
+        self._changes_by_attr = {}
+        self._num_indexed = 0
+
+    def is_changed(self):
+        """ Determine whether the graph has changed since the snapshot
+
+        Returns:
+            :obj:`bool`: :obj:`True` if the graph has changed since the snapshot
+        """
+        return bool(self.journal._changes)
+
+    def get_changed_objects(self):
+        """ Get the objects which have changed since the snapshot
+
+        Returns:
+            :obj:`dict`: dictionary which maps each changed object to the set of the names of its changed
+                attributes (see :obj:`ChangeJournal.get_changed_objects`)
+        """
+        return self.journal.get_changed_objects()
+
+    def get_value(self, obj, attr_name):
+        """ Get the value of an attribute of an object at the time of the snapshot
+
+        Args:
+            obj (:obj:`Model`): object
+            attr_name (:obj:`str`): name of the attribute
+
+        Returns:
+            :obj:`object`: value of the attribute at the time of the snapshot; the values of \*-to-many
+                attributes which have changed are returned as lists
+        """
+        self._index_changes()
+        return self._get_value(obj, attr_name)
+
+    def _index_changes(self):
+        """ Index the changes which have been recorded since the last call by object and attribute """
+        changes = self._changes_by_attr
+        journal_changes = self.journal._changes
+        for change in islice(journal_changes, self._num_indexed, None):
+            key = (change.obj, change.attr_name)
+            attr_changes = changes.get(key, None)
+            if attr_changes is None:
+                attr_changes = changes[key] = []
+            attr_changes.append(change)
+        self._num_indexed = len(journal_changes)
+
+    def _get_value(self, obj, attr_name, get=None):
+        """ Get the value of an attribute of an object at the time of the snapshot, from the indexed changes
+
+        Args:
+            obj (:obj:`Model`): object
+            attr_name (:obj:`str`): name of the attribute
+            get (:obj:`types.FunctionType`, optional): function which gets the current value of the attribute
+                (see :obj:`TraversalPlan`)
+
+        Returns:
+            :obj:`object`: value of the attribute at the time of the snapshot
+        """
+        value = get(obj) if get is not None else getattr(obj, attr_name)
+        attr_changes = self._changes_by_attr.get((obj, attr_name), None)
+        if not attr_changes:
+            return value
+        if isinstance(attr_changes[0], AttributeChange):
+            return attr_changes[0].old_value
+
+        values = list(value)
+        for change in reversed(attr_changes):
+            values[change.start:change.start + len(change.new_values)] = change.old_values
+        return values
+
+    def get_objects(self):
+        """ Get the objects of the graph at the time of the snapshot
+
+        Returns:
+            :obj:`list` of :obj:`Model`: objects, starting with :obj:`root`
+        """
+        self._index_changes()
+        objs = collections.OrderedDict()
+        objs_to_explore = [self.root]
+        while objs_to_explore:
+            obj = objs_to_explore.pop()
+            if obj not in objs:
+                objs[obj] = None
+                plan = obj.Meta.traversal_plan or obj.get_traversal_plan()
+                for attr_name, _, get, to_many in plan.related_attrs:
+                    value = self._get_value(obj, attr_name, get)
+                    if to_many:
+                        objs_to_explore.extend(value)
+                    elif value is not None:
+                        objs_to_explore.append(value)
+        return list(objs)
+
+    def restore(self):
+        """ Restore the live graph to the state of the snapshot
+
+        Only the changes to the graph are reverted. The snapshot continues to record changes, so that the graph
+        can be restored again (e.g., after each step of a parameter sweep).
+        """
+        self.journal.revert()
+        self.journal.clear()
+        self._changes_by_attr = {}
+        self._num_indexed = 0
+
+    def copy(self):
+        """ Create an independent copy of the graph in the state of the snapshot
+
+        The objects are copied (see :obj:`Model.copy`) with the values of their attributes at the time of the
+        snapshot, without changing the live graph. The parsed expressions of the
+        :obj:`obj_tables.math.expression.Expression`\ s which have changed are parsed again.
+
+        Every object of the graph at the time of the snapshot is copied, so the cost is O(graph), regardless of
+        the number of changes. Unchanged objects cannot be shared between the copy and the live graph because
+        related attributes are bidirectional: the related attributes of a shared object would have to refer
+        to both its live and its copied neighbors.
+
+        Returns:
+            :obj:`Model`: copy of :obj:`root` in the state of the snapshot
+        """
+        objs = self.get_objects()
+        changed_objs = set(obj for obj, _ in self._changes_by_attr.keys())
+        return Model._copy_objs(objs, get_value=self._get_value, changed_objs=changed_objs)[self.root]
+
+
+class SubgraphView(object):
+    """ Read-only view of an object and a kind of its children (see :obj:`Model.get_subgraph_view`)
+
+    In contrast to :obj:`Model.cut`, a view doesn't copy or change the object graph. Instead, the view only
+    records which objects belong to it, and the values of the related attributes of its objects are filtered
+    to the objects of the view as they are read with :obj:`get_value`. :obj:`Validator.run`,
+    :obj:`Model.to_dict`, and the writers in :obj:`obj_tables.io` accept views in place of lists of objects,
+    and validate, encode, or write the objects of the view as if the view had been cut from the graph.
+
+    Attributes:
+        root (:obj:`Model`): object
+        kind (:obj:`str`): kind of children of the object which belong to the view
+        _objects (:obj:`dict`): dictionary whose keys are the objects of the view, in the order in which they
+            were found
+        _attrs_by_class (:obj:`dict`): dictionary which maps each model to a dictionary which maps the names of its
+            attributes to their value functions and kinds (see :obj:`TraversalPlan.attrs`)
+    """
+
+    def __init__(self, root, kind=None):
+        """
+        Args:
+            root (:obj:`Model`): object
+            kind (:obj:`str`, optional): kind of children of the object which belong to the view; if :obj:`None`,
+                children are defined to be the values of the related attributes defined in each class
+        """
+        self.root = root
+        self.kind = kind
+
+        objects = {root: None}
+        objs_to_explore = [root]
+        while objs_to_explore:
+            for child in objs_to_explore.pop().get_immediate_children(kind=kind):
+                if child not in objects:
+                    objects[child] = None
+                    objs_to_explore.append(child)
+        self._objects = objects
+        self._attrs_by_class = {}
+
+    def __len__(self):
+        """ Get the number of objects in the view
+
+        Returns:
+            :obj:`int`: number of objects
+        """
+        return len(self._objects)
+
+    def __iter__(self):
+        """ Iterate over the objects of the view
+
+        Returns:
+            :obj:`iterator` of :obj:`Model`: objects
+        """
+        return iter(self._objects)
+
+    def __contains__(self, obj):
+        """ Determine whether an object belongs to the view
+
+        Args:
+            obj (:obj:`Model`): object
+
+        Returns:
+            :obj:`bool`: :obj:`True` if the object belongs to the view
+        """
+        return obj in self._objects
+
+    def get_objects(self, __type=None, **kwargs):
+        """ Get the objects of the view
+
+        Args:
+            __type (:obj:`types.TypeType` or :obj:`tuple` of :obj:`types.TypeType`): subclass(es) of :obj:`Model`
+            **kwargs: dictionary of attribute name/value pairs
+
+        Returns:
+            :obj:`list` of :obj:`Model`: objects
+        """
+        if '__type' in kwargs:
+            __type = kwargs.pop('__type')
+
+        if __type is None and not kwargs:
+            return list(self._objects)
+        return [obj for obj in self._objects if obj.has_attr_vals(__type=__type, __check_attr_defined=False, **kwargs)]
+
+    def _get_attrs(self, cls):
+        """ Get the value functions and kinds of the attributes of a model
+
+        Args:
+            cls (:obj:`type`): model
+
+        Returns:
+            :obj:`dict`: dictionary which maps the names of the attributes to their value functions and kinds
+        """
+        attrs = self._attrs_by_class.get(cls, None)
+        if attrs is None:
+            plan = cls.Meta.traversal_plan or cls.get_traversal_plan()
+            attrs = self._attrs_by_class[cls] = {attr_name: (get, kind) for attr_name, _, get, kind in plan.attrs}
+        return attrs
+
+    def get_value(self, obj, attr_name):
+        """ Get the value of an attribute of an object, restricted to the objects of the view
+
+        Args:
+            obj (:obj:`Model`): object
+            attr_name (:obj:`str`): name of the attribute
+
+        Returns:
+            :obj:`object`: value of a literal attribute, related object of a \*-to-one attribute if it belongs
+                to the view or :obj:`None`, or :obj:`list` of the related objects of a \*-to-many attribute
+                which belong to the view
+        """
+        get_kind = self._get_attrs(obj.__class__).get(attr_name, None)
+        if get_kind is None:
+            return getattr(obj, attr_name)
+
+        get, kind = get_kind
+        value = get(obj)
+        if kind == TraversalPlan.TO_MANY:
+            objects = self._objects
+            return [v for v in value if v in objects]
+        if kind == TraversalPlan.TO_ONE and value not in self._objects:
+            return None
+        return value
+
+    def to_builtin(self, obj, json_obj, encode):
+        """ Encode the values of the attributes of an object of the view into a dictionary
+        (see :obj:`Model.to_dict`)
+
+        Args:
+            obj (:obj:`Model`): object
+            json_obj (:obj:`dict`): dictionary
+            encode (:obj:`types.FunctionType`): function which encodes related objects
+        """
+        objects = self._objects
+        for attr_name, (get, kind) in self._get_attrs(obj.__class__).items():
+            value = get(obj)
+            if kind == TraversalPlan.LITERAL:
+                json_obj[attr_name] = obj.Meta.attributes[attr_name].to_builtin(value)
+            elif kind == TraversalPlan.TO_MANY:
+                json_obj[attr_name] = [encode(v) for v in value if v in objects]
+            else:
+                json_obj[attr_name] = encode(value) if value in objects else None
+
+
+class TableFormat(Enum):
+    """ Describes a table's orientation
+
+    * :obj:`row`: the first row contains attribute names; subsequents rows store objects
+    * :obj:`column`: the first column contains attribute names; subsequents columns store objects
+    * :obj:`cell`: a cell contains a table, as a comma-separated list for example
+    * :obj:`multiple_cells`: multiple cells within a row or column
+    """
+    row = 1
+    column = 2
+    cell = 3
+    multiple_cells = 4
+
+
+class CompactSlot(object):
+    """ Descriptor which stores the value of an attribute of an instance of a compact :obj:`Model`
+
+    Compact models (:obj:`Model.Meta.compact` = :obj:`True`) store the values of their attributes in a
+    list, rather than in a dictionary, and only create the :obj:`RelatedManager`\ s of their related
+    attributes when they are first accessed.
+
+    Attributes:
+        attr (:obj:`Attribute`): attribute
+        name (:obj:`str`): name of the attribute within the model
+        index (:obj:`int`): index of the value of the attribute within the values of each instance
+        related (:obj:`bool`): if :obj:`True`, the attribute is a related attribute of the model
+    """
+    __slots__ = ('attr', 'name', 'index', 'related')
+
+    def __init__(self, attr, name, index, related=False):
+        """
+        Args:
+            attr (:obj:`Attribute`): attribute
+            name (:obj:`str`): name of the attribute within the model
+            index (:obj:`int`): index of the value of the attribute within the values of each instance
+            related (:obj:`bool`, optional): if :obj:`True`, the attribute is a related attribute of the model
+        """
+        self.attr = attr
+        self.name = name
+        self.index = index
+        self.related = related
+
+    def __get__(self, obj, cls=None):
+        """ Get the value of the attribute of an instance, creating the initial value of the
+        attribute if necessary
+
+        Args:
+            obj (:obj:`Model`): instance
+            cls (:obj:`type`, optional): model
+
+        Returns:
+            :obj:`object`: value of the attribute, or the attribute itself if :obj:`obj` is :obj:`None`
+        """
+        if obj is None:
+            if self.related:
+                return self
+            return self.attr
+
+        value = self.peek(obj)
+        if value is CompactSlot.UNINITIALIZED:
+            if self.related:
+                value = self.attr.get_related_init_value(obj)
+            else:
+                value = self.attr.get_init_value(obj)
+            obj._values[self.index] = value
+        return value
+
+    def __set__(self, obj, value):
+        """ Set the value of the attribute of an instance
+
+        Args:
+            obj (:obj:`Model`): instance
+            value (:obj:`object`): value
+        """
+        values = obj._values
+        if self.index >= len(values):
+            values.extend([CompactSlot.UNINITIALIZED] * (self.index + 1 - len(values)))
+        values[self.index] = value
+
+    def peek(self, obj):
+        """ Get the value of the attribute of an instance without creating its initial value
+
+        Args:
+            obj (:obj:`Model`): instance
+
+        Returns:
+            :obj:`object`: value of the attribute, or :obj:`CompactSlot.UNINITIALIZED` if the
+                value of the attribute has not been initialized
+        """
+        values = obj._values
+        if self.index < len(values):
+            return values[self.index]
+
+        # the attribute was added to the model after the instance was created
+        values.extend([CompactSlot.UNINITIALIZED] * (self.index + 1 - len(values)))
+        return CompactSlot.UNINITIALIZED
+
+    def get_getter(self, empty=None):
+        """ Get a function which gets the value of the attribute of an instance without creating its
+        initial value
+
+        Args:
+            empty (:obj:`object`, optional): value to return if the value of the attribute has not been initialized
+
+        Returns:
+            :obj:`types.FunctionType`: function which gets the value of the attribute of an instance
+        """
+        index = self.index
+        uninitialized = CompactSlot.UNINITIALIZED
+
+        def get(obj):
+            values = obj._values
+            if index < len(values):
+                value = values[index]
+                if value is not uninitialized:
+                    return value
+            return empty
+        return get
+
+    @staticmethod
+    def get_state(obj):
+        """ Get the state of an instance of a compact model for pickling and copying
+
+        Args:
+            obj (:obj:`Model`): instance
+
+        Returns:
+            :obj:`dict`: state, including the indices and values of the initialized attributes
+        """
+        state = {}
+        for slot_name in CompactSlot.INSTANCE_SLOT_NAMES:
+            value = getattr(obj, slot_name, CompactSlot.UNINITIALIZED)
+            if value is not CompactSlot.UNINITIALIZED:
+                state[slot_name] = value
+        if '_values' in state:
+            state['_values'] = [(index, value) for index, value in enumerate(state['_values'])
+                                if value is not CompactSlot.UNINITIALIZED]
+        return state
+
+    @staticmethod
+    def set_state(obj, state):
+        """ Set the state of an instance of a compact model
+
+        Args:
+            obj (:obj:`Model`): instance
+            state (:obj:`dict`): state
+        """
+        state = dict(state)
+        values = [CompactSlot.UNINITIALIZED] * len(obj.__class__.Meta.compact_slots)
+        for index, value in state.pop('_values', ()):
+            if index >= len(values):
+                values.extend([CompactSlot.UNINITIALIZED] * (index + 1 - len(values)))
+            values[index] = value
+        object.__setattr__(obj, '_values', values)
+        object.__setattr__(obj, '_graph_state', None)
+        for slot_name, value in state.items():
+            object.__setattr__(obj, slot_name, value)
+
+    UNINITIALIZED = object()
+
+    # names of the slots of the instances of compact models, which store the values of their attributes
+    # (:obj:`_values`) and their internal state (e.g., :obj:`Model._source`, :obj:`GraphState`\ s, and the
+    # parsed expressions of :obj:`obj_tables.math.expression.Expression`\ s)
+    INSTANCE_SLOT_NAMES = ('_values', '_source', '_comments', '_graph_state', '_fingerprint', '_parsed_expression')
+
+
+class ColumnSlot(object):
+    """ Descriptor which stores the value of an attribute of an instance of a columnar :obj:`Model`
+    in the model's :obj:`ColumnStore`
+
+    Attributes:
+        attr (:obj:`Attribute`): attribute
+        name (:obj:`str`): name of the attribute within the model
+        store (:obj:`ColumnStore`): store of the values of the attribute
+    """
+    __slots__ = ('attr', 'name', 'store')
+
+    def __init__(self, attr, name, store):
+        """
+        Args:
+            attr (:obj:`Attribute`): attribute
+            name (:obj:`str`): name of the attribute within the model
+            store (:obj:`ColumnStore`): store of the values of the attribute
+        """
+        self.attr = attr
+        self.name = name
+        self.store = store
+
+    def __get__(self, obj, cls=None):
+        """ Get the value of the attribute of an instance
+
+        Args:
+            obj (:obj:`Model`): instance
+            cls (:obj:`type`, optional): model
+
+        Returns:
+            :obj:`object`: value of the attribute, or the attribute itself if :obj:`obj` is :obj:`None`
+        """
+        if obj is None:
+            return self.attr
+        return self.store.get(obj, self.name)
+
+    def __set__(self, obj, value):
+        """ Set the value of the attribute of an instance
+
+        Args:
+            obj (:obj:`Model`): instance
+            value (:obj:`object`): value
+        """
+        self.store.set(obj, self.name, value)
+
+
+class ColumnStore(object):
+    """ Store of the values of the numeric and Boolean attributes of the instances of a columnar :obj:`Model`
+
+    Columnar models (:obj:`Model.Meta.columnar` = :obj:`True`) store the values of the attributes which
+    have a NumPy data type (see :obj:`Attribute.get_column_dtype`) in typed NumPy arrays, rather than in
+    the dictionaries of their instances. Each instance is assigned a row of the arrays when one of these
+    attributes is first set. Values which the data type of an array cannot represent exactly (e.g., :obj:`None`,
+    values of other types, or integers which overflow 64 bits) are stored in a dictionary of overflow values
+    of each column.
+
+    The rows of instances which have been garbage collected are removed before the columns are read
+    in bulk, which renumbers the rows of the remaining instances.
+
+    Attributes:
+        cls (:obj:`type`): model
+        arrays (:obj:`collections.OrderedDict` of :obj:`str`, :obj:`numpy.ndarray`): dictionary that maps
+            the names of the attributes to the arrays of their values
+        types (:obj:`dict` of :obj:`str`, :obj:`type`): dictionary that maps the names of the attributes to
+            the Python types of the values which are stored in their arrays
+        overflow (:obj:`dict` of :obj:`str`, :obj:`dict`): dictionary that maps the names of the attributes
+            to dictionaries that map rows to values which are not stored in the arrays
+        refs (:obj:`list` of :obj:`weakref.ref`): weak references to the instance of each row
+        n_rows (:obj:`int`): number of rows
+        capacity (:obj:`int`): number of rows which have been allocated
+    """
+    MIN_CAPACITY = 16
+    ROW = '_column_row'
+    PYTHON_TYPES = {
+        numpy.dtype(numpy.float64): float,
+        numpy.dtype(numpy.int64): int,
+        numpy.dtype(numpy.bool_): bool,
+    }
+
+    def __init__(self, cls):
+        """
+        Args:
+            cls (:obj:`type`): model
+        """
+        self.cls = cls
+        self.arrays = collections.OrderedDict()
+        self.types = {}
+        self.overflow = {}
+        self.refs = []
+        self.n_rows = 0
+        self.capacity = 0
+        self._has_released = False
+
+    def add_column(self, attr_name, dtype):
+        """ Add a column
+
+        Args:
+            attr_name (:obj:`str`): name of the attribute
+            dtype (:obj:`numpy.dtype`): data type of the values of the attribute
+        """
+        dtype = numpy.dtype(dtype)
+        self.arrays[attr_name] = numpy.zeros(self.capacity, dtype=dtype)
+        self.types[attr_name] = self.PYTHON_TYPES[dtype]
+        self.overflow[attr_name] = {}
+
+    def get(self, obj, attr_name):
+        """ Get the value of an attribute of an instance
+
+        Args:
+            obj (:obj:`Model`): instance
+            attr_name (:obj:`str`): name of the attribute
+
+        Returns:
+            :obj:`object`: value, or :obj:`None` if the instance doesn't have a row
+        """
+        row = obj.__dict__.get(self.ROW, None)
+        if row is None:
+            return None
+        overflow = self.overflow[attr_name]
+        if overflow and row in overflow:
+            return overflow[row]
+        return self.arrays[attr_name][row].item()
+
+    def set(self, obj, attr_name, value):
+        """ Set the value of an attribute of an instance
+
+        Args:
+            obj (:obj:`Model`): instance
+            attr_name (:obj:`str`): name of the attribute
+            value (:obj:`object`): value
+        """
+        row = obj.__dict__.get(self.ROW, None)
+        if row is None:
+            row = self.add_rows([obj])
+        overflow = self.overflow[attr_name]
+        if type(value) is self.types[attr_name]:
+            try:
+                self.arrays[attr_name][row] = value
+            except OverflowError:
+                overflow[row] = value
+                return
+            if overflow:
+                overflow.pop(row, None)
+        else:
+            overflow[row] = value
+
+    def add_rows(self, objs):
+        """ Assign rows to instances
+
+        Args:
+            objs (:obj:`list` of :obj:`Model`): instances
+
+        Returns:
+            :obj:`int`: first row
+        """
+        start = self.n_rows
+        end = start + len(objs)
+        if end > self.capacity:
+            self.resize(max(end, 2 * self.capacity, self.MIN_CAPACITY))
+
+        release = self._release
+        for row, obj in enumerate(objs, start):
+            obj.__dict__[self.ROW] = row
+            self.refs.append(weakref.ref(obj, release))
+        self.n_rows = end
+        return start
+
+    def extend(self, objs, columns):
+        """ Assign rows to new instances and set the values of their attributes in bulk
+
+        Args:
+            objs (:obj:`list` of :obj:`Model`): instances
+            columns (:obj:`dict` of :obj:`str`, :obj:`list`): dictionary that maps the names of attributes
+                to their values for each instance
+        """
+        start = self.add_rows(objs)
+        end = self.n_rows
+        for attr_name, values in columns.items():
+            if set(map(type, values)) == set([self.types[attr_name]]):
+                try:
+                    self.arrays[attr_name][start:end] = numpy.array(values, dtype=self.arrays[attr_name].dtype)
+                    continue
+                except OverflowError:
+                    pass
+            for obj, value in zip(objs, values):
+                self.set(obj, attr_name, value)
+
+    def resize(self, capacity):
+        """ Change the number of allocated rows
+
+        Args:
+            capacity (:obj:`int`): number of rows
+        """
+        for attr_name, array in self.arrays.items():
+            new_array = numpy.zeros(capacity, dtype=array.dtype)
+            new_array[:self.n_rows] = array[:self.n_rows]
+            self.arrays[attr_name] = new_array
+        self.capacity = capacity
+
+    def _release(self, ref):
+        """ Record that the instance of a row has been garbage collected
+
+        Args:
+            ref (:obj:`weakref.ref`): weak reference to the instance
+        """
+        self._has_released = True
+
+    def compact(self):
+        """ Remove the rows of instances which have been garbage collected """
+        if not self._has_released:
+            return
+        self._has_released = False
+
+        live_rows = []
+        live_objs = []
+        for row, ref in enumerate(self.refs):
+            obj = ref()
+            if obj is not None:
+                live_rows.append(row)
+                live_objs.append(obj)
+        if len(live_rows) == self.n_rows:
+            return
+
+        n_rows = len(live_rows)
+        for array in self.arrays.values():
+            array[:n_rows] = array[live_rows]
+        new_rows = {row: new_row for new_row, row in enumerate(live_rows)}
+        for attr_name, overflow in self.overflow.items():
+            self.overflow[attr_name] = {new_rows[row]: value for row, value in overflow.items() if row in new_rows}
+        for new_row, obj in enumerate(live_objs):
+            obj.__dict__[self.ROW] = new_row
+        self.refs = [self.refs[row] for row in live_rows]
+        self.n_rows = n_rows
+
+    def get_objects(self):
+        """ Get the instances in the order of their rows
+
+        Returns:
+            :obj:`list` of :obj:`Model`: instances
+        """
+        self.compact()
+        return [ref() for ref in self.refs]
+
+    def get_column(self, attr_name):
+        """ Get the values of an attribute of all instances, in the order of their rows
+
+        Args:
+            attr_name (:obj:`str`): name of the attribute
+
+        Returns:
+            :obj:`numpy.ndarray`: read-only view of the array of the values of the attribute, or, if some
+                values are not stored in the array, an array of Python objects; views are valid until the
+                store is resized or compacted
+        """
+        self.compact()
+        array = self.arrays[attr_name][:self.n_rows]
+        overflow = self.overflow[attr_name]
+        if overflow:
+            array = array.astype(object)
+            for row, value in overflow.items():
+                array[row] = value
+            return array
+
+        view = array.view()
+        view.flags.writeable = False
+        return view
+
+    def set_column(self, attr_name, values):
+        """ Set the values of an attribute of all instances, in the order of their rows
+
+        Args:
+            attr_name (:obj:`str`): name of the attribute
+            values (:obj:`numpy.ndarray` or :obj:`list`): values
+
+        Returns:
+            :obj:`bool`: :obj:`True` if the values were set in bulk, :obj:`False` if the values could not
+                be stored in the array of the attribute
+
+        Raises:
+            :obj:`ValueError`: if the number of values is different from the number of rows
+        """
+        self.compact()
+        array = self.arrays[attr_name]
+        values = numpy.asarray(values)
+        if values.shape != (self.n_rows, ):
+            raise ValueError('{} values must be provided for `{}`'.format(self.n_rows, attr_name))
+
+        kinds = {'f': 'f', 'i': 'iu', 'b': 'b'}[array.dtype.kind]
+        if values.dtype.kind not in kinds or not numpy.can_cast(values.dtype, array.dtype, casting='safe'):
+            return False
+
+        array[:self.n_rows] = values
+        self.overflow[attr_name] = {}
+        return True
+
+    def take(self, attr_name, objs):
+        """ Get the values of an attribute of instances
+
+        Args:
+            attr_name (:obj:`str`): name of the attribute
+            objs (:obj:`list` of :obj:`Model`): instances
+
+        Returns:
+            :obj:`numpy.ndarray`: values, or :obj:`None` if some of the values are not stored in the array
+                of the attribute
+        """
+        if self.overflow[attr_name]:
+            return None
+        rows = [obj.__dict__.get(self.ROW, None) for obj in objs]
+        if None in rows:
+            return None
+        return self.arrays[attr_name][numpy.array(rows, dtype=numpy.intp)]
+
+    @staticmethod
+    def get_state(obj):
+        """ Get the state of an instance of a columnar model for pickling and copying
+
+        Args:
+            obj (:obj:`Model`): instance
+
+        Returns:
+            :obj:`dict`: state, including the values of the attributes which are stored in columns
+        """
+        store = obj.__class__.Meta.column_store
+        state = dict(obj.__dict__)
+        state.pop(ColumnStore.ROW, None)
+        if store.ROW in obj.__dict__:
+            for attr_name in store.arrays.keys():
+                state[attr_name] = store.get(obj, attr_name)
+        return state
+
+    @staticmethod
+    def set_state(obj, state):
+        """ Set the state of an instance of a columnar model
+
+        Args:
+            obj (:obj:`Model`): instance
+            state (:obj:`dict`): state
+        """
+        store = obj.__class__.Meta.column_store
+        state = dict(state)
+        column_values = [(attr_name, state.pop(attr_name)) for attr_name in store.arrays.keys()
+                         if attr_name in state]
+        obj.__dict__.update(state)
+        for attr_name, value in column_values:
+            store.set(obj, attr_name, value)
+
+
+class ModelInitializer(object):
+    """ Initializer which efficiently constructs many instances of a :obj:`Model`
+
+    The initializer precomputes the initial and default values of the attributes of a model once. It sets
+    the values of the literal attributes of each new instance directly, bypassing :obj:`Model.__setattr__`,
+    and then sets the values of the related attributes of the new instances in a separate pass, one
+    attribute at a time.
+
+    Attributes:
+        cls (:obj:`type`): model
+        direct_attrs (:obj:`dict` of :obj:`str`, :obj:`Attribute`): dictionary that maps the names of the
+            attributes whose values can be set directly to the attributes
+        deferred_attrs (:obj:`dict` of :obj:`str`, :obj:`Attribute`): dictionary that maps the names of the
+            attributes whose values must be set through :obj:`Model.__setattr__` to the attributes
+        const_defaults (:obj:`dict` of :obj:`str`, :obj:`object`): dictionary that maps the names of the
+            literal attributes with immutable defaults to their defaults
+        copied_defaults (:obj:`list` of :obj:`Attribute`): literal attributes whose defaults must be copied or
+            computed for each instance
+        init_values (:obj:`list` of :obj:`tuple` of :obj:`str`, :obj:`Attribute`, :obj:`bool`): names, attributes,
+            and directions (:obj:`True` for forward attributes) of the related attributes whose initial values must
+            be created for each instance
+        related_defaults (:obj:`list` of :obj:`tuple` of :obj:`str`, :obj:`Attribute`, :obj:`bool`): names,
+            attributes, and directions of the related attributes which may have non-empty defaults
+    """
+
+    def __init__(self, cls):
+        """
+        Args:
+            cls (:obj:`type`): model
+        """
+        self.cls = cls
+        self.direct_attrs = {}
+        self.deferred_attrs = {}
+        self.const_defaults = {}
+        self.copied_defaults = []
+        self.init_values = []
+        self.related_defaults = []
+
+        for attr_name, attr in cls.Meta.attributes.items():
+            if isinstance(attr, RelatedAttribute):
+                self.deferred_attrs[attr_name] = attr
+                if not cls.Meta.compact:
+                    self.init_values.append((attr_name, attr, True))
+                if callable(attr.default) or attr.default:
+                    self.related_defaults.append((attr_name, attr, True))
+
+            else:
+                # attributes which customize :obj:`Attribute.set_value` must be set through :obj:`Model.__setattr__`
+                if type(attr).set_value is Attribute.set_value:
+                    self.direct_attrs[attr_name] = attr
+                else:
+                    self.deferred_attrs[attr_name] = attr
+
+                if not callable(attr.default) and \
+                        (attr.default is None or isinstance(attr.default, (str, bool, int, float, Enum))):
+                    self.const_defaults[attr_name] = attr.default
+                else:
+                    self.copied_defaults.append(attr)
+
+        for attr_name, attr in cls.Meta.related_attributes.items():
+            self.deferred_attrs[attr_name] = attr
+            if not cls.Meta.compact:
+                self.init_values.append((attr_name, attr, False))
+            if callable(attr.related_default) or attr.related_default:
+                self.related_defaults.append((attr_name, attr, False))
+
+    def create(self, rows, attr_names=None, comments=None, set_related_defaults=True):
+        """ Create instances of the model
+
+        Args:
+            rows (:obj:`list` of :obj:`dict` or :obj:`list` of :obj:`tuple`): values of the attributes of the instances;
+                either a list of dictionaries that map the names of attributes to their values, or, if
+                :obj:`attr_names` is defined, a list of tuples of the values of the attributes in :obj:`attr_names`
+            attr_names (:obj:`list` of :obj:`str`, optional): names of the attributes of the values in each tuple
+                of :obj:`rows`
+            comments (:obj:`list` of :obj:`list` of :obj:`str`, optional): comments about each instance
+            set_related_defaults (:obj:`bool`, optional): if :obj:`False`, don't set the default values of the
+                related attributes whose values are not provided (e.g., because the caller sets them)
+
+        Returns:
+            :obj:`list` of :obj:`Model`: instances
+
+        Raises:
+            :obj:`TypeError`: if a value is provided for an attribute which is not defined
+        """
+        cls = self.cls
+        if cls.__init__ is not Model.__init__:
+            # respect models which customize their construction
+            if attr_names is not None:
+                rows = [dict(zip(attr_names, row)) for row in rows]
+            if comments is None:
+                return [cls(**row) for row in rows]
+            return [cls(_comments=obj_comments, **row) for row, obj_comments in zip(rows, comments)]
+
+        cls.validate_related_attributes()
+
+        direct_attrs = self.direct_attrs
+        deferred_attrs = self.deferred_attrs
+        const_defaults = self.const_defaults
+        copied_defaults = self.copied_defaults
+        init_values = self.init_values
+        related_defaults = self.related_defaults if set_related_defaults else ()
+        compact_slots = cls.Meta.compact_slots if cls.Meta.compact else None
+        if compact_slots is not None:
+            num_slots = len(compact_slots)
+        column_store = cls.Meta.column_store if cls.Meta.columnar else None
+        if column_store is not None:
+            column_values = {attr_name: [] for attr_name in column_store.arrays.keys()}
+
+        if attr_names is not None:
+            attr_names = list(attr_names)
+            for attr_name in attr_names:
+                if attr_name not in direct_attrs and attr_name not in deferred_attrs:
+                    raise TypeError("'{:s}' is an invalid keyword argument for {}.__init__".format(
+                        attr_name, cls.__name__))
+            direct_cols = [(i_col, attr_name) for i_col, attr_name in enumerate(attr_names)
+                           if attr_name in direct_attrs]
+            deferred_cols = [(i_col, attr_name) for i_col, attr_name in enumerate(attr_names)
+                             if attr_name in deferred_attrs]
+            row_attr_names = set(attr_names)
+
+        objs = []
+        deferred_values = collections.defaultdict(list)
+        for i_row, row in enumerate(rows):
+            obj = cls.__new__(cls)
+
+            values = dict(const_defaults)
+            for attr in copied_defaults:
+                values[attr.name] = attr.get_default()
+            for attr_name, attr, forward in init_values:
+                if forward:
+                    values[attr_name] = attr.get_init_value(obj)
+                else:
+                    values[attr_name] = attr.get_related_init_value(obj)
+
+            if attr_names is None:
+                row_attr_names = row
+                for attr_name, value in row.items():
+                    if attr_name in direct_attrs:
+                        values[attr_name] = value
+                    elif attr_name in deferred_attrs:
+                        deferred_values[attr_name].append((obj, value))
+                    else:
+                        raise TypeError("'{:s}' is an invalid keyword argument for {}.__init__".format(
+                            attr_name, cls.__name__))
+            else:
+                for i_col, attr_name in direct_cols:
+                    values[attr_name] = row[i_col]
+                for i_col, attr_name in deferred_cols:
+                    deferred_values[attr_name].append((obj, row[i_col]))
+
+            for attr_name, attr, forward in related_defaults:
+                if attr_name not in row_attr_names:
+                    if forward:
+                        default = attr.get_default()
+                    else:
+                        default = attr.get_related_default(obj)
+                    if default:
+                        deferred_values[attr_name].append((obj, default))
+
+            if column_store is not None:
+                for attr_name, attr_values in column_values.items():
+                    attr_values.append(values.pop(attr_name))
+
+            if compact_slots is None:
+                obj.__dict__.update(values)
+            else:
+                slot_values = [CompactSlot.UNINITIALIZED] * num_slots
+                for attr_name, value in values.items():
+                    slot_values[compact_slots[attr_name].index] = value
+                object.__setattr__(obj, '_values', slot_values)
+                object.__setattr__(obj, '_graph_state', None)
+
+            object.__setattr__(obj, '_source', None)
+            object.__setattr__(obj, '_comments', (comments[i_row] if comments else None) or [])
+
+            objs.append(obj)
+
+        if column_store is not None:
+            column_store.extend(objs, column_values)
+
+        # set the values of the related attributes, one attribute at a time
+        for attr_name, objs_values in deferred_values.items():
+            for obj, value in objs_values:
+                setattr(obj, attr_name, value)
+
+        # register the instances with the class' Manager
+        cls.objects._register_objs(objs)
+
+        return objs
+
+
+class TraversalPlan(object):
+    """ Precompiled plan for walking the attributes of the instances of a :obj:`Model`
+
+    Each related attribute is described by a tuple of its name, the attribute, a function which gets its
+    value from an instance, and whether the attribute relates each instance to many objects. The value
+    functions of the \*-to-many attributes of compact models return empty tuples rather than creating
+    empty :obj:`RelatedManager`\ s.
+
+    Attributes:
+        cls (:obj:`type`): model
+        literal_attrs (:obj:`tuple` of :obj:`tuple`): names and literal attributes
+        to_one_attrs (:obj:`tuple` of :obj:`tuple`): forward \*-to-one attributes
+        to_many_attrs (:obj:`tuple` of :obj:`tuple`): forward \*-to-many attributes
+        reverse_to_one_attrs (:obj:`tuple` of :obj:`tuple`): reverse \*-to-one attributes
+        reverse_to_many_attrs (:obj:`tuple` of :obj:`tuple`): reverse \*-to-many attributes
+        forward_related_attrs (:obj:`tuple` of :obj:`tuple`): forward related attributes, in the order of
+            :obj:`Model.Meta.attributes`
+        reverse_related_attrs (:obj:`tuple` of :obj:`tuple`): reverse related attributes, in the order of
+            :obj:`Model.Meta.related_attributes`
+        related_attrs (:obj:`tuple` of :obj:`tuple`): forward and reverse related attributes
+        attrs (:obj:`tuple` of :obj:`tuple`): names, attributes, value functions, and kinds
+            (:obj:`TraversalPlan.LITERAL`, :obj:`TraversalPlan.TO_ONE`, or :obj:`TraversalPlan.TO_MANY`)
+            of all of the attributes, in the order of :obj:`Model.Meta.attributes` followed by
+            :obj:`Model.Meta.related_attributes`
+        expression (:obj:`bool`): if :obj:`True`, the model is a subclass of
+            :obj:`obj_tables.math.expression.Expression`
+    """
+    LITERAL = 0
+    TO_ONE = 1
+    TO_MANY = 2
+
+    def __init__(self, cls):
+        """
+        Args:
+            cls (:obj:`type`): model
+        """
+        self.cls = cls
+
+        literal_attrs = []
+        forward_related_attrs = []
+        reverse_related_attrs = []
+        attrs = []
+
+        for attr_name, attr in cls.Meta.attributes.items():
+            if isinstance(attr, RelatedAttribute):
+                to_many = isinstance(attr, ToManyAttribute)
+                get = self.get_getter(cls, attr_name, to_many)
+                forward_related_attrs.append((attr_name, attr, get, to_many))
+                attrs.append((attr_name, attr, get, self.TO_MANY if to_many else self.TO_ONE))
+            else:
+                literal_attrs.append((attr_name, attr))
+                attrs.append((attr_name, attr, attrgetter(attr_name), self.LITERAL))
+
+        for attr_name, attr in cls.Meta.related_attributes.items():
+            to_many = isinstance(attr, (ManyToOneAttribute, ManyToManyAttribute))
+            get = self.get_getter(cls, attr_name, to_many)
+            reverse_related_attrs.append((attr_name, attr, get, to_many))
+            attrs.append((attr_name, attr, get, self.TO_MANY if to_many else self.TO_ONE))
+
+        self.literal_attrs = tuple(literal_attrs)
+        self.to_one_attrs = tuple(attr for attr in forward_related_attrs if not attr[3])
+        self.to_many_attrs = tuple(attr for attr in forward_related_attrs if attr[3])
+        self.reverse_to_one_attrs = tuple(attr for attr in reverse_related_attrs if not attr[3])
+        self.reverse_to_many_attrs = tuple(attr for attr in reverse_related_attrs if attr[3])
+        self.forward_related_attrs = tuple(forward_related_attrs)
+        self.reverse_related_attrs = tuple(reverse_related_attrs)
+        self.related_attrs = self.forward_related_attrs + self.reverse_related_attrs
+        self.attrs = tuple(attrs)
+        # models can only be expressions if :obj:`obj_tables.math.expression` has been imported
+        expression_module = sys.modules.get('obj_tables.math.expression', None)
+        self.expression = expression_module is not None and issubclass(cls, expression_module.Expression)
+
+    @staticmethod
+    def get_getter(cls, attr_name, to_many):
+        """ Get a function which gets the value of a related attribute of an instance of a model
+
+        Args:
+            cls (:obj:`type`): model
+            attr_name (:obj:`str`): attribute name
+            to_many (:obj:`bool`): if :obj:`True`, the attribute relates each instance to many objects
+
+        Returns:
+            :obj:`types.FunctionType`: function which gets the value of the attribute of an instance
+        """
+        if cls.Meta.compact:
+            return cls.Meta.compact_slots[attr_name].get_getter(empty=() if to_many else None)
+        return attrgetter(attr_name)
+
+
+class ModelCodeGenerator(object):
+    """ Generator of functions which are specialized to the attributes of a :obj:`Model`
+
+    The generic implementations of the methods which initialize, encode, serialize, deserialize, and validate
+    instances iterate over the attributes of a model and dispatch to each attribute. The generator compiles
+    straight-line functions which unroll these loops for a single model, access the values of the attributes
+    directly, and copy the values of the attributes whose methods are identities without calling them. The
+    functions are compiled once per model and cached in :obj:`Model.Meta.code_generator`.
+
+    Attributes:
+        cls (:obj:`type`): model
+        init (:obj:`types.FunctionType`): function which sets the initial values of the attributes of a new
+            instance (see :obj:`Model.__init__`), or :obj:`None` for compact models
+        to_builtin (:obj:`types.FunctionType`): function which encodes the values of the attributes of an
+            instance into a dictionary (see :obj:`Model.to_dict`)
+        validate (:obj:`types.FunctionType`): function which validates the values of the attributes of an
+            instance and returns a list of their errors (see :obj:`Model.validate`)
+        sources (:obj:`dict` of :obj:`str`, :obj:`str`): dictionary that maps the names of the generated
+            functions to their source code
+        _serializers (:obj:`dict`): dictionary that maps tuples of the names of attributes to functions which
+            serialize their values into rows
+        _deserializers (:obj:`dict`): dictionary that maps tuples of the names of attributes to functions which
+            deserialize rows of their values
+    """
+
+    def __init__(self, cls):
+        """
+        Args:
+            cls (:obj:`type`): model
+        """
+        self.cls = cls
+        self.sources = {}
+        self._serializers = {}
+        self._deserializers = {}
+        self.init = self.gen_init()
+        self.to_builtin = self.gen_to_builtin()
+        self.validate = self.gen_validate()
+
+    def compile(self, func_name, args, lines, namespace):
+        """ Compile a function
+
+        Args:
+            func_name (:obj:`str`): name of the function
+            args (:obj:`list` of :obj:`str`): names of the arguments of the function
+            lines (:obj:`list` of :obj:`str`): lines of the body of the function
+            namespace (:obj:`dict`): global variables of the function
+
+        Returns:
+            :obj:`types.FunctionType`: function
+        """
+        source = 'def {}({}):\n{}'.format(func_name, ', '.join(args),
+                                          ''.join('    {}\n'.format(line) for line in lines or ['pass']))
+        self.sources[func_name] = source
+        exec(compile(source, '<{}.{}>'.format(self.cls.__name__, func_name), 'exec'), namespace)
+        return namespace[func_name]
+
+    @staticmethod
+    def get_value(obj, attr_name, namespace):
+        """ Get an expression for the value of an attribute of an object
+
+        Args:
+            obj (:obj:`str`): name of the variable which holds the object
+            attr_name (:obj:`str`): name of the attribute
+            namespace (:obj:`dict`): global variables of the function being generated
+
+        Returns:
+            :obj:`str`: expression
+        """
+        if attr_name.isidentifier() and not keyword.iskeyword(attr_name):
+            return '{}.{}'.format(obj, attr_name)
+        var = '_name_{}'.format(len(namespace))
+        namespace[var] = attr_name
+        return 'getattr({}, {})'.format(obj, var)
+
+    @staticmethod
+    def bind(value, prefix, namespace):
+        """ Bind a value to a global variable of a generated function
+
+        Args:
+            value (:obj:`object`): value
+            prefix (:obj:`str`): prefix for the name of the variable
+            namespace (:obj:`dict`): global variables of the function being generated
+
+        Returns:
+            :obj:`str`: name of the variable
+        """
+        var = '_{}_{}'.format(prefix, len(namespace))
+        namespace[var] = value
+        return var
+
+    def gen_init(self):
+        """ Generate a function which sets the initial values of the attributes of a new instance
+
+        Returns:
+            :obj:`types.FunctionType`: function, or :obj:`None` for compact models
+        """
+        cls = self.cls
+        if cls.Meta.compact:
+            return None
+
+        namespace = {}
+        items = []
+        column_store = cls.Meta.column_store if cls.Meta.columnar else None
+        for attr_name, attr in cls.Meta.attributes.items():
+            if column_store is not None and attr_name in column_store.arrays:
+                # the values of the attributes stored in columns are set by :obj:`Model.__init__`
+                continue
+            if type(attr).get_init_value is Attribute.get_init_value \
+                    and (attr.init_value is None or isinstance(attr.init_value, (str, bool, int, float, Enum))):
+                value = self.bind(attr.init_value, 'init_value', namespace)
+            else:
+                value = '{}.get_init_value(obj)'.format(self.bind(attr, 'attr', namespace))
+            items.append('{!r}: {},'.format(attr_name, value))
+        for attr in cls.Meta.related_attributes.values():
+            items.append('{!r}: {}.get_related_init_value(obj),'.format(
+                attr.related_name, self.bind(attr, 'attr', namespace)))
+
+        return self.compile('init', ['obj'], ['obj.__dict__.update({'] + ['    ' + item for item in items] + ['})'],
+                            namespace)
+
+    def gen_to_builtin(self):
+        """ Generate a function which encodes the values of the attributes of an instance into a dictionary
+
+        The function has three arguments: the instance, the dictionary, and a function which encodes related
+        objects.
+
+        Returns:
+            :obj:`types.FunctionType`: function
+        """
+        plan = self.cls.Meta.traversal_plan or self.cls.get_traversal_plan()
+        namespace = {}
+        lines = []
+        for attr_name, attr, get, kind in plan.attrs:
+            if kind == TraversalPlan.LITERAL:
+                value = self.get_value('obj', attr_name, namespace)
+                if type(attr).to_builtin is not LiteralAttribute.to_builtin:
+                    value = '{}.to_builtin({})'.format(self.bind(attr, 'attr', namespace), value)
+                lines.append('json_obj[{!r}] = {}'.format(attr_name, value))
+            else:
+                lines.append('val = {}(obj)'.format(self.bind(get, 'get', namespace)))
+                if kind == TraversalPlan.TO_MANY:
+                    lines.append('json_obj[{!r}] = [encode(v) for v in val]'.format(attr_name))
+                else:
+                    lines.append('json_obj[{!r}] = None if val is None else encode(val)'.format(attr_name))
+        return self.compile('to_builtin', ['obj', 'json_obj', 'encode'], lines, namespace)
+
+    def gen_validate(self):
+        """ Generate a function which validates the values of the attributes of an instance
+
+        Returns:
+            :obj:`types.FunctionType`: function which returns a list of the errors of the attributes
+        """
+        cls = self.cls
+        namespace = {}
+        lines = ['errors = []']
+        for attr_name, attr in cls.Meta.attributes.items():
+            lines.append('error = {}.validate(obj, {})'.format(self.bind(attr, 'attr', namespace),
+                                                              self.get_value('obj', attr_name, namespace)))
+            lines.append('if error:')
+            lines.append('    errors.append(error)')
+        for attr in cls.Meta.related_attributes.values():
+            if attr.related_name:
+                lines.append('error = {}.related_validate(obj, {})'.format(
+                    self.bind(attr, 'attr', namespace), self.get_value('obj', attr.related_name, namespace)))
+                lines.append('if error:')
+                lines.append('    errors.append(error)')
+        lines.append('return errors')
+        return self.compile('validate', ['obj'], lines, namespace)
+
+    def get_serializer(self, attrs):
+        """ Get a function which serializes the values of attributes of an instance into a row
+
+        The function has two arguments: the instance and a dictionary of the objects that have already been
+        encoded (see :obj:`RelatedAttribute.serialize`).
+
+        Args:
+            attrs (:obj:`list` of :obj:`Attribute`): attributes of the model, in the order of the columns
+
+        Returns:
+            :obj:`types.FunctionType`: function which returns a list of the serialized values
+        """
+        key = tuple(attr.name for attr in attrs)
+        serializer = self._serializers.get(key, None)
+        if serializer is None:
+            namespace = {}
+            items = []
+            for attr in attrs:
+                value = self.get_value('obj', attr.name, namespace)
+                if isinstance(attr, RelatedAttribute):
+                    value = '{}.serialize({}, encoded=encoded)'.format(self.bind(attr, 'attr', namespace), value)
+                elif type(attr).serialize not in (LiteralAttribute.serialize, StringAttribute.serialize):
+                    value = '{}.serialize({})'.format(self.bind(attr, 'attr', namespace), value)
+                items.append('    {},'.format(value))
+            serializer = self._serializers[key] = self.compile(
+                'serialize', ['obj', 'encoded'], ['return ['] + items + [']'], namespace)
+        return serializer
+
+    def get_deserializer(self, attrs):
+        """ Get a function which deserializes and validates the values of literal attributes from a row
+
+        The function has two arguments: the row and a list to which the function appends the errors of the
+        values. It returns a dictionary that maps the names of the attributes to their values, which can be
+        passed to :obj:`Model.bulk_create`. Each error is a tuple of the attribute, the value in the row, and the
+        deserialization error, validation error, and exception (or :obj:`None`). Attributes whose values raise
+        exceptions are omitted from the dictionary. Columns which have a value of :obj:`None` in :obj:`attrs`
+        are ignored.
+
+        Args:
+            attrs (:obj:`list` of :obj:`LiteralAttribute`): literal attributes of the model, in the order
+                of the columns
+
+        Returns:
+            :obj:`types.FunctionType`: function
+        """
+        key = tuple(attr.name if attr else None for attr in attrs)
+        deserializer = self._deserializers.get(key, None)
+        if deserializer is None:
+            namespace = {}
+            lines = ['values = {}']
+            for i_col, attr in enumerate(attrs):
+                if attr is None:
+                    continue
+                attr_var = self.bind(attr, 'attr', namespace)
+                lines.extend([
+                    'attr_value = row[{}]'.format(i_col),
+                    'try:',
+                    '    value, deserialize_error = {}.deserialize(attr_value)'.format(attr_var),
+                    '    validation_error = {}.validate({}, value)'.format(
+                        attr_var, self.bind(attr.__class__, 'attr_cls', namespace)),
+                    '    if deserialize_error or validation_error:',
+                    '        errors.append(({}, attr_value, deserialize_error, validation_error, None))'.format(
+                        attr_var),
+                    '    values[{}] = value'.format(self.bind(attr.name, 'name', namespace)),
+                    'except Exception as exception:',
+                    '    errors.append(({}, attr_value, None, None, exception))'.format(attr_var),
+                ])
+            lines.append('return values')
+            deserializer = self._deserializers[key] = self.compile(
+                'deserialize', ['row', 'errors'], lines, namespace)
+        return deserializer
+
+
+class GraphState(object):
+    """ Version of a connected graph of objects
+
+    The states of the objects of a graph are merged (as in a union-find forest) when the graph is
+    traversed (e.g., by :obj:`Model.normalize`) and when objects which have states are related to other
+    objects. The version of the root state of a graph is incremented whenever an attribute of one of its
+    objects or one of their :obj:`RelatedManager`\ s is modified. This allows computations on graphs to be
+    skipped when the graphs have not been modified, independently of the changes to other graphs, and
+    allows changes to be attributed to graphs (see :obj:`ChangeJournal`).
+
+    Objects only have states once their graph has been traversed, which avoids any overhead for objects
+    which are never traversed. If an object has a state, all of the objects of its graph have states with
+    the same root: when an object without a state is related to an object with a state, the graph of the
+    former is traversed once to give its objects states. States are never split when objects are unrelated,
+    which conservatively invalidates the computations on both of the resulting graphs.
+
+    Attributes:
+        parent (:obj:`GraphState`): state which this state was merged into, or :obj:`None` if this state
+            is the root of its graph
+        version (:obj:`int`): version of the graph (only maintained by the root state)
+        normalized_version (:obj:`int`): version of the graph when it was last normalized
+    """
+    __slots__ = ('parent', 'version', 'normalized_version')
+
+    def __init__(self):
+        self.parent = None
+        self.version = 0
+        self.normalized_version = None
+
+    def get_root(self):
+        """ Get the root state of the graph of this state
+
+        Returns:
+            :obj:`GraphState`: root state
+        """
+        state = self
+        while state.parent is not None:
+            parent = state.parent
+            if parent.parent is not None:
+                state.parent = parent.parent
+            state = parent
+        return state
+
+    @staticmethod
+    def get(obj):
+        """ Get the root state of the graph of an object, creating states for the objects of the graph
+        if the object has no state
+
+        Args:
+            obj (:obj:`Model`): object
+
+        Returns:
+            :obj:`GraphState`: root state
+        """
+        state = obj._graph_state
+        if state is None:
+            return GraphState.link_all(Model.get_all_related([obj]))
+        return state.get_root()
+
+    @staticmethod
+    def touch(obj):
+        """ Record that an object was modified
+
+        Args:
+            obj (:obj:`Model`): object
+        """
+        state = obj._graph_state
+        if state is not None:
+            state.get_root().version += 1
+
+    @staticmethod
+    def link(obj, values):
+        """ Record that an object was related to other objects by merging their states, if any of them
+        has a state
+
+        Args:
+            obj (:obj:`Model`): object
+            values (:obj:`iterable` of :obj:`Model`): related objects
+        """
+        if obj._graph_state is None:
+            for value in values:
+                if value._graph_state is not None:
+                    break
+            else:
+                return
+
+        root = GraphState.get(obj)
+        for value in values:
+            root = GraphState.merge(root, GraphState.get(value))
+        root.version += 1
+
+    @staticmethod
+    def merge(root, other_root):
+        """ Merge two graphs
+
+        Args:
+            root (:obj:`GraphState`): root state of a graph
+            other_root (:obj:`GraphState`): root state of another graph
+
+        Returns:
+            :obj:`GraphState`: root state of the merged graph
+        """
+        if other_root is root:
+            return root
+        other_root.parent = root
+        root.version = max(root.version, other_root.version) + 1
+        return root
 
-class TableFormat(Enum):
-    """ Describes a table's orientation
+    @staticmethod
+    def link_all(objs):
+        """ Merge the states of objects which were traversed into the state of a single graph
 
-    * :obj:`row`: the first row contains attribute names; subsequents rows store objects
-    * :obj:`column`: the first column contains attribute names; subsequents columns store objects
-    * :obj:`cell`: a cell contains a table, as a comma-separated list for example
-    * :obj:`multiple_cells`: multiple cells within a row or column
-    """
-    row = 1
-    column = 2
-    cell = 3
-    multiple_cells = 4
+        Args:
+            objs (:obj:`iterable` of :obj:`Model`): objects
+
+        Returns:
+            :obj:`GraphState`: root state of the graph
+        """
+        root = None
+        for obj in objs:
+            state = obj._graph_state
+            if state is None:
+                if root is None:
+                    root = GraphState()
+                object.__setattr__(obj, '_graph_state', root)
+            elif root is None:
+                root = state.get_root()
+            else:
+                root = GraphState.merge(root, state.get_root())
+        return root
 
 
 class Model(object, metaclass=ModelMeta):
@@ -1001,6 +4443,9 @@ class Model(object, metaclass=ModelMeta):
                 attribute values must be unique
             indexed_attrs_tuples (:obj:`tuple` of :obj:`tuple`'s of attribute names): tuples of attributes on
                 which instances of this :obj:`Model` will be indexed by the :obj:`Model`'s :obj:`Manager`
+            ordered_indexes (:obj:`tuple` of attribute names): attributes whose values will be kept in sorted
+                indexes by the :obj:`Model`'s :obj:`Manager` to support range and prefix queries
+                (see :obj:`Manager.filter`)
             attribute_order (:obj:`tuple` of :obj:`str`): tuple of attribute names, in the order in which they should be displayed
             verbose_name (:obj:`str`): verbose name to refer to an instance of the model
             verbose_name_plural (:obj:`str`): plural verbose name for multiple instances of the model
@@ -1012,12 +4457,27 @@ class Model(object, metaclass=ModelMeta):
             children (:obj:`dict` that maps :obj:`str` to :obj:`tuple` of :obj:`str`): dictionary that maps types of children to
                 names of attributes which compose each type of children
             merge (:obj:`ModelMerge`): type of merging operation
+            compact (:obj:`bool`): if :obj:`True`, store the values of the attributes of each instance in
+                slots rather than in a dictionary, and create the :obj:`RelatedManager`\ s of instances lazily;
+                instances don't have dictionaries, so attributes other than the model attributes and the internal
+                attributes of :obj:`CompactSlot.INSTANCE_SLOT_NAMES` cannot be set
+            compact_slots (:obj:`collections.OrderedDict` of :obj:`str`, :obj:`CompactSlot`): dictionary that maps
+                the names of the attributes of compact models to the descriptors which store their values
+            columnar (:obj:`bool`): if :obj:`True`, store the values of the numeric and Boolean attributes of
+                the instances in typed NumPy arrays (see :obj:`ColumnStore`)
+            column_store (:obj:`ColumnStore`): store of the values of the numeric and Boolean attributes of the
+                instances of columnar models
+            initializer (:obj:`ModelInitializer`): initializer which constructs instances in bulk
+            traversal_plan (:obj:`TraversalPlan`): plan for walking the attributes of instances
+            code_generator (:obj:`ModelCodeGenerator`): functions which are specialized to the attributes
+                of the model
         """
         attributes = None
         related_attributes = None
         primary_attribute = None
         unique_together = ()
         indexed_attrs_tuples = ()
+        ordered_indexes = ()
         attribute_order = ()
         verbose_name = ''
         verbose_name_plural = ''
@@ -1028,6 +4488,22 @@ class Model(object, metaclass=ModelMeta):
         ordering = None
         children = {}
         merge = ModelMerge.join
+        compact = False
+        compact_slots = None
+        columnar = False
+        column_store = None
+        initializer = None
+        traversal_plan = None
+        code_generator = None
+
+    __slots__ = ()
+
+    # state of the graph of the instance (see :obj:`GraphState`), created when the instance is first traversed
+    _graph_state = None
+
+    # maximum number of rounds of refinement of the fingerprints of the objects of a graph
+    # (see :obj:`Model._compute_fingerprints`)
+    _fingerprint_rounds = 8
 
     def __init__(self, _comments=None, **kwargs):
         """
@@ -1042,21 +4518,29 @@ class Model(object, metaclass=ModelMeta):
         self.validate_related_attributes()
 
         """ initialize attributes """
-        # attributes
-        for attr in self.Meta.attributes.values():
-            super(Model, self).__setattr__(
-                attr.name, attr.get_init_value(self))
+        compact = self.Meta.compact
+        if compact:
+            # the initial values of related attributes are created lazily by :obj:`CompactSlot`
+            super(Model, self).__setattr__('_values', [CompactSlot.UNINITIALIZED] * len(self.Meta.compact_slots))
+            super(Model, self).__setattr__('_graph_state', None)
 
-        # related attributes
-        for attr in self.Meta.related_attributes.values():
-            super(Model, self).__setattr__(
-                attr.related_name, attr.get_related_init_value(self))
+            for attr in self.Meta.attributes.values():
+                if not isinstance(attr, RelatedAttribute):
+                    super(Model, self).__setattr__(
+                        attr.name, attr.get_init_value(self))
+
+        else:
+            # attributes and related attributes
+            code_generator = self.Meta.code_generator or self.get_code_generator()
+            code_generator.init(self)
 
         """ set attribute values """
         # attributes
         for attr in self.Meta.attributes.values():
             if attr.name not in kwargs:
                 default = attr.get_default()
+                if compact and not default and isinstance(attr, RelatedAttribute):
+                    continue
                 setattr(self, attr.name, default)
 
         # attributes
@@ -1264,6 +4748,11 @@ class Model(object, metaclass=ModelMeta):
             value (:obj:`object`): value
             propagate (:obj:`bool`, optional): propagate change through attribute :obj:`set_value` and :obj:`set_related_value`
         """
+        if isinstance(value, Model):
+            GraphState.link(self, (value, ))
+        else:
+            GraphState.touch(self)
+
         if propagate:
             if attr_name in self.__class__.Meta.attributes:
                 attr = self.__class__.Meta.attributes[attr_name]
@@ -1273,7 +4762,83 @@ class Model(object, metaclass=ModelMeta):
                 attr = self.__class__.Meta.related_attributes[attr_name]
                 value = attr.set_related_value(self, value)
 
-        super(Model, self).__setattr__(attr_name, value)
+        if ChangeJournal._journals and (attr_name in self.__class__.Meta.attributes
+                                        or attr_name in self.__class__.Meta.related_attributes):
+            old_value = ChangeJournal.get_value(self, attr_name)
+            super(Model, self).__setattr__(attr_name, value)
+            if old_value is not value and old_value is not ChangeJournal.MISSING:
+                ChangeJournal._record_all(AttributeChange(self, attr_name, old_value, value))
+        else:
+            super(Model, self).__setattr__(attr_name, value)
+
+        manager = self.__class__.objects
+        if attr_name in manager._attr_tuples_by_name or manager._any_attr_tuples:
+            manager._update_attr(self, attr_name)
+
+        # notify the stores which contain instances of the model, except about changes to internal attributes
+        # (e.g., :obj:`_source`)
+        store_refs = ObjectStore._stores_by_model.get(self.__class__, None)
+        if store_refs and (attr_name in self.__class__.Meta.attributes
+                           or attr_name in self.__class__.Meta.related_attributes):
+            for ref in store_refs:
+                store = ref()
+                if store is not None:
+                    store._update_attr(self, attr_name)
+
+        if RelatedManager._indexed_attr_names and attr_name in RelatedManager._indexed_attr_names:
+            for manager in self._get_indexing_related_managers(attr_name):
+                manager._unindex_values((self, ))
+                manager._index_values((self, ))
+
+        if attr_name in Manager._related_dependencies:
+            Manager._update_related_dependents(self, attr_name)
+
+    def _get_indexing_related_managers(self, attr_name):
+        """ Get the :obj:`RelatedManager`\ s which contain this object and which index the attribute :obj:`attr_name`
+        of their values
+
+        The managers which contain an object are found by following the related attributes of the object.
+
+        Args:
+            attr_name (:obj:`str`): attribute name
+
+        Returns:
+            :obj:`list` of :obj:`RelatedManager`: related managers
+        """
+        managers = []
+        cls = self.__class__
+        for attr in cls.Meta.attributes.values():
+            if isinstance(attr, RelatedAttribute) and attr.related_name:
+                managers.extend(self._get_containing_related_managers(attr.name, attr.related_name, attr_name))
+        for attr in cls.Meta.related_attributes.values():
+            managers.extend(self._get_containing_related_managers(attr.related_name, attr.name, attr_name))
+        return managers
+
+    def _get_containing_related_managers(self, attr_name, other_attr_name, indexed_attr_name):
+        """ Get the :obj:`RelatedManager`\ s of the objects related to this object through one of its related
+        attributes which contain this object and index an attribute
+
+        Args:
+            attr_name (:obj:`str`): name of a related attribute of this object
+            other_attr_name (:obj:`str`): name of the corresponding attribute of the related objects
+            indexed_attr_name (:obj:`str`): name of the indexed attribute
+
+        Returns:
+            :obj:`list` of :obj:`RelatedManager`: related managers
+        """
+        value = getattr(self, attr_name, None)
+        if value is None:
+            return []
+        if not isinstance(value, (list, tuple)):
+            value = (value, )
+
+        managers = []
+        for related_obj in value:
+            manager = getattr(related_obj, other_attr_name, None)
+            if isinstance(manager, RelatedManager) and manager._indexes and self in manager and \
+                    any(indexed_attr_name in attr_names for attr_names in manager._indexes):
+                managers.append(manager)
+        return managers
 
     @classmethod
     def get_nested_attr(cls, attr_path):
@@ -1457,51 +5022,89 @@ class Model(object, metaclass=ModelMeta):
 
         return (attr_name, attr_get_one_filter)
 
-    def normalize(self):
+    def normalize(self, force=False):
         """ Normalize an object into a canonical form. Specifically, this method sorts the RelatedManagers
         into a canonical order because their order has no semantic meaning. Importantly, this canonical form
         is reproducible. Thus, this canonical form facilitates reproducible computations on top of :obj:`Model`
         objects.
+
+        The object graph is traversed once, the sort key of each object is computed at most once, and
+        object graphs which have not been modified since they were last normalized are skipped. Changes
+        to the attributes of objects and to :obj:`RelatedManager`\ s are tracked separately for each
+        graph (see :obj:`GraphState`). In-place changes to mutable attribute values (e.g., lists) are not
+        tracked.
+
+        Args:
+            force (:obj:`bool`, optional): if :obj:`True`, normalize the object graph even if it has
+                not been modified since it was last normalized
         """
+        state = self._graph_state
+        if not force and state is not None:
+            state = state.get_root()
+            if state.normalized_version == state.version:
+                return
 
         self._generate_normalize_sort_keys()
 
-        normalized_objs = []
+        # sort keys of the objects, memoized for this pass
+        key_cache = {}
+        memoized_key_funcs = {}
+
+        def get_key_func(cls):
+            key_func = memoized_key_funcs.get(cls, None)
+            if key_func is None:
+                cls_key_func = cls._normalize_sort_key(cache=key_cache)
+                cls_keys = {}
+
+                def key_func(obj):
+                    key = cls_keys.get(obj, cls_keys)
+                    if key is cls_keys:
+                        key = cls_keys[obj] = cls_key_func(obj)
+                    return key
+                memoized_key_funcs[cls] = key_func
+            return key_func
+
+        normalized_objs = set()
         objs_to_normalize = [self]
 
         while objs_to_normalize:
             obj = objs_to_normalize.pop()
             if obj not in normalized_objs:
-                normalized_objs.append(obj)
+                normalized_objs.add(obj)
 
-                for attr_name, attr in chain(obj.Meta.attributes.items(), obj.Meta.related_attributes.items()):
-                    if isinstance(attr, RelatedAttribute):
-                        val = getattr(obj, attr_name)
+                plan = obj.Meta.traversal_plan or obj.get_traversal_plan()
+                for attrs, forward in ((plan.forward_related_attrs, True), (plan.reverse_related_attrs, False)):
+                    for attr_name, attr, get, to_many in attrs:
+                        val = get(obj)
 
                         # normalize children
-                        if isinstance(val, list):
+                        if to_many:
                             objs_to_normalize.extend(val)
                         elif val:
                             objs_to_normalize.append(val)
 
                         # sort
-                        if isinstance(val, list) and len(val) > 1:
-                            if attr_name in obj.Meta.attributes:
+                        if to_many and len(val) > 1:
+                            if forward:
                                 cls = attr.related_class
                             else:
                                 cls = attr.primary_class
 
-                            val.sort(key=cls._normalize_sort_key())
+                            val.sort(key=get_key_func(cls))
+
+        # record that the graph is normalized
+        state = GraphState.link_all(normalized_objs)
+        state.normalized_version = state.version
 
     @classmethod
     def _generate_normalize_sort_keys(cls):
         """ Generates keys for sorting the class """
-        generated_keys = []
+        generated_keys = set()
         keys_to_generate = [cls]
         while keys_to_generate:
             cls = keys_to_generate.pop()
             if cls not in generated_keys:
-                generated_keys.append(cls)
+                generated_keys.add(cls)
 
                 cls._normalize_sort_key = cls._generate_normalize_sort_key()
 
@@ -1530,11 +5133,12 @@ class Model(object, metaclass=ModelMeta):
         return cls._generate_normalize_sort_key_all_attrs
 
     @classmethod
-    def _generate_normalize_sort_key_unique_attr(cls, processed_models=None):
+    def _generate_normalize_sort_key_unique_attr(cls, processed_models=None, cache=None):
         """ Generate a key for sorting models by their first unique attribute into a normalized order
 
         Args:
             processed_models (:obj:`list`, optional): list of models for which sort keys have already been generated
+            cache (:obj:`dict`, optional): dictionary of previously computed keys
 
         Returns:
             :obj:`function`: key for sorting models by their first unique attribute into a normalized order
@@ -1551,11 +5155,12 @@ class Model(object, metaclass=ModelMeta):
         return key
 
     @classmethod
-    def _generate_normalize_sort_key_unique_together(cls, processed_models=None):
+    def _generate_normalize_sort_key_unique_together(cls, processed_models=None, cache=None):
         """ Generate a key for sorting models by their shortest set of unique attributes into a normalized order
 
         Args:
             processed_models (:obj:`list`, optional): list of models for which sort keys have already been generated
+            cache (:obj:`dict`, optional): dictionary of previously computed keys
 
         Returns:
             :obj:`function`: key for sorting models by their shortest set of unique attributes into a normalized order
@@ -1579,20 +5184,29 @@ class Model(object, metaclass=ModelMeta):
         return key
 
     @classmethod
-    def _generate_normalize_sort_key_all_attrs(cls, processed_models=None):
+    def _generate_normalize_sort_key_all_attrs(cls, processed_models=None, cache=None):
         """ Generate a key for sorting models by all of their attributes into a normalized order. This method should
         be used for models which do not have unique attributes or sets of unique attributes.
 
         Args:
             processed_models (:obj:`list`, optional): list of models for which sort keys have already been generated
+            cache (:obj:`dict`, optional): dictionary of previously computed keys, which is used to avoid
+                recomputing the keys of related objects
 
         Returns:
             :obj:`function`: key for sorting models by all of their attributes into a normalized order
         """
         processed_models = copy.copy(processed_models) or []
         processed_models.append(cls)
+        cache_context = tuple(processed_models)
 
         def key(obj, processed_models=processed_models):
+            if cache is not None:
+                cache_key = (obj, cache_context)
+                vals = cache.get(cache_key, None)
+                if vals is not None:
+                    return vals
+
             vals = []
             for attr_name in chain(cls.Meta.attributes.keys(), cls.Meta.related_attributes.keys()):
                 val = getattr(obj, attr_name)
@@ -1600,18 +5214,22 @@ class Model(object, metaclass=ModelMeta):
                     if val.__class__ not in processed_models:
                         subvals_serial = []
                         for subval in val:
-                            key = subval._normalize_sort_key(processed_models=processed_models)
+                            key = subval._normalize_sort_key(processed_models=processed_models, cache=cache)
                             subval_serial = key(subval)
                             subvals_serial.append(subval_serial)
                         vals.append(tuple(sorted(subvals_serial)))
                 elif isinstance(val, Model):
                     if val.__class__ not in processed_models:
                         key_gen = val._normalize_sort_key
-                        key = key_gen(processed_models=processed_models)
+                        key = key_gen(processed_models=processed_models, cache=cache)
                         vals.append(key(val))
                 else:
                     vals.append(OrderableNone if val is None else val)
-            return tuple(vals)
+            vals = tuple(vals)
+
+            if cache is not None:
+                cache[cache_key] = vals
+            return vals
         return key
 
     def is_equal(self, other, tol=0.):
@@ -1636,36 +5254,36 @@ class Model(object, metaclass=ModelMeta):
         self.normalize()
         other.normalize()
 
-        checked_pairs = []
+        checked_pairs = set()
         pairs_to_check = [(self, other, )]
         while pairs_to_check:
             pair = pairs_to_check.pop()
             obj, other_obj = pair
             if pair not in checked_pairs:
-                checked_pairs.append(pair)
+                checked_pairs.add(pair)
 
                 # non-related attributes
                 if not obj._is_equal_attributes(other_obj, tol=tol):
                     return False
 
                 # related attributes
-                for attr_name, attr in chain(obj.Meta.attributes.items(), obj.Meta.related_attributes.items()):
-                    if isinstance(attr, RelatedAttribute):
-                        val = getattr(obj, attr_name)
-                        other_val = getattr(other_obj, attr_name)
-
-                        if val.__class__ != other_val.__class__:
-                            return False
+                plan = obj.Meta.traversal_plan or obj.get_traversal_plan()
+                for attr_name, attr, get, to_many in plan.related_attrs:
+                    val = get(obj)
+                    other_val = get(other_obj)
 
-                        if val is None:
-                            pass
-                        elif isinstance(val, Model):
-                            pairs_to_check.append((val, other_val, ))
-                        elif len(val) != len(other_val):
+                    if to_many:
+                        if len(val) != len(other_val):
                             return False  # pragma: no cover # unreachable because already checked by :obj:`_is_equal_attributes`
-                        else:
-                            for v, ov in zip(val, other_val):
-                                pairs_to_check.append((v, ov, ))
+                        for v, ov in zip(val, other_val):
+                            pairs_to_check.append((v, ov, ))
+                    elif val is None:
+                        if other_val is not None:
+                            return False
+                    elif other_val is None:
+                        return False
+                    else:
+                        pairs_to_check.append((val, other_val, ))
 
         return True
 
@@ -1688,15 +5306,16 @@ class Model(object, metaclass=ModelMeta):
             return False
 
         # check that their non-related attributes are semantically equal
-        for attr_name, attr in chain(self.Meta.attributes.items(), self.Meta.related_attributes.items()):
-            val = getattr(self, attr_name)
-            other_val = getattr(other, attr_name)
+        plan = self.Meta.traversal_plan or self.get_traversal_plan()
+        for attr_name, attr, get, kind in plan.attrs:
+            val = get(self)
+            other_val = get(other)
 
-            if not isinstance(attr, RelatedAttribute):
+            if kind == TraversalPlan.LITERAL:
                 if not attr.value_equal(val, other_val, tol=tol):
                     return False
 
-            elif isinstance(val, RelatedManager):
+            elif kind == TraversalPlan.TO_MANY:
                 if len(val) != len(other_val):
                     return False
 
@@ -1706,6 +5325,125 @@ class Model(object, metaclass=ModelMeta):
 
         return True
 
+    def fingerprint(self):
+        """ Get a stable hash of the content of an object and the objects related to it
+
+        The fingerprint of an object is computed from the values of its literal attributes, the
+        fingerprints of the objects in its neighborhood, and the content of its graph (see
+        :obj:`Model._compute_fingerprints`). Therefore, objects which have the same content and
+        relationships have the same fingerprint, independent of the order of their :obj:`RelatedManager`\ s,
+        of their identities, and of the other graphs whose fingerprints have been computed.
+
+        Fingerprints are cached on objects and recomputed after any attribute or :obj:`RelatedManager`
+        of their graph is modified (see :obj:`GraphState`). In-place changes to mutable attribute values
+        (e.g., lists) are not tracked.
+
+        Returns:
+            :obj:`str`: fingerprint
+        """
+        fingerprint = getattr(self, '_fingerprint', None)
+        if fingerprint is None or fingerprint[0] != self._graph_state.get_root().version:
+            Model._compute_fingerprints(Model.get_all_related([self]))
+            fingerprint = self._fingerprint
+        return fingerprint[1].hex()
+
+    @staticmethod
+    def fingerprint_graph(objs):
+        """ Get a stable hash of the content of a graph of objects
+
+        Args:
+            objs (:obj:`list` of :obj:`Model`): objects; the graph includes all objects related to them
+
+        Returns:
+            :obj:`str`: fingerprint of the graph
+        """
+        fingerprints = []
+        found_objs = set()
+        for obj in objs:
+            if obj in found_objs:
+                continue
+
+            # get the fingerprints of the objects of each connected graph
+            graph_objs = Model.get_all_related([obj])
+            found_objs.update(graph_objs)
+            for graph_obj in graph_objs:
+                fingerprint = getattr(graph_obj, '_fingerprint', None)
+                if fingerprint is None or fingerprint[0] != graph_obj._graph_state.get_root().version:
+                    Model._compute_fingerprints(graph_objs)
+                    break
+            fingerprints.extend(graph_obj._fingerprint[1] for graph_obj in graph_objs)
+
+        digest = hashlib.blake2b(b'graph', digest_size=16)
+        for fingerprint in sorted(fingerprints):
+            digest.update(fingerprint)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _compute_fingerprints(objs):
+        """ Compute and cache the fingerprints of the objects of a connected graph
+
+        The fingerprints are computed by iteratively refining hashes of the literal attributes of the
+        objects with the sorted hashes of their related objects, until the refinement no longer distinguishes
+        additional objects or for at most :obj:`Model._fingerprint_rounds` rounds. This handles cycles and
+        requires O(n) time per round. Each refined hash is then combined with a hash of all of the refined
+        hashes of the graph, so that the fingerprint of each object reflects the content of its entire graph.
+        Because each graph is fingerprinted separately, with a number of rounds which only depends on the
+        graph, the fingerprints do not depend on which other graphs have been fingerprinted.
+
+        Args:
+            objs (:obj:`list` of :obj:`Model`): objects of a connected graph
+        """
+        version = GraphState.link_all(objs).version
+
+        # hash the literal attributes of each object
+        hashes = {}
+        plans = {}
+        for obj in objs:
+            cls = obj.__class__
+            plan = plans.get(cls, None)
+            if plan is None:
+                plan = plans[cls] = cls.Meta.traversal_plan or cls.get_traversal_plan()
+
+            digest = hashlib.blake2b((cls.__module__ + '.' + cls.__name__).encode(), digest_size=16)
+            for attr_name, attr in plan.literal_attrs:
+                value = json.dumps(attr.to_builtin(getattr(obj, attr_name)), sort_keys=True, default=str)
+                digest.update('\0{}={}'.format(attr_name, value).encode())
+            hashes[obj] = digest.digest()
+        num_distinct = len(set(hashes.values()))
+
+        # refine the hashes with the hashes of the related objects
+        for _ in range(Model._fingerprint_rounds):
+            refined_hashes = {}
+            for obj, obj_hash in hashes.items():
+                digest = hashlib.blake2b(obj_hash, digest_size=16)
+                for attr_name, attr, get, to_many in plans[obj.__class__].related_attrs:
+                    val = get(obj)
+                    if to_many:
+                        related_hashes = sorted(hashes[v] for v in val)
+                    elif val is None:
+                        related_hashes = ()
+                    else:
+                        related_hashes = (hashes[val], )
+                    digest.update('\0{}:{}:'.format(attr_name, len(related_hashes)).encode())
+                    for related_hash in related_hashes:
+                        digest.update(related_hash)
+                refined_hashes[obj] = digest.digest()
+
+            hashes = refined_hashes
+            refined_num_distinct = len(set(hashes.values()))
+            if refined_num_distinct == num_distinct:
+                break
+            num_distinct = refined_num_distinct
+
+        # combine the hashes with the hash of the graph, and cache the fingerprints
+        graph_digest = hashlib.blake2b(b'graph', digest_size=16)
+        for obj_hash in sorted(hashes.values()):
+            graph_digest.update(obj_hash)
+        graph_hash = graph_digest.digest()
+        for obj, obj_hash in hashes.items():
+            object.__setattr__(obj, '_fingerprint', (version, hashlib.blake2b(
+                obj_hash + graph_hash, digest_size=16).digest()))
+
     def __str__(self):
         """ Get the string representation of an object
 
@@ -1803,19 +5541,32 @@ class Model(object, metaclass=ModelMeta):
         attr = cls.Meta.attributes[attr_name]
         return attr.serialize(getattr(object, attr_name))
 
-    def difference(self, other, tol=0.):
+    def difference(self, other, tol=0., keys=None):
         """ Get the semantic difference between two models
 
+        The elements of \*-to-many attributes are paired by their serialized values with hash joins,
+        and the serialized value of each object is computed at most once.
+
         Args:
             other (:obj:`Model`): other :obj:`Model`
             tol (:obj:`float`, optional): equality tolerance
+            keys (:obj:`dict`, optional): dictionary that maps objects to their serialized values, which
+                can be shared between calls to memoize the serialized values of objects
 
         Returns:
             :obj:`str`: difference message
         """
+        if keys is None:
+            keys = {}
+
+        def get_key(obj):
+            key = keys.get(obj, None)
+            if key is None:
+                key = keys[obj] = obj.serialize() or ''
+            return key
 
         total_difference = {}
-        checked_pairs = []
+        checked_pairs = set()
         pairs_to_check = [(self, other, total_difference)]
         while pairs_to_check:
             obj, other_obj, difference = pairs_to_check.pop()
@@ -1823,7 +5574,7 @@ class Model(object, metaclass=ModelMeta):
 
             if pair in checked_pairs:
                 continue
-            checked_pairs.append(pair)
+            checked_pairs.add(pair)
 
             # initialize structure to store differences
             difference['objects'] = (obj, other_obj, )
@@ -1837,49 +5588,37 @@ class Model(object, metaclass=ModelMeta):
             # attributes
             difference['attributes'] = {}
 
-            for attr_name, attr in chain(obj.Meta.attributes.items(), obj.Meta.related_attributes.items()):
-                val = getattr(obj, attr_name)
-                other_val = getattr(other_obj, attr_name)
+            plan = obj.Meta.traversal_plan or obj.get_traversal_plan()
+            for attr_name, attr, get, kind in plan.attrs:
+                val = get(obj)
+                other_val = get(other_obj)
 
-                if not isinstance(attr, RelatedAttribute):
+                if kind == TraversalPlan.LITERAL:
                     if not attr.value_equal(val, other_val, tol=tol):
                         difference['attributes'][
                             attr_name] = '{} != {}'.format(val, other_val)
 
-                elif isinstance(val, RelatedManager):
+                elif kind == TraversalPlan.TO_MANY:
                     if len(val) != len(other_val):
                         difference['attributes'][attr_name] = 'Length: {} != Length: {}'.format(
                             len(val), len(other_val))
                     else:
-                        serial_vals = sorted(((v.serialize() or '', v)
-                                              for v in val), key=lambda x: x[0])
-                        serial_other_vals = sorted(
-                            ((v.serialize() or '', v) for v in other_val), key=lambda x: x[0])
+                        # pair the elements by their serialized values
+                        other_vals_by_key = {}
+                        for other_v in other_val:
+                            other_vals_by_key.setdefault(get_key(other_v), collections.deque()).append(other_v)
 
-                        i_val = 0
-                        oi_val = 0
                         difference['attributes'][attr_name] = []
-                        while i_val < len(val) and oi_val < len(other_val):
-                            serial_v = serial_vals[i_val][0]
-                            serial_ov = serial_other_vals[oi_val][0]
-                            if serial_v == serial_ov:
+                        for v in val:
+                            key = get_key(v)
+                            matches = other_vals_by_key.get(key, None)
+                            if matches:
                                 el_diff = {}
-                                difference['attributes'][
-                                    attr_name].append(el_diff)
-                                pairs_to_check.append(
-                                    (serial_vals[i_val][1], serial_other_vals[oi_val][1], el_diff))
-                                i_val += 1
-                                oi_val += 1
-                            elif serial_v < serial_ov:
-                                difference['attributes'][attr_name].append(
-                                    'No matching element {}'.format(serial_v))
-                                i_val += 1
+                                difference['attributes'][attr_name].append(el_diff)
+                                pairs_to_check.append((v, matches.popleft(), el_diff))
                             else:
-                                oi_val += 1
-
-                        for i_val2 in range(i_val, len(val)):
-                            difference['attributes'][attr_name].append(
-                                'No matching element {}'.format(serial_vals[i_val2][0]))
+                                difference['attributes'][attr_name].append(
+                                    'No matching element {}'.format(key))
                 elif val is None:
                     if other_val is not None:
                         difference['attributes'][attr_name] = '{} != {}'.format(
@@ -2106,20 +5845,22 @@ class Model(object, metaclass=ModelMeta):
                     related_objs[obj] = None
                 init_iter = False
 
-                cls = obj.__class__
-                attrs = []
-                if forward:
-                    attrs = chain(attrs, cls.Meta.attributes.items())
-                if reverse:
-                    attrs = chain(attrs, cls.Meta.related_attributes.items())
-                for attr_name, attr in attrs:
-                    if isinstance(attr, RelatedAttribute):
-                        value = getattr(obj, attr_name)
+                plan = obj.Meta.traversal_plan or obj.get_traversal_plan()
+                if forward and reverse:
+                    attrs = plan.related_attrs
+                elif forward:
+                    attrs = plan.forward_related_attrs
+                elif reverse:
+                    attrs = plan.reverse_related_attrs
+                else:
+                    attrs = ()
+                for attr_name, attr, get, to_many in attrs:
+                    value = get(obj)
 
-                        if isinstance(value, list):
-                            objs_to_explore.extend(value)
-                        elif value is not None:
-                            objs_to_explore.append(value)
+                    if to_many:
+                        objs_to_explore.extend(value)
+                    elif value is not None:
+                        objs_to_explore.append(value)
 
         return list(related_objs)
 
@@ -2138,7 +5879,8 @@ class Model(object, metaclass=ModelMeta):
 
             if error:
                 errors.append(error)
-            else:
+            elif clean_value is not value:
+                # only set values which changed, so that unchanged objects are not marked as changed
                 self.__setattr__(attr_name, clean_value)
 
         if errors:
@@ -2152,24 +5894,97 @@ class Model(object, metaclass=ModelMeta):
             :obj:`InvalidObject` or None: :obj:`None` if the object is valid,
                 otherwise return a list of errors as an instance of :obj:`InvalidObject`
         """
-        errors = []
+        # attributes and related attributes
+        code_generator = self.Meta.code_generator or self.get_code_generator()
+        errors = code_generator.validate(self)
+
+        if errors:
+            return InvalidObject(self, errors)
+        return None
+
+    @classmethod
+    def validate_objects(cls, objects, view=None):
+        """ Determine if instances of the class are valid
+
+        The values of each attribute are validated column-wise (see :obj:`Attribute.validate_column`).
+        The errors are the same, and in the same order, as those of :obj:`validate`. The objects must be
+        instances of the class, and the class must not override :obj:`validate`.
+
+        Args:
+            objects (:obj:`list` of :obj:`Model`): instances of the class
+            view (:obj:`SubgraphView`, optional): if not :obj:`None`, validate the values of the related
+                attributes of the objects which belong to the view
+
+        Returns:
+            :obj:`list` of :obj:`InvalidObject` or :obj:`None`: errors of each object, or :obj:`None` for
+                each valid object
+        """
+        errors = [None] * len(objects)
 
         # attributes
-        for attr_name, attr in self.Meta.attributes.items():
-            error = attr.validate(self, getattr(self, attr_name))
-            if error:
-                errors.append(error)
+        for attr_name, attr in cls.Meta.attributes.items():
+            if view is not None and isinstance(attr, RelatedAttribute):
+                values = [view.get_value(obj, attr_name) for obj in objects]
+            else:
+                values = list(map(attrgetter(attr_name), objects))
+            for i_obj, error in attr.validate_column(objects, values):
+                if errors[i_obj] is None:
+                    errors[i_obj] = []
+                errors[i_obj].append(error)
 
         # related attributes
-        for attr_name, attr in self.Meta.related_attributes.items():
-            if attr.related_name:
-                error = attr.related_validate(self, getattr(self, attr.related_name))
-                if error:
-                    errors.append(error)
+        related_attrs = [attr for attr in cls.Meta.related_attributes.values() if attr.related_name]
+        if related_attrs:
+            for i_obj, obj in enumerate(objects):
+                for attr in related_attrs:
+                    if view is None:
+                        value = getattr(obj, attr.related_name)
+                    else:
+                        value = view.get_value(obj, attr.related_name)
+                    error = attr.related_validate(obj, value)
+                    if error:
+                        if errors[i_obj] is None:
+                            errors[i_obj] = []
+                        errors[i_obj].append(error)
 
-        if errors:
-            return InvalidObject(self, errors)
-        return None
+        return [InvalidObject(obj, obj_errors) if obj_errors else None
+                for obj, obj_errors in zip(objects, errors)]
+
+    @classmethod
+    def get_unique_together_value(cls, obj, attr_names, serialized=None):
+        """ Get the serialized values of a combination of attributes of an object which must be unique
+        (see :obj:`Meta.unique_together`)
+
+        Args:
+            obj (:obj:`Model`): object
+            attr_names (:obj:`tuple` of :obj:`str`): names of the attributes
+            serialized (:obj:`dict`, optional): dictionary which caches the serialized values of related objects
+
+        Returns:
+            :obj:`tuple`: serialized values of the attributes
+        """
+        if serialized is None:
+            serialized = {}
+        val = []
+        for attr_name in attr_names:
+            attr_val = getattr(obj, attr_name)
+            if isinstance(attr_val, RelatedManager):
+                sub_vals = []
+                for sub_val in attr_val:
+                    sub_serialized = serialized.get(sub_val, None)
+                    if sub_serialized is None:
+                        sub_serialized = serialized[sub_val] = sub_val.serialize()
+                    sub_vals.append(sub_serialized)
+                val.append(tuple(sorted(sub_vals)))
+            elif isinstance(attr_val, Model):
+                sub_serialized = serialized.get(attr_val, None)
+                if sub_serialized is None:
+                    sub_serialized = serialized[attr_val] = attr_val.serialize()
+                val.append(sub_serialized)
+            else:
+                attr = cls.Meta.attributes[attr_name]
+                val.append(attr.serialize(attr_val))
+        return tuple(val)
 
     @classmethod
     def validate_unique(cls, objects):
@@ -2186,31 +6001,28 @@ class Model(object, metaclass=ModelMeta):
         # validate uniqueness of individual attributes
         for attr_name, attr in cls.Meta.attributes.items():
             if attr.unique:
-                vals = []
-                for obj in objects:
-                    vals.append(getattr(obj, attr_name))
+                vals = list(map(attrgetter(attr_name), objects))
+
+                # skip the (slower) validation of attributes whose values are distinct
+                if type(attr).validate_unique is Attribute.validate_unique \
+                        and not attr.unique_case_insensitive:
+                    try:
+                        if len(set(vals)) == len(vals):
+                            continue
+                    except TypeError:
+                        pass
 
                 error = attr.validate_unique(objects, vals)
                 if error:
                     errors.append(error)
 
         # validate uniqueness of combinations of attributes
+        serialized = {}
         for unique_together in cls.Meta.unique_together:
             vals = set()
             rep_vals = set()
             for obj in objects:
-                val = []
-                for attr_name in unique_together:
-                    attr_val = getattr(obj, attr_name)
-                    if isinstance(attr_val, RelatedManager):
-                        val.append(tuple(sorted((sub_val.serialize() for sub_val in attr_val))))
-                    elif isinstance(attr_val, Model):
-                        val.append(attr_val.serialize())
-                    else:
-                        attr = cls.Meta.attributes[attr_name]
-                        val.append(attr.serialize(attr_val))
-                val = tuple(val)
-
+                val = cls.get_unique_together_value(obj, unique_together, serialized=serialized)
                 if val in vals:
                     rep_vals.add(val)
                 else:
@@ -2384,41 +6196,113 @@ class Model(object, metaclass=ModelMeta):
     def copy(self):
         """ Create a copy
 
+        The object and all of its related objects are copied in a single pass which is driven by the
+        :obj:`TraversalPlan`\ s of their models. The copies are created in bulk for each model
+        (see :obj:`ModelInitializer`), and the values of the related attributes of the copies are set
+        directly in both directions, in the same order as in the original objects, without propagating
+        them to the inverse attributes. The parsed expressions of :obj:`obj_tables.math.expression.Expression`\ s
+        are copied by replacing the objects that they reference with their copies, rather than by parsing
+        the expressions again.
+
         Returns:
             :obj:`Model`: model copy
         """
+        return Model._copy_objs(chain([self], self.get_related()))[self]
+
+    @staticmethod
+    def _copy_objs(objs, get_value=None, changed_objs=()):
+        """ Copy a closed set of objects (see :obj:`copy`)
+
+        Args:
+            objs (:obj:`iterable` of :obj:`Model`): objects, including all of the objects related to them
+            get_value (:obj:`types.FunctionType`, optional): function which gets the value of an attribute
+                of an object to copy, given the object, the name of the attribute, and the value function of
+                the attribute (or :obj:`None` for literal attributes); by default, the current values of the
+                attributes are copied
+            changed_objs (:obj:`set` of :obj:`Model`, optional): objects whose parsed expressions don't
+                correspond to the values returned by :obj:`get_value`, and must be parsed again
+
+        Returns:
+            :obj:`dict`: dictionary which maps the objects to their copies
+        """
+        # initialize copies of objects, and copy the values of their literal attributes
+        objs_by_cls = {}
+        for obj in objs:
+            objs = objs_by_cls.get(obj.__class__, None)
+            if objs is None:
+                objs = objs_by_cls[obj.__class__] = []
+            objs.append(obj)
 
-        # initialize copies of objects
         objects_and_copies = {}
-        for obj in chain([self], self.get_related()):
-            copy = obj.__class__()
-            objects_and_copies[obj] = copy
+        plans = {}
+        for cls, objs in objs_by_cls.items():
+            plan = plans[cls] = cls.Meta.traversal_plan or cls.get_traversal_plan()
+            literal_attrs = plan.literal_attrs
+            rows = []
+            for obj in objs:
+                if get_value is None:
+                    rows.append({attr_name: attr.copy_value(getattr(obj, attr_name), objects_and_copies)
+                                 for attr_name, attr in literal_attrs})
+                else:
+                    rows.append({attr_name: attr.copy_value(get_value(obj, attr_name, None), objects_and_copies)
+                                 for attr_name, attr in literal_attrs})
+            initializer = cls.Meta.initializer or cls.get_initializer()
+            objects_and_copies.update(zip(objs, initializer.create(rows, set_related_defaults=False)))
 
-        # copy attribute values
+        # copy the values of the related attributes
+        set_value = object.__setattr__
         for obj, copy in objects_and_copies.items():
-            obj._copy_attributes(copy, objects_and_copies)
+            for attr_name, _, get, to_many in plans[obj.__class__].related_attrs:
+                value = get(obj) if get_value is None else get_value(obj, attr_name, get)
+                if to_many:
+                    if value:
+                        manager = getattr(copy, attr_name)
+                        if manager:
+                            # values created by a customized constructor
+                            manager.clear()
+                        values = [objects_and_copies[v] for v in value]
+                        list.extend(manager, values)
+                        manager._add_members(values)
+                elif value is not None:
+                    set_value(copy, attr_name, objects_and_copies[value])
 
         # copy expressions
-        for o in objects_and_copies.values():
-            is_expression = next((True for cls in get_superclasses(o.__class__)
-                                  if cls.__module__ == 'obj_tables.math.expression'
-                                  and cls.__name__ == 'Expression'), False)
-            if is_expression:
-                objs = {o.__class__: {o.serialize(): o}}
-                for attr_name, attr in o.Meta.attributes.items():
-                    if isinstance(attr, RelatedAttribute) and \
-                            attr.related_class.__name__ in o.Meta.expression_term_models:
-                        objs[attr.related_class] = {}
-                        for oo in getattr(o, attr_name):
-                            objs[attr.related_class][oo.serialize()] = oo
+        for obj, o in objects_and_copies.items():
+            if not plans[obj.__class__].expression:
+                continue
+
+            parsed_expression = getattr(obj, '_parsed_expression', None)
+            if parsed_expression is not None and obj not in changed_objs:
+                o._parsed_expression = parsed_expression.copy(objects_and_copies)
+                continue
+
+            objs = {o.__class__: {o.serialize(): o}}
+            for attr_name, attr in o.Meta.attributes.items():
+                if isinstance(attr, RelatedAttribute) and \
+                        attr.related_class.__name__ in o.Meta.expression_term_models:
+                    objs[attr.related_class] = {}
+                    for oo in getattr(o, attr_name):
+                        objs[attr.related_class][oo.serialize()] = oo
+
+            ((attr_name, attr),) = o.Meta.related_attributes.items()
+            expr, error = o.deserialize(o.expression, objs)
+            assert error is None, str(error)
+            setattr(getattr(o, attr_name), attr.name, expr)
+
+        return objects_and_copies
 
-                ((attr_name, attr),) = o.Meta.related_attributes.items()
-                expr, error = o.deserialize(o.expression, objs)
-                assert error is None, str(error)
-                setattr(getattr(o, attr_name), attr.name, expr)
+    def snapshot(self):
+        """ Create a snapshot of the graph of the object
 
-        # return copy
-        return objects_and_copies[self]
+        In contrast to :obj:`copy`, creating a snapshot doesn't copy any objects. Instead, the snapshot records the
+        original values of the attributes of the objects as they are changed (see :obj:`Snapshot`). Reading the
+        original values and restoring the graph cost O(changes); copying the graph in the state of the snapshot
+        (:obj:`Snapshot.copy`) costs O(graph).
+
+        Returns:
+            :obj:`Snapshot`: snapshot
+        """
+        return Snapshot(self)
 
     def _copy_attributes(self, other, objects_and_copies):
         """ Copy the attributes from :obj:`self` to its new copy, :obj:`other`
@@ -2531,6 +6415,201 @@ class Model(object, metaclass=ModelMeta):
         """
         return cls.objects
 
+    @classmethod
+    def get_initializer(cls):
+        """ Get the initializer which constructs instances of the model in bulk
+
+        Returns:
+            :obj:`ModelInitializer`: initializer
+        """
+        if cls.Meta.initializer is None:
+            cls.Meta.initializer = ModelInitializer(cls)
+        return cls.Meta.initializer
+
+    @classmethod
+    def get_traversal_plan(cls):
+        """ Get the plan for walking the attributes of the instances of the model
+
+        Returns:
+            :obj:`TraversalPlan`: traversal plan
+        """
+        if cls.Meta.traversal_plan is None:
+            cls.Meta.traversal_plan = TraversalPlan(cls)
+        return cls.Meta.traversal_plan
+
+    @classmethod
+    def get_code_generator(cls):
+        """ Get the functions which are specialized to the attributes of the model
+
+        Returns:
+            :obj:`ModelCodeGenerator`: code generator
+        """
+        if cls.Meta.code_generator is None:
+            cls.Meta.code_generator = ModelCodeGenerator(cls)
+        return cls.Meta.code_generator
+
+    @classmethod
+    def bulk_create(cls, rows, attr_names=None, comments=None):
+        """ Efficiently create many instances of the model
+
+        The values of the attributes can be provided row-wise as a list of dictionaries or a list of tuples
+        of the values of the attributes in :obj:`attr_names`, or column-wise as a dictionary that maps the names
+        of attributes to lists of their values. The values of literal attributes are set directly, without
+        :obj:`__setattr__`. The values of related attributes are set after all of the instances have been
+        constructed.
+
+        Args:
+            rows (:obj:`list` of :obj:`dict`, :obj:`list` of :obj:`tuple`, or :obj:`dict` of :obj:`str`, :obj:`list`):
+                values of the attributes of the instances
+            attr_names (:obj:`list` of :obj:`str`, optional): names of the attributes of the values in each tuple
+                of :obj:`rows`
+            comments (:obj:`list` of :obj:`list` of :obj:`str`, optional): comments about each instance
+
+        Returns:
+            :obj:`list` of :obj:`Model`: instances
+
+        Raises:
+            :obj:`ValueError`: if the columns of values have different lengths
+            :obj:`TypeError`: if a value is provided for an attribute which is not defined
+        """
+        if isinstance(rows, dict):
+            if attr_names is not None:
+                raise ValueError('`attr_names` cannot be used with column-wise values')
+            attr_names = list(rows.keys())
+            # convert NumPy arrays to Python values
+            columns = [column.tolist() if isinstance(column, numpy.ndarray) else list(column)
+                       for column in rows.values()]
+            if len(set(len(column) for column in columns)) > 1:
+                raise ValueError('The columns of values of the attributes of {} must have the same length'.format(
+                    cls.__name__))
+            rows = list(zip(*columns))
+
+        return cls.get_initializer().create(rows, attr_names=attr_names, comments=comments)
+
+    @classmethod
+    def get_column_store(cls, attr_name):
+        """ Get the store of the values of an attribute which is stored in a column (see :obj:`ColumnStore`)
+
+        Args:
+            attr_name (:obj:`str`): name of the attribute
+
+        Returns:
+            :obj:`ColumnStore`: store
+
+        Raises:
+            :obj:`ValueError`: if the values of the attribute are not stored in a column
+        """
+        store = cls.Meta.column_store if cls.Meta.columnar else None
+        if store is None or attr_name not in store.arrays:
+            raise ValueError('The values of `{}` of {} are not stored in a column'.format(attr_name, cls.__name__))
+        return store
+
+    @classmethod
+    def column(cls, attr_name):
+        """ Get the values of an attribute of all instances of a columnar model (:obj:`Model.Meta.columnar`)
+
+        The values are ordered in the same way as :obj:`get_column_objects`. If all of the values are stored
+        in the typed array of the attribute, the values are returned as a read-only view of the array, without
+        copying them. Views are valid until instances are added to or garbage collected from the store.
+
+        Args:
+            attr_name (:obj:`str`): name of the attribute
+
+        Returns:
+            :obj:`numpy.ndarray`: values
+
+        Raises:
+            :obj:`ValueError`: if the values of the attribute are not stored in a column
+        """
+        return cls.get_column_store(attr_name).get_column(attr_name)
+
+    @classmethod
+    def get_column_objects(cls):
+        """ Get the instances of a columnar model (:obj:`Model.Meta.columnar`) in the order of their
+        values in :obj:`column`
+
+        Returns:
+            :obj:`list` of :obj:`Model`: instances
+
+        Raises:
+            :obj:`ValueError`: if the model is not columnar
+        """
+        if not cls.Meta.columnar:
+            raise ValueError('{} is not columnar'.format(cls.__name__))
+        return cls.Meta.column_store.get_objects()
+
+    @classmethod
+    def set_column(cls, attr_name, values):
+        """ Set the values of an attribute of all instances of a columnar model (:obj:`Model.Meta.columnar`)
+
+        The values are assigned to the array of the attribute in a single vectorized operation, unless
+        the attribute customizes :obj:`Attribute.set_value`, the attribute is indexed, a :obj:`ChangeJournal`
+        is recording changes, or the values cannot be stored in the array. In these cases, the values are set one by one through
+        :obj:`__setattr__`.
+
+        Args:
+            attr_name (:obj:`str`): name of the attribute
+            values (:obj:`numpy.ndarray` or :obj:`list`): values, ordered in the same way as
+                :obj:`get_column_objects`
+
+        Raises:
+            :obj:`ValueError`: if the values of the attribute are not stored in a column, or if the number
+                of values is different from the number of instances
+        """
+        store = cls.get_column_store(attr_name)
+        attr = cls.Meta.attributes[attr_name]
+        manager = cls.objects
+        indexed = type(attr).set_value is not Attribute.set_value \
+            or attr_name in manager._attr_tuples_by_name or manager._any_attr_tuples \
+            or cls in ObjectStore._stores_by_model or ChangeJournal._journals \
+            or (RelatedManager._indexed_attr_names and attr_name in RelatedManager._indexed_attr_names)
+        if not indexed and store.set_column(attr_name, values):
+            for obj in store.get_objects():
+                GraphState.touch(obj)
+            return
+
+        objs = store.get_objects()
+        if isinstance(values, numpy.ndarray):
+            values = values.tolist()
+        if len(values) != len(objs):
+            raise ValueError('{} values must be provided for `{}`'.format(len(objs), attr_name))
+        for obj, value in zip(objs, values):
+            setattr(obj, attr_name, value)
+
+    @classmethod
+    def bulk_link(cls, attr_name, pairs):
+        """ Efficiently relate many pairs of objects through a related attribute
+
+        The pairs are grouped by their first objects, and the related objects of each first object are added to
+        its :obj:`RelatedManager` in a single operation (see :obj:`RelatedManager.extend`). Therefore, the runtime
+        is proportional to the number of pairs, independent of the number of objects which are already related.
+
+        Args:
+            attr_name (:obj:`str`): name of a related attribute of the model or of a related attribute of another model
+                whose related name is :obj:`attr_name`
+            pairs (:obj:`list` of :obj:`tuple` of :obj:`Model`, :obj:`Model`): pairs of instances of the model and
+                objects to relate to them
+
+        Raises:
+            :obj:`ValueError`: if :obj:`attr_name` is not the name of a related attribute of the model
+        """
+        attr = cls.Meta.attributes.get(attr_name, None)
+        if not isinstance(attr, RelatedAttribute) and attr_name not in cls.Meta.related_attributes:
+            raise ValueError('{} does not have related attribute "{}"'.format(cls.__name__, attr_name))
+
+        grouped_values = {}
+        for obj, value in pairs:
+            grouped_values.setdefault(obj, []).append(value)
+
+        for obj, values in grouped_values.items():
+            cur_value = getattr(obj, attr_name)
+            if isinstance(cur_value, RelatedManager):
+                cur_value.extend(values)
+            elif len(values) > 1:
+                raise ValueError('{}.{} can only be related to one object'.format(cls.__name__, attr_name))
+            else:
+                setattr(obj, attr_name, values[0])
+
     def __enter__(self):
         """ Enter context """
         return self
@@ -2540,7 +6619,7 @@ class Model(object, metaclass=ModelMeta):
         pass
 
     @staticmethod
-    def to_dict(object, models=None, encode_primary_objects=True, encoded=None):
+    def to_dict(object, models=None, encode_primary_objects=True, encoded=None, view=None):
         """ Encode a instance of :obj:`Model` or a collection of instances of :obj:`Model` using a simple Python representation
         (dict, list, str, float, bool, None) that is compatible with JSON and YAML. Use :obj:`__id` keys to avoid infinite recursion
         by encoding each object once and referring to objects by their __id for each repeated reference.
@@ -2551,6 +6630,8 @@ class Model(object, metaclass=ModelMeta):
             models (:obj:`str`, optional): list of models to encode into JSON
             encode_primary_objects (:obj:`bool`, optional): if :obj:`True`, encode primary classes otherwise just encode their IDs
             encoded (:obj:`dict`, optional): objects that have already been encoded and their assigned JSON identifiers
+            view (:obj:`SubgraphView`, optional): if not :obj:`None`, only encode the related objects which belong
+                to the view
 
         Returns:
             :obj:`dict`: simple Python representation of the object
@@ -2603,20 +6684,11 @@ class Model(object, metaclass=ModelMeta):
                 models.add(cls)
 
                 if encode_primary_objects or cls.Meta.table_format == TableFormat.cell:
-                    for attr_name, attr in chain(cls.Meta.attributes.items(), cls.Meta.related_attributes.items()):
-                        val = getattr(obj, attr_name)
-                        if isinstance(attr, RelatedAttribute):
-                            if val is None:
-                                json_val = None
-                            elif isinstance(val, list):
-                                json_val = []
-                                for v in val:
-                                    json_val.append(add_to_encoding_queue(v))
-                            else:
-                                json_val = add_to_encoding_queue(val)
-                        else:
-                            json_val = attr.to_builtin(val)
-                        json_obj[attr_name] = json_val
+                    if view is not None:
+                        view.to_builtin(obj, json_obj, add_to_encoding_queue)
+                    else:
+                        code_generator = cls.Meta.code_generator or cls.get_code_generator()
+                        code_generator.to_builtin(obj, json_obj, add_to_encoding_queue)
 
             elif isinstance(obj, (list, tuple)):
                 for sub_obj in obj:
@@ -2639,7 +6711,7 @@ class Model(object, metaclass=ModelMeta):
 
     @staticmethod
     def from_dict(json, models, decode_primary_objects=True, primary_objects=None, decoded=None, ignore_extra_models=False,
-                  validate=False, output_format=None):
+                  validate=False, output_format=None, validator=None):
         """ Decode a simple Python representation (dict, list, str, float, bool, None) of an object that
         is compatible with JSON and YAML, including references to objects through :obj:`__id` keys.
 
@@ -2658,6 +6730,8 @@ class Model(object, metaclass=ModelMeta):
                 * :obj:`list`: List of instances of :obj:`Model`.
                 * :obj:`dict`: Dictionary that maps subclasses of :obj:`Model` to the instances of each subclass.
 
+            validator (:obj:`Validator`, optional): validator to use if :obj:`validate` is :obj:`True`
+
         Returns:
             :obj:`Model`: decoded object
         """
@@ -2685,7 +6759,7 @@ class Model(object, metaclass=ModelMeta):
                 else:
                     obj = decoded.get(json['__id'], None)
                     if obj is None:
-                        obj = model()
+                        obj = model.get_initializer().create([{}])[0]
                         decoded[json['__id']] = obj
                     to_decode.append((json, obj))
             elif isinstance(json, list):
@@ -2755,10 +6829,9 @@ class Model(object, metaclass=ModelMeta):
 
         # validate
         if validate:
-            errors = Validator().validate(decoded.values())
+            errors = (validator or Validator()).validate(decoded.values())
             if errors:
-                raise ValueError(
-                    indent_forest(['The data cannot be loaded because it fails to validate:', [errors]]))
+                raise ValidationError('The data cannot be loaded because it fails to validate:', errors)
 
         # format output
         if output_format == 'list':
@@ -2914,30 +6987,46 @@ class Model(object, metaclass=ModelMeta):
 
         return self
 
+    def get_subgraph_view(self, kind=None):
+        """ Get a read-only view of the object and its children, without cutting them from the rest of the
+        object graph (see :obj:`SubgraphView`)
+
+        If :obj:`kind` is :obj:`None`, children are defined to be the values of the related attributes defined
+        in each class.
+
+        Args:
+            kind (:obj:`str`, optional): kind of children to include
+
+        Returns:
+            :obj:`SubgraphView`: view
+        """
+        return SubgraphView(self, kind=kind)
+
     def cut_relations(self, objs_to_keep=None):
         """ Cut relations to objects not in :obj:`objs`.
 
         Args:
             objs_to_keep (:obj:`set` of :obj:`Model`, optional): objects to retain relations to
         """
-        objs_to_keep = objs_to_keep or []
+        if not isinstance(objs_to_keep, (set, frozenset, dict)):
+            objs_to_keep = set(objs_to_keep or [])
 
         # iterate over related attributes
-        for attr in self.Meta.local_attributes.values():
-            if attr.is_related:
-                # get value
-                val = getattr(self, attr.name)
-
-                # cut relationships to objects not in :obj:`objs_to_keep`
-                if isinstance(val, list):
-                    # *ToManyAttribute
-                    for v in list(val):
-                        if v not in objs_to_keep:
-                            val.remove(v)
-                else:
-                    # *ToOneAttribute
-                    if val and val not in objs_to_keep:
-                        setattr(self, attr.name, None)
+        plan = self.Meta.traversal_plan or self.get_traversal_plan()
+        for attr_name, attr, get, to_many in plan.related_attrs:
+            # get value
+            val = get(self)
+
+            # cut relationships to objects not in :obj:`objs_to_keep`
+            if to_many:
+                # *ToManyAttribute
+                vals_to_cut = [v for v in val if v not in objs_to_keep]
+                if vals_to_cut:
+                    val.difference_update(vals_to_cut)
+            else:
+                # *ToOneAttribute
+                if val and val not in objs_to_keep:
+                    setattr(self, attr_name, None)
 
     def merge(self, other, normalize=True, validate=True):
         """ Merge another model into a model
@@ -2983,6 +7072,109 @@ class Model(object, metaclass=ModelMeta):
             error = Validator().run(self, get_related=True)
             assert error is None, str(error)
 
+    @classmethod
+    def merge_all(cls, models, normalize=True, validate=True, store=None):
+        """ Merge several models into the first model
+
+        Rather than merging the models pairwise with :obj:`merge`, the objects of all of the models are matched
+        with a single index of their serialized values, and the attributes of each object are merged once.
+        The models are assumed to be valid, and only the objects which are added to or changed in the first
+        model by the merge are validated (see :obj:`Validator.validate_incremental`).
+
+        Args:
+            models (:obj:`list` of :obj:`Model`): models to merge; the other models are merged into the first model
+            normalize (:obj:`bool`, optional): if :obj:`True`, normalize models and merged model
+            validate (:obj:`bool`, optional): if :obj:`True`, validate the objects of the merged model which were
+                added or changed by the merge
+            store (:obj:`ObjectStore`, optional): validated store which contains the objects of the first model;
+                the objects which are merged into the first model are added to the store; if :obj:`None`,
+                the objects are validated with a temporary store
+
+        Returns:
+            :obj:`Model`: merged model (the first model)
+
+        Raises:
+            :obj:`ValueError`: if no models are given, if the serialized values of the objects of a model are
+                not unique within each type, if a model maps to an object other than the first model, or
+                if the objects which were added or changed by the merge are invalid
+        """
+        models = list(models)
+        if not models:
+            raise ValueError('At least one model must be merged')
+        merged = models[0]
+
+        # normalize models so merging is reproducible
+        if normalize:
+            for model in models:
+                model.normalize()
+
+        # index the serialized values of the objects of all of the models
+        merged_objs = merged.get_related()
+        index = {}
+        for obj in merged_objs:
+            key = (obj.__class__, obj.serialize())
+            if key in index:
+                raise ValueError('Serialized value "{}" is not unique for {}'.format(key[1], key[0].__name__))
+            index[key] = obj
+
+        # map the objects of each model to the merged objects, and the merged objects to the objects of each model
+        other_objs_in_merged = {}
+        added_objs = []
+        merges = []
+        for model in models[1:]:
+            model_key = (model.__class__, model.serialize())
+            if index.get(model_key, merged) is not merged:
+                raise ValueError('Other must map to self')
+            other_objs_in_merged[model] = merged
+            merged_objs_in_model = {merged: model}
+
+            model_keys = set([model_key])
+            model_merges = []
+            for obj in model.get_related():
+                if obj is model:
+                    continue
+                key = (obj.__class__, obj.serialize())
+                if key in model_keys:
+                    raise ValueError('Serialized value "{}" is not unique for {}'.format(key[1], key[0].__name__))
+                model_keys.add(key)
+
+                merged_obj = index.setdefault(key, obj)
+                if merged_obj is obj:
+                    added_objs.append(obj)
+                    model_merges.append((obj, obj, merged_objs_in_model))
+                else:
+                    other_objs_in_merged[obj] = merged_obj
+                    merged_objs_in_model[merged_obj] = obj
+                    if merged_obj is not merged:
+                        merges.append((merged_obj, obj, merged_objs_in_model))
+            merges.extend(model_merges)
+            merges.append((merged, model, merged_objs_in_model))
+
+        if validate and store is None:
+            validation_store = ObjectStore(merged_objs)
+            validation_store.clear_dirty()
+        else:
+            validation_store = store
+
+        # merge the attributes of each object
+        for left, right, merged_objs_in_model in merges:
+            left.merge_attrs(right, other_objs_in_merged, merged_objs_in_model)
+
+        # normalize so the merge doesn't depend on the order of the models
+        if normalize:
+            merged.normalize()
+
+        if validation_store is not None:
+            validation_store.add_all(added_objs)
+        if validate:
+            error = Validator().validate_incremental(validation_store)
+            if store is None:
+                validation_store.release()
+            if error:
+                raise ValueError(str(error))
+
+        return merged
+
     def gen_merge_map(self, other):
         """ Create a dictionary that maps instances of objects in another model to objects
         in a model
@@ -3228,6 +7420,73 @@ class Attribute(object, metaclass=abc.ABCMeta):
         """
         pass  # pragma: no cover
 
+    def validate_column(self, objects, values):
+        """ Determine which values of the attribute of many objects are invalid
+
+        Attributes whose values can be represented by a NumPy array can screen the entire column at once
+        (see :obj:`get_column_array` and :obj:`get_invalid_column_mask`). Only the values which the screen
+        flags are validated by :obj:`validate`, so the errors are identical to those of :obj:`validate`.
+        The screen is only used if the class which defines :obj:`validate` also defines
+        :obj:`get_invalid_column_mask`.
+
+        Args:
+            objects (:obj:`list` of :obj:`Model`): objects
+            values (:obj:`list`): values of the attribute of the objects
+
+        Returns:
+            :obj:`list` of :obj:`tuple` of :obj:`int`, :obj:`InvalidAttribute`: indices of the invalid values
+                and their errors
+        """
+        array = None
+        for cls in type(self).__mro__:
+            if 'validate' in cls.__dict__:
+                if 'get_invalid_column_mask' in cls.__dict__:
+                    array = self.get_column_array(values)
+                break
+
+        if array is None:
+            indices = range(len(values))
+        else:
+            indices = numpy.flatnonzero(self.get_invalid_column_mask(array)).tolist()
+
+        errors = []
+        for i_value in indices:
+            error = self.validate(objects[i_value], values[i_value])
+            if error:
+                errors.append((i_value, error))
+        return errors
+
+    def get_column_array(self, values):
+        """ Get a NumPy array of values of the attribute, if they can be screened column-wise
+
+        Args:
+            values (:obj:`list`): values of the attribute
+
+        Returns:
+            :obj:`numpy.ndarray`: array of the values, or :obj:`None` if the values must be validated one by one
+        """
+        return None
+
+    def get_column_dtype(self):
+        """ Get the NumPy data type which columnar models use to store the values of the attribute
+        (see :obj:`ColumnStore`)
+
+        Returns:
+            :obj:`type`: NumPy data type, or :obj:`None` if the values cannot be stored in a NumPy array
+        """
+        return None
+
+    def serialize_column(self, values):
+        """ Serialize an array of values of the attribute (see :obj:`ColumnStore`)
+
+        Args:
+            values (:obj:`numpy.ndarray`): values
+
+        Returns:
+            :obj:`numpy.ndarray`: simple representations of the values
+        """
+        return values
+
     def validate_unique(self, objects, values):
         """ Determine if the attribute values are unique
 
@@ -3846,6 +8105,15 @@ class BooleanAttribute(LiteralAttribute):
             return (value, None)
         return (value, InvalidAttribute(self, ['Value must be a `bool` or `None`']))
 
+    def get_column_dtype(self):
+        """ Get the NumPy data type which columnar models use to store the values of the attribute
+        (see :obj:`ColumnStore`)
+
+        Returns:
+            :obj:`type`: NumPy data type
+        """
+        return numpy.bool_
+
     def validate(self, obj, value):
         """ Determine if :obj:`value` is a valid value of the attribute
 
@@ -4013,6 +8281,48 @@ class FloatAttribute(NumericAttribute):
             return InvalidAttribute(self, errors)
         return None
 
+    def get_column_array(self, values):
+        """ Get a NumPy array of values of the attribute, if they can be screened column-wise
+
+        Args:
+            values (:obj:`list`): values of the attribute
+
+        Returns:
+            :obj:`numpy.ndarray`: array of the values, or :obj:`None` if the values are not all instances of
+                :obj:`float`
+        """
+        if set(map(type, values)) == set([float]):
+            return numpy.array(values, dtype=numpy.float64)
+        return None
+
+    def get_invalid_column_mask(self, array):
+        """ Flag the values of a column which may be invalid
+
+        Args:
+            array (:obj:`numpy.ndarray`): values
+
+        Returns:
+            :obj:`numpy.ndarray`: boolean array which is :obj:`True` for the values which may be invalid
+        """
+        mask = numpy.zeros(array.shape, dtype=bool)
+        if not self.nan:
+            mask |= numpy.isnan(array)
+        with numpy.errstate(invalid='ignore'):
+            if not isnan(self.min):
+                mask |= array < self.min
+            if not isnan(self.max):
+                mask |= array > self.max
+        return mask
+
+    def get_column_dtype(self):
+        """ Get the NumPy data type which columnar models use to store the values of the attribute
+        (see :obj:`ColumnStore`)
+
+        Returns:
+            :obj:`type`: NumPy data type
+        """
+        return numpy.float64
+
     def serialize(self, value):
         """ Serialize float
 
@@ -4153,6 +8463,20 @@ class PositiveFloatAttribute(FloatAttribute):
             return InvalidAttribute(self, errors)
         return None
 
+    def get_invalid_column_mask(self, array):
+        """ Flag the values of a column which may be invalid
+
+        Args:
+            array (:obj:`numpy.ndarray`): values
+
+        Returns:
+            :obj:`numpy.ndarray`: boolean array which is :obj:`True` for the values which may be invalid
+        """
+        mask = super(PositiveFloatAttribute, self).get_invalid_column_mask(array)
+        with numpy.errstate(invalid='ignore'):
+            mask |= array <= 0
+        return mask
+
     def get_xlsx_validation(self, sheet_models=None, doc_metadata_model=None):
         """ Get XLSX validation
 
@@ -4312,6 +8636,59 @@ class IntegerAttribute(NumericAttribute):
             return InvalidAttribute(self, errors)
         return None
 
+    def get_column_array(self, values):
+        """ Get a NumPy array of values of the attribute, if they can be screened column-wise
+
+        Args:
+            values (:obj:`list`): values of the attribute
+
+        Returns:
+            :obj:`numpy.ndarray`: array of the values, or :obj:`None` if the values are not all instances of
+                :obj:`int` which can be represented by 64-bit integers
+        """
+        if set(map(type, values)) == set([int]):
+            try:
+                return numpy.array(values, dtype=numpy.int64)
+            except OverflowError:
+                pass
+        return None
+
+    def get_invalid_column_mask(self, array):
+        """ Flag the values of a column which may be invalid
+
+        Args:
+            array (:obj:`numpy.ndarray`): values
+
+        Returns:
+            :obj:`numpy.ndarray`: boolean array which is :obj:`True` for the values which may be invalid
+        """
+        mask = numpy.zeros(array.shape, dtype=bool)
+        if self.min is not None:
+            mask |= array < self.min
+        if self.max is not None:
+            mask |= array > self.max
+        return mask
+
+    def get_column_dtype(self):
+        """ Get the NumPy data type which columnar models use to store the values of the attribute
+        (see :obj:`ColumnStore`)
+
+        Returns:
+            :obj:`type`: NumPy data type
+        """
+        return numpy.int64
+
+    def serialize_column(self, values):
+        """ Serialize an array of values of the attribute (see :obj:`ColumnStore`)
+
+        Args:
+            values (:obj:`numpy.ndarray`): values
+
+        Returns:
+            :obj:`numpy.ndarray`: simple representations of the values
+        """
+        return values.astype(numpy.float64)
+
     def serialize(self, value):
         """ Serialize integer
 
@@ -4460,6 +8837,19 @@ class PositiveIntegerAttribute(IntegerAttribute):
             return InvalidAttribute(self, errors)
         return None
 
+    def get_invalid_column_mask(self, array):
+        """ Flag the values of a column which may be invalid
+
+        Args:
+            array (:obj:`numpy.ndarray`): values
+
+        Returns:
+            :obj:`numpy.ndarray`: boolean array which is :obj:`True` for the values which may be invalid
+        """
+        mask = super(PositiveIntegerAttribute, self).get_invalid_column_mask(array)
+        mask |= array <= 0
+        return mask
+
     def get_xlsx_validation(self, sheet_models=None, doc_metadata_model=None):
         """ Get XLSX validation
 
@@ -6042,12 +10432,40 @@ class ListAttribute(LiteralAttribute):
 class RelatedManager(list):
     """ Represent values and related values of related attributes
 
+    In addition to the list of values, each manager maintains a hash index of its values which
+    provides constant-time membership tests (e.g., to skip values which are already related) and
+    enables objects to be linked and unlinked in bulk (see :obj:`RelatedManager.extend`,
+    :obj:`RelatedManager.difference_update` and :obj:`Model.bulk_link`) in time proportional to the
+    number of values which are linked or unlinked.
+
+    Managers can also maintain opt-in hash indexes of the values of attributes of their values (see
+    :obj:`RelatedManager.create_index`), which :obj:`RelatedManager.get`, :obj:`RelatedManager.get_one` and
+    :obj:`RelatedManager.get_or_create` use to find matching values in constant time. The indexes are updated
+    when values are added to or removed from the manager, and when the indexed attributes of the values are set.
+    Managers without indexes incur no overhead.
+
     Attributes:
         object (:obj:`Model`): model instance
         attribute (:obj:`Attribute`): attribute
         related (:obj:`bool`): is related attribute
+        _members (:obj:`dict`): dictionary which maps each value to its number of occurrences in the list
+        _indexes (:obj:`dict`): dictionary which maps each indexed tuple of attribute names to a dictionary which
+            maps hashable values of the attributes to dictionaries whose keys are the matching values of the list
+        _index_keys (:obj:`dict`): reverse index which maps each indexed value of the list to a dictionary which maps
+            each indexed tuple of attribute names to the hashable values of the attributes
+        _index_positions (:obj:`dict`): dictionary which maps each indexed value to its relative position in the
+            list, or :obj:`None` if the list has been reordered since the positions were computed
+        _index_next_position (:obj:`int`): relative position of the next value appended to the list
+        _index_finalizers (:obj:`dict`): dictionary which maps each indexed tuple of attribute names to a
+            finalizer which unregisters the names of the attributes from :obj:`_indexed_attr_names`
     """
 
+    # number of indexes of :obj:`RelatedManager`\ s which include each attribute name; used by
+    # :obj:`Model.__setattr__` to skip searching for indexes that need to be updated
+    _indexed_attr_names = collections.Counter()
+
+    _indexes = None
+
     def __init__(self, object, attribute, related=True):
         """
         Args:
@@ -6059,6 +10477,329 @@ class RelatedManager(list):
         self.object = object
         self.attribute = attribute
         self.related = related
+        self._members = {}
+
+    def __getstate__(self):
+        """ Get the state of the manager, excluding the index of its values, which is rebuilt as the
+        values are added to copies of the manager
+
+        Returns:
+            :obj:`dict`: state
+        """
+        state = dict(self.__dict__)
+        for name in ['_members', '_indexes', '_index_keys', '_index_positions', '_index_next_position',
+                     '_index_finalizers']:
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        """ Set the state of the manager
+
+        Args:
+            state (:obj:`dict`): state
+        """
+        self.__dict__.update(state)
+        self._members = {}
+
+    def __contains__(self, value):
+        """ Determine whether a value is in the list
+
+        Args:
+            value (:obj:`object`): value
+
+        Returns:
+            :obj:`bool`: :obj:`True` if :obj:`value` is in the list
+        """
+        try:
+            return value in self._members
+        except TypeError:
+            return False
+
+    def _add_members(self, values):
+        """ Add values to the index of the values of the list
+
+        Args:
+            values (:obj:`iterable`): values
+        """
+        members = self._members
+        for value in values:
+            members[value] = members.get(value, 0) + 1
+        if self._indexes:
+            self._index_values(values)
+        self._update_indices()
+
+    def _remove_members(self, values):
+        """ Remove values from the index of the values of the list
+
+        Args:
+            values (:obj:`iterable`): values
+        """
+        members = self._members
+        for value in values:
+            count = members[value]
+            if count == 1:
+                del members[value]
+                if self._indexes:
+                    self._unindex_values((value,))
+            else:
+                members[value] = count - 1
+        self._update_indices()
+
+    def _record_replacement(self, old_values):
+        """ Record in the recording :obj:`ChangeJournal`\ s that the values of the list have been replaced
+
+        Args:
+            old_values (:obj:`tuple`): values of the list before the change
+        """
+        new_values = tuple(self)
+        start = 0
+        n_common = min(len(old_values), len(new_values))
+        while start < n_common and old_values[start] is new_values[start]:
+            start += 1
+        end = 0
+        while end < n_common - start and old_values[-1 - end] is new_values[-1 - end]:
+            end += 1
+        ChangeJournal._record_all(RelatedManagerChange(self, start, old_values[start:len(old_values) - end],
+                                                       new_values[start:len(new_values) - end]))
+
+    def _update_indices(self):
+        """ Update the entries of the :obj:`Manager` and :obj:`ObjectStore` indices which depend on the values of
+        the list, and record in the stores which contain the object of the list that the values have changed
+
+        As with :obj:`Model.__setattr__`, the updates are deferred within :obj:`Manager.batch` and
+        :obj:`ObjectStore.batch`.
+        """
+        obj = self.object
+        cls = obj.__class__
+        attr_name = self.attribute.related_name if self.related else self.attribute.name
+
+        manager = cls.objects
+        if attr_name in manager._attr_tuples_by_name or manager._any_attr_tuples:
+            manager._update_attr(obj, attr_name)
+
+        if cls in ObjectStore._stores_by_model:
+            for store in ObjectStore.get_registered_stores(cls):
+                store._update_attr(obj, attr_name)
+
+        if attr_name in Manager._related_dependencies:
+            Manager._update_related_dependents(obj, attr_name)
+
+    def create_index(self, attr_names=None):
+        """ Create a hash index of the values of attributes of the values of the list
+
+        Subsequently, :obj:`get` (and :obj:`get_one` and :obj:`get_or_create`) queries whose attribute names
+        include all of the indexed names are answered from the index, rather than by scanning the list.
+        Only literal and \*-to-one attributes can be indexed.
+
+        Args:
+            attr_names (:obj:`str` or :obj:`tuple` of :obj:`str`, optional): name(s) of the attribute(s) to index;
+                if :obj:`None`, index the primary attribute and the :obj:`Meta.indexed_attrs_tuples` of the
+                class of the values
+
+        Raises:
+            :obj:`ValueError`: if an attribute is not a literal or \*-to-one attribute of the class of the values
+        """
+        if self.related:
+            cls = self.attribute.primary_class
+        else:
+            cls = self.attribute.related_class
+
+        if attr_names is None:
+            attr_names_tuples = []
+            if cls.Meta.primary_attribute:
+                attr_names_tuples.append((cls.Meta.primary_attribute.name, ))
+            # computed attributes are only indexed by :obj:`Manager` and :obj:`ObjectStore`
+            attr_names_tuples.extend(attr_names for attr_names in cls.Meta.indexed_attrs_tuples
+                                     if all(attr_name in cls.Meta.attributes or attr_name in cls.Meta.related_attributes
+                                            for attr_name in attr_names))
+        elif isinstance(attr_names, str):
+            attr_names_tuples = [(attr_names, )]
+        else:
+            attr_names_tuples = [tuple(attr_names)]
+
+        for attr_names in attr_names_tuples:
+            for attr_name in attr_names:
+                attr = cls.Meta.attributes.get(attr_name, None)
+                if attr is not None:
+                    to_many = isinstance(attr, RelatedAttribute) and isinstance(attr, ToManyAttribute)
+                elif attr_name in cls.Meta.related_attributes:
+                    attr = cls.Meta.related_attributes[attr_name]
+                    to_many = isinstance(attr, (ManyToOneAttribute, ManyToManyAttribute))
+                else:
+                    raise ValueError('{} does not have attribute "{}"'.format(cls.__name__, attr_name))
+                if to_many:
+                    raise ValueError('*-to-many attribute {}.{} cannot be indexed'.format(cls.__name__, attr_name))
+
+        if self._indexes is None:
+            self._indexes = {}
+            self._index_keys = {}
+            self._index_positions = None
+            self._index_finalizers = {}
+
+        for attr_names in attr_names_tuples:
+            if attr_names in self._indexes:
+                continue
+            self._indexes[attr_names] = {}
+            for attr_name in attr_names:
+                RelatedManager._indexed_attr_names[attr_name] += 1
+            self._index_finalizers[attr_names] = weakref.finalize(
+                self, RelatedManager._unregister_indexed_attr_names, attr_names)
+
+        self._index_keys = {}
+        self._index_positions = None
+        self._index_values(self._members.keys())
+
+    def drop_index(self, attr_names=None):
+        """ Drop a hash index of the values of attributes of the values of the list
+
+        Args:
+            attr_names (:obj:`str` or :obj:`tuple` of :obj:`str`, optional): name(s) of the indexed attribute(s);
+                if :obj:`None`, drop all indexes
+        """
+        if not self._indexes:
+            return
+
+        if attr_names is None:
+            attr_names_tuples = list(self._indexes.keys())
+        elif isinstance(attr_names, str):
+            attr_names_tuples = [(attr_names, )]
+        else:
+            attr_names_tuples = [tuple(attr_names)]
+
+        for attr_names in attr_names_tuples:
+            if attr_names in self._indexes:
+                del self._indexes[attr_names]
+                self._index_finalizers.pop(attr_names)()
+                for keys in self._index_keys.values():
+                    keys.pop(attr_names, None)
+
+        if not self._indexes:
+            self._indexes = None
+            self._index_keys = None
+            self._index_positions = None
+            self._index_finalizers = None
+
+    @staticmethod
+    def _unregister_indexed_attr_names(attr_names):
+        """ Unregister the names of the attributes of a dropped or garbage-collected index
+
+        Args:
+            attr_names (:obj:`tuple` of :obj:`str`): names of the attributes of the index
+        """
+        for attr_name in attr_names:
+            RelatedManager._indexed_attr_names[attr_name] -= 1
+            if RelatedManager._indexed_attr_names[attr_name] <= 0:
+                del RelatedManager._indexed_attr_names[attr_name]
+
+    def _index_values(self, values):
+        """ Add values of the list to the indexes
+
+        Args:
+            values (:obj:`iterable`): values
+        """
+        index_keys = self._index_keys
+        positions = self._index_positions
+        for value in values:
+            if value in index_keys:
+                continue
+            keys = index_keys[value] = {}
+            for attr_names, index in self._indexes.items():
+                key = Manager._get_hashable_values([getattr(value, attr_name, None) for attr_name in attr_names])
+                keys[attr_names] = key
+                bucket = index.get(key, None)
+                if bucket is None:
+                    bucket = index[key] = {}
+                bucket[value] = None
+            if positions is not None and value not in positions:
+                positions[value] = self._index_next_position
+                self._index_next_position += 1
+
+    def _unindex_values(self, values):
+        """ Remove values from the indexes
+
+        Args:
+            values (:obj:`iterable`): values
+        """
+        index_keys = self._index_keys
+        positions = self._index_positions
+        for value in values:
+            keys = index_keys.pop(value, None)
+            if keys is None:
+                continue
+            if positions is not None and value not in self._members:
+                positions.pop(value, None)
+            for attr_names, key in keys.items():
+                index = self._indexes[attr_names]
+                bucket = index[key]
+                del bucket[value]
+                if not bucket:
+                    del index[key]
+
+    def _invalidate_index_positions(self):
+        """ Record that the list has been reordered, such that the positions of the indexed values must be
+        recomputed to return matches in the order of the list
+        """
+        if self._indexes:
+            self._index_positions = None
+
+    def _get_indexed(self, __type=None, **kwargs):
+        """ Get related objects by attribute/value pairs using an index
+
+        Args:
+            __type (:obj:`types.TypeType` or :obj:`tuple` of :obj:`types.TypeType`): subclass(es) of :obj:`Model`
+            **kwargs: dictionary of attribute name/value pairs to find matching
+                objects
+
+        Returns:
+            :obj:`list` of :obj:`Model`: matching instances of :obj:`Model`, or :obj:`None` if no index can be used
+                for the query
+        """
+        if '__type' in kwargs:
+            __type = kwargs.pop('__type')
+
+        for attr_names, index in self._indexes.items():
+            if all(attr_name in kwargs for attr_name in attr_names):
+                break
+        else:
+            return None
+
+        try:
+            key = Manager._get_hashable_values([kwargs[attr_name] for attr_name in attr_names])
+            bucket = index.get(key, None)
+        except TypeError:
+            return None
+        if not bucket:
+            return []
+
+        matches = [obj for obj in bucket
+                   if obj.has_attr_vals(__type=__type, __check_attr_defined=False, **kwargs)]
+        if len(matches) > 1:
+            positions = self._index_positions
+            if positions is None:
+                positions = self._index_positions = {}
+                for obj in self:
+                    positions.setdefault(obj, len(positions))
+                self._index_next_position = len(positions)
+            matches.sort(key=positions.__getitem__)
+        return matches
+
+    def _get_new_values(self, values):
+        """ Get the unique values which are not already in the list, in order
+
+        Args:
+            values (:obj:`iterable`): values
+
+        Returns:
+            :obj:`list`: values which are not already in the list
+        """
+        members = self._members
+        new_values = []
+        new_values_set = set()
+        for value in values:
+            if value not in members and value not in new_values_set:
+                new_values.append(value)
+                new_values_set.add(value)
+        return new_values
 
     def create(self, __type=None, **kwargs):
         """ Create instance of primary class and add to list
@@ -6090,22 +10831,139 @@ class RelatedManager(list):
             cls = __type or self.attribute.related_class
             obj = cls(**kwargs)
 
-        self.append(obj)
+        self.append(obj)
+
+        return obj
+
+    def append(self, value, **kwargs):
+        """ Add value to list
+
+        Args:
+            value (:obj:`object`): value
+
+        Returns:
+            :obj:`RelatedManager`: self
+        """
+        GraphState.link(self.object, (value, ))
+        if ChangeJournal._journals:
+            ChangeJournal._record_all(RelatedManagerChange(self, len(self), (), (value, )))
+        super(RelatedManager, self).append(value, **kwargs)
+        members = self._members
+        members[value] = members.get(value, 0) + 1
+        if self._indexes:
+            self._index_values((value,))
+        self._update_indices()
+
+        return self
+
+    def remove(self, value, update_list=True):
+        """ Remove value from list
+
+        Args:
+            value (:obj:`object`): value
+            update_list (:obj:`bool`, optional): update list
+
+        Returns:
+            :obj:`RelatedManager`: self
+        """
+        if update_list:
+            GraphState.touch(self.object)
+            if ChangeJournal._journals and value in self:
+                ChangeJournal._record_all(RelatedManagerChange(self, list.index(self, value), (value, ), ()))
+            super(RelatedManager, self).remove(value)
+            self._remove_members([value])
+
+        return self
 
-        return obj
+    def insert(self, index, value):
+        """ Insert value into list
 
-    def append(self, value, **kwargs):
-        """ Add value to list
+        Args:
+            index (:obj:`int`): index
+            value (:obj:`object`): value
+        """
+        GraphState.link(self.object, (value, ))
+        if ChangeJournal._journals:
+            n_values = len(self)
+            start = min(max(index + n_values if index < 0 else index, 0), n_values)
+            ChangeJournal._record_all(RelatedManagerChange(self, start, (), (value, )))
+        super(RelatedManager, self).insert(index, value)
+        self._invalidate_index_positions()
+        self._add_members([value])
+
+    def __setitem__(self, index, value):
+        """ Set an element of the list
 
         Args:
+            index (:obj:`int` or :obj:`slice`): index
             value (:obj:`object`): value
+        """
+        journal_values = tuple(self) if ChangeJournal._journals else None
+        if isinstance(index, slice):
+            old_values = super(RelatedManager, self).__getitem__(index)
+            value = list(value)
+            new_values = value
+        else:
+            old_values = [super(RelatedManager, self).__getitem__(index)]
+            new_values = [value]
+        GraphState.link(self.object, new_values)
+        super(RelatedManager, self).__setitem__(index, value)
+        if journal_values is not None:
+            self._record_replacement(journal_values)
+        self._invalidate_index_positions()
+        self._remove_members(old_values)
+        self._add_members(new_values)
+
+    def __delitem__(self, index):
+        """ Delete an element of the list
+
+        Args:
+            index (:obj:`int` or :obj:`slice`): index
+        """
+        GraphState.touch(self.object)
+        journal_values = tuple(self) if ChangeJournal._journals else None
+        if isinstance(index, slice):
+            old_values = super(RelatedManager, self).__getitem__(index)
+        else:
+            old_values = [super(RelatedManager, self).__getitem__(index)]
+        super(RelatedManager, self).__delitem__(index)
+        if journal_values is not None:
+            self._record_replacement(journal_values)
+        self._remove_members(old_values)
+
+    def __iadd__(self, values):
+        """ Add values to list
+
+        Args:
+            values (:obj:`list`): values to add to list
 
         Returns:
             :obj:`RelatedManager`: self
         """
-        super(RelatedManager, self).append(value, **kwargs)
+        return self.extend(values)
 
-        return self
+    def reverse(self):
+        """ Reverse the order of the list """
+        GraphState.touch(self.object)
+        journal_values = tuple(self) if ChangeJournal._journals else None
+        super(RelatedManager, self).reverse()
+        if journal_values is not None:
+            self._record_replacement(journal_values)
+        self._invalidate_index_positions()
+
+    def sort(self, key=None, reverse=False):
+        """ Sort the list
+
+        Args:
+            key (:obj:`types.FunctionType`, optional): sort key
+            reverse (:obj:`bool`, optional): if :obj:`True`, sort in descending order
+        """
+        GraphState.touch(self.object)
+        journal_values = tuple(self) if ChangeJournal._journals else None
+        super(RelatedManager, self).sort(key=key, reverse=reverse)
+        if journal_values is not None:
+            self._record_replacement(journal_values)
+        self._invalidate_index_positions()
 
     def add(self, value, **kwargs):
         """ Add value to list
@@ -6140,8 +10998,7 @@ class RelatedManager(list):
         Returns:
             :obj:`RelatedManager`: self
         """
-        for value in reversed(self):
-            self.remove(value)
+        self._remove_values(list(self))
 
         return self
 
@@ -6154,7 +11011,11 @@ class RelatedManager(list):
         Returns:
             :obj:`object`: removed element
         """
+        GraphState.touch(self.object)
+        if ChangeJournal._journals and self:
+            ChangeJournal._record_all(RelatedManagerChange(self, i + len(self) if i < 0 else i, (self[i], ), ()))
         value = super(RelatedManager, self).pop(i)
+        self._remove_members([value])
         self.remove(value, update_list=False)
 
         return value
@@ -6172,20 +11033,62 @@ class RelatedManager(list):
 
         return self
 
-    def extend(self, values):
-        """ Add values to list
+    def extend(self, values, propagate=True):
+        """ Add values which are not already in the list to the list in a single operation
 
         Args:
             values (:obj:`list`): values to add to list
+            propagate (:obj:`bool`, optional): propagate change to related attribute
 
         Returns:
             :obj:`RelatedManager`: self
         """
-        for value in values:
-            self.append(value)
+        values = self._get_new_values(values)
+        if values:
+            GraphState.link(self.object, values)
+            if ChangeJournal._journals:
+                ChangeJournal._record_all(RelatedManagerChange(self, len(self), (), tuple(values)))
+            super(RelatedManager, self).extend(values)
+            self._add_members(values)
+            if propagate:
+                self._propagate_extend(values)
 
         return self
 
+    def _propagate_extend(self, values):
+        """ Propagate the addition of values to the list to the related attributes of the values
+
+        Args:
+            values (:obj:`list`): values which were added to the list
+        """
+        pass
+
+    def _remove_values(self, values):
+        """ Remove values from the list in a single operation and propagate the removals to the related
+        attributes of the values
+
+        Args:
+            values (:obj:`list`): values to remove from the list; values which are not in the list are ignored
+        """
+        members = self._members
+        values = [value for value in det_dedupe(values) if value in members]
+        if not values:
+            return
+
+        GraphState.touch(self.object)
+        journal_values = tuple(self) if ChangeJournal._journals else None
+        values_set = set(values)
+        super(RelatedManager, self).__setitem__(slice(None), [value for value in self if value not in values_set])
+        if journal_values is not None:
+            self._record_replacement(journal_values)
+        for value in values:
+            del members[value]
+        if self._indexes:
+            self._unindex_values(values)
+        self._update_indices()
+        for value in values:
+            self.remove(value, update_list=False)
+
     def intersection_update(self, values):
         """ Retain only intersection of list and :obj:`values`
 
@@ -6195,9 +11098,8 @@ class RelatedManager(list):
         Returns:
             :obj:`RelatedManager`: self
         """
-        for value in reversed(self):
-            if value not in values:
-                self.remove(value)
+        values = set(values)
+        self._remove_values([value for value in self if value not in values])
 
         return self
 
@@ -6210,9 +11112,7 @@ class RelatedManager(list):
         Returns:
             :obj:`RelatedManager`: self
         """
-        for value in values:
-            if value in self:
-                self.remove(value)
+        self._remove_values(values)
 
         return self
 
@@ -6225,14 +11125,13 @@ class RelatedManager(list):
         Returns:
             :obj:`RelatedManager`: self
         """
-        self_copy = copy.copy(self)
-        values_copy = copy.copy(values)
+        values = list(values)
+        members = self._members
+        old_values = [value for value in values if value in members]
+        new_values = [value for value in values if value not in members]
 
-        for value in values_copy:
-            if value in self_copy:
-                self.remove(value)
-            else:
-                self.add(value)
+        self._remove_values(old_values)
+        self.extend(new_values)
 
         return self
 
@@ -6302,6 +11201,11 @@ class RelatedManager(list):
         if '__type' in kwargs:
             __type = kwargs.pop('__type')
 
+        if self._indexes and kwargs:
+            matches = self._get_indexed(__type=__type, **kwargs)
+            if matches is not None:
+                return matches
+
         matches = []
         for obj in self:
             if obj.has_attr_vals(__type=__type, __check_attr_defined=False, **kwargs):
@@ -6405,6 +11309,15 @@ class ManyToOneRelatedManager(RelatedManager):
 
         return self
 
+    def _propagate_extend(self, values):
+        """ Propagate the addition of values to the list to the related attributes of the values
+
+        Args:
+            values (:obj:`list`): values which were added to the list
+        """
+        for value in values:
+            value.__setattr__(self.attribute.name, self.object, propagate=True)
+
     def cut(self, kind=None):
         """ Cut values and their children of kind :obj:`kind` into separate graphs.
 
@@ -6475,6 +11388,16 @@ class OneToManyRelatedManager(RelatedManager):
 
         return self
 
+    def _propagate_extend(self, values):
+        """ Propagate the addition of values to the list to the related attributes of the values
+
+        Args:
+            values (:obj:`list`): values which were added to the list
+        """
+        for value in values:
+            value.__setattr__(self.attribute.related_name,
+                              self.object, propagate=True)
+
     def cut(self, kind=None):
         """ Cut values and their children of kind :obj:`kind` into separate graphs.
 
@@ -6545,6 +11468,19 @@ class ManyToManyRelatedManager(RelatedManager):
 
         return self
 
+    def _propagate_extend(self, values):
+        """ Propagate the addition of values to the list to the related attributes of the values
+
+        Args:
+            values (:obj:`list`): values which were added to the list
+        """
+        if self.related:
+            related_attr_name = self.attribute.name
+        else:
+            related_attr_name = self.attribute.related_name
+        for value in values:
+            getattr(value, related_attr_name).append(self.object, propagate=False)
+
     def cut(self, kind=None):
         """ Cut values and their children of kind :obj:`kind` into separate graphs.
 
@@ -7978,10 +12914,12 @@ class OneToManyAttribute(ToManyAttribute, RelatedAttribute):
         Raises:
             :obj:`ValueError`: if the attributes of the elements of the models are different
         """
-        left_children = getattr(left, self.name)
         right_children = getattr(right, self.name)
+        if not right_children:
+            return
 
-        for right_child in list(right_children):
+        new_left_children = []
+        for right_child in right_children:
             left_child = right_objs_in_left.get(right_child, right_child)
             cur_left_child_parent = getattr(left_child, self.related_name)
 
@@ -7992,8 +12930,11 @@ class OneToManyAttribute(ToManyAttribute, RelatedAttribute):
                     left_child.__class__.__name__,
                     self.related_name))
 
-            right_children.remove(right_child)
-            left_children.append(left_child)
+            new_left_children.append(left_child)
+
+        # move the children in bulk rather than removing them one by one
+        right_children.clear()
+        getattr(left, self.name).extend(new_left_children)
 
     def get_xlsx_validation(self, sheet_models=None, doc_metadata_model=None):
         """ Get XLSX validation
@@ -8342,13 +13283,14 @@ class ManyToManyAttribute(ToManyAttribute, RelatedAttribute):
         Raises:
             :obj:`ValueError`: if the attributes of the elements of the models are different
         """
-        left_children = getattr(left, self.name)
         right_children = getattr(right, self.name)
+        if not right_children:
+            return
 
-        for right_child in list(right_children):
-            left_child = right_objs_in_left.get(right_child, right_child)
-            right_children.remove(right_child)
-            left_children.append(left_child)
+        # move the children in bulk rather than removing them one by one
+        new_left_children = [right_objs_in_left.get(right_child, right_child) for right_child in right_children]
+        right_children.clear()
+        getattr(left, self.name).extend(new_left_children)
 
     def get_xlsx_validation(self, sheet_models=None, doc_metadata_model=None):
         """ Get XLSX validation
@@ -8413,13 +13355,17 @@ class InvalidObjectSet(object):
     Attributes:
         invalid_objects (:obj:`list` of :obj:`InvalidObject`): list of invalid objects
         invalid_models (:obj:`list` of :obj:`InvalidModel`): list of invalid models
+        truncated (:obj:`bool`): if :obj:`True`, validation stopped before all of the errors were found
+            (see :obj:`Validator.max_errors`)
     """
 
-    def __init__(self, invalid_objects, invalid_models):
+    def __init__(self, invalid_objects, invalid_models, truncated=False):
         """
         Args:
             invalid_objects (:obj:`list` of :obj:`InvalidObject`): list of invalid objects
             invalid_models (:obj:`list` of :obj:`InvalidModel`): list of invalid models
+            truncated (:obj:`bool`, optional): if :obj:`True`, validation stopped before all of the errors
+                were found
 
         Raises:
             :obj:`ValueError`: :obj:`invalid_models` is not unique
@@ -8433,6 +13379,7 @@ class InvalidObjectSet(object):
                 [mdl.__class__.__name__ for mdl in duplicate_invalid_models]))
         self.invalid_objects = invalid_objects or []
         self.invalid_models = invalid_models or []
+        self.truncated = truncated
 
     def get_object_errors_by_model(self):
         """ Get object errors grouped by model
@@ -8480,9 +13427,44 @@ class InvalidObjectSet(object):
                                  model], key=lambda x: x.object.get_primary_attribute(), alg=ns.IGNORECASE)
                 error_forest.append([str(obj_err) for obj_err in errs])
 
+        if self.truncated:
+            error_forest.append('Validation stopped after {} error(s); other errors may not have been reported'.format(
+                len(self.invalid_objects) + len(self.invalid_models)))
+
         return indent_forest(error_forest)
 
 
+class ValidationError(ValueError):
+    """ Error which is raised when objects fail to validate
+
+    The message, which can be very long for large datasets, is only rendered when it is needed,
+    such as when the error is converted to a string. The errors themselves are available
+    through :obj:`errors`.
+
+    Attributes:
+        message (:obj:`str`): summary of the error
+        errors (:obj:`InvalidObjectSet`): errors
+    """
+
+    def __init__(self, message, errors):
+        """
+        Args:
+            message (:obj:`str`): summary of the error
+            errors (:obj:`InvalidObjectSet`): errors
+        """
+        super(ValidationError, self).__init__(message, errors)
+        self.message = message
+        self.errors = errors
+
+    def __str__(self):
+        """ Get string representation of the error
+
+        Returns:
+            :obj:`str`: string representation of the error
+        """
+        return indent_forest([self.message, [self.errors]])
+
+
 class InvalidModel(object):
     """ Represents an invalid model, such as a model with an attribute that fails to meet specified constraints
 
@@ -8652,28 +13634,92 @@ def get_model(name, module=None):
 
 
 class Validator(object):
-    """ Engine to validate sets of objects """
+    """ Engine to validate sets of objects
+
+    Objects can be validated in parallel by a pool of forked worker processes. The workers inherit the
+    objects from the parent process, validate shards of consecutive objects and the uniqueness of the
+    instances of each model, and return their errors as tuples of picklable values. The parent process
+    reconstructs the errors in the same order as serial validation. Objects whose errors cannot be
+    represented this way are validated again by the parent process. If the platform cannot fork processes,
+    or if the pool cannot be started or cannot exchange the objects and errors with the workers, a
+    :obj:`ValidationWarning` is issued and all of the objects are validated serially. Exceptions raised
+    while validating objects are propagated to the caller, as they are by serial validation.
+
+    Because :obj:`fork` only copies the calling thread, :obj:`workers` must be 1 when validation is run by
+    multithreaded programs such as web servers.
+
+    Errors can also be reported as they are found. If :obj:`max_errors` or :obj:`on_error` is set, objects
+    are validated serially in shards of :obj:`min_objects_per_shard` objects, each error is passed to
+    :obj:`on_error`, and validation stops once :obj:`max_errors` errors have been found. :obj:`iter_errors`
+    provides the same errors as an iterator.
+
+    Attributes:
+        workers (:obj:`int`): number of worker processes; if 1, objects are validated serially
+        max_errors (:obj:`int`): maximum number of errors to find before stopping; if :obj:`None`, find all errors
+        on_error (:obj:`types.FunctionType`): function which is called with each error (:obj:`InvalidObject`
+            or :obj:`InvalidModel`) as soon as it is found
+        min_objects_per_shard (:obj:`int`): minimum number of objects to validate in each task of a worker
+    """
+    MIN_OBJECTS_PER_SHARD = 1000
+    SHARDS_PER_WORKER = 4
+
+    _worker_objects = None
+    _worker_objects_by_class = None
+    _worker_classes = None
+
+    def __init__(self, workers=1, max_errors=None, on_error=None):
+        """
+        Args:
+            workers (:obj:`int`, optional): number of worker processes; if :obj:`None`, use one process
+                per CPU; must be 1 in multithreaded programs such as web servers
+            max_errors (:obj:`int`, optional): maximum number of errors to find before stopping; if :obj:`None`,
+                find all errors
+            on_error (:obj:`types.FunctionType`, optional): function which is called with each error as soon as
+                it is found
+
+        Raises:
+            :obj:`ValueError`: if :obj:`workers` or :obj:`max_errors` is not a positive integer
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError('`workers` must be a positive integer')
+        if max_errors is not None and (not isinstance(max_errors, int) or max_errors < 1):
+            raise ValueError('`max_errors` must be a positive integer or `None`')
+        self.workers = workers
+        self.max_errors = max_errors
+        self.on_error = on_error
+        self.min_objects_per_shard = self.MIN_OBJECTS_PER_SHARD
 
     def run(self, objects, get_related=False):
         """ Validate a list of objects and return their errors
 
+        The objects of a :obj:`SubgraphView` are validated as if the view had been cut from the rest of
+        the object graph.
+
         Args:
-            objects (:obj:`Model` or :obj:`list` of :obj:`Model`): object or list of objects
-            get_related (:obj:`bool`, optional): if true, get all related objects
+            objects (:obj:`Model`, :obj:`list` of :obj:`Model`, or :obj:`SubgraphView`): object, list of objects,
+                or view
+            get_related (:obj:`bool`, optional): if true, get all related objects; ignored for views
 
         Returns:
             :obj:`InvalidObjectSet` or :obj:`None`: list of invalid objects/models and their errors
         """
-        if isinstance(objects, Model):
-            objects = [objects]
+        view = None
+        if isinstance(objects, SubgraphView):
+            view = objects
+            objects = view.get_objects()
+        else:
+            if isinstance(objects, Model):
+                objects = [objects]
 
-        if get_related:
-            objects = Model.get_all_related(objects)
+            if get_related:
+                objects = Model.get_all_related(objects)
 
         error = self.clean(objects)
         if error:
             return error
-        return self.validate(objects)
+        return self.validate(objects, view=view)
 
     def clean(self, objects):
         """ Clean a list of objects and return their errors
@@ -8684,6 +13730,8 @@ class Validator(object):
         Returns:
             :obj:`InvalidObjectSet` or :obj:`None`: list of invalid objects/models and their errors
         """
+        if self.max_errors is not None or self.on_error is not None:
+            return self.collect_errors(error for error in (obj.clean() for obj in objects) if error)
 
         object_errors = []
         for obj in objects:
@@ -8696,35 +13744,248 @@ class Validator(object):
 
         return None
 
-    def validate(self, objects):
+    def validate(self, objects, view=None):
         """ Validate a list of objects and return their errors
 
         Args:
             object (:obj:`list` of :obj:`Model`): list of Model instances
+            view (:obj:`SubgraphView`, optional): if not :obj:`None`, validate the values of the related
+                attributes of the objects which belong to the view; objects are validated serially
 
         Returns:
             :obj:`InvalidObjectSet` or :obj:`None`: list of invalid objects/models and their errors
         """
+        if self.max_errors is not None or self.on_error is not None:
+            return self.collect_errors(self.iter_errors(objects, view=view))
+
+        objects = list(objects)
+        objects_by_class = self.group_objects_by_class(objects)
+
+        errors = None
+        if self.workers > 1 \
+                and view is None \
+                and len(objects) >= 2 * self.min_objects_per_shard \
+                and 'fork' in multiprocessing.get_all_start_methods():
+            errors = self.validate_in_parallel(objects, objects_by_class)
+
+        if errors is None:
+            # validate individual objects
+            object_errors = [error for error in self.validate_objects(objects, view=view) if error]
+
+            # validate collections of objects of each Model type
+            model_errors = []
+            for cls, cls_objects in objects_by_class.items():
+                error = cls.validate_unique(cls_objects)
+                if error:
+                    model_errors.append(error)
+
+        else:
+            object_errors, model_errors = errors
+
+        # return errors
+        if object_errors or model_errors:
+            return InvalidObjectSet(object_errors, model_errors)
+
+        return None
+
+    def iter_errors(self, objects, view=None):
+        """ Validate a list of objects and generate their errors as they are found
+
+        Objects are validated serially in shards of :obj:`min_objects_per_shard` objects, and the errors of the
+        objects of each shard are generated before the next shard is validated. Then the uniqueness of the
+        instances of each model is validated. Validation stops when the caller stops consuming the errors.
+
+        Args:
+            objects (:obj:`list` of :obj:`Model`): list of Model instances
+            view (:obj:`SubgraphView`, optional): if not :obj:`None`, validate the values of the related
+                attributes of the objects which belong to the view
+
+        Yields:
+            :obj:`InvalidObject` or :obj:`InvalidModel`: error of an object or of a model
+        """
+        objects = list(objects)
 
         # validate individual objects
-        object_errors = []
-        for obj in objects:
-            error = obj.validate()
+        for i_shard in range(0, len(objects), self.min_objects_per_shard):
+            for error in self.validate_objects(objects[i_shard:i_shard + self.min_objects_per_shard], view=view):
+                if error:
+                    yield error
+
+        # validate collections of objects of each Model type
+        for cls, cls_objects in self.group_objects_by_class(objects).items():
+            error = cls.validate_unique(cls_objects)
             if error:
+                yield error
+
+    def collect_errors(self, errors):
+        """ Collect errors as they are found, passing each to :obj:`on_error`, until :obj:`max_errors` errors
+        have been collected
+
+        Args:
+            errors (:obj:`iterator` of :obj:`InvalidObject` or :obj:`InvalidModel`): errors
+
+        Returns:
+            :obj:`InvalidObjectSet` or :obj:`None`: list of invalid objects/models and their errors
+        """
+        object_errors = []
+        model_errors = []
+        truncated = False
+        for error in errors:
+            if self.on_error is not None:
+                self.on_error(error)
+            if isinstance(error, InvalidModel):
+                model_errors.append(error)
+            else:
                 object_errors.append(error)
+            if self.max_errors is not None and len(object_errors) + len(model_errors) >= self.max_errors:
+                truncated = True
+                break
+
+        if object_errors or model_errors:
+            return InvalidObjectSet(object_errors, model_errors, truncated=truncated)
+        return None
+
+    @staticmethod
+    def group_objects_by_class(objects):
+        """ Group objects by their classes and the superclasses of their classes
+
+        Args:
+            objects (:obj:`list` of :obj:`Model`): objects
 
-        # group objects by class
+        Returns:
+            :obj:`dict`: dictionary which maps each class to its instances
+        """
         objects_by_class = {}
         for obj in objects:
             for cls in obj.__class__.Meta.inheritance:
                 if cls not in objects_by_class:
                     objects_by_class[cls] = []
                 objects_by_class[cls].append(obj)
+        return objects_by_class
 
-        # validate collections of objects of each Model type
+    @staticmethod
+    def validate_objects(objects, view=None):
+        """ Validate individual objects
+
+        The instances of each class which doesn't override :obj:`Model.validate` are validated together
+        column-wise (see :obj:`Model.validate_objects`). The instances of classes which override
+        :obj:`Model.validate` are validated with their own values of their related attributes, even if they
+        belong to a view.
+
+        Args:
+            objects (:obj:`list` of :obj:`Model`): objects
+            view (:obj:`SubgraphView`, optional): if not :obj:`None`, validate the values of the related
+                attributes of the objects which belong to the view
+
+        Returns:
+            :obj:`list` of :obj:`InvalidObject` or :obj:`None`: errors of each object, or :obj:`None` for each
+                valid object
+        """
+        errors = [None] * len(objects)
+
+        indices_by_class = {}
+        for i_obj, obj in enumerate(objects):
+            cls = obj.__class__
+            if cls not in indices_by_class:
+                indices_by_class[cls] = []
+            indices_by_class[cls].append(i_obj)
+
+        for cls, indices in indices_by_class.items():
+            if cls.validate is Model.validate:
+                cls_errors = cls.validate_objects([objects[i_obj] for i_obj in indices], view=view)
+                for i_obj, error in zip(indices, cls_errors):
+                    errors[i_obj] = error
+            else:
+                for i_obj in indices:
+                    errors[i_obj] = objects[i_obj].validate()
+
+        return errors
+
+    def validate_incremental(self, store):
+        """ Validate the objects of a store which have changed since the store was last validated
+
+        Objects which have been added to the store or changed (their attributes have been set or related objects
+        have been added to or removed from their related attributes) are cleaned and validated together with the
+        objects which are directly related to them. The uniqueness of the attributes of each model is only checked
+        among the objects whose values of the unique attributes (or combinations of attributes) are the same
+        as the values of the changed objects. The values are kept in an index in the store, which is built the
+        first time that the store is validated incrementally. Afterwards, the record of changes of the store is
+        cleared, unless the changed objects could not be cleaned.
+
+        Args:
+            store (:obj:`ObjectStore`): store
+
+        Returns:
+            :obj:`InvalidObjectSet` or :obj:`None`: list of invalid objects/models and their errors
+        """
+        dirty, removed = store.pop_dirty()
+
+        # changed objects and their neighbors
+        objects = {}
+        for obj in chain(dirty.keys(), removed):
+            if obj in store:
+                objects[obj] = None
+            plan = obj.Meta.traversal_plan or obj.get_traversal_plan()
+            for _, _, get, to_many in plan.related_attrs:
+                value = get(obj)
+                if to_many:
+                    for related_obj in value:
+                        if related_obj in store:
+                            objects[related_obj] = None
+                elif value is not None and value in store:
+                    objects[value] = None
+        objects = list(objects.keys())
+
+        error = self.clean(objects)
+        if error:
+            for obj, attr_names in dirty.items():
+                if obj in store:
+                    store._dirty[obj] = attr_names
+            store._removed.update(dict.fromkeys(removed))
+            return error
+
+        # cleaning doesn't change the objects which need to be validated
+        for obj in objects:
+            store._dirty.pop(obj, None)
+
+        # validate individual objects
+        object_errors = [error for error in self.validate_objects(objects) if error]
+
+        # update the index of the values of the unique attributes and find the objects whose values may be repeated
+        unique_index = store._unique_index
+        unique_keys = store._unique_keys
+        if unique_index is None:
+            unique_index = store._unique_index = {}
+            for obj in store.all():
+                if obj not in dirty:
+                    self._index_unique_values(unique_index, unique_keys, obj)
+
+        touched = {}
+        for obj in removed:
+            for index_key, val in unique_keys.pop(obj, {}).items():
+                matches = unique_index[index_key][val]
+                matches.pop(obj, None)
+                touched[(index_key, val)] = None
+        for obj in objects:
+            for index_key, val in unique_keys.pop(obj, {}).items():
+                matches = unique_index[index_key][val]
+                matches.pop(obj, None)
+                touched[(index_key, val)] = None
+            for index_key, val in self._index_unique_values(unique_index, unique_keys, obj).items():
+                touched[(index_key, val)] = None
+
+        objects_by_class = {}
+        for (cls, attr_names), val in touched.keys():
+            matches = unique_index[(cls, attr_names)].get(val, None)
+            if matches is not None and len(matches) > 1:
+                objects_by_class.setdefault(cls, {}).update(matches)
+            elif matches is not None and not matches:
+                del unique_index[(cls, attr_names)][val]
+
+        # validate the uniqueness of the attributes of the objects whose values may be repeated
         model_errors = []
         for cls, cls_objects in objects_by_class.items():
-            error = cls.validate_unique(cls_objects)
+            error = cls.validate_unique(list(cls_objects.keys()))
             if error:
                 model_errors.append(error)
 
@@ -8734,6 +13995,211 @@ class Validator(object):
 
         return None
 
+    @classmethod
+    def _index_unique_values(cls, unique_index, unique_keys, obj):
+        """ Add the values of the unique attributes and combinations of attributes of an object to an index
+
+        Args:
+            unique_index (:obj:`dict`): dictionary which maps each model and each tuple of attribute names whose
+                values must be unique to a dictionary which maps the values of the attributes to dictionaries
+                whose keys are the matching objects
+            unique_keys (:obj:`dict`): reverse index which maps each object to a dictionary which maps the keys
+                of :obj:`unique_index` to the values of the attributes of the object
+            obj (:obj:`Model`): object
+
+        Returns:
+            :obj:`dict`: dictionary which maps the keys of :obj:`unique_index` to the values of the attributes
+                of the object
+        """
+        keys = {}
+        for model in obj.__class__.Meta.inheritance:
+            for attr_name, attr in model.Meta.attributes.items():
+                if attr.unique:
+                    keys[(model, (attr_name,))] = cls.get_unique_value(attr, getattr(obj, attr_name))
+            for attr_names in model.Meta.unique_together:
+                keys[(model, attr_names)] = model.get_unique_together_value(obj, attr_names)
+
+        for index_key, val in keys.items():
+            index = unique_index.get(index_key, None)
+            if index is None:
+                index = unique_index[index_key] = {}
+            matches = index.get(val, None)
+            if matches is None:
+                matches = index[val] = {}
+            matches[obj] = None
+        unique_keys[obj] = keys
+        return keys
+
+    @staticmethod
+    def get_unique_value(attr, value):
+        """ Get the value of a unique attribute which :obj:`Attribute.validate_unique` compares with the
+        values of the attribute of other objects
+
+        Args:
+            attr (:obj:`Attribute`): attribute
+            value (:obj:`object`): value of the attribute
+
+        Returns:
+            :obj:`object`: hashable value
+        """
+        if type(attr).validate_unique is not Attribute.validate_unique:
+            # attributes which customize :obj:`Attribute.validate_unique` compare serialized values
+            value = attr.serialize(value)
+        if attr.unique_case_insensitive and isinstance(value, str):
+            value = value.lower()
+        return value
+
+    def validate_in_parallel(self, objects, objects_by_class):
+        """ Validate objects and the uniqueness of the instances of each model with a pool of forked processes
+
+        Args:
+            objects (:obj:`list` of :obj:`Model`): list of Model instances
+            objects_by_class (:obj:`dict` of :obj:`type`, :obj:`list` of :obj:`Model`): dictionary that maps
+                models to their instances
+
+        Returns:
+            :obj:`tuple` of :obj:`list` of :obj:`InvalidObject`, :obj:`list` of :obj:`InvalidModel`: errors of
+                the objects and models, or :obj:`None` if the objects could not be validated in parallel
+        """
+        n_shards = min(self.workers * self.SHARDS_PER_WORKER,
+                       max(1, len(objects) // self.min_objects_per_shard))
+        bounds = [(len(objects) * i_shard // n_shards, len(objects) * (i_shard + 1) // n_shards)
+                  for i_shard in range(n_shards)]
+        classes = list(objects_by_class.keys())
+
+        context = multiprocessing.get_context('fork')
+        try:
+            with context.Pool(self.workers, initializer=self._init_worker,
+                              initargs=(objects, objects_by_class)) as pool:
+                async_model_results = pool.map_async(self._validate_unique_in_worker, range(len(classes)))
+                object_results = pool.map(self._validate_objects_in_worker, bounds)
+                model_results = async_model_results.get()
+        except (OSError, pickle.PicklingError, multiprocessing.pool.MaybeEncodingError) as exception:
+            warnings.warn('Objects could not be validated in parallel; validating them serially: {}'.format(
+                exception), ValidationWarning)
+            return None
+
+        object_errors = []
+        for shard_results in object_results:
+            for i_obj, encoded_errors in shard_results:
+                obj = objects[i_obj]
+                if encoded_errors is None:
+                    error = obj.validate()
+                else:
+                    error = InvalidObject(obj, self._decode_attribute_errors(obj.__class__, encoded_errors))
+                object_errors.append(error)
+
+        model_errors = []
+        for cls, (invalid, encoded_errors) in zip(classes, model_results):
+            if not invalid:
+                continue
+            if encoded_errors is None:
+                error = cls.validate_unique(objects_by_class[cls])
+            else:
+                error = InvalidModel(cls, self._decode_attribute_errors(cls, encoded_errors))
+            model_errors.append(error)
+
+        return (object_errors, model_errors)
+
+    @staticmethod
+    def _init_worker(objects, objects_by_class):
+        """ Store the objects inherited by a worker process
+
+        Args:
+            objects (:obj:`list` of :obj:`Model`): list of Model instances
+            objects_by_class (:obj:`dict` of :obj:`type`, :obj:`list` of :obj:`Model`): dictionary that maps
+                models to their instances
+        """
+        Validator._worker_objects = objects
+        Validator._worker_objects_by_class = objects_by_class
+        Validator._worker_classes = list(objects_by_class.keys())
+
+    @staticmethod
+    def _validate_objects_in_worker(bounds):
+        """ Validate a shard of the objects inherited by a worker process
+
+        Args:
+            bounds (:obj:`tuple` of :obj:`int`): indices of the first and last (exclusive) objects of the shard
+
+        Returns:
+            :obj:`list` of :obj:`tuple`: indices and encoded errors of the invalid objects; the errors are
+                :obj:`None` for errors which cannot be encoded
+        """
+        objects = Validator._worker_objects
+        results = []
+        errors = Validator.validate_objects(objects[bounds[0]:bounds[1]])
+        for i_obj, error in enumerate(errors, bounds[0]):
+            if error:
+                obj = objects[i_obj]
+                if type(error) is InvalidObject and error.object is obj:
+                    encoded_errors = Validator._encode_attribute_errors(obj.__class__, error.attributes)
+                else:
+                    encoded_errors = None
+                results.append((i_obj, encoded_errors))
+        return results
+
+    @staticmethod
+    def _validate_unique_in_worker(i_cls):
+        """ Validate the uniqueness of the instances of a model inherited by a worker process
+
+        Args:
+            i_cls (:obj:`int`): index of the model
+
+        Returns:
+            :obj:`tuple` of :obj:`bool`, :obj:`list`: whether the instances are invalid and their encoded errors;
+                the errors are :obj:`None` if they cannot be encoded
+        """
+        cls = Validator._worker_classes[i_cls]
+        error = cls.validate_unique(Validator._worker_objects_by_class[cls])
+        if not error:
+            return (False, None)
+        if type(error) is InvalidModel and error.model is cls:
+            return (True, Validator._encode_attribute_errors(cls, error.attributes))
+        return (True, None)
+
+    @staticmethod
+    def _encode_attribute_errors(cls, errors):
+        """ Encode errors into tuples of picklable values
+
+        Args:
+            cls (:obj:`type`): model whose attributes are invalid
+            errors (:obj:`list` of :obj:`InvalidAttribute`): errors
+
+        Returns:
+            :obj:`list` of :obj:`tuple`: encoded errors, or :obj:`None` if an error does not describe an
+                attribute of the model
+        """
+        encoded_errors = []
+        for error in errors:
+            if type(error) is not InvalidAttribute:
+                return None
+            attr = error.attribute
+            if cls.Meta.attributes.get(getattr(attr, 'name', None), None) is attr:
+                key = (False, attr.name)
+            elif cls.Meta.related_attributes.get(getattr(attr, 'related_name', None), None) is attr:
+                key = (True, attr.related_name)
+            else:
+                return None
+            encoded_errors.append((key, error.messages, error.related, error.location, error.value))
+        return encoded_errors
+
+    @staticmethod
+    def _decode_attribute_errors(cls, encoded_errors):
+        """ Decode errors encoded by :obj:`_encode_attribute_errors`
+
+        Args:
+            cls (:obj:`type`): model whose attributes are invalid
+            encoded_errors (:obj:`list` of :obj:`tuple`): encoded errors
+
+        Returns:
+            :obj:`list` of :obj:`InvalidAttribute`: errors
+        """
+        errors = []
+        for (reverse, attr_name), messages, related, location, value in encoded_errors:
+            attr = cls.Meta.related_attributes[attr_name] if reverse else cls.Meta.attributes[attr_name]
+            errors.append(InvalidAttribute(attr, messages, related=related, location=location, value=value))
+        return errors
+
 
 def xlsx_col_name(col):
     """ Convert column number to an XLSX-style string.
@@ -8771,6 +14237,11 @@ class SchemaWarning(ObjTablesWarning):
     pass
 
 
+class ValidationWarning(ObjTablesWarning):
+    """ Validation warning """
+    pass
+
+
 def join_separated_list(values, separator=','):
     """ Parse a separator list of values into a list of values
 
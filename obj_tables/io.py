@@ -35,8 +35,8 @@ from os.path import basename, splitext
 from warnings import warn
 from obj_tables import utils
 from obj_tables.core import (Model, Attribute, BaseRelatedAttribute, RelatedAttribute, Validator, TableFormat,
-                             InvalidObject, xlsx_col_name,
-                             InvalidAttribute, ObjTablesWarning,
+                             InvalidObject, ValidationError, xlsx_col_name,
+                             InvalidAttribute, ObjTablesWarning, SubgraphView,
                              DOC_TABLE_TYPE,
                              SCHEMA_TABLE_TYPE, SCHEMA_SHEET_NAME,
                              TOC_TABLE_TYPE, TOC_SHEET_NAME)
@@ -69,7 +69,8 @@ class WriterBase(object, metaclass=abc.ABCMeta):
 
         Args:
             path (:obj:`str`): path to write file(s)
-            objects (:obj:`Model` or :obj:`list` of :obj:`Model`): object or list of objects
+            objects (:obj:`Model`, :obj:`list` of :obj:`Model`, or :obj:`SubgraphView`): object, list of objects,
+                or view of objects
             schema_name (:obj:`str`, optional): schema name
             doc_metadata (:obj:`dict`, optional): dictionary of document metadata to be saved to header row
                 (e.g., ``!!!ObjTables ...``)
@@ -178,7 +179,8 @@ class JsonWriter(WriterBase):
 
         Args:
             path (:obj:`str`): path to write file(s)
-            objects (:obj:`Model` or :obj:`list` of :obj:`Model`): object or list of objects
+            objects (:obj:`Model`, :obj:`list` of :obj:`Model`, or :obj:`SubgraphView`): object, list of objects,
+                or view of objects
             schema_name (:obj:`str`, optional): schema name
             doc_metadata (:obj:`dict`, optional): dictionary of document metadata to be saved to header row
                 (e.g., ``!!!ObjTables ...``)
@@ -224,9 +226,15 @@ class JsonWriter(WriterBase):
         if not include_all_attributes:
             warn('`include_all_attributes=False` has no effect', IoWarning)
 
+        # write the objects of views, restricted to the views
+        view = None
+        if isinstance(objects, SubgraphView):
+            view = objects
+            objects = view.get_objects()
+
         # validate
         if objects and validate:
-            error = Validator().run(objects, get_related=get_related)
+            error = Validator().run(objects if view is None else view, get_related=get_related)
             if error:
                 warn('Some data will not be written because objects are not valid:\n  {}'.format(
                     str(error).replace('\n', '\n  ').rstrip()), IoWarning)
@@ -257,7 +265,7 @@ class JsonWriter(WriterBase):
 
         # encode to json
         all_models = set(models)
-        json_objects = Model.to_dict(objects, all_models)
+        json_objects = Model.to_dict(objects, all_models, view=view)
 
         # add model metadata to JSON
         l_case_format = 'objTables'
@@ -318,7 +326,8 @@ class WorkbookWriter(WriterBase):
 
         Args:
             path (:obj:`str`): path to write file(s)
-            objects (:obj:`Model` or :obj:`list` of :obj:`Model`): :obj:`Model` instance or list of :obj:`Model` instances
+            objects (:obj:`Model`, :obj:`list` of :obj:`Model`, or :obj:`SubgraphView`): :obj:`Model` instance,
+                list of :obj:`Model` instances, or view of instances
             schema_name (:obj:`str`, optional): schema name
             doc_metadata (:obj:`dict`, optional): dictionary of document metadata to be saved to header row
                 (e.g., ``!!!ObjTables ...``)
@@ -353,8 +362,13 @@ class WorkbookWriter(WriterBase):
         Raises:
             :obj:`ValueError`: if no model is provided or a class cannot be serialized
         """
+        view = None
         if objects is None:
             objects = []
+        elif isinstance(objects, SubgraphView):
+            view = objects
+            objects = view.get_objects()
+            get_related = False
         elif not isinstance(objects, (list, tuple)):
             objects = [objects]
 
@@ -373,7 +387,7 @@ class WorkbookWriter(WriterBase):
             all_objects = Model.get_all_related(objects)
 
         if validate:
-            error = Validator().run(all_objects)
+            error = Validator().run(all_objects if view is None else view)
             if error:
                 warn('Some data will not be written because objects are not valid:\n  {}'.format(
                     str(error).replace('\n', '\n  ').rstrip()), IoWarning)
@@ -464,7 +478,7 @@ class WorkbookWriter(WriterBase):
             self.write_model(writer, model, objects, schema_name, date, doc_metadata, doc_metadata_model, model_metadata.get(model, {}),
                              sheet_models, include_all_attributes=include_all_attributes, encoded=encoded,
                              write_empty_models=write_empty_models, write_empty_cols=write_empty_cols,
-                             extra_entries=extra_entries, protected=protected)
+                             extra_entries=extra_entries, protected=protected, view=view)
             doc_metadata = None
 
         # finalize workbook
@@ -650,7 +664,7 @@ class WorkbookWriter(WriterBase):
 
     def write_model(self, writer, model, objects, schema_name, date, doc_metadata, doc_metadata_model, model_metadata, sheet_models,
                     include_all_attributes=True, encoded=None, write_empty_models=True, write_empty_cols=True,
-                    extra_entries=0, protected=True):
+                    extra_entries=0, protected=True, view=None):
         """ Write a list of model objects to a file
 
         Args:
@@ -671,6 +685,8 @@ class WorkbookWriter(WriterBase):
             write_empty_cols (:obj:`bool`, optional): if :obj:`True`, write columns even when all values are :obj:`None`
             extra_entries (:obj:`int`, optional): additional entries to display
             protected (:obj:`bool`, optional): if :obj:`True`, protect the worksheet
+            view (:obj:`SubgraphView`, optional): if not :obj:`None`, only write the related objects which belong
+                to the view
         """
         if not write_empty_models and not objects:
             return
@@ -683,6 +699,16 @@ class WorkbookWriter(WriterBase):
         # objects
         model.sort(objects)
 
+        # rows which don't contain the attributes of related objects can be serialized by a generated function,
+        # unless the related objects must be restricted to a view
+        get_value = getattr if view is None else view.get_value
+        if view is not None or any(isinstance(attr, RelatedAttribute)
+                                   and attr.related_class.Meta.table_format == TableFormat.multiple_cells
+                                   for attr in attrs):
+            serialize = None
+        else:
+            serialize = model.get_code_generator().get_serializer(attrs)
+
         data = []
         for obj in objects:
             # comments
@@ -690,15 +716,19 @@ class WorkbookWriter(WriterBase):
                 data.append(['%/ ' + comment + ' /%'])
 
             # properties
+            if serialize:
+                data.append(serialize(obj, encoded))
+                continue
+
             obj_data = []
             for attr in attrs:
-                val = getattr(obj, attr.name)
+                val = get_value(obj, attr.name)
                 if isinstance(attr, RelatedAttribute):
                     if attr.related_class.Meta.table_format == TableFormat.multiple_cells:
                         sub_attrs = get_ordered_attributes(attr.related_class, include_all_attributes=include_all_attributes)
                         for sub_attr in sub_attrs:
                             if val:
-                                sub_val = getattr(val, sub_attr.name)
+                                sub_val = get_value(val, sub_attr.name)
                                 if isinstance(sub_attr, RelatedAttribute):
                                     obj_data.append(sub_attr.serialize(sub_val, encoded=encoded))
                                 else:
@@ -706,9 +736,9 @@ class WorkbookWriter(WriterBase):
                             else:
                                 obj_data.append(None)
                     else:
-                        obj_data.append(attr.serialize(getattr(obj, attr.name), encoded=encoded))
+                        obj_data.append(attr.serialize(val, encoded=encoded))
                 else:
-                    obj_data.append(attr.serialize(getattr(obj, attr.name)))
+                    obj_data.append(attr.serialize(val))
             data.append(obj_data)
 
         # optionally, remove empty columns
@@ -879,7 +909,8 @@ class PandasWriter(WorkbookWriter):
         """ Write model instances to a dictionary of :obj:`pandas.DataFrame`
 
         Args:
-            objects (:obj:`Model` or :obj:`list` of :obj:`Model`): object or list of objects
+            objects (:obj:`Model`, :obj:`list` of :obj:`Model`, or :obj:`SubgraphView`): object, list of objects,
+                or view of objects
             schema_name (:obj:`str`, optional): schema name
             models (:obj:`list` of :obj:`Model`, optional): models in the order that they should
                 appear as worksheets; all models which are not in :obj:`models` will
@@ -905,21 +936,89 @@ class PandasWriter(WorkbookWriter):
                                       protected=protected)
         return self._data_frames
 
-    def write_sheet(self, writer, model, data, headings, metadata_headings, validation,
-                    extra_entries=0, merge_ranges=None, protected=False):
-        """ Write data to sheet
+    def write_model(self, writer, model, objects, schema_name, date, doc_metadata, doc_metadata_model, model_metadata,
+                    sheet_models, include_all_attributes=True, encoded=None, write_empty_models=True,
+                    write_empty_cols=True, extra_entries=0, protected=True, view=None):
+        """ Write a list of model objects to a :obj:`pandas.DataFrame`
+
+        The values of the attributes of columnar models (:obj:`Model.Meta.columnar`) which are stored in
+        NumPy arrays are copied into the data frame column by column, rather than serialized value by value.
 
         Args:
             writer (:obj:`wc_utils.workbook.io.Writer`): io writer
             model (:obj:`type`): model
-            data (:obj:`list` of :obj:`list` of :obj:`object`): list of list of cell values
-            headings (:obj:`list` of :obj:`list` of :obj:`str`): list of list of row headingsvalidations
-            metadata_headings (:obj:`list` of :obj:`list` of :obj:`str`): model metadata (name, description)
-                to print at the top of the worksheet
-            validation (:obj:`WorksheetValidation`): validation
+            objects (:obj:`list` of :obj:`Model`): list of instances of :obj:`Model`
+            schema_name (:obj:`str`): schema name
+            date (:obj:`str`): date
+            doc_metadata (:obj:`dict`): dictionary of document metadata to be saved to header row
+                (e.g., ``!!!ObjTables ...``)
+            doc_metadata_model (:obj:`type`): model whose worksheet contains the document metadata
+            model_metadata (:obj:`dict`): dictionary of model metadata
+            sheet_models (:obj:`list` of :obj:`Model`): models encoded as separate sheets
+            include_all_attributes (:obj:`bool`, optional): if :obj:`True`, export all attributes
+                including those not explictly included in :obj:`Model.Meta.attribute_order`
+            encoded (:obj:`dict`, optional): objects that have already been encoded and their assigned JSON identifiers
+            write_empty_models (:obj:`bool`, optional): if :obj:`True`, write models even when there are no instances
+            write_empty_cols (:obj:`bool`, optional): if :obj:`True`, write columns even when all values are :obj:`None`
             extra_entries (:obj:`int`, optional): additional entries to display
-            merge_ranges (:obj:`list` of :obj:`tuple`): list of ranges of cells to merge
             protected (:obj:`bool`, optional): if :obj:`True`, protect the worksheet
+            view (:obj:`SubgraphView`, optional): if not :obj:`None`, only write the related objects which belong
+                to the view
+        """
+        columnar = model.Meta.columnar \
+            and model.Meta.table_format == TableFormat.row \
+            and write_empty_cols \
+            and not any(obj._comments for obj in objects)
+        if columnar:
+            if not write_empty_models and not objects:
+                return
+
+            attrs, _, headings, _, _, _ = get_fields(
+                model, schema_name, date, doc_metadata, doc_metadata_model, model_metadata,
+                include_all_attributes=include_all_attributes,
+                sheet_models=sheet_models)
+
+            # attributes of related objects which are encoded as multiple cells require multiple rows of headings
+            columnar = len(headings) == 1
+
+        if not columnar:
+            return super(PandasWriter, self).write_model(
+                writer, model, objects, schema_name, date, doc_metadata, doc_metadata_model, model_metadata,
+                sheet_models, include_all_attributes=include_all_attributes, encoded=encoded,
+                write_empty_models=write_empty_models, write_empty_cols=write_empty_cols,
+                extra_entries=extra_entries, protected=protected, view=view)
+
+        model.sort(objects)
+
+        column_store = model.Meta.column_store
+        columns = []
+        for attr in attrs:
+            values = None
+            if attr.name in column_store.arrays:
+                values = column_store.take(attr.name, objects)
+                if values is not None:
+                    values = attr.serialize_column(values)
+            if values is None:
+                if isinstance(attr, RelatedAttribute):
+                    get_value = getattr if view is None else view.get_value
+                    values = [attr.serialize(get_value(obj, attr.name), encoded=encoded) for obj in objects]
+                else:
+                    values = [attr.serialize(getattr(obj, attr.name)) for obj in objects]
+            columns.append(values)
+
+        data_frame = pandas.DataFrame(dict(enumerate(columns)), columns=range(len(columns)))
+        data_frame.columns = self.get_data_frame_columns(headings)
+        self._data_frames[model] = data_frame
+
+    @staticmethod
+    def get_data_frame_columns(headings):
+        """ Get the columns of a data frame from the headings of a sheet
+
+        Args:
+            headings (:obj:`list` of :obj:`list` of :obj:`str`): list of list of row headings
+
+        Returns:
+            :obj:`list` of :obj:`str` or :obj:`pandas.MultiIndex`: columns
         """
         if len(headings) == 1:
             columns = []
@@ -931,7 +1030,25 @@ class PandasWriter(WorkbookWriter):
                     if cell:
                         row[i_cell] = cell[1:]
             columns = pandas.MultiIndex.from_tuples(transpose(headings))
+        return columns
+
+    def write_sheet(self, writer, model, data, headings, metadata_headings, validation,
+                    extra_entries=0, merge_ranges=None, protected=False):
+        """ Write data to sheet
 
+        Args:
+            writer (:obj:`wc_utils.workbook.io.Writer`): io writer
+            model (:obj:`type`): model
+            data (:obj:`list` of :obj:`list` of :obj:`object`): list of list of cell values
+            headings (:obj:`list` of :obj:`list` of :obj:`str`): list of list of row headingsvalidations
+            metadata_headings (:obj:`list` of :obj:`list` of :obj:`str`): model metadata (name, description)
+                to print at the top of the worksheet
+            validation (:obj:`WorksheetValidation`): validation
+            extra_entries (:obj:`int`, optional): additional entries to display
+            merge_ranges (:obj:`list` of :obj:`tuple`): list of ranges of cells to merge
+            protected (:obj:`bool`, optional): if :obj:`True`, protect the worksheet
+        """
+        columns = self.get_data_frame_columns(headings)
         self._data_frames[model] = pandas.DataFrame(data, columns=columns)
 
 
@@ -951,7 +1068,8 @@ class MultiSeparatedValuesWriter(WriterBase):
 
         Args:
             path (:obj:`str`): path to write file(s)
-            objects (:obj:`Model` or :obj:`list` of :obj:`Model`): :obj:`Model` instance or list of :obj:`Model` instances
+            objects (:obj:`Model`, :obj:`list` of :obj:`Model`, or :obj:`SubgraphView`): :obj:`Model` instance,
+                list of :obj:`Model` instances, or view of instances
             schema_name (:obj:`str`, optional): schema name
             doc_metadata (:obj:`dict`, optional): dictionary of document metadata to be saved to header row
                 (e.g., ``!!!ObjTables ...``)
@@ -1089,7 +1207,8 @@ class Writer(WriterBase):
 
         Args:
             path (:obj:`str`): path to write file(s)
-            objects (:obj:`Model` or :obj:`list` of :obj:`Model`): object or list of objects
+            objects (:obj:`Model`, :obj:`list` of :obj:`Model`, or :obj:`SubgraphView`): object, list of objects,
+                or view of objects
             schema_name (:obj:`str`, optional): schema name
             doc_metadata (:obj:`dict`, optional): dictionary of document metadata to be saved to header row
                 (e.g., ``!!!ObjTables ...``)
@@ -1162,7 +1281,7 @@ class ReaderBase(object, metaclass=abc.ABCMeta):
             ignore_sheet_order=False,
             include_all_attributes=True, ignore_missing_attributes=False, ignore_extra_attributes=False,
             ignore_attribute_order=False, ignore_empty_rows=True,
-            group_objects_by_model=True, validate=True):
+            group_objects_by_model=True, validate=True, object_store=None, max_errors=None, on_error=None):
         """ Read a list of model objects from file(s) and, optionally, validate them
 
         Args:
@@ -1189,6 +1308,11 @@ class ReaderBase(object, metaclass=abc.ABCMeta):
             group_objects_by_model (:obj:`bool`, optional): if :obj:`True`, group decoded objects by their
                 types
             validate (:obj:`bool`, optional): if :obj:`True`, validate the data
+            object_store (:obj:`ObjectStore`, optional): if provided, add the decoded objects to this store
+            max_errors (:obj:`int`, optional): maximum number of validation errors to find before stopping;
+                if :obj:`None`, find all errors
+            on_error (:obj:`types.FunctionType`, optional): function which is called with each validation
+                error as soon as it is found
 
         Returns:
             :obj:`dict`: model objects grouped by :obj:`Model` class
@@ -1205,7 +1329,7 @@ class JsonReader(ReaderBase):
             ignore_sheet_order=False,
             include_all_attributes=True, ignore_missing_attributes=False, ignore_extra_attributes=False,
             ignore_attribute_order=False, ignore_empty_rows=True,
-            group_objects_by_model=True, validate=True):
+            group_objects_by_model=True, validate=True, object_store=None, max_errors=None, on_error=None):
         """ Read model objects from file(s) and, optionally, validate them
 
         Args:
@@ -1232,6 +1356,11 @@ class JsonReader(ReaderBase):
             group_objects_by_model (:obj:`bool`, optional): if :obj:`True`, group decoded objects by their
                 types
             validate (:obj:`bool`, optional): if :obj:`True`, validate the data
+            object_store (:obj:`ObjectStore`, optional): if provided, add the decoded objects to this store
+            max_errors (:obj:`int`, optional): maximum number of validation errors to find before stopping;
+                if :obj:`None`, find all errors
+            on_error (:obj:`types.FunctionType`, optional): function which is called with each validation
+                error as soon as it is found
 
         Returns:
             :obj:`dict`: model objects grouped by :obj:`Model` class
@@ -1265,7 +1394,10 @@ class JsonReader(ReaderBase):
             output_format = 'list'
 
         objs = Model.from_dict(json_objs, models, ignore_extra_models=ignore_extra_models, validate=validate,
-                               output_format=output_format)
+                               output_format=output_format,
+                               validator=Validator(max_errors=max_errors, on_error=on_error))
+        if object_store is not None and objs:
+            object_store.add_all(objs)
 
         # read the metadata
         self._doc_metadata = {}
@@ -1300,7 +1432,7 @@ class WorkbookReader(ReaderBase):
             ignore_sheet_order=False,
             include_all_attributes=True, ignore_missing_attributes=False, ignore_extra_attributes=False,
             ignore_attribute_order=False, ignore_empty_rows=True,
-            group_objects_by_model=True, validate=True):
+            group_objects_by_model=True, validate=True, object_store=None, max_errors=None, on_error=None):
         """ Read a list of model objects from file(s) and, optionally, validate them
 
         File(s) may be a single XLSX workbook with multiple worksheets or a set of delimeter
@@ -1330,6 +1462,11 @@ class WorkbookReader(ReaderBase):
             group_objects_by_model (:obj:`bool`, optional): if :obj:`True`, group decoded objects by their
                 types
             validate (:obj:`bool`, optional): if :obj:`True`, validate the data
+            object_store (:obj:`ObjectStore`, optional): if provided, add the decoded objects to this store
+            max_errors (:obj:`int`, optional): maximum number of validation errors to find before stopping;
+                if :obj:`None`, find all errors
+            on_error (:obj:`types.FunctionType`, optional): function which is called with each validation
+                error as soon as it is found
 
         Returns:
             :obj:`obj`: if :obj:`group_objects_by_model` set returns :obj:`dict`: of model objects grouped by :obj:`Model` class;
@@ -1603,10 +1740,12 @@ class WorkbookReader(ReaderBase):
             all_objects.extend(objects[model])
 
         if validate:
-            errors = Validator().validate(all_objects)
+            errors = Validator(max_errors=max_errors, on_error=on_error).validate(all_objects)
             if errors:
-                raise ValueError(
-                    indent_forest(['The data cannot be loaded because it fails to validate:', [errors]]))
+                raise ValidationError('The data cannot be loaded because it fails to validate:', errors)
+
+        if object_store is not None:
+            object_store.add_all(objects)
 
         # return
         if group_objects_by_model:
@@ -1806,36 +1945,44 @@ class WorkbookReader(ReaderBase):
         errors = []
 
         source_table_id = self._model_metadata[model][sheet_name].get('id', None)
-        for row_num, (obj_data, obj_comments) in enumerate(zip(data, objs_comments), start=2):
-            obj = model()
-            obj._comments = obj_comments
+        deserialize = model.get_code_generator().get_deserializer([
+            None if group_attr or isinstance(sub_attr, RelatedAttribute) else sub_attr
+            for group_attr, sub_attr in sub_attrs])
+        rows = []
+        rows_errors = []
+        for obj_data in data:
+            row_errors = []
+            obj_data = list(compress(obj_data, good_columns))
 
+            if len(obj_data) >= len(sub_attrs):
+                row = deserialize(obj_data, row_errors)
+            else:
+                row = {}
+                for (group_attr, sub_attr), attr_value in zip(sub_attrs, obj_data):
+                    try:
+                        if not group_attr and not isinstance(sub_attr, RelatedAttribute):
+                            value, deserialize_error = sub_attr.deserialize(attr_value)
+                            validation_error = sub_attr.validate(sub_attr.__class__, value)
+                            if deserialize_error or validation_error:
+                                row_errors.append((sub_attr, attr_value, deserialize_error, validation_error, None))
+                            row[sub_attr.name] = value
+
+                    except Exception as exception:
+                        row_errors.append((sub_attr, attr_value, None, None, exception))
+
+            rows.append(row)
+            rows_errors.append(row_errors)
+
+        # create the objects with the values of their literal attributes
+        objs = model.bulk_create(rows, comments=objs_comments)
+        for row_num, (obj, row_errors) in enumerate(zip(objs, rows_errors), start=2):
             # save object location in file
             obj.set_source(reader.path, sheet_name, attribute_seq, row_num, table_id=source_table_id)
 
             obj_errors = []
-            obj_data = list(compress(obj_data, good_columns))
-
-            for (group_attr, sub_attr), attr_value in zip(sub_attrs, obj_data):
-                try:
-                    if not group_attr and not isinstance(sub_attr, RelatedAttribute):
-                        value, deserialize_error = sub_attr.deserialize(attr_value)
-                        validation_error = sub_attr.validate(sub_attr.__class__, value)
-                        if deserialize_error or validation_error:
-                            if deserialize_error:
-                                deserialize_error.set_location_and_value(utils.source_report(obj, sub_attr.name),
-                                                                         attr_value)
-                                obj_errors.append(deserialize_error)
-                            if validation_error:
-                                validation_error.set_location_and_value(utils.source_report(obj, sub_attr.name),
-                                                                        attr_value)
-                                obj_errors.append(validation_error)
-                        setattr(obj, sub_attr.name, value)
-
-                except Exception as e:
-                    error = InvalidAttribute(sub_attr, ["{}".format(e)])
-                    error.set_location_and_value(utils.source_report(obj, sub_attr.name), attr_value)
-                    obj_errors.append(error)
+            for sub_attr, attr_value, deserialize_error, validation_error, exception in row_errors:
+                self.report_attribute_errors(obj, sub_attr, attr_value, obj_errors,
+                                             deserialize_error, validation_error, exception=exception)
 
             if obj_errors:
                 errors.append(InvalidObject(obj, obj_errors))
@@ -1847,6 +1994,26 @@ class WorkbookReader(ReaderBase):
             errors = []
         return (sub_attrs, data, errors, objects)
 
+    @staticmethod
+    def report_attribute_errors(obj, attr, value, errors, deserialize_error=None, validation_error=None, exception=None):
+        """ Record the location of the errors in the value of an attribute read from a file
+
+        Args:
+            obj (:obj:`Model`): object
+            attr (:obj:`Attribute`): attribute
+            value (:obj:`object`): value of the attribute in the file
+            errors (:obj:`list` of :obj:`InvalidAttribute`): list to append the errors to
+            deserialize_error (:obj:`InvalidAttribute`, optional): deserialization error
+            validation_error (:obj:`InvalidAttribute`, optional): validation error
+            exception (:obj:`Exception`, optional): exception raised while deserializing the value
+        """
+        if exception is not None:
+            deserialize_error = InvalidAttribute(attr, ["{}".format(exception)])
+        for error in (deserialize_error, validation_error):
+            if error:
+                error.set_location_and_value(utils.source_report(obj, attr.name), value)
+                errors.append(error)
+
     def read_sheet(self, model, reader, sheet_name, num_row_heading_columns=0, num_column_heading_rows=0,
                    ignore_empty_rows=False, ignore_empty_cols=False):
         """ Read worksheet or file into a two-dimensional list
@@ -2191,7 +2358,7 @@ class MultiSeparatedValuesReader(ReaderBase):
             ignore_sheet_order=False,
             include_all_attributes=True, ignore_missing_attributes=False, ignore_extra_attributes=False,
             ignore_attribute_order=False, ignore_empty_rows=True,
-            group_objects_by_model=True, validate=True):
+            group_objects_by_model=True, validate=True, object_store=None, max_errors=None, on_error=None):
         """ Read a list of model objects from a single text file which contains
         multiple comma or tab-separated files
 
@@ -2219,6 +2386,11 @@ class MultiSeparatedValuesReader(ReaderBase):
             group_objects_by_model (:obj:`bool`, optional): if :obj:`True`, group decoded objects by their
                 types
             validate (:obj:`bool`, optional): if :obj:`True`, validate the data
+            object_store (:obj:`ObjectStore`, optional): if provided, add the decoded objects to this store
+            max_errors (:obj:`int`, optional): maximum number of validation errors to find before stopping;
+                if :obj:`None`, find all errors
+            on_error (:obj:`types.FunctionType`, optional): function which is called with each validation
+                error as soon as it is found
 
         Returns:
             :obj:`obj`: if :obj:`group_objects_by_model` set returns :obj:`dict`: of model objects grouped by :obj:`Model` class;
@@ -2288,7 +2460,10 @@ class MultiSeparatedValuesReader(ReaderBase):
                              ignore_attribute_order=ignore_attribute_order,
                              ignore_empty_rows=ignore_empty_rows,
                              group_objects_by_model=group_objects_by_model,
-                             validate=validate)
+                             validate=validate,
+                             object_store=object_store,
+                             max_errors=max_errors,
+                             on_error=on_error)
         self._model_metadata = wb_reader._model_metadata
 
         shutil.rmtree(tmp_dirname)
@@ -2346,7 +2521,7 @@ class Reader(ReaderBase):
             ignore_sheet_order=False,
             include_all_attributes=True, ignore_missing_attributes=False, ignore_extra_attributes=False,
             ignore_attribute_order=False, ignore_empty_rows=True,
-            group_objects_by_model=True, validate=True):
+            group_objects_by_model=True, validate=True, object_store=None, max_errors=None, on_error=None):
         """ Read a list of model objects from file(s) and, optionally, validate them
 
         Args:
@@ -2373,6 +2548,11 @@ class Reader(ReaderBase):
             group_objects_by_model (:obj:`bool`, optional): if :obj:`True`, group decoded objects by their
                 types
             validate (:obj:`bool`, optional): if :obj:`True`, validate the data
+            object_store (:obj:`ObjectStore`, optional): if provided, add the decoded objects to this store
+            max_errors (:obj:`int`, optional): maximum number of validation errors to find before stopping;
+                if :obj:`None`, find all errors
+            on_error (:obj:`types.FunctionType`, optional): function which is called with each validation
+                error as soon as it is found
 
         Returns:
             :obj:`obj`: if :obj:`group_objects_by_model` is set returns :obj:`dict`: model objects grouped
@@ -2393,7 +2573,10 @@ class Reader(ReaderBase):
                             ignore_attribute_order=ignore_attribute_order,
                             ignore_empty_rows=ignore_empty_rows,
                             group_objects_by_model=group_objects_by_model,
-                            validate=validate)
+                            validate=validate,
+                            object_store=object_store,
+                            max_errors=max_errors,
+                            on_error=on_error)
         self._doc_metadata = reader._doc_metadata
         self._model_metadata = reader._model_metadata
         return result
@@ -280,6 +280,7 @@ class Expression(object):
     Attributes:
         _parsed_expression (:obj:`ParsedExpression`): parsed expression
     """
+    __slots__ = ()
 
     class Meta(object):
         """ Metadata for subclasses of :obj:`Expression`
@@ -728,6 +729,35 @@ class ParsedExpression(object):
         self._compiled_namespace = {}
         self._compiled_namespace_with_units = {}
 
+    def copy(self, objects_and_copies):
+        """ Copy the parsed expression for copies of the objects which it references, without parsing it again
+
+        The tokens, related objects, and linear coefficients of the copy reference the copies of the objects,
+        and the copy shares the Python tokens and compiled expressions of this parsed expression.
+
+        Args:
+            objects_and_copies (:obj:`dict`): dictionary that maps objects to their copies; objects which are
+                not in the dictionary are referenced by the copy
+
+        Returns:
+            :obj:`ParsedExpression`: copy
+        """
+        get = objects_and_copies.get
+
+        copy = self.__class__.__new__(self.__class__)
+        copy.__dict__.update(self.__dict__)
+        copy.related_objects = {model_type: {id: get(obj, obj) for id, obj in objs.items()}
+                                for model_type, objs in self.related_objects.items()}
+        copy.lin_coeffs = {model_type: {get(obj, obj): coeff for obj, coeff in coeffs.items()}
+                           for model_type, coeffs in self.lin_coeffs.items()}
+        copy._obj_tables_tokens = [token if token.model is None else token._replace(model=get(token.model, token.model))
+                                   for token in self._obj_tables_tokens]
+        copy._objs = {model_type: dict(objs) for model_type, objs in copy.related_objects.items()}
+        copy.errors = list(self.errors)
+        copy._compiled_namespace = dict(self._compiled_namespace)
+        copy._compiled_namespace_with_units = dict(self._compiled_namespace_with_units)
+        return copy
+
     def _get_trailing_whitespace(self, idx):
         """ Get the number of trailing spaces following a Python token
 
@@ -143,11 +143,41 @@ class ArrayAttribute(core.LiteralAttribute):
             :obj:`core.InvalidAttribute` or None: None if values are unique, otherwise return a
                 list of errors as an instance of :obj:`core.InvalidAttribute`
         """
+        # skip serializing the values if their binary representations are distinct
+        fingerprints = set()
+        for v in values:
+            fingerprint = self.get_fingerprint(v)
+            if fingerprint is False or fingerprint in fingerprints:
+                break
+            fingerprints.add(fingerprint)
+        else:
+            return None
+
         str_values = []
         for v in values:
             str_values.append(self.serialize(v))
         return super(ArrayAttribute, self).validate_unique(objects, str_values)
 
+    @staticmethod
+    def get_fingerprint(value):
+        """ Get a hashable representation of a value which is the same for all values which have the
+        same serialization
+
+        Args:
+            value (:obj:`numpy.array`): value
+
+        Returns:
+            :obj:`tuple`: shape and bytes of the value, :obj:`None` if the value is :obj:`None`, or :obj:`False`
+                if the value doesn't have a numeric data type
+        """
+        if value is None:
+            return None
+        if not isinstance(value, numpy.ndarray) or value.dtype.kind not in 'biuf':
+            return False
+        value = value.astype(numpy.float64)
+        value[numpy.isnan(value)] = numpy.nan
+        return (value.shape, value.tobytes())
+
     def serialize(self, value):
         """ Serialize string
 
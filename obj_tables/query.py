@@ -0,0 +1,421 @@
+""" Declarative queries over collections of model objects
+
+For example, the following query finds the reactions whose enzymes are translated from RNA transcribed from
+gene `g1` and whose fluxes are positive::
+
+    Q(Reaction).where(enzyme__rna__gene__id='g1', flux__gt=0)
+
+Each keyword argument of :obj:`Q.where` is a condition on the values of an attribute or a nested attribute,
+expressed as the names of the attributes along a path of related attributes (see :obj:`Model.get_nested_attr`),
+separated by `__` and optionally followed by a lookup. Conditions on \\*-to-many paths are satisfied if any of
+the related objects satisfies the condition.
+
+Queries are planned to use the :obj:`Manager` or :obj:`ObjectStore` indices of the models along the paths of
+the conditions. The most selective indexed condition is evaluated against the indices of its model and of the
+subclasses of its model (e.g., the :obj:`Gene`\\ s with `id` `g1`), and the matching objects are joined back
+along the inverse attributes of the path to the queried model. Conditions whose paths contain attributes without
+inverse attributes cannot be joined back, and are only evaluated by scanning the collection. The remaining
+conditions are evaluated lazily as the candidate objects are iterated.
+
+:Author: Jonathan Karr <karr@mssm.edu>
+:Date: 2020-06-01
+:Copyright: 2020, Karr Lab
+:License: MIT
+"""
+
+from obj_tables.core import Model, Manager, ObjectStore, RelatedManager
+from wc_utils.util.list import det_dedupe
+from wc_utils.util.types import get_subclasses
+
+__all__ = ['Q']
+
+
+class Condition(object):
+    """ Condition on the values of an attribute or a nested attribute of objects
+
+    Attributes:
+        key (:obj:`str`): keyword argument which expressed the condition
+        path (:obj:`list` of :obj:`LocalAttribute`): related attributes from the queried model to the model of
+            the condition
+        model (:obj:`type`): model whose attribute is tested by the condition
+        attr_name (:obj:`str`): name of the tested attribute of :obj:`model`
+        lookup (:obj:`str`): comparison between the values of the attribute and :obj:`value`
+        value (:obj:`object`): argument of the comparison
+    """
+
+    LOOKUPS = ('exact', 'ne', 'gt', 'gte', 'lt', 'lte', 'between', 'prefix', 'in', 'isnull')
+
+    def __init__(self, model, key, value):
+        """
+        Args:
+            model (:obj:`type`): queried model
+            key (:obj:`str`): path of the attribute and lookup (e.g., `enzyme__rna__gene__id__exact`)
+            value (:obj:`object`): argument of the lookup
+
+        Raises:
+            :obj:`ValueError`: if the path is not a path of attributes of :obj:`model`, or the argument of a
+                :obj:`between` or :obj:`in` lookup is invalid
+        """
+        names = key.split('__')
+        if len(names) > 1 and names[-1] in self.LOOKUPS:
+            lookup = names.pop()
+        else:
+            lookup = 'exact'
+
+        path = []
+        cls = model
+        for i_name, name in enumerate(names):
+            local_attr = cls.Meta.local_attributes.get(name, None)
+            if local_attr is None:
+                raise ValueError("'{}' is not a valid path of attributes of '{}'; '{}' does not have attribute '{}'".format(
+                    key, model.__name__, cls.__name__, name))
+            if i_name < len(names) - 1:
+                if not local_attr.is_related:
+                    raise ValueError("'{}' is not a valid path of attributes of '{}'; '{}.{}' is not a related "
+                                     "attribute".format(key, model.__name__, cls.__name__, name))
+                path.append(local_attr)
+                cls = local_attr.related_class
+
+        if lookup == 'between' and (not isinstance(value, (tuple, list)) or len(value) != 2):
+            raise ValueError("The argument of '{}' must be a pair of values".format(key))
+        if lookup == 'in':
+            value = list(value)
+
+        self.key = key
+        self.path = path
+        self.model = cls
+        self.attr_name = names[-1]
+        self.lookup = lookup
+        self.value = value
+
+    def get_values(self, obj):
+        """ Get the values of the tested attribute of the objects which are related to an object along
+        :obj:`path`
+
+        Args:
+            obj (:obj:`Model`): object of the queried model
+
+        Returns:
+            :obj:`list`: values
+        """
+        objs = [obj]
+        for local_attr in self.path:
+            related_objs = []
+            for obj in objs:
+                value = getattr(obj, local_attr.name)
+                if isinstance(value, list):
+                    related_objs.extend(value)
+                elif value is not None:
+                    related_objs.append(value)
+            objs = related_objs
+
+        values = []
+        for obj in objs:
+            value = getattr(obj, self.attr_name)
+            if isinstance(value, RelatedManager):
+                values.extend(value)
+            else:
+                values.append(value)
+        return values
+
+    def is_satisfied(self, obj):
+        """ Determine whether an object satisfies the condition
+
+        Args:
+            obj (:obj:`Model`): object of the queried model
+
+        Returns:
+            :obj:`bool`: :obj:`True` if any of the values of the attribute satisfies the condition
+        """
+        values = self.get_values(obj)
+        if self.lookup == 'isnull':
+            return all(value is None for value in values) == bool(self.value)
+        return any(self.test(value) for value in values)
+
+    def test(self, value):
+        """ Determine whether a value satisfies the lookup
+
+        Args:
+            value (:obj:`object`): value
+
+        Returns:
+            :obj:`bool`: :obj:`True` if the value satisfies the lookup
+        """
+        lookup = self.lookup
+        arg = self.value
+        if lookup == 'exact':
+            if isinstance(value, Model) or isinstance(arg, Model):
+                return value is arg
+            return value == arg
+        if lookup == 'ne':
+            if isinstance(value, Model) or isinstance(arg, Model):
+                return value is not arg
+            return value != arg
+        if lookup == 'in':
+            if isinstance(value, Model):
+                return any(value is el for el in arg)
+            return value in arg
+        if value is None:
+            return False
+        try:
+            if lookup == 'gt':
+                return value > arg
+            if lookup == 'gte':
+                return value >= arg
+            if lookup == 'lt':
+                return value < arg
+            if lookup == 'lte':
+                return value <= arg
+            if lookup == 'between':
+                return arg[0] <= value <= arg[1]
+        except TypeError:
+            return False
+        # prefix
+        return isinstance(value, str) and value.startswith(arg)
+
+    def get_indexed_objects(self, source):
+        """ Get the objects of :obj:`model` and its subclasses which satisfy the condition from their indices
+
+        Args:
+            source (:obj:`Manager` or :obj:`ObjectStore`): source of indices
+
+        Returns:
+            :obj:`list` of :obj:`Model`: objects which satisfy the condition, or :obj:`None` if the condition
+                cannot be evaluated with the indices of the model and its subclasses, or if the matching objects
+                cannot be joined back to the queried model because an attribute of the path has no inverse
+        """
+        if self.value is None or any(not local_attr.related_name for local_attr in self.path):
+            return None
+
+        objs = []
+        for cls in det_dedupe([self.model] + get_subclasses(self.model)):
+            cls_objs = self._get_indexed_objects(cls, source)
+            if cls_objs is None:
+                return None
+            objs.extend(cls_objs)
+        return objs
+
+    def _get_indexed_objects(self, cls, source):
+        """ Get the instances of a model which satisfy the condition from an index
+
+        Args:
+            cls (:obj:`type`): :obj:`model` or one of its subclasses
+            source (:obj:`Manager` or :obj:`ObjectStore`): source of indices
+
+        Returns:
+            :obj:`list` of :obj:`Model`: instances of the model which satisfy the condition, or :obj:`None` if the
+                condition cannot be evaluated with an index of the model
+        """
+        attr_name = self.attr_name
+        if attr_name not in cls.Meta.attributes or cls.Meta.local_attributes[attr_name].is_related:
+            return None
+
+        if isinstance(source, ObjectStore):
+            if self.lookup == 'exact' and (attr_name,) in source.get_indexed_attrs_tuples(cls):
+                return source.get(cls, **{attr_name: self.value}) or []
+            return None
+
+        manager = cls.objects
+        if self.lookup == 'exact' and manager._indexed and (attr_name,) in manager._index_dicts:
+            return manager.get(**{attr_name: self.value}) or []
+        if self.lookup in Manager.ORDERED_LOOKUPS and attr_name in manager._ordered_indexes:
+            return manager.filter(**{attr_name + '__' + self.lookup: self.value}) or []
+        return None
+
+
+class Q(object):
+    """ Declarative query over the instances of a model
+
+    Queries are immutable; :obj:`where` returns a new query. Iterating over a query lazily yields the
+    matching objects.
+
+    Attributes:
+        model (:obj:`type`): queried model
+        objects (:obj:`list` of :obj:`Model` or :obj:`ObjectStore`): collection of objects which is queried;
+            if :obj:`None`, query the instances of the model which have been inserted into its :obj:`Manager`
+        conditions (:obj:`list` of :obj:`Condition`): conditions which the objects must satisfy
+    """
+
+    def __init__(self, model, objects=None, conditions=None):
+        """
+        Args:
+            model (:obj:`type`): queried model
+            objects (:obj:`list` of :obj:`Model` or :obj:`ObjectStore`, optional): collection of objects which is
+                queried; if :obj:`None`, query the instances of the model which have been inserted into its
+                :obj:`Manager`
+            conditions (:obj:`list` of :obj:`Condition`, optional): conditions which the objects must satisfy
+        """
+        self.model = model
+        self.objects = objects
+        self.conditions = list(conditions or [])
+
+    def where(self, **kwargs):
+        """ Get a query which also requires the objects to satisfy conditions
+
+        Args:
+            **kwargs: dictionary which maps paths of attributes and lookups to the arguments of the lookups
+
+        Returns:
+            :obj:`Q`: query
+        """
+        conditions = self.conditions + [Condition(self.model, key, value) for key, value in kwargs.items()]
+        return Q(self.model, objects=self.objects, conditions=conditions)
+
+    def _get_index_source(self):
+        """ Get the source of the indices which can be used to evaluate the conditions
+
+        Returns:
+            :obj:`Manager` or :obj:`ObjectStore`: source of indices, or :obj:`None` if indices cannot be used
+                because the collection of objects is a list
+        """
+        if self.objects is None:
+            return self.model.objects
+        if isinstance(self.objects, ObjectStore):
+            return self.objects
+        return None
+
+    def plan(self):
+        """ Plan the evaluation of the query
+
+        The driving condition is the indexed condition with the fewest matching objects. The matching objects
+        are joined back to the queried model along the inverse attributes of the path of the condition.
+
+        Returns:
+            :obj:`tuple`:
+
+                * :obj:`Condition`: driving condition, or :obj:`None` if no condition can be evaluated with an
+                  index and the collection of objects must be scanned
+                * :obj:`list` of :obj:`Model`: objects of the model of the driving condition which satisfy it
+                * :obj:`list` of :obj:`Condition`: conditions which must be tested for each candidate object
+        """
+        source = self._get_index_source()
+        driver = None
+        driver_objs = None
+        if source is not None:
+            for condition in self.conditions:
+                objs = condition.get_indexed_objects(source)
+                if objs is not None and (driver_objs is None or len(objs) < len(driver_objs)):
+                    driver = condition
+                    driver_objs = objs
+                    if not objs:
+                        break
+        filters = [condition for condition in self.conditions if condition is not driver]
+        return (driver, driver_objs, filters)
+
+    def explain(self):
+        """ Describe how the query will be evaluated
+
+        Returns:
+            :obj:`str`: description of the plan of the query
+        """
+        driver, driver_objs, filters = self.plan()
+        if driver is None:
+            lines = ['scan {}'.format(self.model.__name__)]
+        else:
+            lines = ['index {}.{} {} ({} objects)'.format(
+                driver.model.__name__, driver.attr_name, driver.lookup, len(driver_objs))]
+            for local_attr in reversed(driver.path):
+                lines.append('join {}.{}'.format(local_attr.related_class.__name__, local_attr.related_name))
+        for condition in filters:
+            lines.append('filter {}'.format(condition.key))
+        return '\n'.join(lines)
+
+    def _get_all_objects(self):
+        """ Get all of the objects of the queried model in the collection
+
+        Returns:
+            :obj:`iterable` of :obj:`Model`: objects
+        """
+        if self.objects is None:
+            return self.model.objects.all()
+        if isinstance(self.objects, ObjectStore):
+            return self.objects.all(self.model)
+        return (obj for obj in self.objects if obj.__class__ is self.model)
+
+    def _join(self, driver, driver_objs):
+        """ Get the objects of the queried model which are related to the objects which satisfy the driving
+        condition
+
+        Args:
+            driver (:obj:`Condition`): driving condition
+            driver_objs (:obj:`list` of :obj:`Model`): objects which satisfy the driving condition
+
+        Returns:
+            :obj:`iterable` of :obj:`Model`: objects of the queried model
+        """
+        objs = driver_objs
+        for local_attr in reversed(driver.path):
+            related_objs = {}
+            for obj in objs:
+                value = getattr(obj, local_attr.related_name)
+                if isinstance(value, list):
+                    for related_obj in value:
+                        related_objs[related_obj] = None
+                elif value is not None:
+                    related_objs[value] = None
+            objs = related_objs.keys()
+
+        # restrict the objects to the instances of the queried model in the queried collection
+        if isinstance(self.objects, ObjectStore):
+            objs = [obj for obj in objs if obj.__class__ is self.model and obj in self.objects]
+        elif driver.path:
+            reverse_index = self.model.objects._reverse_index
+            objs = [obj for obj in objs if obj in reverse_index]
+        else:
+            objs = [obj for obj in objs if obj.__class__ is self.model]
+        return objs
+
+    def __iter__(self):
+        """ Lazily iterate over the objects which satisfy the conditions of the query
+
+        Returns:
+            :obj:`iterator` of :obj:`Model`: objects
+
+        Raises:
+            :obj:`ValueError`: if the collection is the :obj:`Manager` of the model, and the model is not indexed
+        """
+        if self.objects is None and not self.model.objects._indexed:
+            raise ValueError("The instances of '{}' cannot be queried because it does not have a Manager index; "
+                             "query a collection of objects instead".format(self.model.__name__))
+
+        driver, driver_objs, filters = self.plan()
+        if driver is None:
+            candidates = self._get_all_objects()
+        else:
+            candidates = self._join(driver, driver_objs)
+
+        for obj in candidates:
+            if all(condition.is_satisfied(obj) for condition in filters):
+                yield obj
+
+    def all(self):
+        """ Get all of the objects which satisfy the conditions of the query
+
+        Returns:
+            :obj:`list` of :obj:`Model`: objects
+        """
+        return list(self)
+
+    def first(self):
+        """ Get the first object which satisfies the conditions of the query
+
+        Returns:
+            :obj:`Model`: object, or :obj:`None` if no object satisfies the conditions
+        """
+        return next(iter(self), None)
+
+    def count(self):
+        """ Get the number of objects which satisfy the conditions of the query
+
+        Returns:
+            :obj:`int`: number of objects
+        """
+        return sum(1 for _ in self)
+
+    def exists(self):
+        """ Determine whether any object satisfies the conditions of the query
+
+        Returns:
+            :obj:`bool`: :obj:`True` if any object satisfies the conditions
+        """
+        return self.first() is not None
@@ -827,20 +827,357 @@ def to_pandas(objs, models=None, get_related=True,
                               validate=validate)
 
 
-def diff_workbooks(filename_1, filename_2, models, model_name, schema_name=None, **kwargs):
+def diff_objects(objs_1, objs_2, models=None, tol=0.):
+    """ Get the structured difference between two collections of objects
+
+    Objects of each model are paired by the values of their primary attributes or, for models whose
+    primary attributes are not unique, by the values of their shortest tuple of :obj:`unique_together`
+    attributes. Objects of models which have neither are paired by their fingerprints. Pairing uses
+    hash joins, and each pair of objects is compared once, so the runtime scales linearly with the
+    number of objects.
+
+    Related attributes are compared by the keys of the related objects, and each relationship is
+    compared only at the model which defines it.
+
+    Args:
+        objs_1 (:obj:`list` of :obj:`Model` or :obj:`dict` that maps :obj:`type` to :obj:`list` of :obj:`Model`):
+            first collection of objects (and, recursively, the objects related to them)
+        objs_2 (:obj:`list` of :obj:`Model` or :obj:`dict` that maps :obj:`type` to :obj:`list` of :obj:`Model`):
+            second collection of objects (and, recursively, the objects related to them)
+        models (:obj:`list` of :obj:`type`, optional): models to compare; if :obj:`None`, compare all models
+        tol (:obj:`float`, optional): equality tolerance
+
+    Returns:
+        :obj:`dict`: dictionary that maps the name of each model whose objects are different to a dictionary
+            with three keys: ``removed`` (keys of the objects which are only in the first collection), ``added``
+            (keys of the objects which are only in the second collection), and ``changed`` (list of dictionaries
+            with the key of each pair of different objects and a dictionary ``attributes`` that maps the name of
+            each different attribute to its values in the first and second collections)
+    """
+    grouped_objs_1 = _group_objects_for_diff(objs_1)
+    grouped_objs_2 = _group_objects_for_diff(objs_2)
+    key_getter_1 = _DiffKeyGetter()
+    key_getter_2 = _DiffKeyGetter()
+
+    if models is None:
+        models = det_dedupe(list(grouped_objs_1.keys()) + list(grouped_objs_2.keys()))
+
+    diff = {}
+    for model in models:
+        model_objs_2 = {}
+        for obj_2 in grouped_objs_2.get(model, []):
+            model_objs_2.setdefault(key_getter_2(obj_2), []).append(obj_2)
+        for bucket in model_objs_2.values():
+            bucket.reverse()
+
+        removed = []
+        changed = []
+        for obj_1 in grouped_objs_1.get(model, []):
+            key = key_getter_1(obj_1)
+            bucket = model_objs_2.get(key)
+            if not bucket:
+                removed.append(key)
+                continue
+            attr_diffs = _diff_attributes(obj_1, bucket.pop(), key_getter_1, key_getter_2, tol)
+            if attr_diffs:
+                changed.append({'key': key, 'attributes': attr_diffs})
+
+        added = [key for key, bucket in model_objs_2.items() for _ in bucket]
+
+        if removed or added or changed:
+            diff[model.__name__] = {
+                'removed': removed,
+                'added': added,
+                'changed': changed,
+            }
+
+    return diff
+
+
+def _group_objects_for_diff(objs):
+    """ Group a collection of objects, and the objects related to them, by their models
+
+    Args:
+        objs (:obj:`list` of :obj:`Model` or :obj:`dict` that maps :obj:`type` to :obj:`list` of :obj:`Model`):
+            objects
+
+    Returns:
+        :obj:`dict` that maps :obj:`type` to :obj:`list` of :obj:`Model`: objects grouped by their models
+    """
+    if isinstance(objs, dict):
+        objs = list(chain.from_iterable(objs.values()))
+    grouped_objs = {}
+    for obj in Model.get_all_related(objs):
+        grouped_objs.setdefault(obj.__class__, []).append(obj)
+    return grouped_objs
+
+
+def _diff_attributes(obj_1, obj_2, key_getter_1, key_getter_2, tol=0.):
+    """ Get the differences between the attributes of two paired objects
+
+    Args:
+        obj_1 (:obj:`Model`): object from the first collection
+        obj_2 (:obj:`Model`): object from the second collection
+        key_getter_1 (:obj:`_DiffKeyGetter`): keys of the objects of the first collection
+        key_getter_2 (:obj:`_DiffKeyGetter`): keys of the objects of the second collection
+        tol (:obj:`float`, optional): equality tolerance
+
+    Returns:
+        :obj:`dict`: dictionary that maps the name of each different attribute to a list of its
+            values for :obj:`obj_1` and :obj:`obj_2`
+    """
+    plan = obj_1.Meta.traversal_plan or obj_1.get_traversal_plan()
+    attr_diffs = {}
+
+    for attr_name, attr in plan.literal_attrs:
+        val_1 = getattr(obj_1, attr_name)
+        val_2 = getattr(obj_2, attr_name)
+        if not attr.value_equal(val_1, val_2, tol=tol):
+            attr_diffs[attr_name] = [attr.to_builtin(val_1), attr.to_builtin(val_2)]
+
+    for attr_name, attr, get, to_many in plan.forward_related_attrs:
+        if to_many:
+            keys_1 = [key_getter_1(val) for val in get(obj_1)]
+            keys_2 = [key_getter_2(val) for val in get(obj_2)]
+            if collections.Counter(keys_1) != collections.Counter(keys_2):
+                attr_diffs[attr_name] = [sorted(keys_1, key=str), sorted(keys_2, key=str)]
+        else:
+            val_1 = get(obj_1)
+            val_2 = get(obj_2)
+            key_1 = None if val_1 is None else key_getter_1(val_1)
+            key_2 = None if val_2 is None else key_getter_2(val_2)
+            if key_1 != key_2 or (val_1 is None) != (val_2 is None):
+                attr_diffs[attr_name] = [key_1, key_2]
+
+    return attr_diffs
+
+
+class _DiffKeyGetter(object):
+    """ Memoized keys which are used to pair objects between two collections
+
+    Attributes:
+        _keys (:obj:`dict`): dictionary that maps objects to their keys
+        _key_funcs (:obj:`dict`): dictionary that maps models to functions which generate keys for their instances
+    """
+
+    def __init__(self):
+        self._keys = {}
+        self._key_funcs = {}
+
+    def __call__(self, obj):
+        """ Get the key of an object
+
+        Args:
+            obj (:obj:`Model`): object
+
+        Returns:
+            :obj:`object`: hashable key
+        """
+        key = self._keys.get(obj, None)
+        if key is None:
+            cls = obj.__class__
+            key_func = self._key_funcs.get(cls, None)
+            if key_func is None:
+                key_func = self._key_funcs[cls] = self._get_key_func(cls)
+            key = self._keys[obj] = key_func(obj)
+        return key
+
+    @staticmethod
+    def _get_key_func(cls):
+        """ Get a function which generates keys for the instances of a model
+
+        Args:
+            cls (:obj:`type`): model
+
+        Returns:
+            :obj:`function`: function which generates the key of an instance of :obj:`cls`
+        """
+        primary_attr = cls.Meta.primary_attribute
+        if primary_attr and primary_attr.unique and not isinstance(primary_attr, RelatedAttribute):
+            attr_name = primary_attr.name
+            return lambda obj: primary_attr.serialize(getattr(obj, attr_name))
+
+        if cls.Meta.unique_together:
+            attr_names = min(cls.Meta.unique_together, key=len)
+            attrs = [cls.Meta.attributes[attr_name] for attr_name in attr_names]
+
+            def key_func(obj):
+                key = []
+                for attr in attrs:
+                    val = getattr(obj, attr.name)
+                    if isinstance(attr, RelatedAttribute):
+                        if val is None:
+                            key.append(None)
+                        elif isinstance(val, Model):
+                            key.append(val.serialize())
+                        else:
+                            key.append(tuple(sorted((v.serialize() for v in val), key=str)))
+                    else:
+                        key.append(attr.serialize(val))
+                return tuple(key)
+            return key_func
+
+        return lambda obj: obj.fingerprint()
+
+
+def render_diff(diff, first='first', second='second'):
+    """ Render a structured difference (see :obj:`diff_objects`) as a list of messages
+
+    Args:
+        diff (:obj:`dict`): structured difference
+        first (:obj:`str`, optional): description of the first collection
+        second (:obj:`str`, optional): description of the second collection
+
+    Returns:
+        :obj:`list` of :obj:`str`: list of differences
+    """
+    def render_key(key):
+        if isinstance(key, (tuple, list)):
+            return '({})'.format(', '.join(render_key(k) for k in key))
+        return str(key)
+
+    removed = []
+    added = []
+    changed = []
+    for model_name, model_diff in diff.items():
+        for key in model_diff['removed']:
+            removed.append('{}: {}'.format(model_name, render_key(key)))
+        for key in model_diff['added']:
+            added.append('{}: {}'.format(model_name, render_key(key)))
+        for obj_diff in model_diff['changed']:
+            changed.append('{}: {}\n    {}'.format(
+                model_name, render_key(obj_diff['key']), '\n    '.join(
+                    '{}: {} != {}'.format(attr_name, render_key(val_1), render_key(val_2))
+                    for attr_name, (val_1, val_2) in obj_diff['attributes'].items())))
+
+    msgs = []
+    if removed:
+        msgs.append('{} objects in the {} workbook are missing from the {}:\n  {}'.format(
+            len(removed), first, second, '\n  '.join(removed)))
+    if added:
+        msgs.append('{} objects in the {} workbook are missing from the {}:\n  {}'.format(
+            len(added), second, first, '\n  '.join(added)))
+    if changed:
+        msgs.append('{} objects are different in the workbooks:\n  {}'.format(
+            len(changed), '\n  '.join(changed)))
+    return msgs
+
+
+def get_workbook_diff(filename_1, filename_2, models, model_name, schema_name=None, tol=0., related=False, **kwargs):
+    """ Get the structured difference between the objects of a model in two workbooks (see :obj:`diff_objects`)
+
+    Args:
+        filename_1 (:obj:`str`): path to first workbook
+        filename_2 (:obj:`str`): path to second workbook
+        models (:obj:`list` of :obj:`Model`): schema for objects to compare
+        model_name (:obj:`str`): Type of objects to compare
+        schema_name (:obj:`str`, optional): name of the schema
+        tol (:obj:`float`, optional): equality tolerance
+        related (:obj:`bool`, optional): if :obj:`True`, also compare the objects of the models which are
+            related to the model
+        kwargs (:obj:`dict`, optional): additional arguments to :obj:`obj_tables.io.Reader`
+
+    Returns:
+        :obj:`dict`: structured difference
+
+    Raises:
+        :obj:`ValueError`: if the schema does not have model :obj:`model_name`
+    """
+    model, objs1, objs2 = _read_workbooks_for_diff(filename_1, filename_2, models, model_name,
+                                                   schema_name=schema_name, **kwargs)
+    if related:
+        diff_models = get_related_models(model, include_root_model=True)
+    else:
+        diff_models = [model]
+    return diff_objects(objs1, objs2, models=diff_models, tol=tol)
+
+
+def diff_workbooks(filename_1, filename_2, models, model_name, schema_name=None, related=False, **kwargs):
     """ Get difference of models in two workbooks
 
+    By default, the objects of the model are paired by their serialized values with a hash join, and each pair
+    of objects is compared with :obj:`Model.difference`, which pairs the elements of \*-to-many attributes in
+    the same way. The serialized value of each object is computed at most once. If :obj:`related` is :obj:`True`, the objects of the models which
+    are related to the model are also compared, and the differences are described as by :obj:`render_diff`.
+
     Args:
         filename_1 (:obj:`str`): path to first workbook
         filename_2 (:obj:`str`): path to second workbook
         models (:obj:`list` of :obj:`Model`): schema for objects to compare
         model_name (:obj:`str`): Type of objects to compare
         schema_name (:obj:`str`, optional): name of the schema
+        related (:obj:`bool`, optional): if :obj:`True`, also compare the objects of the models which are
+            related to the model
         kwargs (:obj:`dict`, optional): additional arguments to :obj:`obj_tables.io.Reader`
 
     Returns:
         :obj:`list` of :obj:`str`: list of differences
     """
+    if related:
+        return render_diff(get_workbook_diff(filename_1, filename_2, models, model_name,
+                                             schema_name=schema_name, related=True, **kwargs))
+
+    model, objs1, objs2 = _read_workbooks_for_diff(filename_1, filename_2, models, model_name,
+                                                   schema_name=schema_name, **kwargs)
+
+    # pair the objects by their serialized values with a hash join
+    keys = {}
+    objs2_by_key = {}
+    for obj2 in objs2[model]:
+        key = keys[obj2] = obj2.serialize() or ''
+        objs2_by_key.setdefault(key, collections.deque()).append(obj2)
+
+    missing_objs1 = []
+    matched_objs2 = set()
+    obj_diffs = []
+    for obj1 in objs1[model]:
+        key = keys[obj1] = obj1.serialize() or ''
+        matches = objs2_by_key.get(key, None)
+        if not matches:
+            missing_objs1.append(obj1)
+            continue
+        obj2 = matches.popleft()
+        matched_objs2.add(obj2)
+        obj_diff = obj1.difference(obj2, keys=keys)
+        if obj_diff:
+            obj_diffs.append(obj_diff)
+    missing_objs2 = [obj2 for obj2 in objs2[model] if obj2 not in matched_objs2]
+
+    diffs = []
+    if missing_objs1:
+        diffs.append('{} objects in the first workbook are missing from the second:\n  {}'.format(
+            len(missing_objs1), '\n  '.join(obj.serialize() for obj in missing_objs1)))
+    if missing_objs2:
+        diffs.append('{} objects in the second workbook are missing from the first:\n  {}'.format(
+            len(missing_objs2), '\n  '.join(obj.serialize() for obj in missing_objs2)))
+    if obj_diffs:
+        diffs.append('{} objects are different in the workbooks:\n  {}'.format(
+            len(obj_diffs), '\n  '.join(obj_diffs)))
+
+    return diffs
+
+
+def _read_workbooks_for_diff(filename_1, filename_2, models, model_name, schema_name=None, **kwargs):
+    """ Read two workbooks to compare the objects of a model
+
+    Args:
+        filename_1 (:obj:`str`): path to first workbook
+        filename_2 (:obj:`str`): path to second workbook
+        models (:obj:`list` of :obj:`Model`): schema for objects to compare
+        model_name (:obj:`str`): Type of objects to compare
+        schema_name (:obj:`str`, optional): name of the schema
+        kwargs (:obj:`dict`, optional): additional arguments to :obj:`obj_tables.io.Reader`
+
+    Returns:
+        :obj:`tuple`:
+
+            * :obj:`type`: model named :obj:`model_name`
+            * :obj:`dict`: dictionary that maps models to the objects of the first workbook
+            * :obj:`dict`: dictionary that maps models to the objects of the second workbook
+
+    Raises:
+        :obj:`ValueError`: if the schema does not have model :obj:`model_name`
+    """
     objs1 = obj_tables.io.Reader().run(filename_1,
                                        schema_name=schema_name,
                                        models=models,
@@ -858,32 +1195,7 @@ def diff_workbooks(filename_1, filename_2, models, model_name, schema_name=None,
     if model.__name__ != model_name:
         raise ValueError('Workbook does not have model "{}".'.format(model_name))
 
-    obj_diffs = []
-    for obj1 in list(objs1[model]):
-        match = False
-        for obj2 in list(objs2[model]):
-            if obj1.serialize() == obj2.serialize():
-                match = True
-                objs2[model].remove(obj2)
-                obj_diff = obj1.difference(obj2)
-                if obj_diff:
-                    obj_diffs.append(obj_diff)
-                break
-        if match:
-            objs1[model].remove(obj1)
-
-    diffs = []
-    if objs1[model]:
-        diffs.append('{} objects in the first workbook are missing from the second:\n  {}'.format(
-            len(objs1[model]), '\n  '.join(obj.serialize() for obj in objs1[model])))
-    if objs2[model]:
-        diffs.append('{} objects in the second workbook are missing from the first:\n  {}'.format(
-            len(objs2[model]), '\n  '.join(obj.serialize() for obj in objs2[model])))
-    if obj_diffs:
-        diffs.append('{} objects are different in the workbooks:\n  {}'.format(
-            len(obj_diffs), '\n  '.join(obj_diffs)))
-
-    return diffs
+    return (model, objs1, objs2)
 
 
 def viz_schema(module, filename, attributes=True, tail_labels=True, hidden_classes=None, extra_edges=None,
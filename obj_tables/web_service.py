@@ -151,6 +151,17 @@ diff_parser.add_argument('workbook-2', location='files',
                          type=FileStorage,
                          required=True,
                          help='Second workbook (.csv, .json, .tsv, .yml, .xlsx, .zip of .csv or .tsv)')
+diff_parser.add_argument('related',
+                         type=flask_restplus.inputs.boolean,
+                         default=False,
+                         required=False,
+                         help='If true, also compare the objects of the models which are related to the model')
+diff_parser.add_argument('structured',
+                         type=flask_restplus.inputs.boolean,
+                         default=False,
+                         required=False,
+                         help=('If true, return the objects which were added, removed, and changed, '
+                               'grouped by model, rather than a list of messages'))
 
 
 @api.route("/diff/",
@@ -164,7 +175,8 @@ class Diff(flask_restplus.Resource):
         """
         """
         Returns:
-            :obj:`list` of :obj:`str`: list of difference between workbooks
+            :obj:`list` of :obj:`str` or :obj:`dict`: list of difference between workbooks or, if
+                :obj:`structured` is true, structured difference between the workbooks
         """
         args = diff_parser.parse_args()
         schema_dir, schema_filename = save_schema(args['schema'])
@@ -181,10 +193,18 @@ class Diff(flask_restplus.Resource):
             flask_restplus.abort(400, str(err))
 
         try:
-            diffs = utils.diff_workbooks(wb_filename_1, wb_filename_2,
-                                         models, model_name,
-                                         schema_name=schema_name,
-                                         **DEFAULT_READER_ARGS)
+            if args['structured']:
+                diff = utils.get_workbook_diff(wb_filename_1, wb_filename_2,
+                                               models, model_name,
+                                               schema_name=schema_name,
+                                               related=args['related'],
+                                               **DEFAULT_READER_ARGS)
+            else:
+                diff = utils.diff_workbooks(wb_filename_1, wb_filename_2,
+                                            models, model_name,
+                                            schema_name=schema_name,
+                                            related=args['related'],
+                                            **DEFAULT_READER_ARGS)
         except Exception as err:
             flask_restplus.abort(400, str(err))
         finally:
@@ -192,7 +212,7 @@ class Diff(flask_restplus.Resource):
             shutil.rmtree(wb_dir_1)
             shutil.rmtree(wb_dir_2)
 
-        return diffs
+        return diff
 
 
 """ Generate template """
@@ -419,6 +439,11 @@ validate_parser.add_argument('workbook', location='files',
                              type=FileStorage,
                              required=True,
                              help='Workbook (.csv, .json, .tsv, .yml, .xlsx, .zip of .csv or .tsv)')
+validate_parser.add_argument('max-errors',
+                             type=flask_restplus.inputs.positive,
+                             default=None,
+                             required=False,
+                             help='Maximum number of errors to report')
 
 
 @api.route("/validate/")
@@ -452,7 +477,7 @@ class Validate(flask_restplus.Resource):
             shutil.rmtree(schema_dir)
             shutil.rmtree(wb_dir)
 
-        errors = core.Validator().validate(objs)
+        errors = core.Validator(max_errors=args['max-errors']).validate(objs)
         if errors:
             msg = indent_forest(['The dataset is invalid:', [errors]])
         else:
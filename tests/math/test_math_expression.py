@@ -1613,3 +1613,30 @@ class CopyTestCase(unittest.TestCase):
             },
         }
         )
+
+    def test_parsed_expressions_are_not_parsed_again(self):
+        p_1 = Parameter(id='p_1', value=1.5, units=unit_registry.parse_units('g'))
+        p_2 = Parameter(id='p_2', value=2.5, units=unit_registry.parse_units('l'))
+        func_1 = Function(id='func_1')
+        func_1.expression, error = FunctionExpression.deserialize('2 * p_1 + p_2', {
+            Parameter: {p_1.id: p_1, p_2.id: p_2}
+        })
+        assert error is None, str(error)
+        parsed_1 = func_1.expression._parsed_expression
+
+        with mock.patch.object(ParsedExpression, 'tokenize', side_effect=Exception('tokenized')):
+            with mock.patch.object(LinearParsedExpressionValidator, 'validate', side_effect=Exception('validated')):
+                func_2 = func_1.copy()
+
+        self.assertTrue(func_2.is_equal(func_1))
+        parsed_2 = func_2.expression._parsed_expression
+        self.assertIsNot(parsed_2, parsed_1)
+        self.assertIs(parsed_2._py_tokens, parsed_1._py_tokens)
+        p_1_copy = func_2.expression.parameters.get_one(id='p_1')
+        self.assertIsNot(p_1_copy, p_1)
+        self.assertEqual([token.model for token in parsed_2._obj_tables_tokens if token.model is not None],
+                         [p_1_copy, func_2.expression.parameters.get_one(id='p_2')])
+        self.assertEqual(parsed_2.lin_coeffs[Parameter], {p_1_copy: 2., func_2.expression.parameters.get_one(id='p_2'): 1.})
+        self.assertEqual(parsed_1.lin_coeffs[Parameter], {p_1: 2., p_2: 1.})
+        self.assertEqual(parsed_2.is_linear, parsed_1.is_linear)
+        self.assertEqual(parsed_2.test_eval({Parameter: {'p_1': 1., 'p_2': 3.}}), 5.)
@@ -79,6 +79,9 @@ class ArrayAttributeTestCase(unittest.TestCase):
         self.assertEqual(attr.validate_unique([], [numpy.array([1, 2]), None]), None)
         self.assertNotEqual(attr.validate_unique([], [numpy.array([1, 2]), numpy.array([1, 2])]), None)
         self.assertNotEqual(attr.validate_unique([], [None, None]), None)
+        self.assertNotEqual(attr.validate_unique([], [numpy.array([1., numpy.nan]), numpy.array([1., -numpy.nan])]), None)
+        self.assertEqual(attr.validate_unique([], [numpy.array([1, 2]), numpy.array([[1, 2]])]), None)
+        self.assertNotEqual(attr.validate_unique([], [numpy.array(['a']), numpy.array(['a'])]), None)
 
         # serialize
         attr = obj_tables.math.numeric.ArrayAttribute()
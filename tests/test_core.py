@@ -17,19 +17,24 @@ import gc
 import io
 import itertools
 import math
+import mock
+import multiprocessing.context
 import numpy
 import obj_tables
 import obj_tables.math
 import objsize
 import os
 import pathlib
+import pickle
 import pronto
 import psutil
 import pytest
+import random
 import re
 import resource
 import sys
 import unittest
+import weakref
 
 
 class Order(enum.Enum):
@@ -231,6 +236,31 @@ class TestCore(unittest.TestCase):
         test_name = self.__module__ + '.' + 'Test'
         self.assertEqual(core.get_model(test_name), test_earlier)
 
+    def test_init_related_attributes(self):
+        class RegistryChild(core.Model):
+            id = core.StringAttribute(primary=True, unique=True)
+            parent = core.ManyToOneAttribute('RegistryParent', related_name='registry_children')
+
+        self.assertEqual(RegistryChild.Meta.attributes['parent'].related_class, 'RegistryParent')
+
+        class RegistryParent(core.Model):
+            id = core.StringAttribute(primary=True, unique=True)
+
+        self.assertIs(RegistryChild.Meta.attributes['parent'].related_class, RegistryParent)
+        self.assertIs(RegistryChild.Meta.local_attributes['parent'].related_class, RegistryParent)
+        self.assertIn('registry_children', RegistryParent.Meta.related_attributes)
+        self.assertIs(core.ModelMeta.get_model_by_name(RegistryParent.__module__ + '.RegistryParent'), RegistryParent)
+
+        class RegistryParentSubclass(RegistryParent):
+            pass
+
+        self.assertIn('registry_children', RegistryParentSubclass.Meta.related_attributes)
+        self.assertIn('registry_children', RegistryParentSubclass.Meta.local_attributes)
+
+        parent = RegistryParentSubclass(id='parent')
+        child = RegistryChild(id='child', parent=parent)
+        self.assertEqual(parent.registry_children, [child])
+
     def test_verbose_name(self):
         self.assertEqual(Root.Meta.verbose_name, 'Root')
         self.assertEqual(Root.Meta.verbose_name_plural, 'Roots')
@@ -2640,6 +2670,178 @@ class TestCore(unittest.TestCase):
         self.assertIsInstance(errors, core.InvalidObjectSet)
         self.assertEqual(set([invalid_obj.object for invalid_obj in errors.invalid_objects]), set([child_0, child_1]))
 
+    def test_validator_workers(self):
+        class WorkerParent(core.Model):
+            id = core.StringAttribute(min_length=4, unique=True)
+
+        class WorkerChild(core.Model):
+            id = core.StringAttribute(min_length=4)
+            value = core.FloatAttribute(min=0.)
+            parent = core.ManyToOneAttribute(WorkerParent, related_name='children')
+
+            class Meta(core.Model.Meta):
+                unique_together = (('id', 'parent'),)
+
+        parents = [WorkerParent(id='parent_{}'.format(i_parent % 15)) for i_parent in range(20)]
+        children = [WorkerChild(id='child_{}'.format(i_child % 95), value=float(i_child % 7 - 1),
+                                parent=parents[i_child % 20]) for i_child in range(100)]
+        parents[3].id = 'p_3'
+        objects = parents + children
+
+        serial_errors = core.Validator().validate(objects)
+        self.assertIsInstance(serial_errors, core.InvalidObjectSet)
+
+        validator = core.Validator(workers=2)
+        validator.min_objects_per_shard = 10
+        parallel_errors = validator.validate(objects)
+        self.assertEqual([error.object for error in parallel_errors.invalid_objects],
+                         [error.object for error in serial_errors.invalid_objects])
+        self.assertEqual([error.model for error in parallel_errors.invalid_models],
+                         [error.model for error in serial_errors.invalid_models])
+        self.assertEqual(str(parallel_errors), str(serial_errors))
+        self.assertIs(parallel_errors.invalid_objects[0].attributes[0].attribute, WorkerParent.Meta.attributes['id'])
+
+        # errors which cannot be encoded are recomputed serially
+        other_attr = core.StringAttribute()
+        with mock.patch.object(WorkerChild, 'validate',
+                               lambda self: core.InvalidObject(self, [core.InvalidAttribute(other_attr, ['error'])])):
+            parallel_errors = validator.validate(children)
+        self.assertEqual(len(parallel_errors.invalid_objects), 100)
+        self.assertIs(parallel_errors.invalid_objects[0].attributes[0].attribute, other_attr)
+
+        # objects are validated serially if the pool cannot be started
+        with mock.patch.object(multiprocessing.context.ForkContext, 'Pool', side_effect=OSError('no processes')):
+            with self.assertWarnsRegex(core.ValidationWarning, 'validating them serially: no processes'):
+                fallback_errors = validator.validate(objects)
+        self.assertEqual(str(fallback_errors), str(serial_errors))
+
+        # exceptions raised while validating objects are not hidden
+        def validate(self):
+            raise TypeError('invalid object')
+        with mock.patch.object(WorkerChild, 'validate', validate):
+            with self.assertRaisesRegex(TypeError, 'invalid object'):
+                validator.validate(children)
+
+        with self.assertRaisesRegex(ValueError, 'must be a positive integer'):
+            core.Validator(workers=0)
+        self.assertGreaterEqual(core.Validator(workers=None).workers, 1)
+
+    def test_validate_columns(self):
+        class ColumnParent(core.Model):
+            id = core.StringAttribute(min_length=4, unique=True)
+
+        class ColumnChild(core.Model):
+            id = core.StringAttribute(unique=True)
+            value = core.FloatAttribute(min=-1., max=4., nan=False)
+            positive_value = core.PositiveFloatAttribute()
+            count = core.IntegerAttribute(min=-2, max=10)
+            positive_count = core.PositiveIntegerAttribute()
+            parent = core.ManyToOneAttribute(ColumnParent, related_name='children', min_related=1)
+
+            class Meta(core.Model.Meta):
+                unique_together = (('count', 'parent'),)
+
+        parents = [ColumnParent(id='parent_{}'.format(i_parent)) for i_parent in range(3)]
+        parents[1].id = 'p_1'
+        children = []
+        for i_child in range(50):
+            children.append(ColumnChild(id='child_{}'.format(i_child % 48),
+                                        value=float(i_child % 9 - 2),
+                                        positive_value=float(i_child % 5),
+                                        count=i_child % 15 - 3,
+                                        positive_count=i_child % 4,
+                                        parent=parents[i_child % 3] if i_child % 10 else None))
+        children[0].value = float('nan')
+        children[1].positive_value = float('nan')
+        children[2].value = 1
+        children[3].count = 2 ** 70
+        children[4].positive_count = None
+
+        expected = [obj.validate() for obj in children]
+        errors = ColumnChild.validate_objects(children)
+        self.assertEqual([str(error) if error else None for error in errors],
+                         [str(error) if error else None for error in expected])
+        self.assertIsNone(errors[11])
+        self.assertIsNotNone(errors[0])
+        self.assertIsNotNone(errors[2])
+        self.assertIsNotNone(errors[3])
+
+        objects = parents + children
+        validator_errors = core.Validator().validate(objects)
+        self.assertEqual([error.object for error in validator_errors.invalid_objects],
+                         [obj for obj in objects if obj.validate()])
+        self.assertEqual(str(validator_errors.invalid_models[0]),
+                         str(ColumnChild.validate_unique(children)))
+        self.assertIn('child_0', str(validator_errors.invalid_models[0]))
+
+        # the column-wise screen doesn't hide the errors of attributes which override `validate`
+        class StrictFloatAttribute(core.FloatAttribute):
+            def validate(self, obj, value):
+                return core.InvalidAttribute(self, ['error'])
+
+        attr = StrictFloatAttribute()
+        self.assertEqual(len(attr.validate_column(children, [1., 2.])), 2)
+        self.assertEqual(core.FloatAttribute().validate_column(children, [1., float('nan')]), [])
+        self.assertEqual([i_value for i_value, _ in core.PositiveIntegerAttribute().validate_column(
+            children, [1, 0, -1, 2])], [1, 2])
+
+    def test_validator_max_errors(self):
+        class ErrorParent(core.Model):
+            id = core.StringAttribute(min_length=4, unique=True)
+
+        parents = [ErrorParent(id='p_{}'.format(i_parent % 8)) for i_parent in range(10)]
+
+        all_errors = core.Validator().validate(parents)
+        self.assertEqual(len(all_errors.invalid_objects), 10)
+        self.assertEqual(len(all_errors.invalid_models), 1)
+        self.assertFalse(all_errors.truncated)
+
+        # iterator of errors
+        validator = core.Validator()
+        validator.min_objects_per_shard = 3
+        errors = list(validator.iter_errors(parents))
+        self.assertEqual([error.object for error in errors[:-1]], parents)
+        self.assertIsInstance(errors[-1], core.InvalidModel)
+
+        # stop after a maximum number of errors
+        reported = []
+        validator = core.Validator(max_errors=4, on_error=reported.append)
+        validator.min_objects_per_shard = 3
+        with mock.patch.object(core.Model, 'validate_unique', side_effect=Exception('not reached')):
+            errors = validator.validate(parents)
+        self.assertEqual(len(errors.invalid_objects), 4)
+        self.assertEqual(errors.invalid_models, [])
+        self.assertTrue(errors.truncated)
+        self.assertEqual(reported, errors.invalid_objects)
+        self.assertIn('Validation stopped after 4 error(s)', str(errors))
+
+        # stream errors without a limit
+        reported = []
+        errors = core.Validator(on_error=reported.append).validate(parents)
+        self.assertEqual(reported, errors.invalid_objects + errors.invalid_models)
+        self.assertFalse(errors.truncated)
+        self.assertEqual(str(errors), str(all_errors))
+
+        # cleaning
+        class ErrorChild(core.Model):
+            value = core.FloatAttribute()
+
+        children = [ErrorChild(value='a'), ErrorChild(value='b')]
+        errors = core.Validator(max_errors=1).run(children)
+        self.assertEqual([error.object for error in errors.invalid_objects], [children[0]])
+        self.assertTrue(errors.truncated)
+
+        # errors are only rendered when needed
+        error = core.ValidationError('Invalid data:', all_errors)
+        self.assertIsInstance(error, ValueError)
+        with mock.patch.object(core.InvalidObjectSet, '__str__', side_effect=Exception('rendered')):
+            self.assertIs(error.errors, all_errors)
+        self.assertTrue(str(error).startswith('Invalid data:\n'))
+        self.assertIn('p_0', str(error))
+
+        with self.assertRaisesRegex(ValueError, 'must be a positive integer'):
+            core.Validator(max_errors=0)
+
     def test_inheritance(self):
         self.assertEqual(Leaf.Meta.attributes['name'].max_length, 255)
         self.assertEqual(UnrootedLeaf.Meta.attributes['name'].max_length, 10)
@@ -3518,6 +3720,328 @@ class TestCore(unittest.TestCase):
                       str(context.exception))
         self.assertEqual(Example2.objects.all(), None)
 
+    def test_manager_automatic_update(self):
+        mgr1 = Example1.get_manager()
+        mgr1.reset()
+
+        t1s = [Example1(str_attr='s_{}'.format(i), int_attr=i, int_attr2=i) for i in range(3)]
+        mgr1.insert_all_new()
+
+        # indices are updated when indexed attributes are set
+        t1s[0].str_attr = 'new'
+        self.assertEqual(mgr1.get(str_attr='s_0'), None)
+        self.assertEqual(mgr1.get_one(str_attr='new'), t1s[0])
+        t1s[1].int_attr += 10
+        self.assertEqual(mgr1.get(int_attr=1, int_attr2=1), None)
+        self.assertEqual(mgr1.get_one(int_attr=11, int_attr2=1), t1s[1])
+        t0 = Example0(int_attr=1)
+        t1s[2].test0 = t0
+        self.assertEqual(mgr1.get_one(test0=id(t0)), t1s[2])
+
+        # new instances are not indexed until they are inserted
+        t1 = Example1(str_attr='other')
+        t1.str_attr = 'other_2'
+        self.assertEqual(mgr1.get(str_attr='other_2'), None)
+
+        # updates are deferred until the end of a batch
+        with mgr1.batch():
+            with mgr1.batch():
+                t1s[0].str_attr = 'new_2'
+                t1s[0].str_attr = 'new_3'
+            self.assertEqual(mgr1.get_one(str_attr='new'), t1s[0])
+            self.assertEqual(mgr1.get(str_attr='new_3'), None)
+        self.assertEqual(mgr1.get(str_attr='new'), None)
+        self.assertEqual(mgr1.get_one(str_attr='new_3'), t1s[0])
+        self.assertEqual(mgr1._batch_depth, 0)
+        self.assertEqual(mgr1._batched_instances, {})
+
+    def test_manager_ordered_indexes(self):
+        class OrderedParameter(core.Model):
+            id = core.StringAttribute(primary=True, unique=True)
+            value = core.FloatAttribute()
+
+            class Meta(core.Model.Meta):
+                ordered_indexes = ('id', 'value')
+
+        mgr = OrderedParameter.objects
+        params = [OrderedParameter(id='p_{}'.format(i), value=float(i)) for i in range(10)]
+        other = OrderedParameter(id='other', value=2.)
+        mgr.insert_all_new()
+
+        self.assertEqual(set(mgr.filter(value=2.)), set([params[2], other]))
+        self.assertEqual(mgr.filter(value__gt=7.), [params[8], params[9]])
+        self.assertEqual(mgr.filter(value__gte=8.), [params[8], params[9]])
+        self.assertEqual(mgr.filter(value__lt=1.), [params[0]])
+        self.assertEqual(mgr.filter(value__lte=1.), [params[0], params[1]])
+        self.assertEqual(mgr.filter(value__between=(4., 6.)), [params[4], params[5], params[6]])
+        self.assertEqual(mgr.filter(value__gt=9.), None)
+        self.assertEqual(mgr.filter(id__prefix='p_'), params)
+        self.assertEqual(mgr.filter(id__prefix='p_1'), [params[1]])
+        self.assertEqual(mgr.filter(id__prefix='q'), None)
+        self.assertEqual(mgr.filter(value__gte=2., id__prefix='p_', value__lt=4.), [params[2], params[3]])
+        self.assertEqual(mgr.filter(id='other'), [other])
+
+        # indexes are updated when attributes are set
+        params[0].value = 10.
+        self.assertEqual(mgr.filter(value__gt=9.), [params[0]])
+        with mgr.batch():
+            params[0].value = -1.
+        self.assertEqual(mgr.filter(value__lt=0.), [params[0]])
+
+        mgr._delete(params[0])
+        self.assertEqual(mgr.filter(value__lt=0.), None)
+        mgr._insert(params[0])
+        self.assertEqual(mgr.filter(value__lt=0.), [params[0]])
+
+        with self.assertRaisesRegex(ValueError, 'No arguments provided'):
+            mgr.filter()
+        with self.assertRaisesRegex(ValueError, 'does not have an ordered index'):
+            mgr.filter(value__ne=1.)
+        with self.assertRaisesRegex(ValueError, 'pair of values'):
+            mgr.filter(value__between=1.)
+        with self.assertRaisesRegex(ValueError, 'cannot be None'):
+            mgr.filter(value=None)
+
+        with self.assertRaisesRegex(ValueError, 'must be a tuple of the names of non-related attributes'):
+            class InvalidOrderedParameter(core.Model):
+                value = core.FloatAttribute()
+
+                class Meta(core.Model.Meta):
+                    ordered_indexes = ('undefined',)
+
+        with self.assertRaisesRegex(ValueError, 'cannot repeat attribute names'):
+            class InvalidOrderedParameter(core.Model):
+                value = core.FloatAttribute()
+
+                class Meta(core.Model.Meta):
+                    ordered_indexes = ('value', 'value')
+
+    def test_ordered_index_chunks(self):
+        class ChunkedParameter(core.Model):
+            id = core.StringAttribute(primary=True, unique=True)
+            value = core.FloatAttribute()
+
+            class Meta(core.Model.Meta):
+                ordered_indexes = ('value',)
+
+        index = ChunkedParameter.objects._ordered_indexes['value']
+        with mock.patch.object(core.OrderedIndex, 'CHUNK_SIZE', 4):
+            params = []
+            for i_param in range(100):
+                params.append(ChunkedParameter(id='p_{}'.format(i_param), value=float((i_param * 37) % 10)))
+                ChunkedParameter.objects._insert_new(params[-1])
+            self.assertGreater(len(index._chunks), 1)
+            self.assertEqual(index._maxes, [chunk[-1] for chunk in index._chunks])
+
+            # instances with equal values are kept in the order in which they were inserted
+            self.assertEqual(ChunkedParameter.objects.filter(value=3.), [param for param in params if param.value == 3.])
+
+            for param in params[::2]:
+                param.value = -param.value
+            for param in params[1::4]:
+                ChunkedParameter.objects._delete(param)
+            expected = sorted((param for i_param, param in enumerate(params) if i_param % 4 != 1),
+                              key=lambda param: param.value)
+            self.assertEqual(index.range(), expected)
+            self.assertEqual(ChunkedParameter.objects.filter(value__gt=-2., value__lte=3.),
+                             [param for param in expected if -2. < param.value <= 3.])
+            self.assertEqual(index._maxes, [chunk[-1] for chunk in index._chunks])
+            self.assertTrue(all(index._chunks))
+
+    def test_manager_computed_attributes(self):
+        class ComputedIndexModel(core.Model):
+            id = core.StringAttribute(primary=True, unique=True)
+            name = core.StringAttribute()
+            compartment = core.StringAttribute()
+
+            class Meta(core.Model.Meta):
+                indexed_attrs_tuples = (('normalized_name',), ('get_key',), ('compartment', 'normalized_name'))
+
+            @property
+            @core.depends_on('name')
+            def normalized_name(self):
+                return self.name.strip().lower()
+
+            def get_key(self):
+                return '{}[{}]'.format(self.id, self.compartment)
+
+        mgr = ComputedIndexModel.objects
+        self.assertEqual(mgr._attr_tuples_by_name, {
+            'name': [('normalized_name',), ('compartment', 'normalized_name')],
+            'compartment': [('compartment', 'normalized_name')],
+        })
+        self.assertEqual(mgr._any_attr_tuples, [('get_key',)])
+
+        obj_1 = ComputedIndexModel(id='a', name=' Glucose ', compartment='c')
+        obj_2 = ComputedIndexModel(id='b', name='ATP', compartment='e')
+        mgr.insert_all_new()
+
+        self.assertEqual(mgr.get_one(normalized_name='glucose'), obj_1)
+        self.assertEqual(mgr.get_one(get_key='b[e]'), obj_2)
+        self.assertEqual(mgr.get_one(normalized_name='atp', compartment='e'), obj_2)
+
+        # cached values are updated when their dependencies change
+        obj_1.name = 'Fructose'
+        self.assertEqual(mgr.get(normalized_name='glucose'), None)
+        self.assertEqual(mgr.get_one(normalized_name='fructose'), obj_1)
+        self.assertEqual(mgr.get_one(normalized_name='fructose', compartment='c'), obj_1)
+
+        obj_2.compartment = 'c'
+        self.assertEqual(mgr.get(get_key='b[e]'), None)
+        self.assertEqual(mgr.get_one(get_key='b[c]'), obj_2)
+        self.assertEqual(mgr.get_one(normalized_name='atp', compartment='c'), obj_2)
+
+        store = core.ObjectStore([obj_1, obj_2])
+        obj_2.id = 'd'
+        self.assertEqual(mgr.get_one(get_key='d[c]'), obj_2)
+        self.assertEqual(store.get_one(ComputedIndexModel, get_key='d[c]'), obj_2)
+        self.assertEqual(store.get(ComputedIndexModel, get_key='b[c]'), None)
+
+        # methods with required arguments cannot be indexed
+        with self.assertRaisesRegex(ValueError, 'must be a tuple of tuples of attribute names'):
+            class InvalidComputedIndexModel(core.Model):
+                id = core.StringAttribute()
+
+                class Meta(core.Model.Meta):
+                    indexed_attrs_tuples = (('get_key',),)
+
+                def get_key(self, prefix):
+                    return prefix + self.id
+
+    def test_manager_computed_attributes_of_related_objects(self):
+        class RelatedKeySpecies(core.Model):
+            id = core.StringAttribute(primary=True, unique=True)
+
+            class Meta(core.Model.Meta):
+                indexed_attrs_tuples = (('get_reaction_ids',),)
+
+            @core.depends_on('reactions__id')
+            def get_reaction_ids(self):
+                return ','.join(sorted(rxn.id for rxn in self.reactions))
+
+        class RelatedKeyReaction(core.Model):
+            id = core.StringAttribute(primary=True, unique=True)
+            species = core.ManyToOneAttribute(RelatedKeySpecies, related_name='reactions')
+
+            class Meta(core.Model.Meta):
+                indexed_attrs_tuples = (('species_id',),)
+
+            @property
+            @core.depends_on('species__id')
+            def species_id(self):
+                return self.species.id if self.species else None
+
+        mgr = RelatedKeyReaction.objects
+        self.assertEqual(mgr._attr_tuples_by_name, {
+            'species__id': [('species_id',)],
+            'species': [('species_id',)],
+        })
+
+        species_1 = RelatedKeySpecies(id='s_1')
+        species_2 = RelatedKeySpecies(id='s_2')
+        rxn = RelatedKeyReaction(id='r', species=species_1)
+        mgr.insert_all_new()
+        RelatedKeySpecies.objects.insert_all_new()
+        store = core.ObjectStore([species_1, species_2, rxn])
+        store.pop_dirty()
+        self.assertEqual(mgr.get_one(species_id='s_1'), rxn)
+
+        # keys are updated when an attribute of a related object is set
+        species_1.id = 's_3'
+        self.assertEqual(mgr.get(species_id='s_1'), None)
+        self.assertEqual(mgr.get_one(species_id='s_3'), rxn)
+        self.assertEqual(store.get_one(RelatedKeyReaction, species_id='s_3'), rxn)
+        self.assertEqual(store.get_dirty(), {species_1: set(['id'])})
+
+        rxn.id = 'r_2'
+        self.assertEqual(RelatedKeySpecies.objects.get_one(get_reaction_ids='r_2'), species_1)
+        self.assertEqual(store.get_one(RelatedKeySpecies, get_reaction_ids='r_2'), species_1)
+
+        # keys are updated when the related attribute is set
+        rxn.species = species_2
+        self.assertEqual(mgr.get(species_id='s_3'), None)
+        self.assertEqual(mgr.get_one(species_id='s_2'), rxn)
+
+        with mgr.batch():
+            species_2.id = 's_4'
+            self.assertEqual(mgr.get_one(species_id='s_2'), rxn)
+        self.assertEqual(mgr.get_one(species_id='s_4'), rxn)
+
+        # dependencies must be paths to attributes of related objects
+        with self.assertRaisesRegex(ValueError, 'must be the name of a related attribute'):
+            class InvalidRelatedKeyReaction(core.Model):
+                id = core.StringAttribute()
+
+                class Meta(core.Model.Meta):
+                    indexed_attrs_tuples = (('get_key',),)
+
+                @core.depends_on('id__name')
+                def get_key(self):
+                    return self.id
+
+        with self.assertRaisesRegex(ValueError, 'must be the name of a related attribute'):
+            class InvalidRelatedKeyReaction(core.Model):
+                species = core.ManyToOneAttribute(RelatedKeySpecies, related_name='invalid_reactions')
+
+                class Meta(core.Model.Meta):
+                    indexed_attrs_tuples = (('get_key',),)
+
+                @core.depends_on('species__compartment__id')
+                def get_key(self):
+                    return self.species.id
+
+    def test_manager_to_many_indexed_attributes(self):
+        class ToManyIndexChild(core.Model):
+            id = core.StringAttribute(primary=True, unique=True)
+
+        class ToManyIndexParent(core.Model):
+            id = core.StringAttribute(primary=True, unique=True)
+            children = core.ManyToManyAttribute(ToManyIndexChild, related_name='parents')
+
+            class Meta(core.Model.Meta):
+                indexed_attrs_tuples = (('children',), ('child_ids',))
+
+            @property
+            @core.depends_on('children__id')
+            def child_ids(self):
+                return ','.join(sorted(child.id for child in self.children))
+
+        mgr = ToManyIndexParent.objects
+        children = [ToManyIndexChild(id='c_{}'.format(i)) for i in range(3)]
+        parent = ToManyIndexParent(id='p', children=children[0:1])
+        mgr.insert_all_new()
+        store = core.ObjectStore([parent])
+        store.pop_dirty()
+        self.assertEqual(mgr.get_one(children=(id(children[0]), )), parent)
+
+        # indices follow the mutations of the list
+        parent.children.append(children[1])
+        self.assertEqual(mgr.get(children=(id(children[0]), )), None)
+        self.assertEqual(mgr.get_one(children=tuple(sorted([id(children[0]), id(children[1])]))), parent)
+        self.assertEqual(mgr.get_one(child_ids='c_0,c_1'), parent)
+        self.assertEqual(store.get_one(ToManyIndexParent, child_ids='c_0,c_1'), parent)
+        self.assertEqual(store.get_dirty(), {parent: set(['children'])})
+
+        parent.children.remove(children[0])
+        self.assertEqual(mgr.get_one(child_ids='c_1'), parent)
+        self.assertEqual(store.get_one(ToManyIndexParent, child_ids='c_1'), parent)
+
+        # including mutations from the other side of the relationship
+        children[2].parents.append(parent)
+        self.assertEqual(mgr.get_one(child_ids='c_1,c_2'), parent)
+
+        children[2].id = 'c_3'
+        self.assertEqual(mgr.get_one(child_ids='c_1,c_3'), parent)
+
+        # within a batch, instances are re-indexed when the batch exits
+        with mgr.batch():
+            parent.children.clear()
+            self.assertEqual(mgr.get_one(child_ids='c_1,c_3'), parent)
+        self.assertEqual(mgr.get(child_ids='c_1,c_3'), None)
+        self.assertEqual(mgr.get_one(child_ids=''), parent)
+
+        store.release()
+
     def test_simple_manager_example(self):
         from obj_tables.core import Model, StringAttribute, IntegerAttribute, OneToManyAttribute
 
@@ -3729,6 +4253,99 @@ class TestCore(unittest.TestCase):
         self.assertEqual(node_1.children, [
                          node_2_a, node_2_b, node_2_c, node_2_d])
 
+    def test_normalize_skips_unchanged_graphs(self):
+        class NormSkipParent(core.Model):
+            label = core.StringAttribute(primary=True, unique=True)
+
+        class NormSkipChild(core.Model):
+            label = core.StringAttribute()
+            value = core.FloatAttribute()
+            parent = core.ManyToOneAttribute(NormSkipParent, related_name='children')
+
+        parent = NormSkipParent(label='parent')
+        child_b = parent.children.create(label='b', value=1.)
+        child_a = parent.children.create(label='a', value=2.)
+        child_c = parent.children.create(label='c', value=0.)
+
+        parent.normalize()
+        self.assertEqual(parent.children, [child_a, child_b, child_c])
+        state = parent._graph_state.get_root()
+        self.assertIs(child_a._graph_state.get_root(), state)
+        self.assertEqual(state.normalized_version, state.version)
+
+        # unchanged graphs are skipped
+        version = state.version
+        child_b.normalize()
+        self.assertEqual(state.version, version)
+
+        # changes to unrelated graphs do not invalidate the normalization
+        other_parent = NormSkipParent(label='other_parent')
+        other_child = other_parent.children.create(label='b', value=1.)
+        other_parent.normalize()
+        other_child.label = 'e'
+        other_parent.children.create(label='a')
+        self.assertIsNot(other_parent._graph_state.get_root(), state)
+        self.assertEqual(state.normalized_version, state.version)
+
+        # objects which are related to normalized graphs are detected
+        child_0 = NormSkipChild(label='0')
+        parent.children.append(child_0)
+        parent.normalize()
+        self.assertEqual(parent.children, [child_0, child_a, child_b, child_c])
+        parent.children.remove(child_0)
+
+        # changes to the order of related managers are detected
+        random.shuffle(parent.children)
+        parent.children.reverse()
+        child_a.normalize()
+        self.assertEqual(parent.children, [child_a, child_b, child_c])
+
+        # changes to attributes are detected
+        child_a.label = 'd'
+        parent.normalize()
+        self.assertEqual(parent.children, [child_b, child_c, child_a])
+
+        # untracked changes require forcing normalization
+        list.reverse(parent.children)
+        parent.normalize()
+        self.assertEqual(parent.children, [child_a, child_c, child_b])
+        parent.normalize(force=True)
+        self.assertEqual(parent.children, [child_b, child_c, child_a])
+
+    def test_normalize_memoizes_sort_keys(self):
+        class NormKeyLeaf(core.Model):
+            label = core.StringAttribute(unique=True)
+
+        class NormKeyNode(core.Model):
+            label = core.StringAttribute()
+            leaves = core.ManyToManyAttribute(NormKeyLeaf, related_name='nodes')
+
+        class NormKeyRoot(core.Model):
+            label = core.StringAttribute(unique=True)
+            nodes = core.OneToManyAttribute(NormKeyNode, related_name='root')
+
+        root = NormKeyRoot(label='root')
+        leaves = [NormKeyLeaf(label=label) for label in 'dcba']
+        nodes = [root.nodes.create(label='n', leaves=leaves[i:i + 2]) for i in range(3)]
+
+        key_gen = NormKeyNode._generate_normalize_sort_key_all_attrs
+        num_calls = [0]
+
+        def counting_key_gen(processed_models=None, cache=None):
+            key = key_gen(processed_models=processed_models, cache=cache)
+
+            def counting_key(obj):
+                num_calls[0] += 1
+                return key(obj)
+            return counting_key
+
+        with mock.patch.object(NormKeyNode, '_generate_normalize_sort_key',
+                               return_value=mock.Mock(side_effect=counting_key_gen)):
+            root.normalize()
+        self.assertEqual(num_calls[0], len(nodes))
+        self.assertEqual([[leaf.label for leaf in node.leaves] for node in root.nodes],
+                         [['a', 'b'], ['b', 'c'], ['c', 'd']])
+
     def test_is_equal(self):
         class TestChild(core.Model):
             id = core.StringAttribute(primary=True)
@@ -5157,6 +5774,1223 @@ class TestErrors(unittest.TestCase):
                     Parent2, related_name='children2')
 
 
+class CompactRoot(core.Model):
+    id = core.SlugAttribute()
+    name = core.StringAttribute()
+
+    class Meta(core.Model.Meta):
+        compact = True
+        attribute_order = ('id', 'name')
+
+
+class CompactLeaf(core.Model):
+    id = core.SlugAttribute()
+    value = core.FloatAttribute()
+    root = core.ManyToOneAttribute(CompactRoot, related_name='leaves')
+    roots = core.ManyToManyAttribute(CompactRoot, related_name='shared_leaves')
+
+    class Meta(core.Model.Meta):
+        compact = True
+        attribute_order = ('id', 'value', 'root', 'roots')
+
+
+class CompactSubLeaf(CompactLeaf):
+    label = core.StringAttribute()
+
+
+class CompactModelTestCase(unittest.TestCase):
+    def test_slots(self):
+        self.assertTrue(CompactRoot.Meta.compact)
+        self.assertTrue(CompactSubLeaf.Meta.compact)
+        self.assertFalse(Root.Meta.compact)
+        self.assertIn('_values', CompactRoot.__slots__)
+        self.assertEqual(CompactSubLeaf.__slots__, ())
+
+        self.assertIsInstance(CompactRoot.id, core.SlugAttribute)
+        self.assertIsInstance(CompactRoot.__dict__['id'], core.CompactSlot)
+        self.assertIsInstance(CompactRoot.leaves, core.CompactSlot)
+        self.assertEqual(set(CompactRoot.Meta.compact_slots.keys()), set(['id', 'name', 'leaves', 'shared_leaves']))
+        self.assertEqual(set(CompactSubLeaf.Meta.attributes.keys()), set(['id', 'value', 'root', 'roots', 'label']))
+
+        root = CompactRoot(id='root')
+        self.assertFalse(hasattr(root, '__dict__'))
+        self.assertIs(weakref.ref(root)(), root)
+
+    def test_internal_attributes_without_dict(self):
+        root = CompactRoot(id='root')
+        leaf = CompactLeaf(id='leaf', value=1., root=root)
+        root.normalize()
+        root.fingerprint()
+        leaf._source = core.ModelSource('path.xlsx', 'Leaves', ['id'], 2)
+        self.assertIsNotNone(leaf._graph_state)
+        self.assertIsNotNone(leaf._fingerprint)
+        self.assertFalse(hasattr(root, '__dict__'))
+        self.assertFalse(hasattr(leaf, '__dict__'))
+
+    def test_copy_and_pickle(self):
+        root = CompactRoot(id='root', name='Root')
+        leaf = CompactLeaf(id='leaf', value=1., root=root)
+        root.fingerprint()
+
+        leaf_2 = copy.deepcopy(leaf)
+        self.assertIsNot(leaf_2, leaf)
+        self.assertTrue(leaf_2.is_equal(leaf))
+        self.assertIs(CompactLeaf.Meta.compact_slots['roots'].peek(leaf_2), core.CompactSlot.UNINITIALIZED)
+        self.assertEqual(leaf_2.roots, [])
+
+        root_2 = pickle.loads(pickle.dumps(root))
+        self.assertTrue(root_2.is_equal(root))
+        self.assertEqual(root_2.fingerprint(), root.fingerprint())
+        root_2.leaves[0].value = 2.
+        self.assertEqual(leaf.value, 1.)
+        self.assertNotEqual(root_2.fingerprint(), root.fingerprint())
+
+    def test_lazy_related_managers(self):
+        root = CompactRoot(id='root')
+        leaves_slot = CompactRoot.Meta.compact_slots['leaves']
+        self.assertIs(leaves_slot.peek(root), core.CompactSlot.UNINITIALIZED)
+
+        leaf = CompactLeaf(id='leaf', root=root)
+        self.assertIsInstance(leaves_slot.peek(root), core.ManyToOneRelatedManager)
+        self.assertEqual(root.leaves, [leaf])
+        self.assertIs(CompactLeaf.Meta.compact_slots['roots'].peek(leaf), core.CompactSlot.UNINITIALIZED)
+        self.assertEqual(leaf.roots, [])
+        self.assertIsInstance(CompactLeaf.Meta.compact_slots['roots'].peek(leaf), core.ManyToManyRelatedManager)
+
+        leaf_2 = root.leaves.create(id='leaf_2', roots=[root])
+        self.assertEqual(leaf_2.root, root)
+        self.assertEqual(root.shared_leaves, [leaf_2])
+
+        leaf_2.root = None
+        self.assertEqual(root.leaves, [leaf])
+
+    def test_subclass(self):
+        root = CompactRoot(id='root')
+        leaf = CompactSubLeaf(id='leaf', label='label', root=root)
+        self.assertEqual(leaf.label, 'label')
+        self.assertEqual(root.leaves, [leaf])
+
+    def test_non_attributes(self):
+        leaf = CompactLeaf(id='leaf')
+        with self.assertRaises(AttributeError):
+            leaf._extra = 1
+        self.assertEqual(leaf._source, None)
+        self.assertEqual(leaf._comments, [])
+
+    def test_get_related_validate_and_to_dict(self):
+        root = CompactRoot(id='root', name='Root')
+        leaf_1 = CompactLeaf(id='leaf_1', value=1., root=root, roots=[root])
+        leaf_2 = CompactSubLeaf(id='leaf_2', value=2., root=root, label='b')
+
+        self.assertEqual(set(root.get_related()), set([leaf_1, leaf_2]))
+        self.assertEqual(core.Validator().run(root, get_related=True), None)
+
+        json = core.Model.to_dict(root)
+        root_2 = core.Model.from_dict(json, [CompactRoot, CompactLeaf, CompactSubLeaf])
+        self.assertTrue(root_2.is_equal(root))
+        self.assertEqual(root_2.difference(root), '')
+
+        root_3 = root.copy()
+        self.assertTrue(root_3.is_equal(root))
+
+
+class ColumnarRoot(core.Model):
+    id = core.SlugAttribute()
+
+    class Meta(core.Model.Meta):
+        attribute_order = ('id',)
+
+
+class ColumnarLeaf(core.Model):
+    id = core.SlugAttribute()
+    value = core.FloatAttribute()
+    count = core.IntegerAttribute(none=True)
+    flag = core.BooleanAttribute()
+    root = core.ManyToOneAttribute(ColumnarRoot, related_name='leaves')
+
+    class Meta(core.Model.Meta):
+        columnar = True
+        attribute_order = ('id', 'value', 'count', 'flag', 'root')
+
+
+class ColumnarSubLeaf(ColumnarLeaf):
+    weight = core.PositiveFloatAttribute()
+
+
+class ColumnarModelTestCase(unittest.TestCase):
+    def setUp(self):
+        gc.collect()
+
+    def test_store(self):
+        store = ColumnarLeaf.Meta.column_store
+        self.assertEqual(list(store.arrays.keys()), ['value', 'count', 'flag'])
+        self.assertIsInstance(ColumnarLeaf.value, core.FloatAttribute)
+        self.assertIsInstance(ColumnarLeaf.__dict__['value'], core.ColumnSlot)
+        self.assertTrue(ColumnarSubLeaf.Meta.columnar)
+        self.assertIsNot(ColumnarSubLeaf.Meta.column_store, store)
+        self.assertEqual(list(ColumnarSubLeaf.Meta.column_store.arrays.keys()), ['count', 'flag', 'value', 'weight'])
+
+        leaf = ColumnarLeaf(id='leaf', value=1.5, count=3, flag=True)
+        self.assertEqual(leaf.value, 1.5)
+        self.assertEqual(leaf.count, 3)
+        self.assertIs(leaf.flag, True)
+        self.assertIs(type(leaf.value), float)
+        self.assertIs(type(leaf.count), int)
+        self.assertNotIn('value', leaf.__dict__)
+
+        # values which cannot be stored in the arrays
+        for value in [None, 'a', 2 ** 70, True, 1.]:
+            leaf.count = value
+            self.assertEqual(leaf.count, value)
+            self.assertIs(type(leaf.count), type(value))
+        leaf.count = 4
+        self.assertEqual(leaf.count, 4)
+        self.assertEqual(store.overflow['count'], {})
+
+        with self.assertRaisesRegex(ValueError, 'both compact and columnar'):
+            class CompactColumnarModel(core.Model):
+                value = core.FloatAttribute()
+
+                class Meta(core.Model.Meta):
+                    compact = True
+                    columnar = True
+
+    def test_column(self):
+        leaves = [ColumnarLeaf(id='leaf_{}'.format(i_leaf), value=float(i_leaf), count=i_leaf)
+                  for i_leaf in range(40)]
+        self.assertEqual(ColumnarLeaf.get_column_objects(), leaves)
+
+        values = ColumnarLeaf.column('value')
+        self.assertEqual(values.dtype, numpy.float64)
+        self.assertEqual(values.tolist(), [float(i_leaf) for i_leaf in range(40)])
+        self.assertTrue(numpy.shares_memory(values, ColumnarLeaf.Meta.column_store.arrays['value']))
+        with self.assertRaises(ValueError):
+            values[0] = 2.
+
+        leaves[1].count = None
+        counts = ColumnarLeaf.column('count')
+        self.assertEqual(counts.dtype, object)
+        self.assertEqual(counts[1], None)
+
+        # vectorized assignment
+        ColumnarLeaf.set_column('value', numpy.arange(40, dtype=numpy.float64) * 2)
+        self.assertEqual(leaves[3].value, 6.)
+        ColumnarLeaf.set_column('count', numpy.arange(40))
+        self.assertEqual(leaves[1].count, 1)
+        self.assertEqual(ColumnarLeaf.column('count').dtype, numpy.int64)
+
+        # values which are set one by one
+        ColumnarLeaf.set_column('value', list(range(40)))
+        self.assertIs(type(leaves[2].value), int)
+        with self.assertRaisesRegex(ValueError, 'values must be provided'):
+            ColumnarLeaf.set_column('count', [1, 2])
+        with self.assertRaisesRegex(ValueError, 'not stored in a column'):
+            ColumnarLeaf.column('id')
+        with self.assertRaisesRegex(ValueError, 'not columnar'):
+            ColumnarRoot.get_column_objects()
+
+        # rows of garbage collected instances are removed
+        del leaves[10:]
+        gc.collect()
+        self.assertEqual(ColumnarLeaf.get_column_objects(), leaves)
+        self.assertEqual(ColumnarLeaf.column('value').tolist(), list(range(10)))
+        self.assertEqual([leaf.value for leaf in leaves], list(range(10)))
+
+    def test_bulk_create_copy_and_pickle(self):
+        root = ColumnarRoot(id='root')
+        leaves = ColumnarLeaf.bulk_create({
+            'id': ['leaf_{}'.format(i_leaf) for i_leaf in range(5)],
+            'value': numpy.linspace(0., 1., 5),
+            'count': [1, 2, None, 4, 5],
+            'root': [root] * 5,
+        })
+        self.assertEqual(ColumnarLeaf.column('value').tolist(), numpy.linspace(0., 1., 5).tolist())
+        self.assertIs(type(leaves[1].value), float)
+        self.assertEqual([leaf.count for leaf in leaves], [1, 2, None, 4, 5])
+        self.assertEqual([leaf.flag for leaf in leaves], [False] * 5)
+        self.assertEqual(root.leaves, leaves)
+
+        self.assertEqual(core.Validator().run(root, get_related=True), None)
+
+        root_2 = root.copy()
+        self.assertTrue(root_2.is_equal(root))
+
+        json = core.Model.to_dict(root)
+        root_3 = core.Model.from_dict(json, [ColumnarRoot, ColumnarLeaf])
+        self.assertTrue(root_3.is_equal(root))
+
+        leaf = copy.deepcopy(leaves[1])
+        self.assertEqual(leaf.value, leaves[1].value)
+        self.assertNotEqual(leaf.__dict__['_column_row'], leaves[1].__dict__['_column_row'])
+        leaf.value = 10.
+        self.assertEqual(leaves[1].value, 0.25)
+
+
+class JournalRoot(core.Model):
+    id = core.SlugAttribute()
+    name = core.StringAttribute()
+
+    class Meta(core.Model.Meta):
+        attribute_order = ('id', 'name')
+
+
+class JournalLeaf(core.Model):
+    id = core.SlugAttribute()
+    value = core.FloatAttribute()
+    root = core.ManyToOneAttribute(JournalRoot, related_name='leaves')
+    roots = core.ManyToManyAttribute(JournalRoot, related_name='shared_leaves')
+
+    class Meta(core.Model.Meta):
+        attribute_order = ('id', 'value', 'root', 'roots')
+
+
+class ChangeJournalTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root_0 = JournalRoot(id='root_0')
+        self.root_1 = JournalRoot(id='root_1')
+        self.leaves = [JournalLeaf(id='leaf_{}'.format(i_leaf), value=float(i_leaf), root=self.root_0)
+                       for i_leaf in range(3)]
+        self.leaves[0].roots.append(self.root_0)
+
+    def get_state(self):
+        return (
+            [(root.name, list(root.leaves), list(root.shared_leaves)) for root in [self.root_0, self.root_1]],
+            [(leaf.value, leaf.root, list(leaf.roots)) for leaf in self.leaves],
+        )
+
+    def test_record(self):
+        journal = core.ChangeJournal()
+        self.assertFalse(journal.is_recording())
+        self.root_0.name = 'not recorded'
+
+        with journal:
+            self.assertTrue(journal.is_recording())
+            self.root_0.name = 'Root 0'
+            self.leaves[1].root = self.root_1
+            self.leaves[2].roots.append(self.root_1)
+            self.root_0._cache = 'not recorded'
+            leaf = JournalLeaf(id='leaf_3', root=self.root_1)
+        self.assertFalse(journal.is_recording())
+        self.root_0.name = 'not recorded'
+
+        changes = list(journal.iter_changes())
+        self.assertEqual(len(journal), len(changes))
+        self.assertIsInstance(changes[0], core.AttributeChange)
+        self.assertEqual((changes[0].obj, changes[0].attr_name, changes[0].old_value, changes[0].new_value),
+                         (self.root_0, 'name', 'not recorded', 'Root 0'))
+        self.assertIn('Root 0', repr(changes[0]))
+
+        changed = journal.get_changed_objects()
+        self.assertEqual(list(changed.keys())[0], self.root_0)
+        self.assertEqual(changed[self.root_0], set(['name', 'leaves']))
+        self.assertEqual(changed[self.leaves[1]], set(['root']))
+        self.assertEqual(changed[self.leaves[2]], set(['roots']))
+        self.assertEqual(changed[self.root_1], set(['leaves', 'shared_leaves']))
+        self.assertNotIn(self.leaves[0], changed)
+        self.assertEqual(changed[leaf], set(['root']))
+
+        manager_change = next(change for change in changes if isinstance(change, core.RelatedManagerChange)
+                              and change.obj is self.root_0)
+        self.assertEqual((manager_change.attr_name, manager_change.start, manager_change.old_values,
+                          manager_change.new_values), ('leaves', 1, (self.leaves[1], ), ()))
+
+    def test_undo_redo(self):
+        journal = core.ChangeJournal()
+        states = [self.get_state()]
+        with journal:
+            self.root_0.name = 'Root 0'
+            self.leaves[1].root = self.root_1
+            journal.checkpoint()
+            states.append(self.get_state())
+
+            self.root_1.leaves.append(self.leaves[2])
+            self.root_1.shared_leaves.extend(self.leaves)
+            self.root_1.shared_leaves.remove(self.leaves[1])
+            self.root_0.leaves.insert(0, self.leaves[1])
+            self.root_1.shared_leaves.reverse()
+            self.leaves[0].roots.clear()
+            journal.checkpoint()
+            states.append(self.get_state())
+
+            self.root_1.shared_leaves.pop(0)
+            del self.root_0.leaves[0]
+            self.root_1.shared_leaves.sort(key=lambda leaf: leaf.id)
+            states.append(self.get_state())
+
+            self.assertTrue(journal.can_undo())
+            self.assertFalse(journal.can_redo())
+            for state in reversed(states[:-1]):
+                self.assertTrue(journal.undo())
+                self.assertEqual(self.get_state(), state)
+            self.assertFalse(journal.undo())
+            self.assertEqual(self.root_0.leaves.get_one(id='leaf_1'), self.leaves[1])
+
+            for state in states[1:]:
+                self.assertTrue(journal.redo())
+                self.assertEqual(self.get_state(), state)
+            self.assertFalse(journal.redo())
+
+            # new changes discard the steps which can be redone
+            journal.undo()
+            self.root_1.name = 'Root 1'
+            self.assertFalse(journal.can_redo())
+            journal.undo()
+            self.assertEqual(self.get_state(), states[2])
+
+        # undone changes are included in the changes since checkpoints
+        self.assertEqual(journal.get_changed_objects(journal.checkpoint()), {})
+        checkpoint = journal.checkpoint()
+        journal.undo()
+        self.assertEqual(self.get_state(), states[1])
+        self.assertIn(self.leaves[0], journal.get_changed_objects(checkpoint))
+
+        journal.clear()
+        self.assertEqual(len(journal), 0)
+        self.assertFalse(journal.can_undo())
+
+    def test_transaction(self):
+        journal = core.ChangeJournal()
+        state = self.get_state()
+
+        with self.assertRaisesRegex(ValueError, 'error'):
+            with journal.transaction():
+                self.root_0.name = 'Root 0'
+                self.leaves[1].root = self.root_1
+                self.root_1.shared_leaves.extend(self.leaves)
+                raise ValueError('error')
+        self.assertEqual(self.get_state(), state)
+        self.assertFalse(journal.is_recording())
+        self.assertFalse(journal.can_undo())
+
+        with journal.transaction():
+            self.root_0.name = 'Root 0'
+            with self.assertRaisesRegex(ValueError, 'error'):
+                with journal.transaction():
+                    self.leaves[1].root = self.root_1
+                    raise ValueError('error')
+            self.assertEqual(self.leaves[1].root, self.root_0)
+            self.leaves[2].root = self.root_1
+            self.assertEqual(journal.checkpoint(), len(journal))
+            with self.assertRaisesRegex(ValueError, 'within a transaction'):
+                journal.undo()
+        state_2 = self.get_state()
+
+        self.assertTrue(journal.undo())
+        self.assertEqual(self.get_state(), state)
+        self.assertFalse(journal.can_undo())
+        self.assertTrue(journal.redo())
+        self.assertEqual(self.get_state(), state_2)
+
+    def test_compact_and_columnar(self):
+        root = CompactRoot(id='root')
+        leaf = CompactLeaf(id='leaf', value=1.)
+        leaves = [ColumnarLeaf(id='leaf_{}'.format(i_leaf), value=float(i_leaf)) for i_leaf in range(3)]
+        gc.collect()
+        n_leaves = len(ColumnarLeaf.get_column_objects())
+
+        with core.ChangeJournal() as journal:
+            leaf.value = 2.
+            leaf.root = root
+            ColumnarLeaf.set_column('value', numpy.zeros(n_leaves))
+            self.assertTrue(journal.undo())
+        self.assertEqual(leaf.value, 1.)
+        self.assertEqual(leaf.root, None)
+        self.assertEqual(root.leaves, [])
+        self.assertEqual([leaf.value for leaf in leaves], [0., 1., 2.])
+
+
+class SnapshotTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = JournalRoot(id='root', name='Root')
+        self.leaves = [JournalLeaf(id='leaf_{}'.format(i_leaf), value=float(i_leaf), root=self.root)
+                       for i_leaf in range(3)]
+        self.leaves[0].roots.append(self.root)
+
+    def get_state(self, root):
+        return (root.id, root.name,
+                [(leaf.id, leaf.value, leaf.root.id, [r.id for r in leaf.roots]) for leaf in root.leaves],
+                [leaf.id for leaf in root.shared_leaves])
+
+    def test_snapshot(self):
+        state = self.get_state(self.root)
+        snapshot = self.root.snapshot()
+        self.assertIsInstance(snapshot, core.Snapshot)
+        self.assertFalse(snapshot.is_changed())
+        self.assertIs(snapshot.get_value(self.leaves[0], 'root'), self.root)
+
+        self.root.name = 'Root 2'
+        self.leaves[1].value = 10.
+        self.leaves[1].value = 11.
+        leaf = JournalLeaf(id='leaf_3', root=self.root)
+        self.leaves[2].root = None
+        self.root.shared_leaves.append(self.leaves[1])
+        self.root.shared_leaves.remove(self.leaves[0])
+        state_2 = self.get_state(self.root)
+
+        self.assertTrue(snapshot.is_changed())
+        self.assertEqual(snapshot.get_value(self.root, 'name'), 'Root')
+        self.assertEqual(snapshot.get_value(self.leaves[1], 'value'), 1.)
+        self.assertEqual(snapshot.get_value(self.leaves[0], 'value'), 0.)
+        self.assertIs(snapshot.get_value(self.leaves[2], 'root'), self.root)
+        self.assertEqual(snapshot.get_value(self.root, 'leaves'), self.leaves)
+        self.assertEqual(snapshot.get_value(self.root, 'shared_leaves'), [self.leaves[0]])
+        self.assertIn(self.leaves[1], snapshot.get_changed_objects())
+        self.assertNotIn(self.leaves[0], snapshot.get_changed_objects())
+
+        # copies are created in the state of the snapshot, without changing the live graph
+        copy = snapshot.copy()
+        self.assertIsNot(copy, self.root)
+        self.assertEqual(self.get_state(copy), state)
+        self.assertEqual(self.get_state(self.root), state_2)
+        self.assertEqual(snapshot.get_value(self.leaves[1], 'value'), 1.)
+
+        # restoring returns the live objects to the state of the snapshot
+        snapshot.restore()
+        self.assertEqual(self.get_state(self.root), state)
+        self.assertEqual(leaf.root, None)
+        self.assertFalse(snapshot.is_changed())
+
+        self.leaves[0].value = 20.
+        snapshot.restore()
+        self.assertEqual(self.leaves[0].value, 0.)
+
+        snapshot.release()
+        self.leaves[0].value = 20.
+        self.assertFalse(snapshot.is_changed())
+
+    def test_unrelated_graphs(self):
+        other_root = JournalRoot(id='other_root', name='Other root')
+        other_leaf = JournalLeaf(id='other_leaf', value=1., root=other_root)
+
+        snapshot = self.root.snapshot()
+        other_root.name = 'Other root 2'
+        other_leaf.value = 2.
+        other_root.leaves.create(id='other_leaf_2')
+        self.assertFalse(snapshot.is_changed())
+
+        self.root.name = 'Root 2'
+        snapshot.restore()
+        self.assertEqual(self.root.name, 'Root')
+        self.assertEqual(other_root.name, 'Other root 2')
+        self.assertEqual(other_leaf.value, 2.)
+        self.assertEqual(len(other_root.leaves), 2)
+
+        # objects which are related to the graph after the snapshot are restored
+        state = self.get_state(self.root)
+        other_leaf.root = self.root
+        other_leaf.value = 3.
+        self.assertEqual(snapshot.get_value(self.root, 'leaves'), self.leaves)
+        self.assertEqual(self.get_state(snapshot.copy()), state)
+        snapshot.restore()
+        self.assertEqual(self.root.leaves, self.leaves)
+        self.assertEqual(other_leaf.root, other_root)
+        self.assertEqual(other_leaf.value, 2.)
+        snapshot.release()
+
+    def test_nested_snapshots(self):
+        with self.root.snapshot() as snapshot_1:
+            self.root.name = 'Root 2'
+            with self.root.snapshot() as snapshot_2:
+                self.leaves[0].root = None
+                self.assertEqual(snapshot_1.get_value(self.root, 'name'), 'Root')
+                self.assertEqual(snapshot_2.get_value(self.root, 'name'), 'Root 2')
+
+                snapshot_1.restore()
+                self.assertEqual(self.root.name, 'Root')
+                self.assertIs(self.leaves[0].root, self.root)
+
+                snapshot_2.restore()
+                self.assertEqual(self.root.name, 'Root 2')
+                self.assertEqual(self.leaves[0].root, None)
+        self.assertFalse(core.ChangeJournal._journals)
+
+
+class BulkCreateTestCase(unittest.TestCase):
+    def test_rows(self):
+        root = Root(label='root')
+        leaves = Leaf.bulk_create([
+            {'id': 'leaf_1', 'root': root},
+            {'id': 'leaf_2', 'name': 'Leaf 2'},
+        ], comments=[['comment'], None])
+        self.assertEqual(len(leaves), 2)
+        self.assertEqual(leaves[0].id, 'leaf_1')
+        self.assertEqual(leaves[0].name, '')
+        self.assertEqual(leaves[0].root, root)
+        self.assertEqual(leaves[0]._comments, ['comment'])
+        self.assertEqual(leaves[0]._source, None)
+        self.assertEqual(leaves[1].name, 'Leaf 2')
+        self.assertEqual(leaves[1].root, None)
+        self.assertEqual(leaves[1]._comments, [])
+        self.assertEqual(root.leaves, leaves[0:1])
+
+        leaf_3 = Leaf(id='leaf_3', root=root)
+        self.assertEqual(leaves[0].__dict__.keys(), leaf_3.__dict__.keys())
+
+        leaves = UnrootedLeaf.bulk_create([('leaf_4', root), ('leaf_5', None)], attr_names=['id', 'root2'])
+        self.assertEqual(leaves[0].enum3, Order['leaf'])
+        self.assertEqual(root.leaves2, leaves[0:1])
+
+        with self.assertRaisesRegex(TypeError, 'invalid keyword argument'):
+            Leaf.bulk_create([{'undefined': 1}])
+        with self.assertRaisesRegex(TypeError, 'invalid keyword argument'):
+            Leaf.bulk_create([(1, )], attr_names=['undefined'])
+
+    def test_columns(self):
+        roots = Root.bulk_create({'label': ['root_1', 'root_2']})
+        self.assertEqual([root.label for root in roots], ['root_1', 'root_2'])
+
+        leaves = Leaf.bulk_create({'id': ['leaf_1', 'leaf_2', 'leaf_3'], 'root': [roots[0], roots[1], roots[0]]})
+        self.assertEqual(roots[0].leaves, [leaves[0], leaves[2]])
+        self.assertEqual(roots[1].leaves, [leaves[1]])
+
+        with self.assertRaisesRegex(ValueError, 'same length'):
+            Leaf.bulk_create({'id': ['leaf_1'], 'name': []})
+        with self.assertRaisesRegex(ValueError, 'cannot be used'):
+            Leaf.bulk_create({'id': ['leaf_1']}, attr_names=['id'])
+
+    def test_related(self):
+        ex0s = Example0.bulk_create([{'int_attr': 1}, {'int_attr': 2}])
+        ex1s = Example1.objects.bulk_create([{'str_attr': 'bulk_a', 'test0': ex0s[0], 'test0s': ex0s}])
+        self.assertEqual(ex0s[0].test1, ex1s[0])
+        self.assertEqual(ex1s[0].test0s, ex0s)
+        self.assertEqual(ex0s[1].test1_1tm, ex1s[0])
+
+        Example1.objects.insert_all_new()
+        self.assertEqual(Example1.objects.get_one(str_attr='bulk_a'), ex1s[0])
+
+    def test_compact(self):
+        roots = CompactRoot.bulk_create([{'id': 'root'}])
+        leaves = CompactSubLeaf.bulk_create({'id': ['leaf_1', 'leaf_2'], 'root': roots * 2, 'label': ['a', 'b']})
+        self.assertEqual(roots[0].leaves, leaves)
+        self.assertEqual(roots[0].name, '')
+        self.assertEqual(leaves[1].label, 'b')
+        self.assertEqual(leaves[1].roots, [])
+        self.assertTrue(leaves[0].is_equal(CompactSubLeaf(id='leaf_1', root=CompactRoot(id='root'), label='a')))
+
+    def test_custom_init(self):
+        class CustomInitModel(core.Model):
+            id = core.StringAttribute()
+            name = core.StringAttribute()
+
+            def __init__(self, **kwargs):
+                super(CustomInitModel, self).__init__(**kwargs)
+                self.name = self.id.upper()
+
+        objs = CustomInitModel.bulk_create([('a', ), ('b', )], attr_names=['id'])
+        self.assertEqual([obj.name for obj in objs], ['A', 'B'])
+
+    def test_initializer_reset_by_new_related_attributes(self):
+        class BulkRoot(core.Model):
+            id = core.StringAttribute()
+
+        initializer = BulkRoot.get_initializer()
+        self.assertIs(BulkRoot.get_initializer(), initializer)
+
+        class BulkLeaf(core.Model):
+            root = core.ManyToOneAttribute(BulkRoot, related_name='leaves')
+
+        self.assertIsNot(BulkRoot.get_initializer(), initializer)
+        root = BulkRoot.bulk_create([{'id': 'root'}])[0]
+        self.assertEqual(root.leaves, [])
+
+
+class TraversalPlanTestCase(unittest.TestCase):
+    def test_plan(self):
+        plan = Example1.get_traversal_plan()
+        self.assertIs(Example1.get_traversal_plan(), plan)
+        self.assertEqual([attr_name for attr_name, _ in plan.literal_attrs], ['int_attr', 'int_attr2', 'str_attr'])
+        self.assertEqual([attr[0] for attr in plan.to_one_attrs], ['test0'])
+        self.assertEqual([attr[0] for attr in plan.to_many_attrs], ['test0s'])
+        self.assertEqual(plan.reverse_to_one_attrs, ())
+        self.assertEqual(plan.reverse_to_many_attrs, ())
+
+        plan = Example0.get_traversal_plan()
+        self.assertEqual(plan.to_one_attrs, ())
+        self.assertEqual([attr[0] for attr in plan.reverse_to_one_attrs], ['test1', 'test1_1tm'])
+
+        plan = ManyToManyRoot.get_traversal_plan()
+        self.assertIn('leaves', [attr[0] for attr in plan.reverse_to_many_attrs])
+        self.assertEqual([attr[3] for attr in plan.attrs][0:2],
+                         [core.TraversalPlan.LITERAL, core.TraversalPlan.TO_MANY])
+
+    def test_reset_by_new_related_attributes(self):
+        class PlanRoot(core.Model):
+            id = core.StringAttribute()
+
+        plan = PlanRoot.get_traversal_plan()
+        self.assertEqual(plan.reverse_related_attrs, ())
+
+        class PlanLeaf(core.Model):
+            root = core.ManyToOneAttribute(PlanRoot, related_name='leaves')
+
+        plan = PlanRoot.get_traversal_plan()
+        self.assertEqual([attr[0] for attr in plan.reverse_to_many_attrs], ['leaves'])
+
+    def test_compact_getters(self):
+        root = CompactRoot(id='root')
+        leaf = CompactLeaf(id='leaf', root=root)
+        self.assertEqual(root.get_related(), [leaf])
+
+        leaves_slot = CompactRoot.Meta.compact_slots['shared_leaves']
+        self.assertIs(leaves_slot.peek(root), core.CompactSlot.UNINITIALIZED)
+        self.assertIs(CompactLeaf.Meta.compact_slots['roots'].peek(leaf), core.CompactSlot.UNINITIALIZED)
+
+        root.cut_relations([root])
+        self.assertEqual(root.leaves, [])
+        self.assertEqual(leaf.root, None)
+
+
+class ModelCodeGeneratorTestCase(unittest.TestCase):
+    def test_functions(self):
+        class CodeGenRoot(core.Model):
+            id = core.StringAttribute(primary=True, unique=True)
+            value = core.FloatAttribute()
+            tags = core.ListAttribute()
+
+        class CodeGenLeaf(core.Model):
+            id = core.StringAttribute(primary=True, unique=True)
+            root = core.ManyToOneAttribute(CodeGenRoot, related_name='leaves')
+
+        code_generator = CodeGenRoot.get_code_generator()
+        self.assertIs(CodeGenRoot.get_code_generator(), code_generator)
+        self.assertEqual(sorted(code_generator.sources), ['init', 'to_builtin', 'validate'])
+
+        # initialization
+        root = CodeGenRoot(id='root', value=float('nan'))
+        self.assertEqual(root.tags, [])
+        self.assertIsNot(root.tags, CodeGenRoot(id='root_2').tags)
+        self.assertEqual(root.leaves, [])
+        leaf = CodeGenLeaf(id='leaf', root=root)
+        self.assertEqual(root.leaves, [leaf])
+
+        # encoding
+        self.assertIn("json_obj['id'] = obj.id\n", code_generator.sources['to_builtin'])
+        self.assertIn(".to_builtin(obj.tags)", code_generator.sources['to_builtin'])
+        root.tags = ['a', 'b']
+        json = root.to_dict()
+        self.assertEqual(json['id'], 'root')
+        self.assertEqual(json['tags'], ['a', 'b'])
+        self.assertEqual(json['leaves'][0]['id'], 'leaf')
+
+        # validation
+        self.assertEqual(root.validate(), None)
+        root.id = 1
+        error = root.validate()
+        self.assertEqual([attr_error.attribute.name for attr_error in error.attributes], ['id'])
+
+        # serialization
+        root.id = 'root'
+        root.value = 2.
+        serialize = code_generator.get_serializer([CodeGenRoot.Meta.attributes['id'],
+                                                   CodeGenRoot.Meta.attributes['value']])
+        self.assertIs(code_generator.get_serializer([CodeGenRoot.Meta.attributes['id'],
+                                                     CodeGenRoot.Meta.attributes['value']]), serialize)
+        self.assertEqual(serialize(root, None), ['root', 2.])
+        self.assertEqual(CodeGenLeaf.get_code_generator().get_serializer(
+            [CodeGenLeaf.Meta.attributes['root']])(leaf, None), ['root'])
+
+        # deserialization
+        deserialize = code_generator.get_deserializer([CodeGenRoot.Meta.attributes['id'], None,
+                                                       CodeGenRoot.Meta.attributes['value']])
+        errors = []
+        self.assertEqual(deserialize(['new_root', 'ignored', '3.5'], errors), {'id': 'new_root', 'value': 3.5})
+        self.assertEqual(errors, [])
+
+        values = deserialize(['new_root', 'ignored', 'abc'], errors)
+        self.assertEqual(values['id'], 'new_root')
+        self.assertEqual(len(errors), 1)
+        attr, value, deserialize_error, _, exception = errors[0]
+        self.assertIs(attr, CodeGenRoot.Meta.attributes['value'])
+        self.assertEqual(value, 'abc')
+        self.assertTrue(deserialize_error)
+        self.assertEqual(exception, None)
+
+    def test_reset_by_new_related_attributes(self):
+        class CodeGenRoot(core.Model):
+            id = core.StringAttribute()
+
+        code_generator = CodeGenRoot.get_code_generator()
+
+        class CodeGenLeaf(core.Model):
+            root = core.ManyToOneAttribute(CodeGenRoot, related_name='leaves')
+
+        self.assertIsNot(CodeGenRoot.get_code_generator(), code_generator)
+        self.assertIn("'leaves'", CodeGenRoot.get_code_generator().sources['to_builtin'])
+
+
+class FingerprintTestCase(unittest.TestCase):
+    def make_graph(self, labels=('b', 'a', 'c')):
+        root = ManyToManyRoot(id='root')
+        leaves = [ManyToManyLeaf(id=label, roots=[root]) for label in labels]
+        other_root = ManyToManyRoot(id='other_root', leaves=[leaf for leaf in leaves if leaf.id in ('a', 'b')])
+        return root, leaves, other_root
+
+    def test_fingerprint(self):
+        root, leaves, other_root = self.make_graph()
+        root_2, leaves_2, other_root_2 = self.make_graph(labels=('c', 'b', 'a'))
+
+        self.assertRegex(root.fingerprint(), '^[0-9a-f]{32}$')
+        self.assertEqual(root.fingerprint(), root_2.fingerprint())
+        self.assertEqual(leaves[0].fingerprint(), leaves_2[1].fingerprint())
+        self.assertNotEqual(root.fingerprint(), other_root.fingerprint())
+        self.assertNotEqual(leaves[0].fingerprint(), leaves[2].fingerprint())
+
+        self.assertEqual(core.Model.fingerprint_graph([root]), core.Model.fingerprint_graph([other_root_2]))
+
+    def test_fingerprint_distinguishes_relationships(self):
+        root, leaves, other_root = self.make_graph()
+        root_2, leaves_2, other_root_2 = self.make_graph()
+        other_root_2.leaves.remove(leaves_2[0])
+        other_root_2.leaves.append(leaves_2[2])
+
+        self.assertNotEqual(core.Model.fingerprint_graph([root]), core.Model.fingerprint_graph([root_2]))
+        self.assertNotEqual(root.fingerprint(), root_2.fingerprint())
+
+    def test_cache(self):
+        root, leaves, other_root = self.make_graph()
+        fingerprint = root.fingerprint()
+        self.assertEqual(root._fingerprint[1].hex(), fingerprint)
+        self.assertEqual(leaves[0]._fingerprint[0], root._graph_state.get_root().version)
+        graph_fingerprint = core.Model.fingerprint_graph([root])
+
+        leaves[0].id = 'd'
+        self.assertNotEqual(root.fingerprint(), fingerprint)
+        self.assertNotEqual(core.Model.fingerprint_graph([leaves[1]]), graph_fingerprint)
+
+        leaves[0].id = 'b'
+        self.assertEqual(root.fingerprint(), fingerprint)
+        self.assertEqual(core.Model.fingerprint_graph([leaves[1]]), graph_fingerprint)
+
+    def test_independent_of_other_graphs(self):
+        root, leaves, other_root = self.make_graph()
+        root_2, leaves_2, other_root_2 = self.make_graph()
+        unrelated_root, _, _ = self.make_graph(labels=('d', 'e', 'f', 'g'))
+
+        core.Model.fingerprint_graph([root, unrelated_root])
+        self.assertEqual(root.fingerprint(), root_2.fingerprint())
+        self.assertEqual(leaves[1].fingerprint(), leaves_2[1].fingerprint())
+        self.assertEqual(core.Model.fingerprint_graph([root, unrelated_root]),
+                         core.Model.fingerprint_graph([unrelated_root, root_2]))
+
+        # changes to other graphs do not invalidate the cached fingerprints
+        fingerprint = root._fingerprint
+        unrelated_root.id = 'unrelated_root'
+        self.assertEqual(root.fingerprint(), fingerprint[1].hex())
+        self.assertIs(root._fingerprint, fingerprint)
+
+    def test_chain(self):
+        class FingerprintNode(core.Model):
+            id = core.StringAttribute()
+            next = core.OneToOneAttribute('FingerprintNode', related_name='previous')
+
+        nodes = [FingerprintNode(id='node') for _ in range(100)]
+        for node, next_node in zip(nodes[:-1], nodes[1:]):
+            node.next = next_node
+
+        fingerprint = nodes[0].fingerprint()
+        nodes[-1].id = 'last_node'
+        self.assertNotEqual(nodes[0].fingerprint(), fingerprint)
+        self.assertNotEqual(nodes[0].fingerprint(), nodes[-1].fingerprint())
+
+    def test_compact(self):
+        root = CompactRoot(id='root', name='Root')
+        CompactLeaf(id='leaf', value=1., root=root)
+        root_2 = CompactRoot(id='root', name='Root')
+        root_2.leaves.create(id='leaf', value=1., roots=[])
+        self.assertEqual(root.fingerprint(), root_2.fingerprint())
+
+
+class RelatedManagerIndexTestCase(unittest.TestCase):
+    def test_membership(self):
+        root = ManyToManyRoot(id='root')
+        leaves = [ManyToManyLeaf(id='leaf_{}'.format(i)) for i in range(4)]
+        root.leaves.append(leaves[0])
+        root.leaves.append(leaves[0])
+        self.assertEqual(root.leaves, [leaves[0]])
+        self.assertIn(leaves[0], root.leaves)
+        self.assertNotIn(leaves[1], root.leaves)
+        self.assertNotIn([], root.leaves)
+        self.assertEqual(leaves[0].roots, [root])
+
+        root.leaves.insert(0, leaves[1])
+        self.assertIn(leaves[1], root.leaves)
+
+        root.leaves[0] = leaves[2]
+        self.assertNotIn(leaves[1], root.leaves)
+        self.assertIn(leaves[2], root.leaves)
+
+        root.leaves[0:1] = [leaves[3]]
+        self.assertNotIn(leaves[2], root.leaves)
+        self.assertIn(leaves[3], root.leaves)
+
+        del root.leaves[0]
+        self.assertNotIn(leaves[3], root.leaves)
+        self.assertEqual(root.leaves, [leaves[0]])
+
+        root.leaves.pop()
+        self.assertNotIn(leaves[0], root.leaves)
+        self.assertEqual(leaves[0].roots, [])
+
+        root.leaves.extend(leaves)
+        copy_leaves = copy.copy(root.leaves)
+        self.assertEqual(copy_leaves, leaves)
+        self.assertIn(leaves[3], copy_leaves)
+
+    def test_extend(self):
+        root = ManyToManyRoot(id='root')
+        leaves = [ManyToManyLeaf(id='leaf_{}'.format(i)) for i in range(3)]
+        root.leaves.append(leaves[1])
+
+        root.leaves.extend([leaves[0], leaves[1], leaves[2], leaves[0]])
+        self.assertEqual(root.leaves, [leaves[1], leaves[0], leaves[2]])
+        for leaf in leaves:
+            self.assertEqual(leaf.roots, [root])
+
+        other_root = ManyToManyRoot(id='other_root')
+        other_root.leaves.extend(leaves, propagate=False)
+        self.assertEqual(other_root.leaves, leaves)
+        self.assertEqual(leaves[0].roots, [root])
+
+        other_root.leaves += [ManyToManyLeaf(id='leaf_3')]
+        self.assertEqual(len(other_root.leaves), 4)
+        self.assertEqual(other_root.leaves[3].roots, [other_root])
+
+        one_root = OneToManyRoot(id='root')
+        one_leaf = OneToManyLeaf(id='leaf')
+        one_leaf.roots.extend([one_root])
+        self.assertEqual(one_root.leaf, one_leaf)
+
+        parent = Root(label='parent')
+        other_parent = Root(label='other_parent')
+        children = [Leaf(id='child_{}'.format(i), root=other_parent) for i in range(3)]
+        parent.leaves.extend(children)
+        self.assertEqual(parent.leaves, children)
+        self.assertEqual(other_parent.leaves, [])
+        for child in children:
+            self.assertEqual(child.root, parent)
+
+    def test_remove_values(self):
+        root = ManyToManyRoot(id='root')
+        leaves = [ManyToManyLeaf(id='leaf_{}'.format(i), roots=[root]) for i in range(5)]
+
+        root.leaves.difference_update([leaves[0], leaves[2], ManyToManyLeaf(id='other')])
+        self.assertEqual(root.leaves, [leaves[1], leaves[3], leaves[4]])
+        self.assertNotIn(leaves[0], root.leaves)
+        self.assertEqual(leaves[0].roots, [])
+
+        root.leaves.intersection_update([leaves[1], leaves[3]])
+        self.assertEqual(root.leaves, [leaves[1], leaves[3]])
+        self.assertEqual(leaves[4].roots, [])
+
+        root.leaves.symmetric_difference_update([leaves[1], leaves[2]])
+        self.assertEqual(root.leaves, [leaves[3], leaves[2]])
+        self.assertEqual(leaves[1].roots, [])
+        self.assertEqual(leaves[2].roots, [root])
+
+        root.leaves.discard(leaves[1])
+        root.leaves.discard(leaves[2])
+        self.assertEqual(root.leaves, [leaves[3]])
+
+        root.leaves.clear()
+        self.assertEqual(root.leaves, [])
+        self.assertNotIn(leaves[3], root.leaves)
+        self.assertEqual(leaves[3].roots, [])
+
+    def test_attribute_index(self):
+        parent = Root(label='parent')
+        children = [Leaf(id='child_{}'.format(i), root=parent, name='name_{}'.format(i % 2)) for i in range(6)]
+
+        parent.leaves.create_index()
+        parent.leaves.create_index('name')
+        self.assertEqual(set(parent.leaves._indexes.keys()), set([('id', ), ('name', )]))
+        self.assertIn('name', core.RelatedManager._indexed_attr_names)
+
+        checked_objs = []
+        has_attr_vals = core.Model.has_attr_vals
+
+        def counting_has_attr_vals(obj, *args, **kwargs):
+            checked_objs.append(obj)
+            return has_attr_vals(obj, *args, **kwargs)
+        with mock.patch.object(Leaf, 'has_attr_vals', counting_has_attr_vals):
+            self.assertEqual(parent.leaves.get_one(id='child_3'), children[3])
+        self.assertEqual(checked_objs, [children[3]])
+        self.assertEqual(parent.leaves.get(id='child_10'), [])
+        self.assertEqual(parent.leaves.get(name='name_1'), [children[1], children[3], children[5]])
+        self.assertEqual(parent.leaves.get(name='name_1', id='child_3'), [children[3]])
+        self.assertEqual(parent.leaves.get(id='child_3', name='name_0'), [])
+        self.assertEqual(parent.leaves.get(__type=Root, id='child_3'), [])
+
+        # attribute changes
+        children[3].id = 'child_30'
+        self.assertEqual(parent.leaves.get(id='child_3'), [])
+        self.assertEqual(parent.leaves.get_one(id='child_30'), children[3])
+
+        children[0].name = 'name_1'
+        self.assertEqual(parent.leaves.get(name='name_1'), [children[0], children[1], children[3], children[5]])
+
+        # membership changes
+        children[1].root = None
+        self.assertEqual(parent.leaves.get(name='name_1'), [children[0], children[3], children[5]])
+        new_child = parent.leaves.create(id='child_6', name='name_1')
+        self.assertEqual(parent.leaves.get(name='name_1'), [children[0], children[3], children[5], new_child])
+        self.assertEqual(parent.leaves.get_or_create(id='child_6'), new_child)
+
+        parent.leaves.reverse()
+        self.assertEqual(parent.leaves.get(name='name_1'), [new_child, children[5], children[3], children[0]])
+
+        parent.leaves.difference_update([children[5]])
+        self.assertEqual(parent.leaves.get(name='name_1'), [new_child, children[3], children[0]])
+        self.assertEqual(parent.leaves.get(name='name_1'),
+                         [leaf for leaf in parent.leaves if leaf.name == 'name_1'])
+
+        parent.leaves.drop_index('name')
+        self.assertEqual(list(parent.leaves._indexes.keys()), [('id', )])
+        self.assertEqual(parent.leaves.get(name='name_1'), [new_child, children[3], children[0]])
+        parent.leaves.drop_index()
+        self.assertEqual(parent.leaves._indexes, None)
+        self.assertEqual(parent.leaves.get_one(id='child_30'), children[3])
+
+        with self.assertRaisesRegex(ValueError, 'cannot be indexed'):
+            ManyToManyRoot(id='root').leaves.create_index('roots')
+        with self.assertRaisesRegex(ValueError, 'does not have attribute'):
+            parent.leaves.create_index('undefined')
+
+    def test_attribute_index_related_values(self):
+        roots = [ManyToManyRoot(id='root_{}'.format(i)) for i in range(2)]
+        leaf = ManyToManyLeaf(id='leaf', roots=roots)
+        parent = Root(label='parent')
+        parent.leaves.create_index('root')
+        self.assertEqual(parent.leaves.get(root=parent), [])
+
+        child = Leaf(id='child', root=parent)
+        self.assertEqual(parent.leaves.get(root=parent), [child])
+
+        roots[0].leaves.create_index()
+        self.assertEqual(roots[0].leaves.get_one(id='leaf'), leaf)
+        leaf.id = 'leaf_2'
+        self.assertEqual(roots[0].leaves.get_one(id='leaf'), None)
+        self.assertEqual(roots[0].leaves.get_one(id='leaf_2'), leaf)
+
+
+    def test_bulk_link(self):
+        roots = [ManyToManyRoot(id='root_{}'.format(i)) for i in range(3)]
+        leaves = [ManyToManyLeaf(id='leaf_{}'.format(i)) for i in range(4)]
+        pairs = [(leaf, root) for leaf in leaves for root in roots]
+        ManyToManyLeaf.bulk_link('roots', pairs)
+        for leaf in leaves:
+            self.assertEqual(leaf.roots, roots)
+        for root in roots:
+            self.assertEqual(root.leaves, leaves)
+
+        new_root = ManyToManyRoot(id='new_root')
+        ManyToManyRoot.bulk_link('leaves', [(new_root, leaves[0]), (new_root, leaves[0])])
+        self.assertEqual(new_root.leaves, [leaves[0]])
+        self.assertEqual(leaves[0].roots, roots + [new_root])
+
+        parent = Root(label='parent')
+        children = [Leaf(id='child_{}'.format(i)) for i in range(3)]
+        Leaf.bulk_link('root', [(child, parent) for child in children])
+        self.assertEqual(parent.leaves, children)
+
+        with self.assertRaisesRegex(ValueError, 'can only be related to one object'):
+            Leaf.bulk_link('root', [(children[0], parent), (children[0], Root(label='other'))])
+
+        with self.assertRaisesRegex(ValueError, 'does not have related attribute'):
+            Leaf.bulk_link('id', [])
+
+
+class ObjectStoreTestCase(unittest.TestCase):
+    def test_add_get(self):
+        e0s = [Example0(int_attr=i % 2) for i in range(4)]
+        e1 = Example1(str_attr='a', int_attr=1, int_attr2=2, test0=e0s[0])
+        other_e0 = Example0(int_attr=0)
+
+        store = core.ObjectStore([e1])
+        self.assertEqual(len(store), 1)
+        self.assertEqual(store.add_all(e0s), 4)
+        self.assertEqual(store.add_all([e1, e0s[0]]), 0)
+        self.assertEqual(len(store), 5)
+        self.assertIn(e0s[1], store)
+        self.assertNotIn(other_e0, store)
+
+        self.assertEqual(store.get(Example0, int_attr=0), [e0s[0], e0s[2]])
+        self.assertEqual(store.get(Example0, int_attr=2), None)
+        self.assertEqual(store.get_one(Example1, str_attr='a'), e1)
+        self.assertEqual(store.get_one(Example1, int_attr2=2, int_attr=1), e1)
+        self.assertEqual(store.get_one(Example1, test0=e0s[0]), e1)
+        self.assertEqual(store.get_one(Example1, test0=e0s[1]), None)
+        with self.assertRaisesRegex(ValueError, 'get_one'):
+            store.get_one(Example0, int_attr=1)
+        with self.assertRaisesRegex(ValueError, 'No arguments'):
+            store.get(Example0)
+        with self.assertRaisesRegex(ValueError, 'not an indexed attribute tuple'):
+            store.get(Example1, int_attr=1)
+
+        self.assertEqual(store.all(Example0), e0s)
+        self.assertEqual(store.all(Example2), [])
+        self.assertEqual(store.all(), [e1] + e0s)
+
+        e0s[0].int_attr = 1
+        self.assertEqual(store.get(Example0, int_attr=0), [e0s[2]])
+        self.assertEqual(store.get(Example0, int_attr=1), [e0s[1], e0s[3], e0s[0]])
+        with store.batch():
+            e0s[2].int_attr = 1
+            self.assertEqual(store.get(Example0, int_attr=0), [e0s[2]])
+        self.assertEqual(store.get(Example0, int_attr=0), None)
+        store.upsert_all()
+        self.assertEqual(store.get(Example0, int_attr=0), None)
+        self.assertEqual(store.get(Example0, int_attr=1), [e0s[0], e0s[1], e0s[2], e0s[3]])
+
+        store.upsert(other_e0)
+        self.assertEqual(store.get(Example0, int_attr=0), [other_e0])
+
+        store.remove(e0s[1])
+        self.assertNotIn(e0s[1], store)
+        self.assertEqual(store.get(Example0, int_attr=1), [e0s[0], e0s[2], e0s[3]])
+        with self.assertRaisesRegex(ValueError, 'not in the store'):
+            store.remove(e0s[1])
+
+    def test_primary_attribute_and_release(self):
+        root = Root(label='root')
+        leaves = [Leaf(id='leaf_{}'.format(i), root=root) for i in range(3)]
+
+        other_store = core.ObjectStore()
+        other_store.add(Leaf(id='leaf_0'))
+
+        with core.ObjectStore() as store:
+            self.assertEqual(store.add_all([root], get_related=True), 4)
+            self.assertEqual(store.get_one(Root, label='root'), root)
+            self.assertEqual(store.get_one(Leaf, id='leaf_1'), leaves[1])
+            self.assertNotEqual(other_store.get_one(Leaf, id='leaf_0'), leaves[0])
+        self.assertEqual(len(store), 0)
+        self.assertEqual(store.get(Leaf, id='leaf_1'), None)
+        self.assertEqual(len(other_store), 1)
+
+        store.add_all({Root: [root], Leaf: leaves})
+        self.assertEqual(len(store), 4)
+        store.release()
+        self.assertEqual(store.all(), [])
+
+    def test_notify_registered_stores(self):
+        class RegistryParent(core.Model):
+            id = core.StringAttribute(primary=True, unique=True)
+
+        class RegistryChild(core.Model):
+            id = core.StringAttribute(primary=True, unique=True)
+            parent = core.ManyToOneAttribute(RegistryParent, related_name='children')
+
+        parent = RegistryParent(id='p')
+        child = RegistryChild(id='c', parent=parent)
+
+        # stores are only notified of changes to the instances of the models which they contain
+        store = core.ObjectStore([child])
+        self.assertEqual(core.ObjectStore.get_registered_stores(RegistryChild), [store])
+        self.assertEqual(core.ObjectStore.get_registered_stores(RegistryParent), [])
+        with mock.patch.object(core.ObjectStore, '_update_attr') as update_attr:
+            parent.id = 'p_2'
+            update_attr.assert_not_called()
+            child.id = 'c_2'
+            update_attr.assert_called_once_with(child, 'id')
+        self.assertEqual(store.get_one(RegistryChild, id='c_2'), None)
+        store.upsert(child)
+        self.assertEqual(store.get_one(RegistryChild, id='c_2'), child)
+
+        other_store = core.ObjectStore([child])
+        self.assertEqual(core.ObjectStore.get_registered_stores(RegistryChild), [store, other_store])
+
+        # stores are unregistered when they are released or garbage collected
+        store.release()
+        self.assertEqual(core.ObjectStore.get_registered_stores(RegistryChild), [other_store])
+        del other_store
+        gc.collect()
+        self.assertNotIn(RegistryChild, core.ObjectStore._stores_by_model)
+        child.id = 'c_3'
+
+    def test_update_attr(self):
+        e0 = Example0(int_attr=0)
+        other_e0 = Example0(int_attr=0)
+        store = core.ObjectStore([e0])
+        store.clear_dirty()
+
+        # objects which are not in the store are ignored before their changes are recorded
+        with mock.patch.object(store, '_mark_dirty', wraps=store._mark_dirty) as mark_dirty:
+            other_e0.int_attr = 1
+            mark_dirty.assert_not_called()
+            e0.int_attr = 1
+            mark_dirty.assert_called_once_with(e0, 'int_attr')
+        self.assertEqual(store.get(Example0, int_attr=1), [e0])
+        self.assertEqual(store.get_dirty(), {e0: set(['int_attr'])})
+        store.release()
+
+    def test_dirty_tracking_and_incremental_validation(self):
+        class DirtyParent(core.Model):
+            id = core.StringAttribute(primary=True, unique=True)
+
+        class DirtyChild(core.Model):
+            id = core.StringAttribute(primary=True, unique=True)
+            value = core.FloatAttribute(min=0.)
+            parent = core.ManyToOneAttribute(DirtyParent, related_name='children')
+
+        parents = [DirtyParent(id='p_{}'.format(i)) for i in range(2)]
+        children = [DirtyChild(id='c_{}'.format(i), value=float(i), parent=parents[i % 2]) for i in range(10)]
+        other_child = DirtyChild(id='c_0')
+
+        store = core.ObjectStore(parents + children)
+        self.assertEqual(store.get_dirty(), {obj: None for obj in parents + children})
+        self.assertEqual(core.Validator().validate_incremental(store), None)
+        self.assertEqual(store.get_dirty(), {})
+
+        # attribute changes
+        children[3].value = -1.
+        other_child.value = 2.
+        self.assertEqual(store.get_dirty(), {children[3]: set(['value'])})
+        errors = core.Validator().validate_incremental(store)
+        self.assertEqual([error.object for error in errors.invalid_objects], [children[3]])
+        self.assertEqual(errors.invalid_models, [])
+        self.assertEqual(store.get_dirty(), {})
+        children[3].value = 3.
+        self.assertEqual(core.Validator().validate_incremental(store), None)
+
+        # cleaning unchanged objects doesn't mark them as changed
+        self.assertEqual(children[1].clean(), None)
+        self.assertEqual(store.get_dirty(), {})
+
+        # changes to internal attributes don't mark objects as changed
+        children[1].set_source('file.xlsx', 'Children', ['id', 'value'], 3)
+        children[1]._comments = ['comment']
+        children[1].fingerprint()
+        self.assertEqual(store.get_dirty(), {})
+
+        # related manager mutations
+        parents[0].children.remove(children[0])
+        self.assertEqual(store.get_dirty(), {parents[0]: set(['children']), children[0]: set(['parent'])})
+        parents[1].children.append(children[0])
+        self.assertEqual(store.get_dirty()[parents[1]], set(['children']))
+        self.assertEqual(core.Validator().validate_incremental(store), None)
+
+        # uniqueness is checked among the objects with the same values
+        children[5].id = 'c_6'
+        errors = core.Validator().validate_incremental(store)
+        self.assertEqual(errors.invalid_objects, [])
+        self.assertEqual([error.model for error in errors.invalid_models], [DirtyChild])
+        self.assertRegex(str(errors), 'c_6')
+        children[5].id = 'c_5'
+        self.assertEqual(core.Validator().validate_incremental(store), None)
+
+        # removed and added objects
+        store.remove(children[9])
+        self.assertEqual(store.get_dirty(), {})
+        self.assertEqual(list(store._removed), [children[9]])
+        store.add(other_child)
+        errors = core.Validator().validate_incremental(store)
+        self.assertEqual([error.model for error in errors.invalid_models], [DirtyChild])
+        store.remove(other_child)
+        self.assertEqual(core.Validator().validate_incremental(store), None)
+
+        store.release()
+        self.assertEqual(store.get_dirty(), {})
+
+
 class BigModel(core.Model):
     # include an id to make this cacheable
     # used in TestCaching.perf_no_caching
@@ -7,6 +7,10 @@
 """
 
 from obj_tables import core
+import obj_tables.io
+import os
+import shutil
+import tempfile
 import unittest
 
 
@@ -63,6 +67,9 @@ class Level011(core.Model):
     id = core.SlugAttribute()
 
 
+MODELS = [Level0, Level00, Level01, Level000, Level001, Level010, Level011]
+
+
 class CutTestCase(unittest.TestCase):
     def setUp(self):
         self.obj_0 = Level0(id='obj_0')
@@ -445,3 +452,99 @@ class CutTestCase(unittest.TestCase):
         self.assertEqual(len(cut_children), 1)
         self.assertTrue(cut_children[0].is_equal(Level00(id='obj_00_1', children_001=[
                         Level001(id='obj_00_1_0'), Level001(id='obj_00_1_1')])))
+
+
+class SubgraphViewTestCase(unittest.TestCase):
+    setUp = CutTestCase.setUp
+
+    def get_related_ids(self, obj, get_value):
+        ids = {}
+        plan = obj.Meta.traversal_plan or obj.get_traversal_plan()
+        for attr_name, _, _, to_many in plan.related_attrs:
+            value = get_value(obj, attr_name)
+            if to_many:
+                ids[attr_name] = [v.id for v in value]
+            else:
+                ids[attr_name] = value.id if value else None
+        return ids
+
+    def test_view(self):
+        for obj_name in ['obj_0', 'obj_00_0', 'obj_00_1', 'obj_01_0']:
+            for kind in [None, 'left', 'right', 'all']:
+                self.setUp()
+                obj = getattr(self, obj_name)
+                all_objs = obj.get_related()
+                all_ids = {o: self.get_related_ids(o, getattr) for o in all_objs}
+
+                view = obj.get_subgraph_view(kind=kind)
+                self.assertEqual(view.root, obj)
+                self.assertEqual(set(view), set([obj] + obj.get_children(kind=kind)))
+                self.assertEqual(len(view), len(set(view)))
+                view_ids = {o: self.get_related_ids(o, view.get_value) for o in view}
+                self.assertEqual(view.get_value(obj, 'id'), obj.id)
+
+                # the view doesn't change the graph
+                self.assertEqual({o: self.get_related_ids(o, getattr) for o in all_objs}, all_ids)
+
+                # the values of the view are the values of the cut graph
+                obj.cut(kind=kind)
+                self.assertEqual(view_ids, {o: self.get_related_ids(o, getattr) for o in view})
+
+    def test_get_objects(self):
+        view = self.obj_0.get_subgraph_view(kind='left')
+        self.assertEqual(view.get_objects()[0], self.obj_0)
+        self.assertIn(self.obj_00_1_0, view)
+        self.assertNotIn(self.obj_01_0, view)
+        self.assertEqual(set(view.get_objects(__type=Level00)), set([self.obj_00_0, self.obj_00_1]))
+        self.assertEqual(view.get_objects(id='obj_00_1_1'), [self.obj_00_1_1])
+        self.assertEqual(view.get_objects(__type=Level001, id='obj_00_0'), [])
+
+    def test_validate(self):
+        class Parent(core.Model):
+            id = core.SlugAttribute()
+
+        class Child(core.Model):
+            id = core.SlugAttribute()
+            parents = core.ManyToManyAttribute(Parent, related_name='children', min_related=1)
+
+            class Meta(core.Model.Meta):
+                children = {'parents': ('parents',)}
+
+        parent = Parent(id='parent')
+        child_1 = Child(id='child_1', parents=[parent])
+        child_2 = Child(id='child_2', parents=[parent])
+        self.assertEqual(core.Validator().run(child_1.get_subgraph_view(kind='parents')), None)
+
+        view = parent.get_subgraph_view(kind='parents')
+        self.assertEqual(view.get_objects(), [parent])
+        self.assertEqual(core.Validator().run(view), None)
+        self.assertEqual(core.Validator().run(child_1.get_subgraph_view(kind='none')).invalid_objects[0].object,
+                         child_1)
+        self.assertEqual(core.Validator(max_errors=1).run(child_2.get_subgraph_view()), None)
+        self.assertEqual(parent.children, [child_1, child_2])
+
+    def test_to_dict(self):
+        view = self.obj_0.get_subgraph_view(kind='right')
+        encoded = {}
+        json = core.Model.to_dict(view.get_objects(), view=view, encoded=encoded)
+        self.assertEqual(set(encoded.keys()), set(view))
+        self.assertEqual(json[0]['children_00'], [])
+        self.assertEqual(len(json[0]['children_01']), 2)
+
+    def test_write(self):
+        dirname = tempfile.mkdtemp()
+        try:
+            for ext in ['xlsx', 'json']:
+                self.setUp()
+                view = self.obj_0.get_subgraph_view(kind='right')
+                filename = os.path.join(dirname, 'view.' + ext)
+                obj_tables.io.Writer().run(filename, view, models=MODELS)
+                self.assertNotEqual(self.obj_0.children_00, [])
+
+                objs = obj_tables.io.Reader().run(filename, models=MODELS)
+                self.assertEqual(objs.get(Level00, []), [])
+                self.assertEqual(len(objs[Level01]), 2)
+                self.obj_0.cut(kind='right')
+                self.assertTrue(objs[Level0][0].is_equal(self.obj_0))
+        finally:
+            shutil.rmtree(dirname)
@@ -597,6 +597,17 @@ class TestIo(unittest.TestCase):
         self.check_reader_errors('duplicate-primaries.xlsx', RE_msgs, [MainRoot, Node, Leaf, OneToManyRow],
                                  use_re=True)
 
+        filename = os.path.join(os.path.dirname(__file__), 'fixtures', 'duplicate-primaries.xlsx')
+        reported = []
+        with self.assertRaises(core.ValidationError) as context:
+            WorkbookReader().run(filename, models=[MainRoot, Node, Leaf, OneToManyRow],
+                                 max_errors=1, on_error=reported.append)
+        errors = context.exception.errors
+        self.assertEqual(len(errors.invalid_objects) + len(errors.invalid_models), 1)
+        self.assertTrue(errors.truncated)
+        self.assertEqual(reported, errors.invalid_models)
+        self.assertIn('Validation stopped after 1 error(s)', str(context.exception))
+
     def test_create_worksheet_style(self):
         self.assertIsInstance(WorkbookWriter.create_worksheet_style(MainRoot), WorksheetStyle)
 
@@ -1365,6 +1376,43 @@ class MultiSeparatedValuesTestCase(unittest.TestCase):
                                        group_objects_by_model=True)
 
 
+class ObjectStoreReaderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dirname)
+
+    def test(self):
+        class Parent(core.Model):
+            id = core.SlugAttribute()
+            name = core.StringAttribute()
+
+        class Child(core.Model):
+            id = core.SlugAttribute()
+            parents = core.ManyToManyAttribute(Parent, related_name='children')
+
+        p_1 = Parent(id='p_1', name='p 1')
+        Child(id='c_1', parents=[p_1])
+        Child(id='c_2', parents=[p_1])
+
+        for ext in ['xlsx', 'json', 'multi.csv']:
+            path = os.path.join(self.tmp_dirname, 'test.' + ext)
+            obj_tables.io.Writer().run(path, [p_1], models=[Parent, Child])
+
+            store = core.ObjectStore()
+            objs = obj_tables.io.Reader().run(path, models=[Parent, Child],
+                                              group_objects_by_model=True,
+                                              object_store=store)
+            other_objs = obj_tables.io.Reader().run(path, models=[Parent, Child],
+                                                    group_objects_by_model=True)
+            self.assertEqual(len(store), 3)
+            self.assertEqual(store.get_one(Parent, id='p_1'), objs[Parent][0])
+            self.assertNotEqual(store.get_one(Parent, id='p_1'), other_objs[Parent][0])
+            self.assertEqual(set(store.all(Child)), set(objs[Child]))
+            self.assertEqual(store.get_one(Child, id='c_2').parents, objs[Parent])
+
+
 class TestMetadataModels(unittest.TestCase):
 
     class Model1(core.Model):
@@ -2720,6 +2768,9 @@ class JsonTestCase(unittest.TestCase):
             json.dump(objs, file)
         with self.assertRaisesRegex(ValueError, 'fails to validate'):
             obj_tables.io.JsonReader().run(path, models=[AA])
+        with self.assertRaises(core.ValidationError) as context:
+            obj_tables.io.JsonReader().run(path, models=[AA], max_errors=1)
+        self.assertEqual(len(context.exception.errors.invalid_objects), 1)
 
         obj_tables.io.JsonWriter().run(path, aa_0, models=AA)
         aa_0_2 = obj_tables.io.JsonReader().run(path, models=AA)[AA][0]
@@ -6,20 +6,31 @@
 :License: MIT
 """
 
-from obj_tables import core, utils
+from obj_tables import __main__, core, utils
 from obj_tables.io import WorkbookReader, WorkbookWriter
+from obj_tables.math.expression import (Expression, ExpressionStaticTermMeta, LinearParsedExpressionValidator,
+                                        OneToOneExpressionAttribute, ParsedExpression)
 from wc_utils.util.list import is_sorted
+import itertools
+import logging
 import os
 import shutil
 import sys
 import tempfile
+import time
+import tracemalloc
+import types
 import unittest
 
+# :obj:`logging.Logger`: logger of the timings of the benchmarks
+logger = logging.getLogger(__name__)
+
 
 class Model(core.Model):
     id = core.SlugAttribute()
     class Meta(core.Model.Meta):
         attribute_order = ('id',)
+        children = {'proteome': ('genes',)}
 
 
 class Gene(core.Model):
@@ -27,6 +38,7 @@ class Gene(core.Model):
     id = core.SlugAttribute()
     class Meta(core.Model.Meta):
         attribute_order = ('model', 'id',)
+        children = {'proteome': ('rna',)}
 
 
 class Rna(core.Model):
@@ -35,6 +47,7 @@ class Rna(core.Model):
     id = core.SlugAttribute()
     class Meta(core.Model.Meta):
         attribute_order = ('model', 'gene', 'id',)
+        children = {'proteome': ('proteins',)}
 
 
 class Protein(core.Model):
@@ -61,8 +74,172 @@ class Reaction(core.Model):
         attribute_order = ('model', 'id', 'metabolites', 'enzyme')
 
 
-def generate_model(n_gene, n_rna, n_prot, n_met):
-    model = Model(id='model')
+class CompactModel(core.Model):
+    id = core.SlugAttribute()
+    class Meta(core.Model.Meta):
+        attribute_order = ('id',)
+        compact = True
+
+
+class CompactGene(core.Model):
+    model = core.ManyToOneAttribute(CompactModel, related_name='genes')
+    id = core.SlugAttribute()
+    class Meta(core.Model.Meta):
+        attribute_order = ('model', 'id',)
+        compact = True
+
+
+class CompactRna(core.Model):
+    model = core.ManyToOneAttribute(CompactModel, related_name='rna')
+    gene = core.ManyToOneAttribute(CompactGene, related_name='rna')
+    id = core.SlugAttribute()
+    class Meta(core.Model.Meta):
+        attribute_order = ('model', 'gene', 'id',)
+        compact = True
+
+
+class CompactProtein(core.Model):
+    model = core.ManyToOneAttribute(CompactModel, related_name='proteins')
+    rna = core.ManyToOneAttribute(CompactRna, related_name='proteins')
+    id = core.SlugAttribute()
+    class Meta(core.Model.Meta):
+        attribute_order = ('model', 'rna', 'id',)
+        compact = True
+
+
+class CompactMetabolite(core.Model):
+    model = core.ManyToOneAttribute(CompactModel, related_name='metabolites')
+    id = core.SlugAttribute()
+    class Meta(core.Model.Meta):
+        attribute_order = ('model', 'id',)
+        compact = True
+
+
+class CompactReaction(core.Model):
+    model = core.ManyToOneAttribute(CompactModel, related_name='reactions')
+    id = core.SlugAttribute()
+    metabolites = core.ManyToManyAttribute(CompactMetabolite, related_name='reactions')
+    enzyme = core.ManyToOneAttribute(CompactProtein, related_name='reactions')
+    class Meta(core.Model.Meta):
+        attribute_order = ('model', 'id', 'metabolites', 'enzyme')
+        compact = True
+
+
+COMPACT_MODELS = [CompactModel, CompactGene, CompactRna, CompactProtein, CompactMetabolite, CompactReaction]
+
+
+class Parameter(core.Model):
+    id = core.StringAttribute()
+    value = core.FloatAttribute()
+    class Meta(core.Model.Meta):
+        attribute_order = ('id', 'value')
+        ordered_indexes = ('value',)
+
+
+class ColumnarParameter(core.Model):
+    id = core.StringAttribute()
+    value = core.FloatAttribute()
+    count = core.IntegerAttribute()
+    class Meta(core.Model.Meta):
+        attribute_order = ('id', 'value', 'count')
+        columnar = True
+
+
+class ExpressionModel(core.Model):
+    id = core.SlugAttribute()
+    class Meta(core.Model.Meta):
+        attribute_order = ('id',)
+
+
+class ExpressionParameter(core.Model):
+    model = core.ManyToOneAttribute(ExpressionModel, related_name='parameters')
+    id = core.SlugAttribute()
+    value = core.FloatAttribute()
+    class Meta(core.Model.Meta, ExpressionStaticTermMeta):
+        attribute_order = ('model', 'id', 'value')
+        expression_term_value = 'value'
+
+
+class RateLawExpression(core.Model, Expression):
+    expression = core.StringAttribute()
+    parameters = core.ManyToManyAttribute(ExpressionParameter, related_name='rate_law_expressions')
+    class Meta(core.Model.Meta, Expression.Meta):
+        attribute_order = ('expression', 'parameters')
+        expression_term_models = ('ExpressionParameter',)
+        expression_type = float
+
+    def serialize(self): return Expression.serialize(self)
+
+    @classmethod
+    def deserialize(cls, value, objects): return Expression.deserialize(cls, value, objects)
+
+
+class RateLaw(core.Model):
+    model = core.ManyToOneAttribute(ExpressionModel, related_name='rate_laws')
+    id = core.SlugAttribute()
+    expression = OneToOneExpressionAttribute(RateLawExpression, related_name='rate_law')
+    class Meta(core.Model.Meta):
+        attribute_order = ('model', 'id', 'expression')
+
+
+# schema of the models of :obj:`generate_model` with primary attributes, which can be read from workbooks
+DIFF_SCHEMA_SOURCE = '''from obj_tables import core
+
+
+class Model(core.Model):
+    id = core.SlugAttribute(primary=True, unique=True)
+
+    class Meta(core.Model.Meta):
+        attribute_order = ('id',)
+
+
+class Gene(core.Model):
+    model = core.ManyToOneAttribute(Model, related_name='genes')
+    id = core.SlugAttribute(primary=True, unique=True)
+
+    class Meta(core.Model.Meta):
+        attribute_order = ('model', 'id',)
+
+
+class Rna(core.Model):
+    model = core.ManyToOneAttribute(Model, related_name='rna')
+    gene = core.ManyToOneAttribute(Gene, related_name='rna')
+    id = core.SlugAttribute(primary=True, unique=True)
+
+    class Meta(core.Model.Meta):
+        attribute_order = ('model', 'gene', 'id',)
+
+
+class Protein(core.Model):
+    model = core.ManyToOneAttribute(Model, related_name='proteins')
+    rna = core.ManyToOneAttribute(Rna, related_name='proteins')
+    id = core.SlugAttribute(primary=True, unique=True)
+
+    class Meta(core.Model.Meta):
+        attribute_order = ('model', 'rna', 'id',)
+
+
+class Metabolite(core.Model):
+    model = core.ManyToOneAttribute(Model, related_name='metabolites')
+    id = core.SlugAttribute(primary=True, unique=True)
+
+    class Meta(core.Model.Meta):
+        attribute_order = ('model', 'id',)
+
+
+class Reaction(core.Model):
+    model = core.ManyToOneAttribute(Model, related_name='reactions')
+    id = core.SlugAttribute(primary=True, unique=True)
+    metabolites = core.ManyToManyAttribute(Metabolite, related_name='reactions')
+    enzyme = core.ManyToOneAttribute(Protein, related_name='reactions')
+
+    class Meta(core.Model.Meta):
+        attribute_order = ('model', 'id', 'metabolites', 'enzyme')
+'''
+
+
+def generate_model(n_gene, n_rna, n_prot, n_met, model_cls=Model):
+    model = model_cls(id='model')
     for i_gene in range(1, n_gene + 1):
         gene = model.genes.create(id='Gene_{}'.format(i_gene))
         for i_rna in range(1, n_rna + 1):
@@ -73,8 +250,8 @@ def generate_model(n_gene, n_rna, n_prot, n_met):
     for i_met in range(1, n_met + 1):
         met = model.metabolites.create(id='Metabolite_{}'.format(i_met))
 
-    Protein.sort(model.proteins)
-    Metabolite.sort(model.metabolites)
+    model.proteins[0].__class__.sort(model.proteins)
+    model.metabolites[0].__class__.sort(model.metabolites)
     for i_rxn in range(1, n_gene * n_rna * n_prot + 1):
         rxn = model.reactions.create(id='Reaction_{}'.format(i_rxn), enzyme=model.proteins[i_rxn - 1], metabolites=[
             model.metabolites[(i_rxn - 1 + 0) % n_met],
@@ -86,6 +263,356 @@ def generate_model(n_gene, n_rna, n_prot, n_met):
     return model
 
 
+def generate_model_in_bulk(n_gene, n_rna, n_prot, n_met, model_cls=Model):
+    model = model_cls(id='model')
+    gene_cls = model_cls.Meta.related_attributes['genes'].primary_class
+    rna_cls = model_cls.Meta.related_attributes['rna'].primary_class
+    prot_cls = model_cls.Meta.related_attributes['proteins'].primary_class
+    met_cls = model_cls.Meta.related_attributes['metabolites'].primary_class
+    rxn_cls = model_cls.Meta.related_attributes['reactions'].primary_class
+
+    genes = gene_cls.bulk_create({
+        'model': [model] * n_gene,
+        'id': ['Gene_{}'.format(i_gene) for i_gene in range(1, n_gene + 1)],
+    })
+    rna = rna_cls.bulk_create([
+        (model, 'Rna_{}_{}'.format(i_gene, i_rna), gene)
+        for i_gene, gene in enumerate(genes, start=1)
+        for i_rna in range(1, n_rna + 1)], attr_names=['model', 'id', 'gene'])
+    prot_cls.bulk_create([
+        (model, 'Protein_{}_{}'.format(rna_obj.id[4:], i_prot), rna_obj)
+        for rna_obj in rna
+        for i_prot in range(1, n_prot + 1)], attr_names=['model', 'id', 'rna'])
+    met_cls.bulk_create([
+        (model, 'Metabolite_{}'.format(i_met)) for i_met in range(1, n_met + 1)], attr_names=['model', 'id'])
+
+    prot_cls.sort(model.proteins)
+    met_cls.sort(model.metabolites)
+    rxn_cls.bulk_create([
+        {
+            'model': model,
+            'id': 'Reaction_{}'.format(i_rxn),
+            'enzyme': model.proteins[i_rxn - 1],
+            'metabolites': [model.metabolites[(i_rxn - 1 + i_met) % n_met] for i_met in range(4)],
+        } for i_rxn in range(1, n_gene * n_rna * n_prot + 1)])
+
+    return model
+
+
+WideRow = type('WideRow', (core.Model,), dict(
+    [('id', core.StringAttribute(primary=True, unique=True))]
+    + [('float_{}'.format(i_attr), core.FloatAttribute()) for i_attr in range(25)]
+    + [('str_{}'.format(i_attr), core.StringAttribute()) for i_attr in range(25)]))
+
+
+def benchmark_code_generator(test_case, n_objs):
+    """ Compare the generic and generated functions which serialize and validate the rows of a wide table """
+    attrs = list(WideRow.Meta.attributes.values())
+    rows = {'id': ['row_{}'.format(i_obj) for i_obj in range(n_objs)]}
+    for attr in attrs[1:]:
+        if isinstance(attr, core.FloatAttribute):
+            rows[attr.name] = [float(i_obj) for i_obj in range(n_objs)]
+        else:
+            rows[attr.name] = ['value_{}'.format(i_obj) for i_obj in range(n_objs)]
+    objs = WideRow.bulk_create(rows)
+
+    start = time.process_time()
+    generic_data = [[attr.serialize(getattr(obj, attr.name)) for attr in attrs] for obj in objs]
+    generic_errors = []
+    for obj in objs:
+        for attr in attrs:
+            error = attr.validate(obj, getattr(obj, attr.name))
+            if error:
+                generic_errors.append(error)
+    generic_time = time.process_time() - start
+
+    start = time.process_time()
+    serialize = WideRow.get_code_generator().get_serializer(attrs)
+    generated_data = [serialize(obj, None) for obj in objs]
+    generated_errors = [error for error in map(WideRow.validate, objs) if error]
+    generated_time = time.process_time() - start
+
+    logger.info('serialize and validate {} rows of {} attributes: generic: {:.3f} s; generated: {:.3f} s'.format(
+        n_objs, len(attrs), generic_time, generated_time))
+    test_case.assertEqual(generated_data, generic_data)
+    test_case.assertEqual(generic_errors, [])
+    test_case.assertEqual(generated_errors, [])
+    WideRow.objects.reset()
+
+
+def benchmark_column_validation(test_case, n_objs):
+    """ Compare validating and checking the uniqueness of the rows of a wide table object by object and column-wise """
+    attrs = list(WideRow.Meta.attributes.values())
+    rows = {'id': ['row_{}'.format(i_obj) for i_obj in range(n_objs)]}
+    for attr in attrs[1:]:
+        if isinstance(attr, core.FloatAttribute):
+            rows[attr.name] = [float(i_obj) for i_obj in range(n_objs)]
+        else:
+            rows[attr.name] = ['value_{}'.format(i_obj) for i_obj in range(n_objs)]
+    objs = WideRow.bulk_create(rows)
+
+    start = time.process_time()
+    generic_errors = [error for error in map(WideRow.validate, objs) if error]
+    core.Attribute.validate_unique(WideRow.Meta.attributes['id'], objs, rows['id'])
+    generic_time = time.process_time() - start
+
+    start = time.process_time()
+    column_errors = [error for error in WideRow.validate_objects(objs) if error]
+    WideRow.validate_unique(objs)
+    column_time = time.process_time() - start
+
+    logger.info('validate {} rows of {} attributes: by object: {:.3f} s; by column: {:.3f} s'.format(
+        n_objs, len(attrs), generic_time, column_time))
+    test_case.assertEqual(generic_errors, [])
+    test_case.assertEqual(column_errors, [])
+    WideRow.objects.reset()
+
+
+def benchmark_column_store(test_case, n_objs):
+    """ Compare reducing and updating the numeric attributes of a columnar model object by object and column-wise """
+    params = ColumnarParameter.bulk_create({
+        'id': ['param_{}'.format(i_obj) for i_obj in range(n_objs)],
+        'value': [float(i_obj) for i_obj in range(n_objs)],
+        'count': list(range(n_objs)),
+    })
+
+    start = time.process_time()
+    generic_sum = sum(param.value * param.count for param in params)
+    for param in params:
+        param.value = param.value * 2.
+    generic_time = time.process_time() - start
+
+    start = time.process_time()
+    column_sum = float((ColumnarParameter.column('value') * ColumnarParameter.column('count')).sum())
+    ColumnarParameter.set_column('value', ColumnarParameter.column('value') * 0.5)
+    column_time = time.process_time() - start
+
+    logger.info('reduce and update {} values: by object: {:.3f} s; by column: {:.3f} s'.format(
+        n_objs, generic_time, column_time))
+    test_case.assertAlmostEqual(column_sum / generic_sum, 2.)
+    test_case.assertEqual(params[-1].value, float(n_objs - 1))
+    ColumnarParameter.objects.reset()
+
+
+def benchmark_snapshots(test_case, n_gene, n_rna, n_prot, n_met, n_steps=10):
+    """ Compare copying a model with taking and restoring a snapshot of it at each step of a parameter sweep """
+    model = generate_model(n_gene, n_rna, n_prot, n_met)
+    gene = model.genes[0]
+
+    start = time.process_time()
+    for i_step in range(n_steps):
+        copy = model.copy()
+        copy.genes[0].id = 'Gene_sweep_{}'.format(i_step)
+    copy_time = time.process_time() - start
+
+    start = time.process_time()
+    snapshot = model.snapshot()
+    for i_step in range(n_steps):
+        gene.id = 'Gene_sweep_{}'.format(i_step)
+        snapshot.restore()
+    snapshot.release()
+    snapshot_time = time.process_time() - start
+
+    logger.info('{} steps of a sweep of a model with {} objects: copy: {:.3f} s; snapshot: {:.3f} s'.format(
+        n_steps, len(get_all_objects(model)), copy_time, snapshot_time))
+    test_case.assertEqual(gene.id, 'Gene_1')
+    test_case.assertFalse(copy.is_equal(model))
+
+
+def benchmark_expression_copy(test_case, n_exprs, n_params=100):
+    """ Compare copying a model with :obj:`n_exprs` expressions with parsing the expressions again """
+    model = ExpressionModel(id='model')
+    params = [ExpressionParameter(model=model, id='param_{}'.format(i_param), value=float(i_param))
+              for i_param in range(n_params)]
+    params_by_id = {ExpressionParameter: {param.id: param for param in params}}
+    values = []
+    for i_expr in range(n_exprs):
+        value = '{} * param_{} + param_{}'.format(i_expr, i_expr % n_params, (i_expr * 7) % n_params)
+        expression, error = RateLawExpression.deserialize(value, params_by_id)
+        assert error is None, str(error)
+        RateLaw(model=model, id='rate_law_{}'.format(i_expr), expression=expression)
+        values.append(value)
+
+    # the cost of parsing the expressions again, as copies did previously
+    start = time.process_time()
+    for value in values:
+        parsed_expression = ParsedExpression(RateLawExpression, 'expression', value, params_by_id)
+        parsed_expression.tokenize()
+        LinearParsedExpressionValidator().validate(parsed_expression)
+    parse_time = time.process_time() - start
+
+    start = time.process_time()
+    copy = model.copy()
+    copy_time = time.process_time() - start
+
+    logger.info('copy model with {} expressions: parse expressions: {:.3f} s; copy model: {:.3f} s'.format(
+        n_exprs, parse_time, copy_time))
+    test_case.assertEqual(len(copy.rate_laws), n_exprs)
+    rate_law = copy.rate_laws[-1]
+    test_case.assertIsNot(rate_law.expression, model.rate_laws[-1].expression)
+    test_case.assertEqual(set(rate_law.expression._parsed_expression.related_objects[ExpressionParameter].values()),
+                          set(rate_law.expression.parameters))
+    test_case.assertEqual(set(rate_law.expression.parameters) & set(params), set())
+    test_case.assertTrue(copy.is_equal(model))
+
+
+def benchmark_merge_all(test_case, n_gene, n_rna, n_prot, n_met, n_models=4):
+    """ Compare merging several models pairwise with merging them at once """
+    models = [generate_model(n_gene, n_rna, n_prot, n_met) for i_model in range(n_models)]
+    start = time.process_time()
+    for model in models[1:]:
+        models[0].merge(model)
+    pairwise_time = time.process_time() - start
+
+    models = [generate_model(n_gene, n_rna, n_prot, n_met) for i_model in range(n_models)]
+    start = time.process_time()
+    merged = core.Model.merge_all(models)
+    k_way_time = time.process_time() - start
+
+    logger.info('merge {} models with {} objects: pairwise: {:.3f} s; at once: {:.3f} s'.format(
+        n_models, len(get_all_objects(merged)), pairwise_time, k_way_time))
+    test_case.assertTrue(merged.is_equal(generate_model(n_gene, n_rna, n_prot, n_met)))
+
+
+def benchmark_subgraph_view(test_case, n_gene, n_rna, n_prot, n_met):
+    """ Compare validating a view of the proteome of a model with cutting the proteome from the model and
+    validating it """
+    model = generate_model(n_gene, n_rna, n_prot, n_met)
+
+    start = time.process_time()
+    view = model.get_subgraph_view(kind='proteome')
+    view_errors = core.Validator().run(view)
+    view_time = time.process_time() - start
+    test_case.assertEqual(len(model.reactions), n_gene * n_rna * n_prot)
+
+    start = time.process_time()
+    model.cut(kind='proteome')
+    cut_errors = core.Validator().run(model, get_related=True)
+    cut_time = time.process_time() - start
+
+    logger.info('validate proteome of {} objects: view: {:.3f} s; cut: {:.3f} s'.format(
+        len(view), view_time, cut_time))
+    test_case.assertEqual(view_errors, None)
+    test_case.assertEqual(cut_errors, None)
+    test_case.assertEqual(len(view), 1 + n_gene * (1 + n_rna * (1 + n_prot)))
+    test_case.assertEqual(set(view), set(model.get_related()))
+
+
+def benchmark_diff_workbooks(test_case, n_gene, n_rna, n_prot, n_met):
+    """ Measure the time required to compare two workbooks with the default `diff` command """
+    schema_filename = os.path.join(test_case.dirname, 'schema.py')
+    with open(schema_filename, 'w') as file:
+        file.write(DIFF_SCHEMA_SOURCE)
+    schema = utils.get_schema(schema_filename)
+    models = list(utils.get_models(schema).values())
+
+    model = generate_model(n_gene, n_rna, n_prot, n_met, model_cls=schema.Model)
+    filename_1 = os.path.join(test_case.dirname, 'model_1.xlsx')
+    WorkbookWriter().run(filename_1, [model], models=models)
+
+    rxn = model.reactions[-1]
+    rxn.metabolites.remove(rxn.metabolites[0])
+    rxn.metabolites.append(model.metabolites[(len(model.reactions) + 3) % n_met])
+    filename_2 = os.path.join(test_case.dirname, 'model_2.xlsx')
+    WorkbookWriter().run(filename_2, [model], models=models)
+
+    start = time.process_time()
+    with __main__.App(argv=['diff', schema_filename, 'Model', filename_1, filename_1]) as app:
+        app.run()
+    with test_case.assertRaisesRegex(SystemExit, 'No matching element Metabolite_'):
+        with __main__.App(argv=['diff', schema_filename, 'Model', filename_1, filename_2]) as app:
+            app.run()
+    diff_time = time.process_time() - start
+
+    logger.info('diff workbooks of {} objects: {:.3f} s'.format(len(get_all_objects(model)), diff_time))
+
+
+def benchmark_ordered_index(test_case, n_values, n_queries=100):
+    """ Compare range queries with an ordered index to linear scans over :obj:`Manager.all`, and time updates of
+    the indexed values """
+    Parameter.objects.reset()
+    # the manager references instances weakly, so hold strong references to them
+    params = Parameter.bulk_create({
+        'id': ['param_{}'.format(i_value) for i_value in range(n_values)],
+        'value': [float((i_value * 7919) % n_values) for i_value in range(n_values)],
+    })
+
+    start = time.process_time()
+    Parameter.objects.insert_all_new()
+    index_time = time.process_time() - start
+
+    bounds = [(float(i_query * n_values // n_queries), float(i_query * n_values // n_queries + 10))
+              for i_query in range(n_queries)]
+
+    start = time.process_time()
+    scan_results = []
+    for lower, upper in bounds:
+        scan_results.append([param for param in Parameter.objects.all() if lower <= param.value <= upper])
+    scan_time = time.process_time() - start
+
+    start = time.process_time()
+    index_results = []
+    for lower, upper in bounds:
+        index_results.append(Parameter.objects.filter(value__between=(lower, upper)))
+    query_time = time.process_time() - start
+
+    # time updates of the values of indexed instances, each of which removes and re-inserts an entry
+    n_updates = min(n_values, 10 ** 5)
+    start = time.process_time()
+    for i_update in range(n_updates):
+        params[(i_update * 104729) % n_values].value = float((i_update * 31) % n_values)
+    update_time = time.process_time() - start
+
+    logger.info(('ordered index of {} values: build: {:.3f} s; scan: {:.1f} us/query; index: {:.1f} us/query; '
+                 'update: {:.1f} us/update').format(
+        n_values, index_time, scan_time / n_queries * 1e6, query_time / n_queries * 1e6,
+        update_time / n_updates * 1e6))
+    for scan_result, index_result in zip(scan_results, index_results):
+        test_case.assertEqual(set(index_result), set(scan_result))
+
+    lower, upper = bounds[1]
+    test_case.assertEqual(set(Parameter.objects.filter(value__between=(lower, upper))),
+                          set(param for param in params if lower <= param.value <= upper))
+    Parameter.objects.reset()
+
+
+def generate_schema_source(n_models):
+    """ Generate the source code of a schema whose models are related to the previous and next models """
+    lines = ['from obj_tables import core', '']
+    for i_model in range(n_models):
+        lines.append('class Model{}(core.Model):'.format(i_model))
+        lines.append('    id = core.StringAttribute(primary=True, unique=True)')
+        if i_model:
+            lines.append("    prev = core.ManyToOneAttribute(Model{}, related_name='next_models')".format(i_model - 1))
+        if i_model < n_models - 1:
+            lines.append("    next = core.OneToOneAttribute('Model{}', related_name='prev_model')".format(i_model + 1))
+        lines.append('')
+    return '\n'.join(lines)
+
+
+def get_related_without_traversal_plans(obj):
+    """ Get the objects related to an object by inspecting the attributes of each object """
+    related_objs = {obj: None}
+    objs_to_explore = [obj]
+    while objs_to_explore:
+        obj = objs_to_explore.pop()
+        cls = obj.__class__
+        for attr_name, attr in itertools.chain(cls.Meta.attributes.items(), cls.Meta.related_attributes.items()):
+            if isinstance(attr, core.RelatedAttribute):
+                value = getattr(obj, attr_name)
+                if isinstance(value, list):
+                    related_values = value
+                elif value is not None:
+                    related_values = [value]
+                else:
+                    related_values = []
+                for related_obj in related_values:
+                    if related_obj not in related_objs:
+                        related_objs[related_obj] = None
+                        objs_to_explore.append(related_obj)
+    return list(related_objs)
+
+
 def get_all_objects(model):
     return [model] \
         + model.genes \
@@ -122,6 +649,24 @@ class TestMediumDataset(TestDataset):
         objects = model.get_related()
         self.assertEqual(set(objects), set(get_all_objects(model)))
 
+    def test_get_all_related_benchmark(self):
+        """ Compare the per-object cost of walking the object graph with and without traversal plans """
+        model = generate_model(self.n_gene, self.n_rna, self.n_prot, self.n_met)
+        n_objs = len(get_all_objects(model))
+
+        start = time.process_time()
+        objs_without_plans = get_related_without_traversal_plans(model)
+        time_without_plans = time.process_time() - start
+
+        start = time.process_time()
+        objs_with_plans = core.Model.get_all_related([model])
+        time_with_plans = time.process_time() - start
+
+        logger.info('get_all_related: without plans: {:.2f} us/object; with plans: {:.2f} us/object'.format(
+            time_without_plans / n_objs * 1e6, time_with_plans / n_objs * 1e6))
+        self.assertEqual(set(objs_with_plans), set(objs_without_plans))
+        self.assertEqual(len(objs_with_plans), n_objs)
+
     def test_normalize(self):
         model = generate_model(self.n_gene, self.n_rna, self.n_prot, self.n_met)
         utils.randomize_object_graph(model)
@@ -142,12 +687,54 @@ class TestMediumDataset(TestDataset):
         for rxn in model.reactions:
             self.assertTrue(is_sorted([met.id for met in rxn.metabolites]))
 
+    def test_normalize_benchmark(self):
+        """ Measure the time required to normalize a model and to re-normalize an unchanged model """
+        model = generate_model(self.n_gene, self.n_rna, self.n_prot, self.n_met)
+        utils.randomize_object_graph(model)
+
+        start = time.process_time()
+        model.normalize()
+        first_time = time.process_time() - start
+
+        start = time.process_time()
+        model.normalize()
+        model.reactions[0].normalize()
+        repeat_time = time.process_time() - start
+
+        start = time.process_time()
+        model.normalize(force=True)
+        forced_time = time.process_time() - start
+
+        logger.info('normalize: first: {:.3f} s; unchanged: {:.6f} s; forced: {:.3f} s'.format(
+            first_time, repeat_time, forced_time))
+        self.assertLess(repeat_time, first_time)
+        self.assertTrue(is_sorted([rxn.id for rxn in model.reactions]))
+
     def test_is_equal(self):
         model = generate_model(self.n_gene, self.n_rna, self.n_prot, self.n_met)
         model2 = generate_model(self.n_gene, self.n_rna, self.n_prot, self.n_met)
         utils.randomize_object_graph(model2)
         self.assertTrue(model2.is_equal(model))
 
+    def test_fingerprint(self):
+        """ Compare the time required to compare models with :obj:`Model.is_equal` and with fingerprints """
+        model = generate_model(self.n_gene, self.n_rna, self.n_prot, self.n_met)
+        model2 = generate_model(self.n_gene, self.n_rna, self.n_prot, self.n_met)
+        utils.randomize_object_graph(model2)
+
+        start = time.process_time()
+        self.assertEqual(core.Model.fingerprint_graph([model]), core.Model.fingerprint_graph([model2]))
+        fingerprint_time = time.process_time() - start
+
+        start = time.process_time()
+        self.assertTrue(model2.is_equal(model))
+        is_equal_time = time.process_time() - start
+
+        logger.info('fingerprint_graph: {:.3f} s; is_equal: {:.3f} s'.format(fingerprint_time, is_equal_time))
+
+        model2.reactions[0].id = 'Reaction_0'
+        self.assertNotEqual(model.fingerprint(), model2.fingerprint())
+
     def test_difference(self):
         model = generate_model(self.n_gene, self.n_rna, self.n_prot, self.n_met)
         model2 = generate_model(self.n_gene, self.n_rna, self.n_prot, self.n_met)
@@ -159,6 +746,69 @@ class TestMediumDataset(TestDataset):
         errors = core.Validator().run(model)
         self.assertEqual(errors, None)
 
+    def test_incremental_validate_benchmark(self):
+        """ Compare the time required to revalidate a model after a small edit fully and incrementally """
+        model = generate_model(self.n_gene, self.n_rna, self.n_prot, self.n_met)
+        store = core.ObjectStore()
+        store.add_all([model], get_related=True)
+        validator = core.Validator()
+        self.assertEqual(validator.validate_incremental(store), None)
+
+        model.genes[0].id = 'gene_renamed'
+
+        start = time.perf_counter()
+        full_errors = validator.run(model, get_related=True)
+        full_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        incremental_errors = validator.validate_incremental(store)
+        incremental_time = time.perf_counter() - start
+
+        logger.info('revalidate {} objects after an edit: full: {:.3f} s; incremental: {:.6f} s'.format(
+            len(store), full_time, incremental_time))
+        self.assertEqual(full_errors, None)
+        self.assertEqual(incremental_errors, None)
+        store.release()
+
+    def test_parallel_validate_benchmark(self):
+        """ Compare the time required to validate objects serially and with a pool of worker processes """
+        model = generate_model(self.n_gene, self.n_rna, self.n_prot, self.n_met)
+        all_objects = get_all_objects(model)
+
+        start = time.perf_counter()
+        serial_errors = core.Validator().validate(all_objects)
+        serial_time = time.perf_counter() - start
+
+        validator = core.Validator(workers=4)
+        validator.min_objects_per_shard = 100
+        start = time.perf_counter()
+        parallel_errors = validator.validate(all_objects)
+        parallel_time = time.perf_counter() - start
+
+        logger.info('validate {} objects: serial: {:.3f} s; 4 workers: {:.3f} s'.format(
+            len(all_objects), serial_time, parallel_time))
+        self.assertEqual(serial_errors, None)
+        self.assertEqual(parallel_errors, None)
+
+    def test_max_errors_benchmark(self):
+        """ Compare the time required to validate and report the errors of an invalid model fully and fail-fast """
+        model = generate_model(self.n_gene, self.n_rna, self.n_prot, self.n_met)
+        all_objects = get_all_objects(model)
+        for rxn in model.reactions:
+            rxn.id = 'invalid reaction id'
+
+        start = time.perf_counter()
+        all_errors = str(core.Validator().validate(all_objects))
+        full_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        some_errors = str(core.Validator(max_errors=10).validate(all_objects))
+        fail_fast_time = time.perf_counter() - start
+
+        logger.info('validate and report the errors of {} objects: all errors: {:.3f} s; '
+                    'first 10 errors: {:.3f} s'.format(len(all_objects), full_time, fail_fast_time))
+        self.assertLess(len(some_errors), len(all_errors))
+
     def test_read_write(self):
         model = generate_model(self.n_gene, self.n_rna, self.n_prot, self.n_met)
 
@@ -169,6 +819,95 @@ class TestMediumDataset(TestDataset):
         model2 = objects2[Model].pop()
         self.assertTrue(model2.is_equal(model))
 
+    def test_compact_read_write(self):
+        model = generate_model(self.n_gene, self.n_rna, self.n_prot, self.n_met, model_cls=CompactModel)
+        self.assertEqual(core.Validator().run(model, get_related=True), None)
+
+        filename = os.path.join(self.dirname, 'test.xlsx')
+        WorkbookWriter().run(filename, [model], models=COMPACT_MODELS)
+        objects2 = WorkbookReader().run(filename, models=COMPACT_MODELS)
+
+        model2 = objects2[CompactModel].pop()
+        self.assertTrue(model2.is_equal(model))
+
+    def test_compact_memory(self):
+        """ Measure the memory used by regular and compact models """
+        sizes = {}
+        for model_cls in [Model, CompactModel]:
+            tracemalloc.start()
+            model = generate_model(self.n_gene, self.n_rna, self.n_prot, self.n_met, model_cls=model_cls)
+            sizes[model_cls], _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            model = None
+
+        logger.info('Regular: {:.1f} KB; compact: {:.1f} KB'.format(sizes[Model] / 1024, sizes[CompactModel] / 1024))
+        self.assertLess(sizes[CompactModel], sizes[Model])
+
+
+    def test_bulk_create(self):
+        """ Compare the time required to construct models object by object and in bulk """
+        for model_cls in [Model, CompactModel]:
+            start = time.process_time()
+            model = generate_model(self.n_gene, self.n_rna, self.n_prot, self.n_met, model_cls=model_cls)
+            init_time = time.process_time() - start
+
+            start = time.process_time()
+            model2 = generate_model_in_bulk(self.n_gene, self.n_rna, self.n_prot, self.n_met, model_cls=model_cls)
+            bulk_time = time.process_time() - start
+
+            logger.info('{}: __init__: {:.3f} s; bulk_create: {:.3f} s'.format(
+                model_cls.__name__, init_time, bulk_time))
+            self.assertTrue(model2.is_equal(model))
+            self.assertEqual(core.Validator().run(model2, get_related=True), None)
+
+    def test_ordered_index_benchmark(self):
+        benchmark_ordered_index(self, 10 ** 4)
+
+    def test_code_generator_benchmark(self):
+        benchmark_code_generator(self, 10 ** 4)
+
+    def test_column_validation_benchmark(self):
+        benchmark_column_validation(self, 10 ** 4)
+
+    def test_column_store_benchmark(self):
+        benchmark_column_store(self, 10 ** 4)
+
+    def test_snapshot_benchmark(self):
+        benchmark_snapshots(self, self.n_gene, self.n_rna, self.n_prot, self.n_met)
+
+    def test_expression_copy_benchmark(self):
+        benchmark_expression_copy(self, 10 ** 3)
+
+    def test_merge_all_benchmark(self):
+        benchmark_merge_all(self, self.n_gene, self.n_rna, self.n_prot, self.n_met)
+
+    def test_subgraph_view_benchmark(self):
+        benchmark_subgraph_view(self, self.n_gene, self.n_rna, self.n_prot, self.n_met)
+
+    def test_diff_workbooks_benchmark(self):
+        benchmark_diff_workbooks(self, self.n_gene, self.n_rna, self.n_prot, self.n_met)
+
+    def test_schema_import_benchmark(self):
+        """ Measure the time required to create a schema with 500 related models """
+        n_models = 500
+        source = generate_schema_source(n_models)
+        module = types.ModuleType('large_generated_schema')
+
+        start = time.process_time()
+        exec(compile(source, '<large_generated_schema>', 'exec'), module.__dict__)
+        import_time = time.process_time() - start
+
+        logger.info('import schema with {} models: {:.3f} s'.format(n_models, import_time))
+        models = [getattr(module, 'Model{}'.format(i_model)) for i_model in range(n_models)]
+        for i_model, model in enumerate(models):
+            if i_model:
+                self.assertIs(model.Meta.attributes['prev'].related_class, models[i_model - 1])
+                self.assertIn('prev_model', model.Meta.related_attributes)
+            if i_model < n_models - 1:
+                self.assertIs(model.Meta.attributes['next'].related_class, models[i_model + 1])
+                self.assertIs(model.Meta.local_attributes['next'].related_class, models[i_model + 1])
+                self.assertIn('next_models', model.Meta.related_attributes)
+
 
 @unittest.skip("Skipped because test is long")
 class TestLargeDataset(TestDataset):
@@ -192,6 +931,33 @@ class TestLargeDataset(TestDataset):
         WorkbookWriter().run(filename, all_objects, models=[Model, Gene, Rna, Protein, Metabolite, Reaction, ], get_related=False)
         objects2 = WorkbookReader().run(filename, models=[Model, Gene, Rna, Protein, Metabolite, Reaction, ])
 
+    def test_ordered_index_benchmark(self):
+        benchmark_ordered_index(self, 10 ** 6)
+
+    def test_code_generator_benchmark(self):
+        benchmark_code_generator(self, 10 ** 6)
+
+    def test_column_validation_benchmark(self):
+        benchmark_column_validation(self, 10 ** 6)
+
+    def test_column_store_benchmark(self):
+        benchmark_column_store(self, 10 ** 6)
+
+    def test_snapshot_benchmark(self):
+        benchmark_snapshots(self, self.n_gene, self.n_rna, self.n_prot, self.n_met)
+
+    def test_expression_copy_benchmark(self):
+        benchmark_expression_copy(self, 10 ** 5)
+
+    def test_merge_all_benchmark(self):
+        benchmark_merge_all(self, self.n_gene, self.n_rna, self.n_prot, self.n_met, n_models=10)
+
+    def test_subgraph_view_benchmark(self):
+        benchmark_subgraph_view(self, self.n_gene, self.n_rna, self.n_prot, self.n_met)
+
+    def test_diff_workbooks_benchmark(self):
+        benchmark_diff_workbooks(self, self.n_gene, self.n_rna, self.n_prot, self.n_met)
+
 
 @unittest.skip("Skipped because test is long")
 class TestHugeDataset(TestLargeDataset):
@@ -211,6 +211,9 @@ class TestCli(unittest.TestCase):
         with self.assertRaises(SystemExit):
             with __main__.App(argv=['validate', csv_file, xl_file_2]) as app:
                 app.run()
+        with self.assertRaisesRegex(SystemExit, 'Validation stopped after 1 error'):
+            with __main__.App(argv=['validate', csv_file, xl_file_2, '--max-errors', '1']) as app:
+                app.run()
 
     def test_viz_schema(self):
         csv_file = os.path.join('tests', 'fixtures', 'declarative_schema', 'schema.csv')
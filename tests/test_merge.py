@@ -601,3 +601,116 @@ class MergeTestCase(unittest.TestCase):
 
         p_a_1.merge(p_b_1)
         self.assertTrue(p_a_1.is_equal(p_c_1))
+
+    def test_merge_all(self):
+        class Parent(core.Model):
+            id = core.SlugAttribute()
+
+        class Child(core.Model):
+            id = core.SlugAttribute()
+            name = core.StringAttribute(unique=True)
+            parents = core.ManyToManyAttribute(Parent, related_name='children')
+
+        def gen_models(i):
+            p_1 = Parent(id='p_1')
+            p_1.children.create(id='c_1', name='C 1')
+            p_1.children.create(id='c_{}'.format(i + 1), name='C {}'.format(i + 1))
+            Parent(id='p_{}'.format(i + 1)).children.append(p_1.children[0])
+            return p_1
+
+        p_a_1 = gen_models(1)
+        p_b_1 = gen_models(2)
+        p_c_1 = gen_models(3)
+        self.assertIs(core.Model.merge_all([p_a_1, p_b_1, p_c_1]), p_a_1)
+
+        p_d_1 = gen_models(1)
+        p_d_1.merge(gen_models(2))
+        p_d_1.merge(gen_models(3))
+        self.assertTrue(p_a_1.is_equal(p_d_1))
+        self.assertEqual(sorted(child.id for child in p_a_1.children), ['c_1', 'c_2', 'c_3', 'c_4'])
+        self.assertEqual(sorted(parent.id for parent in p_a_1.children.get_one(id='c_1').parents),
+                         ['p_1', 'p_2', 'p_3', 'p_4'])
+        self.assertEqual(len(p_b_1.children), 0)
+
+        # merge into a validated store
+        p_a_1 = gen_models(1)
+        store = core.ObjectStore()
+        store.add_all([p_a_1], get_related=True)
+        self.assertEqual(core.Validator().validate_incremental(store), None)
+        core.Model.merge_all([p_a_1, gen_models(2)], store=store)
+        self.assertIn(p_a_1.children.get_one(id='c_3'), store)
+        self.assertEqual(store.pop_dirty(), ({}, []))
+        store.release()
+
+        # only the changed objects are validated
+        p_a_1 = gen_models(1)
+        p_b_1 = gen_models(2)
+        p_b_1.children.get_one(id='c_3').name = 'C 2'
+        with self.assertRaisesRegex(ValueError, 'repeated'):
+            core.Model.merge_all([p_a_1, p_b_1])
+        core.Model.merge_all([gen_models(1), gen_models(2)], validate=False)
+
+        # test errors
+        with self.assertRaisesRegex(ValueError, 'At least one model'):
+            core.Model.merge_all([])
+
+        p_b_1 = gen_models(2)
+        p_b_1.children.create(id='c_3')
+        with self.assertRaisesRegex(ValueError, 'is not unique'):
+            core.Model.merge_all([gen_models(1), p_b_1])
+
+        p_b_1 = gen_models(2)
+        p_b_1.children.create(id='p_1', parents=[Parent(id='p_1')])
+        with self.assertRaisesRegex(ValueError, 'is not unique'):
+            core.Model.merge_all([gen_models(1), p_b_1])
+
+        p_a_1 = gen_models(1)
+        p_b_1 = gen_models(2)
+        p_b_1.id = 'p_2'
+        with self.assertRaisesRegex(ValueError, 'Other must map to self'):
+            core.Model.merge_all([p_a_1, p_b_1])
+
+    def test_merge_all_children_of_other_models(self):
+        class Root(core.Model):
+            id = core.SlugAttribute()
+
+        class Detail(core.Model):
+            id = core.SlugAttribute()
+            root = core.OneToOneAttribute(Root, related_name='detail')
+
+        class Item(core.Model):
+            id = core.SlugAttribute()
+            root = core.ManyToOneAttribute(Root, related_name='items')
+            detail = core.ManyToOneAttribute(Detail, related_name='items')
+
+        def gen_models():
+            root_1 = Root(id='root')
+            root_1.items.create(id='i_1')
+
+            # the detail and the second item of the second model match those of the third model
+            root_2 = Root(id='root')
+            detail_2 = Detail(id='d', root=root_2)
+            root_2.items.create(id='i_1')
+            root_2.items.create(id='i_2', detail=detail_2)
+
+            root_3 = Root(id='root')
+            detail_3 = Detail(id='d', root=root_3)
+            root_3.items.create(id='i_2', detail=detail_3)
+            root_3.items.create(id='i_3', detail=detail_3)
+
+            return (root_1, root_2, root_3)
+
+        root_1, root_2, root_3 = gen_models()
+        detail_2 = root_2.detail
+        self.assertIs(core.Model.merge_all([root_1, root_2, root_3]), root_1)
+        self.assertIs(root_1.detail, detail_2)
+        self.assertEqual(sorted(item.id for item in root_1.items), ['i_1', 'i_2', 'i_3'])
+        self.assertEqual(sorted(item.id for item in detail_2.items), ['i_2', 'i_3'])
+        self.assertEqual(root_2.detail, None)
+        self.assertEqual(root_3.detail, None)
+        self.assertEqual(len(root_3.items), 0)
+
+        pairwise_root_1, pairwise_root_2, pairwise_root_3 = gen_models()
+        pairwise_root_1.merge(pairwise_root_2)
+        pairwise_root_1.merge(pairwise_root_3)
+        self.assertTrue(root_1.is_equal(pairwise_root_1))
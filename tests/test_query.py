@@ -0,0 +1,191 @@
+""" Test declarative queries
+
+:Author: Jonathan Karr <karr@mssm.edu>
+:Date: 2020-06-01
+:Copyright: 2020, Karr Lab
+:License: MIT
+"""
+
+from obj_tables import core
+from obj_tables.query import Q
+import unittest
+
+
+class QueryGene(core.Model):
+    id = core.StringAttribute(primary=True, unique=True)
+
+    class Meta(core.Model.Meta):
+        indexed_attrs_tuples = (('id',),)
+
+
+class QueryPseudogene(QueryGene):
+    class Meta(QueryGene.Meta):
+        indexed_attrs_tuples = (('id',),)
+
+
+class QueryRna(core.Model):
+    id = core.StringAttribute(primary=True, unique=True)
+    gene = core.ManyToOneAttribute(QueryGene, related_name='rnas')
+
+
+class QueryProtein(core.Model):
+    id = core.StringAttribute(primary=True, unique=True)
+    rna = core.ManyToOneAttribute(QueryRna, related_name='proteins')
+
+
+class QueryReaction(core.Model):
+    id = core.StringAttribute(primary=True, unique=True)
+    enzyme = core.ManyToOneAttribute(QueryProtein, related_name='reactions')
+    flux = core.FloatAttribute()
+
+    class Meta(core.Model.Meta):
+        indexed_attrs_tuples = (('id',),)
+        ordered_indexes = ('flux',)
+
+
+class QueryTestCase(unittest.TestCase):
+    def setUp(self):
+        for model in [QueryGene, QueryPseudogene, QueryRna, QueryProtein, QueryReaction]:
+            model.objects.reset()
+
+        self.genes = [QueryGene(id='g{}'.format(i)) for i in range(3)]
+        self.rnas = [QueryRna(id='r{}'.format(i), gene=self.genes[i % 3]) for i in range(6)]
+        self.prots = [QueryProtein(id='p{}'.format(i), rna=self.rnas[i]) for i in range(6)]
+        self.rxns = [QueryReaction(id='x{}'.format(i), enzyme=self.prots[i % 6], flux=float(i - 4))
+                     for i in range(12)]
+        self.rxns.append(QueryReaction(id='x_no_enzyme', flux=1.))
+        for model in [QueryGene, QueryPseudogene, QueryRna, QueryProtein, QueryReaction]:
+            model.objects.insert_all_new()
+
+    def tearDown(self):
+        for model in [QueryGene, QueryPseudogene, QueryRna, QueryProtein, QueryReaction]:
+            model.objects.reset()
+
+    def get_expected(self, objs, condition):
+        return set(obj for obj in objs if condition(obj))
+
+    def test_where(self):
+        query = Q(QueryReaction).where(enzyme__rna__gene__id='g1', flux__gt=0)
+        expected = self.get_expected(self.rxns, lambda rxn: rxn.enzyme and rxn.enzyme.rna.gene.id == 'g1'
+                                     and rxn.flux > 0)
+        self.assertEqual(set(query), expected)
+        self.assertEqual(len(expected), 2)
+        self.assertEqual(query.count(), 2)
+        self.assertTrue(query.exists())
+        self.assertIn(query.first(), expected)
+
+        # queries are immutable and conditions are combined
+        self.assertEqual(len(Q(QueryReaction).where(enzyme__rna__gene__id='g1').all()), 4)
+        self.assertEqual(query.where(id='x10').all(), [self.rxns[10]])
+        self.assertEqual(query.where(id='x0').all(), [])
+        self.assertEqual(query.where(id='x0').first(), None)
+        self.assertFalse(query.where(id='x0').exists())
+
+    def test_lookups(self):
+        rxns = self.rxns
+        self.assertEqual(set(Q(QueryReaction).where(flux=1.)), set([rxns[5], rxns[12]]))
+        self.assertEqual(set(Q(QueryReaction).where(flux__ne=1.)), set(rxns) - set([rxns[5], rxns[12]]))
+        self.assertEqual(Q(QueryReaction).where(flux__gte=6.).all(), [rxns[10], rxns[11]])
+        self.assertEqual(Q(QueryReaction).where(flux__lt=-3.).all(), [rxns[0]])
+        self.assertEqual(Q(QueryReaction).where(flux__lte=-3.).all(), [rxns[0], rxns[1]])
+        self.assertEqual(set(Q(QueryReaction).where(flux__between=(-1., 0.))), set([rxns[3], rxns[4]]))
+        self.assertEqual(set(Q(QueryReaction).where(id__prefix='x1')), set([rxns[1], rxns[10], rxns[11]]))
+        self.assertEqual(set(Q(QueryReaction).where(id__in=['x1', 'x2'])), set([rxns[1], rxns[2]]))
+        self.assertEqual(Q(QueryReaction).where(enzyme__isnull=True).all(), [rxns[12]])
+        self.assertEqual(Q(QueryReaction).where(enzyme=self.prots[0]).count(), 2)
+        self.assertEqual(set(Q(QueryReaction).where(enzyme__in=[self.prots[0]])), set([rxns[0], rxns[6]]))
+
+        # reverse and *-to-many paths
+        self.assertEqual(set(Q(QueryGene).where(rnas__proteins__reactions__flux__gt=5.)),
+                         set([self.genes[1], self.genes[2]]))
+        self.assertEqual(Q(QueryGene).where(rnas__proteins__reactions__id='x_no_enzyme').all(), [])
+
+    def test_plan(self):
+        query = Q(QueryReaction).where(enzyme__rna__gene__id='g1', flux__gt=0)
+        driver, driver_objs, filters = query.plan()
+        self.assertEqual(driver.model, QueryGene)
+        self.assertEqual(driver_objs, [self.genes[1]])
+        self.assertEqual([condition.key for condition in filters], ['flux__gt'])
+        self.assertEqual(query.explain(), '\n'.join([
+            'index QueryGene.id exact (1 objects)',
+            'join QueryGene.rnas',
+            'join QueryRna.proteins',
+            'join QueryProtein.reactions',
+            'filter flux__gt',
+        ]))
+
+        # the most selective index drives the query
+        driver, _, _ = Q(QueryReaction).where(flux__gt=-10., id='x1').plan()
+        self.assertEqual(driver.attr_name, 'id')
+
+        # queries without indexed conditions scan the collection
+        query = Q(QueryReaction, objects=self.rxns[:6]).where(enzyme__rna__gene__id='g1')
+        self.assertEqual(query.plan()[0], None)
+        self.assertEqual(query.explain(), 'scan QueryReaction\nfilter enzyme__rna__gene__id')
+        self.assertEqual(query.all(), [self.rxns[1], self.rxns[4]])
+
+    def test_object_store(self):
+        store = core.ObjectStore(self.genes + self.rnas + self.prots + self.rxns[:6])
+        query = Q(QueryReaction, objects=store).where(enzyme__rna__gene__id='g1')
+        self.assertEqual(query.plan()[0].model, QueryGene)
+        self.assertEqual(set(query), set([self.rxns[1], self.rxns[4]]))
+
+        self.assertEqual(Q(QueryReaction, objects=store).where(flux__gt=0.).all(), [self.rxns[5]])
+
+    def test_subclasses(self):
+        pseudogene = QueryPseudogene(id='pg')
+        rna = QueryRna(id='r_pg', gene=pseudogene)
+        prot = QueryProtein(id='p_pg', rna=rna)
+        rxn = QueryReaction(id='x_pg', enzyme=prot, flux=1.)
+        for model in [QueryPseudogene, QueryRna, QueryProtein, QueryReaction]:
+            model.objects.insert_all_new()
+
+        # the indices of the subclasses of the model of the driving condition are used
+        query = Q(QueryReaction).where(enzyme__rna__gene__id='pg')
+        self.assertEqual(query.plan()[1], [pseudogene])
+        self.assertEqual(query.all(), [rxn])
+
+        store = core.ObjectStore([pseudogene, rna, prot, rxn])
+        query = Q(QueryReaction, objects=store).where(enzyme__rna__gene__id='pg')
+        self.assertEqual(query.plan()[1], [pseudogene])
+        self.assertEqual(query.all(), [rxn])
+
+        # queries only return instances of the queried model
+        self.assertEqual(Q(QueryGene).where(id='pg').all(), [])
+        self.assertEqual(Q(QueryGene, objects=store).where(id='pg').all(), [])
+
+    def test_paths_without_inverse_attributes(self):
+        class QueryNote(core.Model):
+            id = core.StringAttribute(primary=True, unique=True)
+            gene = core.ManyToOneAttribute(QueryGene)
+
+        notes = [QueryNote(id='n{}'.format(i), gene=self.genes[i % 3]) for i in range(6)]
+        store = core.ObjectStore(self.genes + notes)
+        query = Q(QueryNote, objects=store).where(gene__id='g1')
+        self.assertEqual(query.plan()[0], None)
+        self.assertEqual(query.explain(), 'scan QueryNote\nfilter gene__id')
+        self.assertEqual(query.all(), [notes[1], notes[4]])
+
+    def test_lazy(self):
+        def get_values(obj):
+            n_evaluations[0] += 1
+            return orig_get_values(obj)
+
+        query = Q(QueryReaction).where(flux__gt=-10., enzyme__id__prefix='p')
+        condition = query.conditions[1]
+        orig_get_values = condition.get_values
+        condition.get_values = get_values
+        n_evaluations = [0]
+        self.assertIsNotNone(query.first())
+        self.assertEqual(n_evaluations[0], 1)
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ValueError, 'does not have attribute'):
+            Q(QueryReaction).where(enzyme__undefined=1)
+        with self.assertRaisesRegex(ValueError, 'is not a related attribute'):
+            Q(QueryReaction).where(flux__id=1)
+        with self.assertRaisesRegex(ValueError, 'pair of values'):
+            Q(QueryReaction).where(flux__between=1.)
+        with self.assertRaisesRegex(ValueError, 'does not have a Manager index'):
+            Q(QueryRna).where(id='r1').all()
+        self.assertEqual(Q(QueryRna, objects=self.rnas).where(id='r1').all(), [self.rnas[1]])
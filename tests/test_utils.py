@@ -874,6 +874,131 @@ class InitSchemaTestCase(unittest.TestCase):
         self.assertEqual(attr._get_tabular_schema_format(), 'Url(primary=True, unique=True)')
 
 
+class DiffObjectsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_diff_objects(self):
+        root_1 = Root(id='a')
+        node_1_0 = Node(id='n0', root=root_1)
+        Node(id='n1', root=root_1)
+
+        root_2 = Root(id='a')
+        node_2_0 = Node(id='n0')
+        Node(id='n2', root=root_2)
+
+        self.assertEqual(utils.diff_objects([root_1], [root_1]), {})
+
+        diff = utils.diff_objects([root_1, node_1_0], [root_2, node_2_0])
+        self.assertEqual(list(diff.keys()), ['Node'])
+        self.assertEqual(diff['Node']['removed'], ['n1'])
+        self.assertEqual(diff['Node']['added'], ['n2'])
+        self.assertEqual(diff['Node']['changed'], [{'key': 'n0', 'attributes': {'root': ['a', None]}}])
+
+        diff = utils.diff_objects({Node: [node_1_0]}, {Node: [node_2_0]}, models=[Node])
+        self.assertEqual(list(diff.keys()), ['Node'])
+
+        msgs = utils.render_diff(utils.diff_objects([root_1, node_1_0], [root_2, node_2_0]))
+        self.assertEqual(len(msgs), 3)
+        self.assertIn('Node: n1', msgs[0])
+        self.assertIn('Node: n2', msgs[1])
+        self.assertIn('root: a != None', msgs[2])
+
+    def test_diff_objects_literal_and_to_many(self):
+        class DiffParent(core.Model):
+            id = core.StringAttribute(primary=True, unique=True)
+            value = core.FloatAttribute()
+
+        class DiffChild(core.Model):
+            id = core.StringAttribute(primary=True, unique=True)
+            parents = core.ManyToManyAttribute(DiffParent, related_name='children')
+
+        p_1 = DiffParent(id='p', value=1.)
+        DiffChild(id='c0', parents=[p_1])
+        DiffChild(id='c1', parents=[p_1])
+
+        p_2 = DiffParent(id='p', value=1. + 1e-12)
+        DiffChild(id='c0', parents=[p_2])
+        DiffChild(id='c1', parents=[])
+
+        diff = utils.diff_objects([p_1], [p_2])
+        self.assertEqual(diff['DiffParent']['changed'], [{'key': 'p', 'attributes': {'value': [1., 1. + 1e-12]}}])
+        self.assertEqual(diff['DiffChild']['changed'], [{'key': 'c1', 'attributes': {'parents': [['p'], []]}}])
+
+        diff = utils.diff_objects([p_1], [p_2], tol=1e-6)
+        self.assertNotIn('DiffParent', diff)
+
+    def test_diff_objects_unique_together_and_fingerprints(self):
+        class DiffGroup(core.Model):
+            id = core.StringAttribute(primary=True, unique=True)
+
+        class DiffMember(core.Model):
+            group = core.ManyToOneAttribute(DiffGroup, related_name='members')
+            name = core.StringAttribute()
+            value = core.IntegerAttribute()
+
+            class Meta(core.Model.Meta):
+                unique_together = (('group', 'name'), )
+
+        class DiffNote(core.Model):
+            text = core.StringAttribute()
+            group = core.ManyToOneAttribute(DiffGroup, related_name='notes')
+
+        g_1 = DiffGroup(id='g')
+        DiffMember(group=g_1, name='m0', value=1)
+        DiffMember(group=g_1, name='m1', value=1)
+        DiffNote(group=g_1, text='x')
+
+        g_2 = DiffGroup(id='g')
+        DiffMember(group=g_2, name='m0', value=2)
+        DiffMember(group=g_2, name='m1', value=1)
+        DiffNote(group=g_2, text='y')
+
+        diff = utils.diff_objects([g_1], [g_2])
+        self.assertEqual(diff['DiffMember']['changed'], [{'key': ('g', 'm0'), 'attributes': {'value': [1, 2]}}])
+        self.assertEqual(len(diff['DiffNote']['removed']), 1)
+        self.assertEqual(len(diff['DiffNote']['added']), 1)
+
+    def test_diff_workbooks(self):
+        root = Root(id='a')
+        Node(id='n0', root=root)
+        filename_1 = os.path.join(self.tempdir, 'file1.xlsx')
+        obj_tables.io.Writer().run(filename_1, [root], models=[Root, Node, Leaf])
+
+        root = Root(id='a')
+        Node(id='n0', root=root)
+        Node(id='n1', root=root)
+        filename_2 = os.path.join(self.tempdir, 'file2.xlsx')
+        obj_tables.io.Writer().run(filename_2, [root], models=[Root, Node, Leaf])
+
+        self.assertEqual(utils.diff_workbooks(filename_1, filename_1, [Root, Node, Leaf], 'Root'), [])
+
+        # by default, only the objects of the model are compared
+        diff = utils.get_workbook_diff(filename_1, filename_2, [Root, Node, Leaf], 'Node')
+        self.assertEqual(diff, {'Node': {'removed': [], 'added': ['n1'], 'changed': []}})
+        self.assertEqual(utils.get_workbook_diff(filename_1, filename_2, [Root, Node, Leaf], 'Root'), {})
+
+        msgs = utils.diff_workbooks(filename_1, filename_2, [Root, Node, Leaf], 'Node')
+        self.assertEqual(msgs, ['1 objects in the second workbook are missing from the first:\n  n1'])
+
+        msgs = utils.diff_workbooks(filename_1, filename_2, [Root, Node, Leaf], 'Root')
+        self.assertEqual(len(msgs), 1)
+        self.assertTrue(msgs[0].startswith('1 objects are different in the workbooks:\n  '))
+
+        # the objects of the related models can also be compared
+        diff = utils.get_workbook_diff(filename_1, filename_2, [Root, Node, Leaf], 'Root', related=True)
+        self.assertEqual(diff['Node']['added'], ['n1'])
+
+        msgs = utils.diff_workbooks(filename_1, filename_2, [Root, Node, Leaf], 'Root', related=True)
+        self.assertEqual(msgs, ['1 objects in the second workbook are missing from the first:\n  Node: n1'])
+
+        with self.assertRaisesRegex(ValueError, 'does not have model'):
+            utils.diff_workbooks(filename_1, filename_2, [Root, Node, Leaf], 'Root2')
+
+
 class ToPandasTestCase(unittest.TestCase):
     def test(self):
         class Child(core.Model):
@@ -907,6 +1032,36 @@ class ToPandasTestCase(unittest.TestCase):
         self.assertEqual(dfs[Parent].values.tolist(), [['p_0', '', 'c_0, c_1, c_2']])
         self.assertEqual(dfs[Child].values.tolist(), [['c_0', ''], ['c_1', ''], ['c_2', '']])
 
+    def test_columnar(self):
+        class Point(core.Model):
+            id = core.SlugAttribute(verbose_name='Id')
+            x = core.FloatAttribute(verbose_name='X')
+            n = core.IntegerAttribute(none=True, verbose_name='N')
+            visible = core.BooleanAttribute(verbose_name='Visible')
+
+            class Meta(core.Model.Meta):
+                attribute_order = ('id', 'x', 'n', 'visible')
+                columnar = True
+                verbose_name = 'Point'
+                verbose_name_plural = 'Point'
+
+        points = [Point(id='p_{}'.format(i), x=i / 2., n=i, visible=i % 2 == 0) for i in range(3)]
+
+        dfs = utils.to_pandas(points, models=[Point])
+        self.assertEqual(dfs[Point].columns.tolist(), ['Id', 'X', 'N', 'Visible'])
+        self.assertEqual(dfs[Point].values.tolist(), [
+            ['p_0', 0., 0., True],
+            ['p_1', 0.5, 1., False],
+            ['p_2', 1., 2., True],
+        ])
+        self.assertEqual(dfs[Point]['X'].dtype, numpy.float64)
+        self.assertEqual(dfs[Point]['N'].dtype, numpy.float64)
+
+        points[1].n = None
+        dfs = utils.to_pandas(points, models=[Point])
+        self.assertEqual(dfs[Point]['N'].tolist()[0], 0.)
+        self.assertTrue(numpy.isnan(dfs[Point]['N'][1]))
+
     def test_multicell(self):
         class Child(core.Model):
             id = core.SlugAttribute(verbose_name='Id')
@@ -426,6 +426,17 @@ class RestTestCase(unittest.TestCase):
         self.assertEqual(rv.status_code, 200)
         self.assertNotEqual(rv.json, 'The dataset is valid')
 
+        with open(schema_filename, 'rb') as schema_file:
+            with open(wb_filename_5, 'rb') as wb_file:
+                rv = client.post('/api/validate/', data={
+                    'schema': (schema_file, os.path.basename(schema_filename)),
+                    'workbook': (wb_file, os.path.basename(wb_filename_5)),
+                    'max-errors': 1,
+                })
+
+        self.assertEqual(rv.status_code, 200)
+        self.assertIn('Validation stopped after 1 error(s)', rv.json)
+
         # invalid csv and tsv files
         wb_filename_6 = os.path.join(self.tempdir, 'wb3.zip')
         zip_file = zipfile.ZipFile(wb_filename_6, mode='w')